@@ -0,0 +1,450 @@
+# Copyright 2024 VisualVerse Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed render result cache for the VisualVerse animation system.
+
+Rendered outputs are stored on local disk under a key derived from a
+canonical hash of everything that determines the output: the scene
+definition, quality settings and renderer/asset versions. Identical
+requests are then served by copying the stored file instead of rendering.
+
+Outputs are published atomically (written to a temporary file, then
+renamed into place), the cache is bounded by total size with least recently
+used eviction, and concurrent requests for the same key share one render.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import sys
+import sysconfig
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+# Temporary render directories are reaped once their owner process is gone,
+# or unconditionally after this many seconds (covers reused PIDs)
+TMP_MAX_AGE = 24 * 3600
+
+
+def _canonical_default(value: Any) -> Any:
+    """JSON fallback for values without a native JSON form"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def canonical_hash(spec: Dict[str, Any]) -> str:
+    """SHA-256 of a spec serialized as canonical JSON"""
+    encoded = json.dumps(
+        spec, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_canonical_default
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a local process exists (assumed alive where it cannot be checked)"""
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists, but owned by another user
+        pass
+    return True
+
+
+def _external_roots() -> Tuple[str, ...]:
+    """Install locations whose modules are versioned, not hashed"""
+    paths = sysconfig.get_paths()
+    return tuple(
+        os.path.join(os.path.realpath(paths[name]), "")
+        for name in ("stdlib", "platstdlib", "purelib", "platlib") if name in paths
+    )
+
+
+def _is_external(module: Any, roots: Tuple[str, ...]) -> bool:
+    """Whether a module belongs to manim, the standard library or an installed package"""
+    name = getattr(module, "__name__", "")
+    if name == "manim" or name.startswith("manim.") or name in sys.builtin_module_names:
+        return True
+    path = getattr(module, "__file__", None)
+    return path is not None and os.path.realpath(path).startswith(roots)
+
+
+def _referenced_modules(module: Any):
+    """Modules whose globals a module refers to (imported modules, functions and classes)"""
+    for value in list(vars(module).values()):
+        if inspect.ismodule(value):
+            yield value
+        elif inspect.isclass(value) or inspect.isfunction(value):
+            owner = sys.modules.get(getattr(value, "__module__", None) or "")
+            if owner is not None:
+                yield owner
+
+
+def scene_fingerprint(scene_class: type) -> Optional[Dict[str, Any]]:
+    """
+    Identify a scene class by name and a hash of the code it can run.
+    
+    Hashes the source of every class in the MRO outside manim, plus the
+    files of their modules and of project modules those import (helpers,
+    assets), so editing any of them changes the key. Installed packages
+    are covered by the renderer/asset versions instead.
+    
+    Returns:
+        The fingerprint, or None when some of that source is unavailable
+        (dynamically created or locally defined classes); such scenes must
+        not be cached
+    """
+    roots = _external_roots()
+    digest = hashlib.sha256()
+    pending = []
+    
+    for cls in scene_class.__mro__:
+        module = sys.modules.get(cls.__module__)
+        if module is None:
+            return None
+        if _is_external(module, roots):
+            continue
+        
+        # The class must be the one its name resolves to, or its source
+        # cannot be told apart from another class of the same name
+        target = module
+        for part in cls.__qualname__.split("."):
+            target = getattr(target, part, None)
+        if target is not cls:
+            return None
+        try:
+            source = inspect.getsource(cls)
+        except (OSError, TypeError):
+            return None
+        digest.update(f"class {cls.__module__}.{cls.__qualname__}\n{source}\n".encode("utf-8"))
+        pending.append(module)
+    
+    # Module files reachable from the scene's modules, outside installed packages
+    seen = set()
+    files = {}
+    while pending:
+        module = pending.pop()
+        if module.__name__ in seen:
+            continue
+        seen.add(module.__name__)
+        path = getattr(module, "__file__", None)
+        if path is None:
+            continue
+        try:
+            with open(path, "rb") as f:
+                files[module.__name__] = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        pending.extend(
+            child for child in _referenced_modules(module)
+            if child.__name__ not in seen and not _is_external(child, roots)
+        )
+    
+    for name in sorted(files):
+        digest.update(f"module {name} {files[name]}\n".encode("utf-8"))
+    
+    return {
+        "module": scene_class.__module__,
+        "qualname": scene_class.__qualname__,
+        "source_sha256": digest.hexdigest()
+    }
+
+
+@dataclass
+class CacheOutcome:
+    """Result of a cache lookup-or-render"""
+    path: Optional[str]
+    hit: bool = False
+    coalesced: bool = False
+    result: Any = None
+
+
+class RenderCache:
+    """
+    Size-bounded, content-addressed cache of rendered files.
+    
+    Entries live in ``<cache_dir>/objects/<key[:2]>/<key><suffix>``; file
+    modification times record recency, so LRU order survives restarts.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        versions: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            cache_dir: Cache directory (created on first use)
+            max_bytes: Maximum total size of cached files
+            versions: Renderer/asset versions mixed into every key, so
+                upgrading any of them invalidates earlier renders
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.versions = dict(versions or {})
+        
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "stores": 0, "evictions": 0, "errors": 0}
+    
+    @property
+    def objects_dir(self) -> Path:
+        return self.cache_dir / "objects"
+    
+    @property
+    def tmp_dir(self) -> Path:
+        return self.cache_dir / "tmp"
+    
+    def make_key(self, spec: Dict[str, Any]) -> str:
+        """Cache key for a render spec under this cache's versions"""
+        return canonical_hash({"spec": spec, "versions": self.versions})
+    
+    def _load(self):
+        """Index existing entries by modification time and reap abandoned temp files"""
+        if self._loaded:
+            return
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._reap_temp_dirs()
+        
+        found = []
+        for path in self.objects_dir.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, path.name.split(".", 1)[0], str(path), stat.st_size))
+        
+        for _, key, path, size in sorted(found):
+            self._entries[key] = (path, size)
+            self._bytes += size
+        self._loaded = True
+        self._evict()
+    
+    def _reap_temp_dirs(self):
+        """
+        Remove temporary render directories nobody is writing to any more.
+        
+        Other processes may share the cache directory and still be rendering,
+        so a directory is only removed when the process named in its
+        ``<pid>-`` prefix has exited, or when it is older than ``TMP_MAX_AGE``.
+        """
+        now = time.time()
+        for path in self.tmp_dir.iterdir():
+            try:
+                age = now - path.stat().st_mtime
+            except OSError:
+                continue
+            
+            owner, _, _ = path.name.partition("-")
+            owner_gone = owner.isdigit() and not _process_alive(int(owner))
+            if owner_gone or age > TMP_MAX_AGE:
+                shutil.rmtree(path, ignore_errors=True)
+    
+    def is_pending(self, key: str) -> bool:
+        """Whether a render for this key is currently in flight"""
+        return key in self._inflight
+    
+    def lookup(self, key: str) -> Optional[str]:
+        """Get the cached file for a key, marking it as recently used"""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            path = entry[0]
+            if not os.path.exists(path):
+                # Removed behind our back
+                del self._entries[key]
+                self._bytes -= entry[1]
+                return None
+            self._entries.move_to_end(key)
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+    
+    def new_temp_path(self, suffix: str = ".mp4") -> str:
+        """
+        Reserve a temporary path inside the cache for a render to write to.
+        
+        The path is in a fresh private directory, tagged with this process
+        ID, and does not exist yet, so a render that writes nothing leaves
+        nothing behind.
+        """
+        with self._lock:
+            self._load()
+        directory = tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=self.tmp_dir)
+        return os.path.join(directory, f"output{suffix}")
+    
+    def publish(self, key: str, source_path: str) -> str:
+        """
+        Move a finished render into the cache.
+        
+        ``source_path`` should be on the cache's filesystem (see
+        ``new_temp_path``) so the final rename is atomic.
+        """
+        suffix = Path(source_path).suffix
+        target = self.objects_dir / key[:2] / f"{key}{suffix}"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source_path, target)
+        size = target.stat().st_size
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (str(target), size)
+            self._bytes += size
+            self.stats["stores"] += 1
+            self._evict()
+        return str(target)
+    
+    @staticmethod
+    def export(cached_path: str, destination: str) -> str:
+        """Atomically copy a cached file to a destination path"""
+        destination_path = Path(destination)
+        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{destination_path.name}.", suffix=".tmp", dir=destination_path.parent
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(cached_path, tmp_path)
+            os.replace(tmp_path, destination_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return str(destination_path)
+    
+    async def get_or_render(
+        self,
+        key: str,
+        render: Callable[[str], Awaitable[Any]],
+        suffix: str = ".mp4",
+        should_publish: Optional[Callable[[Any], bool]] = None
+    ) -> CacheOutcome:
+        """
+        Return the cached file for a key, rendering it on a miss.
+        
+        ``render(tmp_path)`` must write its output to ``tmp_path``; the file
+        is published if it exists, is non-empty and ``should_publish(result)``
+        accepts the render's result (when given), so output left behind by
+        a failed render is never cached. Concurrent callers with the same key
+        wait for the first caller's render instead of starting their own.
+        """
+        path = self.lookup(key)
+        if path is not None:
+            self.stats["hits"] += 1
+            return CacheOutcome(path=path, hit=True)
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            outcome = await asyncio.shield(inflight)
+            return CacheOutcome(path=outcome.path, coalesced=True, result=outcome.result)
+        
+        self.stats["misses"] += 1
+        future = asyncio.get_event_loop().create_future()
+        self._inflight[key] = future
+        tmp_path = None
+        try:
+            tmp_path = self.new_temp_path(suffix)
+            result = await render(tmp_path)
+            
+            published = None
+            if (
+                os.path.exists(tmp_path)
+                and os.path.getsize(tmp_path) > 0
+                and (should_publish is None or should_publish(result))
+            ):
+                published = self.publish(key, tmp_path)
+            outcome = CacheOutcome(path=published, result=result)
+            future.set_result(outcome)
+            return outcome
+        except BaseException as e:
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+            if tmp_path is not None:
+                shutil.rmtree(os.path.dirname(tmp_path), ignore_errors=True)
+    
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds max_bytes
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, (path, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.stats["evictions"] += 1
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not evict cached render {path}: {e}")
+    
+    def clear(self):
+        """Remove every cached render"""
+        with self._lock:
+            self._load()
+            for path, _ in self._entries.values():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._bytes = 0
+    
+    def info(self) -> Dict[str, Any]:
+        """Cache metrics"""
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            **self.stats
+        }
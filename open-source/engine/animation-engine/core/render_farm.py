@@ -0,0 +1,514 @@
+# Copyright 2024 VisualVerse Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Process-based render farm for the VisualVerse animation system.
+
+Renders are CPU-bound and configure process-global renderer state, so each
+one runs in a dedicated worker process rather than a thread. The farm keeps
+one long-lived worker per slot, a bounded queue of pending jobs, and a
+registry that tracks each job's status, progress and per-stage timings.
+Cancelling a running job terminates its worker, which is replaced on the
+next job.
+
+Tasks are plain picklable callables ``task(payload, reporter) -> dict``
+defined at module level; ``reporter`` lets the task report stages and
+progress back to the farm. Workers are started with the "spawn" method by
+default, so task modules must be importable in a fresh interpreter.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Any, Optional, List, Callable
+
+logger = logging.getLogger(__name__)
+
+# Seconds between cancellation checks while a job is running
+POLL_INTERVAL = 0.05
+
+# Workers never inherit the parent's threads, locks or renderer state
+DEFAULT_START_METHOD = "spawn"
+
+
+class RenderJobStatus(Enum):
+    """Status of a render job"""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (RenderJobStatus.COMPLETED, RenderJobStatus.FAILED, RenderJobStatus.CANCELLED)
+
+
+class RenderFarmError(Exception):
+    """Base error for render farm failures"""
+
+
+class RenderQueueFull(RenderFarmError):
+    """Raised when a job cannot be queued within the allowed time"""
+
+
+class RenderCancelled(RenderFarmError):
+    """Raised by a job future when the job was cancelled"""
+
+
+@dataclass
+class RenderJob:
+    """A render job tracked by the farm registry"""
+    render_id: str
+    task: Callable[..., Dict[str, Any]]
+    payload: Any
+    status: RenderJobStatus = RenderJobStatus.PENDING
+    progress: float = 0.0
+    stage: Optional[str] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    worker_pid: Optional[int] = None
+    error_message: Optional[str] = None
+    future: Future = field(default_factory=Future, repr=False)
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATUSES
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Status snapshot for APIs"""
+        return {
+            "render_id": self.render_id,
+            "status": self.status.value,
+            "progress": self.progress,
+            "stage": self.stage,
+            "stage_timings": dict(self.stage_timings),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "worker_pid": self.worker_pid,
+            "error_message": self.error_message
+        }
+
+
+class StageReporter:
+    """Reports stages and progress from a worker process to the farm"""
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    @contextmanager
+    def stage(self, name: str, progress: Optional[float] = None):
+        """Time a named stage; ``progress`` is reported when it completes"""
+        self._conn.send(("stage", name, None))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._conn.send(("timing", name, time.perf_counter() - start))
+        if progress is not None:
+            self.progress(progress)
+    
+    def progress(self, fraction: float):
+        """Report overall job progress between 0 and 1"""
+        self._conn.send(("progress", None, max(0.0, min(1.0, fraction))))
+
+
+def _worker_main(conn):
+    """Worker process loop: run one job at a time until told to stop"""
+    reporter = StageReporter(conn)
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message is None:
+            break
+        
+        task, payload = message
+        try:
+            result = task(payload, reporter)
+            conn.send(("done", None, result))
+        except BaseException as e:
+            conn.send(("error", None, f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+
+
+class _WorkerSlot:
+    """One worker process and the supervisor thread that feeds it"""
+    
+    def __init__(self, farm: 'RenderFarm', index: int):
+        self.farm = farm
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.thread = threading.Thread(
+            target=self._run, name=f"render-farm-slot-{index}", daemon=True
+        )
+    
+    def _ensure_process(self):
+        if self.process is not None:
+            if self.process.is_alive():
+                return
+            self._kill_process()
+        
+        parent_conn, child_conn = self.farm.mp_context.Pipe()
+        process = self.farm.mp_context.Process(
+            target=_worker_main, args=(child_conn,),
+            name=f"render-farm-worker-{self.index}", daemon=True
+        )
+        try:
+            process.start()
+        except BaseException:
+            # Leave the slot without a worker so the next job starts a new one
+            parent_conn.close()
+            raise
+        finally:
+            child_conn.close()
+        self.process = process
+        self.conn = parent_conn
+        logger.debug(f"Started render worker {self.process.pid} in slot {self.index}")
+    
+    def _kill_process(self):
+        if self.process is None:
+            return
+        self.process.terminate()
+        self.process.join(5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+        self.process = None
+        self.conn = None
+    
+    def stop(self):
+        """Ask the worker to exit after its current job"""
+        if self.process is not None and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+            self.process.join(5)
+        if self.process is not None and self.process.is_alive():
+            self._kill_process()
+    
+    def _run(self):
+        while True:
+            try:
+                job = self.farm._queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                # shutdown(wait=False) skips sentinels that do not fit the queue
+                if self.farm._closed:
+                    self.stop()
+                    return
+                continue
+            if job is None:
+                self.stop()
+                return
+            
+            try:
+                if job.cancel_event.is_set() or job.future.cancelled():
+                    continue
+                self._execute(job)
+            except Exception as e:
+                logger.error(f"Render farm slot {self.index} failed on {job.render_id}", exc_info=True)
+                self.farm._finish(job, RenderJobStatus.FAILED, error_message=f"Render farm error: {e}")
+                self._kill_process()
+            finally:
+                self.farm._queue.task_done()
+    
+    def _fail_dead_worker(self, job: RenderJob):
+        self.process.join(5)
+        exitcode = self.process.exitcode
+        self._kill_process()
+        self.farm._finish(
+            job, RenderJobStatus.FAILED,
+            error_message=f"Render worker exited with code {exitcode}"
+        )
+    
+    def _execute(self, job: RenderJob):
+        self._ensure_process()
+        if not self.farm._start(job, self.process.pid):
+            return
+        self.conn.send((job.task, job.payload))
+        
+        while True:
+            if job.cancel_event.is_set():
+                self._kill_process()
+                self.farm._finish(job, RenderJobStatus.CANCELLED, error_message="Render cancelled")
+                return
+            
+            if not self.conn.poll(POLL_INTERVAL):
+                if not self.process.is_alive():
+                    self._fail_dead_worker(job)
+                    return
+                continue
+            
+            try:
+                kind, name, value = self.conn.recv()
+            except EOFError:
+                self._fail_dead_worker(job)
+                return
+            
+            if kind == "stage":
+                job.stage = name
+            elif kind == "timing":
+                job.stage_timings[name] = value
+            elif kind == "progress":
+                job.progress = value
+            elif kind == "done":
+                self.farm._finish(job, RenderJobStatus.COMPLETED, result=value)
+                return
+            elif kind == "error":
+                self.farm._finish(job, RenderJobStatus.FAILED, error_message=value)
+                return
+
+
+class RenderFarm:
+    """
+    Bounded-queue render farm backed by worker processes.
+    
+    ``submit`` blocks while the queue is full, which applies backpressure
+    to producers; each job exposes a ``concurrent.futures.Future`` that
+    resolves to the task's result dict.
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_size: Optional[int] = None,
+        mp_context: Optional[Any] = None,
+        history_size: int = 1000
+    ):
+        """
+        Args:
+            max_workers: Number of worker processes (concurrent renders)
+            max_queue_size: Pending jobs accepted before ``submit`` blocks
+                (defaults to twice the worker count)
+            mp_context: multiprocessing context or start method name
+                (defaults to "spawn")
+            history_size: Finished jobs kept in the registry for status queries
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size if max_queue_size is not None else 2 * max_workers
+        if mp_context is None:
+            mp_context = DEFAULT_START_METHOD
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+        self.history_size = history_size
+        
+        self._queue: "queue.Queue[Optional[RenderJob]]" = queue.Queue(maxsize=self.max_queue_size)
+        self._jobs: "OrderedDict[str, RenderJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._slots: List[_WorkerSlot] = []
+        self._ids = itertools.count(1)
+        self._started = False
+        self._closed = False
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0}
+    
+    def _start_slots(self):
+        with self._lock:
+            if self._started:
+                return
+            self._slots = [_WorkerSlot(self, i) for i in range(self.max_workers)]
+            for slot in self._slots:
+                slot.thread.start()
+            self._started = True
+    
+    def submit(
+        self,
+        task: Callable[..., Dict[str, Any]],
+        payload: Any,
+        render_id: Optional[str] = None,
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> RenderJob:
+        """
+        Queue a job, waiting for queue space if the farm is saturated.
+        
+        Args:
+            task: Module-level callable run in the worker as ``task(payload, reporter)``
+            payload: Picklable task input
+            render_id: Job identifier (generated if omitted)
+            block: Wait for queue space instead of failing immediately
+            timeout: Maximum seconds to wait for queue space
+        
+        Raises:
+            RenderQueueFull: If no queue space became available
+        """
+        if self._closed:
+            raise RenderFarmError("Render farm is shut down")
+        self._start_slots()
+        
+        job = RenderJob(
+            render_id=render_id or f"render_{next(self._ids)}_{int(time.time() * 1000)}",
+            task=task,
+            payload=payload
+        )
+        with self._lock:
+            if job.render_id in self._jobs:
+                raise ValueError(f"Duplicate render id: {job.render_id}")
+            self._jobs[job.render_id] = job
+        
+        try:
+            self._queue.put(job, block=block, timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(job.render_id, None)
+            raise RenderQueueFull(f"Render queue is full ({self.max_queue_size} pending jobs)")
+        
+        with self._lock:
+            self.stats["submitted"] += 1
+        # Callers may cancel the future directly instead of calling cancel()
+        job.future.add_done_callback(lambda future: self._on_future_done(job, future))
+        return job
+    
+    def _on_future_done(self, job: RenderJob, future: Future):
+        if future.cancelled():
+            job.cancel_event.set()
+            self._finish(job, RenderJobStatus.CANCELLED, error_message="Render cancelled")
+    
+    def _start(self, job: RenderJob, pid: int) -> bool:
+        with self._lock:
+            if job.done:
+                return False
+            running = job.future.set_running_or_notify_cancel()
+            if running:
+                job.status = RenderJobStatus.PROCESSING
+                job.started_at = time.time()
+                job.worker_pid = pid
+                job.stage_timings["queued"] = job.started_at - job.submitted_at
+        
+        if not running:
+            # The future was cancelled before the job reached a worker
+            self._finish(job, RenderJobStatus.CANCELLED, error_message="Render cancelled")
+        return running
+    
+    def _finish(
+        self,
+        job: RenderJob,
+        status: RenderJobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None
+    ):
+        with self._lock:
+            if job.done:
+                return
+            job.status = status
+            job.finished_at = time.time()
+            job.error_message = error_message
+            job.worker_pid = None
+            if status == RenderJobStatus.COMPLETED:
+                job.progress = 1.0
+            if job.started_at is not None:
+                job.stage_timings["total"] = job.finished_at - job.started_at
+            self.stats[status.value] += 1
+            self._trim_history()
+        
+        try:
+            if status == RenderJobStatus.COMPLETED:
+                job.future.set_result(result)
+            elif status == RenderJobStatus.CANCELLED:
+                job.future.set_exception(RenderCancelled(job.render_id))
+            else:
+                job.future.set_exception(RenderFarmError(error_message))
+        except InvalidStateError:
+            # The caller cancelled the future itself
+            pass
+    
+    def _trim_history(self):
+        finished = [render_id for render_id, job in self._jobs.items() if job.done]
+        for render_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self._jobs[render_id]
+    
+    def get_job(self, render_id: str) -> Optional[RenderJob]:
+        """Look up a job in the registry"""
+        return self._jobs.get(render_id)
+    
+    def cancel(self, render_id: str) -> bool:
+        """
+        Cancel a pending or running job.
+        
+        Pending jobs are dropped when they reach a worker; running jobs have
+        their worker process terminated.
+        
+        Returns:
+            True if the job was still pending or running
+        """
+        job = self._jobs.get(render_id)
+        if job is None or job.done:
+            return False
+        
+        job.cancel_event.set()
+        if job.status == RenderJobStatus.PENDING:
+            self._finish(job, RenderJobStatus.CANCELLED, error_message="Render cancelled")
+        return True
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Queue and worker status"""
+        jobs = list(self._jobs.values())
+        return {
+            "queued_jobs": sum(1 for job in jobs if job.status == RenderJobStatus.PENDING),
+            "active_renders": sum(1 for job in jobs if job.status == RenderJobStatus.PROCESSING),
+            "max_concurrent": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "workers_alive": sum(
+                1 for slot in self._slots if slot.process is not None and slot.process.is_alive()
+            ),
+            **self.stats
+        }
+    
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stop the farm.
+        
+        Args:
+            wait: Wait for queued and running jobs to finish
+            cancel_pending: Cancel jobs that have not started yet
+        """
+        if self._closed:
+            return
+        self._closed = True
+        
+        if cancel_pending:
+            for job in list(self._jobs.values()):
+                if job.status == RenderJobStatus.PENDING:
+                    self.cancel(job.render_id)
+        
+        if not self._started:
+            return
+        
+        # Without wait, slots that miss a sentinel exit once the queue drains
+        for _ in self._slots:
+            try:
+                self._queue.put(None, block=wait)
+            except queue.Full:
+                break
+        if wait:
+            for slot in self._slots:
+                slot.thread.join()
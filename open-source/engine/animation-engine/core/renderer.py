@@ -15,29 +15,50 @@
 """
 Core rendering engine for VisualVerse animation system.
 Provides high-level interface for rendering educational animations.
+
+Renders run on a process-based RenderFarm: every render executes in a
+worker process under its own Manim configuration, so concurrent renders
+neither share config state nor contend for the GIL. Finished outputs are
+kept in a content-addressed RenderCache, so repeated requests for the same
+scene and settings are served from disk.
 """
 
 import asyncio
+import dataclasses
 import json
 import logging
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
 
 import manim
-from manim import config as manim_config
 from manim.scene.scene import Scene
 from manim.utils.file_ops import write_to_movie
 
 from .scene_base import SceneBase
 from .camera import CameraController
 from .timeline import TimelineManager
+from .render_farm import RenderFarm, RenderFarmError, RenderCancelled, StageReporter
+from .render_cache import RenderCache, DEFAULT_MAX_BYTES, scene_fingerprint
 
 logger = logging.getLogger(__name__)
 
+RENDERER_VERSION = "1.0.0"
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "visualverse-render-cache")
+
+# Request quality flags mapped to Manim quality presets
+MANIM_QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality"
+}
+
 @dataclass
 class RenderRequest:
     """Request object for rendering animations"""
@@ -50,6 +71,7 @@ class RenderRequest:
     transparent: bool = False
     background_color: str = "#FFFFFF"
     metadata: Optional[Dict[str, Any]] = None
+    cache: bool = True
     
     def __post_init__(self):
         if self.metadata is None:
@@ -64,31 +86,134 @@ class RenderResult:
     render_time: Optional[float] = None
     file_size: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
+    render_id: Optional[str] = None
+    stage_timings: Optional[Dict[str, float]] = None
+    cache_hit: bool = False
+
+def build_render_config(request: RenderRequest, output_path: str) -> Dict[str, Any]:
+    """Build the Manim configuration for a single render"""
+    render_config = {
+        "quality": MANIM_QUALITIES[request.quality],
+        "frame_rate": request.fps,
+        "transparent": request.transparent,
+        "background_color": request.background_color,
+        "output_file": output_path
+    }
+    
+    if request.resolution:
+        render_config["pixel_width"], render_config["pixel_height"] = request.resolution
+    
+    return render_config
+
+def render_cache_spec(request: RenderRequest, output_format: str) -> Optional[Dict[str, Any]]:
+    """
+    Everything about a request that determines its rendered output.
+    
+    Metadata is included because scenes may read it in ``setup_custom``;
+    per-request bookkeeping should not be stored there when caching.
+    
+    Returns:
+        The spec, or None when the scene's source cannot be fingerprinted
+    """
+    scene = scene_fingerprint(request.scene_class)
+    if scene is None:
+        return None
+    return {
+        "scene": scene,
+        "quality": request.quality,
+        "fps": request.fps,
+        "duration": request.duration,
+        "resolution": request.resolution,
+        "transparent": request.transparent,
+        "background_color": request.background_color,
+        "metadata": request.metadata,
+        "format": output_format
+    }
+
+def render_scene_job(request: RenderRequest, reporter: StageReporter) -> Dict[str, Any]:
+    """
+    Render one request inside a render farm worker process.
+    
+    The scene class is pickled by reference, so it must be importable at
+    module level. Manim settings only apply within ``tempconfig`` for this
+    render and are restored afterwards.
+    """
+    with reporter.stage("configure", progress=0.05):
+        # Create temporary file if no output path specified
+        if not request.output_path:
+            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp_file:
+                output_path = tmp_file.name
+        else:
+            output_path = request.output_path
+        
+        # Ensure output directory exists
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        render_config = build_render_config(request, output_path)
+    
+    with manim.tempconfig(render_config):
+        with reporter.stage("setup", progress=0.1):
+            scene_instance = request.scene_class()
+            
+            # Set up scene with request parameters
+            if hasattr(scene_instance, 'setup_custom'):
+                scene_instance.setup_custom(request)
+        
+        with reporter.stage("render", progress=0.95):
+            scene_instance.render()
+    
+    with reporter.stage("verify"):
+        # Verify output file was created
+        if not Path(output_path).exists():
+            raise RuntimeError("Output file was not created")
+    
+    return {
+        "output_path": output_path,
+        "file_size": Path(output_path).stat().st_size
+    }
 
 class AnimationRenderer:
     """High-level animation rendering engine"""
     
-    def __init__(self, max_concurrent_renders: int = 4):
+    def __init__(
+        self,
+        max_concurrent_renders: int = 4,
+        max_queue_size: Optional[int] = None,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        asset_versions: Optional[Dict[str, str]] = None
+    ):
         self.max_concurrent_renders = max_concurrent_renders
-        self.render_executor = ThreadPoolExecutor(max_workers=max_concurrent_renders)
+        self.render_farm = RenderFarm(
+            max_workers=max_concurrent_renders,
+            max_queue_size=max_queue_size
+        )
         self.camera_controller = CameraController()
         self.timeline_manager = TimelineManager()
-        self.render_queue = []
-        self.active_renders = []
-        
-        # Configure Manim defaults
-        self._configure_manim()
     
-    def _configure_manim(self):
-        """Configure Manim with VisualVerse defaults"""
-        manim_config.quality = "l"  # Medium quality by default
-        manim_config.output_file = "visualverse_output.mp4"
-        manim_config.transparent = False
-        manim_config.background_color = "#FFFFFF"
-        logger.info("Manim configured with VisualVerse defaults")
+        # Render cache (disabled when cache_dir is None)
+        self.render_cache = None
+        if cache_dir is not None:
+            self.render_cache = RenderCache(
+                cache_dir,
+                max_bytes=cache_max_bytes,
+                versions={
+                    "renderer": RENDERER_VERSION,
+                    "manim": getattr(manim, "__version__", "unknown"),
+                    **(asset_versions or {})
+                }
+            )
     
     async def render_animation(self, request: RenderRequest) -> RenderResult:
         """Render an animation asynchronously"""
+        return await self._render(request)
+    
+    async def _render(self, request: RenderRequest, submitted: Optional[asyncio.Event] = None) -> RenderResult:
+        """
+        Validate and render a request.
+        
+        ``submitted`` is set once the request no longer needs a farm queue
+        slot to be granted: it was queued, answered, or joined another render.
+        """
         start_time = datetime.now()
         
         try:
@@ -99,29 +224,20 @@ class AnimationRenderer:
             if not validation_result.success:
                 return validation_result
             
-            # Configure rendering parameters
-            self._apply_render_config(request)
-            
-            # Create scene instance and render
-            scene_instance = request.scene_class()
-            
-            # Run render in thread pool
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.render_executor,
-                self._render_scene_sync,
-                scene_instance,
-                request
-            )
+            result = None
+            if self.render_cache is not None and request.cache:
+                result = await self._render_cached(request, submitted)
+            if result is None:
+                # Queue on the render farm (waits while the queue is full) and wait for the result
+                render_id = await self.submit_render(request)
+                if submitted is not None:
+                    submitted.set()
+                result = await self.wait_for_render(render_id)
             
             # Calculate render time
             render_time = (datetime.now() - start_time).total_seconds()
             result.render_time = render_time
             
-            # Get file size if successful
-            if result.success and result.output_path:
-                result.file_size = self._get_file_size(result.output_path)
-            
             logger.info(f"Render completed: {result.success}, Time: {render_time:.2f}s")
             return result
             
@@ -133,6 +249,74 @@ class AnimationRenderer:
                 error_message=error_message,
                 render_time=(datetime.now() - start_time).total_seconds()
             )
+        finally:
+            if submitted is not None:
+                submitted.set()
+    
+    async def _render_cached(
+        self,
+        request: RenderRequest,
+        submitted: Optional[asyncio.Event]
+    ) -> Optional[RenderResult]:
+        """
+        Serve a request from the render cache, rendering on the farm on a miss.
+        
+        Returns None without rendering when the scene cannot be cached.
+        """
+        output_format = Path(request.output_path).suffix if request.output_path else ""
+        output_format = output_format or ".mp4"
+        spec = render_cache_spec(request, output_format)
+        if spec is None:
+            logger.info(
+                f"Scene {request.scene_class.__qualname__} has no retrievable source; "
+                f"rendering without the cache"
+            )
+            return None
+        key = self.render_cache.make_key(spec)
+        
+        # Requests joining an in-flight render do not take a queue slot
+        if submitted is not None and self.render_cache.is_pending(key):
+            submitted.set()
+        
+        async def render(tmp_path: str) -> RenderResult:
+            render_id = await self.submit_render(dataclasses.replace(request, output_path=tmp_path))
+            if submitted is not None:
+                submitted.set()
+            return await self.wait_for_render(render_id)
+        
+        outcome = await self.render_cache.get_or_render(
+            key, render, suffix=output_format, should_publish=lambda result: result.success
+        )
+        if outcome.path is None:
+            # Render failed or wrote nothing; nothing was cached
+            if outcome.result.success:
+                return RenderResult(
+                    success=False,
+                    error_message="Output file was not created",
+                    render_id=outcome.result.render_id,
+                    stage_timings=outcome.result.stage_timings
+                )
+            return dataclasses.replace(outcome.result)
+        
+        if request.output_path:
+            output_path = request.output_path
+        else:
+            with tempfile.NamedTemporaryFile(suffix=output_format, delete=False) as tmp_file:
+                output_path = tmp_file.name
+        
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, RenderCache.export, outcome.path, output_path)
+        
+        rendered = outcome.result
+        return RenderResult(
+            success=True,
+            output_path=output_path,
+            file_size=Path(output_path).stat().st_size,
+            metadata=request.metadata.copy(),
+            render_id=rendered.render_id if rendered is not None and not outcome.coalesced else None,
+            stage_timings=dict(rendered.stage_timings or {}) if rendered is not None else None,
+            cache_hit=outcome.hit or outcome.coalesced
+        )
     
     def _validate_render_request(self, request: RenderRequest) -> RenderResult:
         """Validate render request parameters"""
@@ -160,101 +344,111 @@ class AnimationRenderer:
         
         return RenderResult(success=True)
     
-    def _apply_render_config(self, request: RenderRequest):
-        """Apply rendering configuration to Manim"""
-        manim_config.quality = request.quality
-        manim_config.fps = request.fps
-        manim_config.transparent = request.transparent
-        manim_config.background_color = request.background_color
+    async def submit_render(self, request: RenderRequest, render_id: Optional[str] = None) -> str:
+        """
+        Queue a render on the farm without waiting for it to finish.
         
-        if request.resolution:
-            manim_config.pixel_width, manim_config.pixel_height = request.resolution
+        Waits (without blocking the event loop) while the farm queue is full.
         
-        if request.output_path:
-            manim_config.output_file = request.output_path
+        Returns:
+            Render ID for get_render_status, cancel_render and wait_for_render
+        """
+        loop = asyncio.get_event_loop()
+        job = await loop.run_in_executor(
+            None,
+            lambda: self.render_farm.submit(render_scene_job, request, render_id=render_id)
+        )
+        return job.render_id
     
-    def _render_scene_sync(self, scene_instance: SceneBase, request: RenderRequest) -> RenderResult:
-        """Synchronous scene rendering"""
+    async def wait_for_render(self, render_id: str) -> RenderResult:
+        """Wait for a submitted render and convert its outcome to a RenderResult"""
+        job = self.render_farm.get_job(render_id)
+        if job is None:
+            return RenderResult(success=False, error_message=f"Unknown render: {render_id}", render_id=render_id)
+        
         try:
-            # Set up scene with request parameters
-            if hasattr(scene_instance, 'setup_custom'):
-                scene_instance.setup_custom(request)
-            
-            # Create temporary file if no output path specified
-            if not request.output_path:
-                with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp_file:
-                    output_path = tmp_file.name
-            else:
-                output_path = request.output_path
-            
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # Configure Manim for this render
-            manim_config.output_file = output_path
-            
-            # Render the scene
-            scene_instance.render()
-            
-            # Verify output file was created
-            if not Path(output_path).exists():
-                return RenderResult(
-                    success=False,
-                    error_message="Output file was not created"
-                )
-            
+            output = await asyncio.wrap_future(job.future)
+        except RenderCancelled:
             return RenderResult(
-                success=True,
-                output_path=output_path,
-                metadata=request.metadata.copy()
+                success=False,
+                error_message="Render cancelled",
+                render_id=render_id,
+                stage_timings=dict(job.stage_timings)
             )
-            
-        except Exception as e:
+        except RenderFarmError as e:
+            logger.error(f"Render {render_id} failed: {e}")
             return RenderResult(
                 success=False,
-                error_message=f"Scene rendering failed: {str(e)}"
+                error_message=f"Scene rendering failed: {str(e).splitlines()[0]}",
+                render_id=render_id,
+                stage_timings=dict(job.stage_timings)
             )
+            
+        return RenderResult(
+            success=True,
+            render_time=job.finished_at - job.submitted_at,
+            output_path=output["output_path"],
+            file_size=output["file_size"],
+            metadata=job.payload.metadata.copy(),
+            render_id=render_id,
+            stage_timings=dict(job.stage_timings)
+        )
     
-    def _get_file_size(self, file_path: str) -> int:
-        """Get file size in bytes"""
-        try:
-            return Path(file_path).stat().st_size
-        except (OSError, FileNotFoundError):
-            return 0
+    async def render_batch(self, requests: List[RenderRequest]) -> List[RenderResult]:
+        """
+        Render multiple requests on the farm, in request order.
+        
+        Each request waits for a farm queue slot before the next one is
+        submitted, so a large batch is fed to the workers as they free up
+        instead of all at once. Cache hits never wait for a slot.
+        """
+        waiters = []
+        for request in requests:
+            submitted = asyncio.Event()
+            waiters.append(asyncio.ensure_future(self._render(request, submitted)))
+            await submitted.wait()
+        
+        return list(await asyncio.gather(*waiters))
     
     def get_render_status(self, render_id: str) -> Dict[str, Any]:
-        """Get status of a render job"""
-        # Implementation for tracking render status
-        return {
-            "render_id": render_id,
-            "status": "unknown",
-            "progress": 0
-        }
+        """Get status, progress and per-stage timings of a render job"""
+        job = self.render_farm.get_job(render_id)
+        if job is None:
+            return {
+                "render_id": render_id,
+                "status": "unknown",
+                "progress": 0
+            }
+        return job.to_dict()
     
     def cancel_render(self, render_id: str) -> bool:
-        """Cancel a running render job"""
-        # Implementation for canceling renders
-        return False
+        """Cancel a queued or running render job"""
+        cancelled = self.render_farm.cancel(render_id)
+        if cancelled:
+            logger.info(f"Cancelled render {render_id}")
+        return cancelled
     
     def get_queue_status(self) -> Dict[str, Any]:
         """Get overall render queue status"""
-        return {
-            "queued_jobs": len(self.render_queue),
-            "active_renders": len(self.active_renders),
-            "max_concurrent": self.max_concurrent_renders
-        }
+        return self.render_farm.get_status()
+    
+    def get_cache_status(self) -> Dict[str, Any]:
+        """Get render cache metrics (hits, misses, size, evictions)"""
+        if self.render_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.render_cache.info()}
     
     def cleanup(self):
         """Cleanup resources"""
-        self.render_executor.shutdown(wait=True)
+        self.render_farm.shutdown(wait=True)
         logger.info("Animation renderer cleaned up")
 
 class AnimationEngine:
     """Main animation engine interface"""
     
-    def __init__(self, max_concurrent_renders: int = 4):
-        self.renderer = AnimationRenderer(max_concurrent_renders)
-        self.version = "1.0.0"
+    def __init__(self, max_concurrent_renders: int = 4, max_queue_size: Optional[int] = None, **renderer_options):
+        self.renderer = AnimationRenderer(max_concurrent_renders, max_queue_size, **renderer_options)
+        self.version = RENDERER_VERSION
         self.logger = logging.getLogger(__name__)
     
     async def render_scene(self, scene_class: type, output_path: str = None, **kwargs) -> RenderResult:
@@ -267,15 +461,15 @@ class AnimationEngine:
         return await self.renderer.render_animation(request)
     
     async def batch_render(self, requests: List[RenderRequest]) -> List[RenderResult]:
-        """Render multiple scenes in batch"""
-        tasks = [self.renderer.render_animation(req) for req in requests]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        """Render multiple scenes in batch on the render farm"""
+        return await self.renderer.render_batch(requests)
     
     def get_engine_status(self) -> Dict[str, Any]:
         """Get overall engine status"""
         return {
             "version": self.version,
             "renderer_status": self.renderer.get_queue_status(),
+            "cache_status": self.renderer.get_cache_status(),
             "active": True
         }
     
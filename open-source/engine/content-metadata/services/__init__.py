@@ -24,9 +24,20 @@ from .graph.engine import (
     GraphEdge,
     PathResult,
     GraphStats,
+    GraphChangeset,
     RelationshipType
 )
 
+from .graph.compact import (
+    CompactGraphIndex,
+    BitsetClosureCache
+)
+
+from .graph.snapshot import (
+    GraphSnapshotReader,
+    SnapshotFormatError
+)
+
 from .graph.linker import (
     InterdisciplinaryLinker,
     CrossSubjectLink,
@@ -111,7 +122,12 @@ __all__ = [
     'GraphEdge',
     'PathResult',
     'GraphStats',
+    'GraphChangeset',
     'RelationshipType',
+    'CompactGraphIndex',
+    'BitsetClosureCache',
+    'GraphSnapshotReader',
+    'SnapshotFormatError',
     
     # Cross-subject linking
     'InterdisciplinaryLinker',
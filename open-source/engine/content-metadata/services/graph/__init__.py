@@ -14,9 +14,23 @@ from .engine import (
     GraphEdge,
     PathResult,
     GraphStats,
+    GraphChangeset,
     RelationshipType
 )
 
+from .compact import (
+    CompactGraphIndex,
+    BitsetClosureCache
+)
+
+from .snapshot import (
+    GraphSnapshotReader,
+    SnapshotFormatError,
+    write_snapshot,
+    append_delta,
+    read_deltas
+)
+
 from .linker import (
     InterdisciplinaryLinker,
     CrossSubjectLink,
@@ -32,8 +46,20 @@ __all__ = [
     'GraphEdge',
     'PathResult',
     'GraphStats',
+    'GraphChangeset',
     'RelationshipType',
     
+    # Compact index
+    'CompactGraphIndex',
+    'BitsetClosureCache',
+    
+    # Snapshots
+    'GraphSnapshotReader',
+    'SnapshotFormatError',
+    'write_snapshot',
+    'append_delta',
+    'read_deltas',
+    
     # Linker
     'InterdisciplinaryLinker',
     'CrossSubjectLink',
@@ -0,0 +1,287 @@
+"""
+Compact Graph Index for VisualVerse Content Metadata Layer
+
+This module provides an array-backed representation of the dependency graph
+for fast transitive prerequisite queries. Concept IDs are interned to
+integers, forward and reverse adjacency are stored in CSR (compressed sparse
+row) form, and transitive ancestor/descendant sets are cached as bitmaps.
+
+The index is a read-side accelerator: DependencyGraphEngine keeps its
+NetworkX graph for mutation, path finding and analysis, so enabling the
+index adds its arrays and bitmaps to the engine's footprint rather than
+replacing the NetworkX storage.
+
+Licensed under the Apache License, Version 2.0
+"""
+
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+from array import array
+from collections import OrderedDict
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class BitsetClosureCache:
+    """
+    LRU-bounded cache of transitive closure bitmaps.
+    
+    Each entry maps an interned node index to a Python integer whose set bits
+    are the indexes of every node reachable from it in one direction.
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize the closure cache.
+        
+        Args:
+            maxsize: Maximum number of bitmaps to retain
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, int]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+    
+    def get(self, index: int) -> Optional[int]:
+        """Get a cached bitmap, marking it as recently used"""
+        mask = self._entries.get(index)
+        if mask is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(index)
+        self.hits += 1
+        return mask
+    
+    def peek(self, index: int) -> Optional[int]:
+        """Get a cached bitmap without touching LRU order or counters"""
+        return self._entries.get(index)
+    
+    def put(self, index: int, mask: int) -> None:
+        """Store a bitmap, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+        
+        self._entries[index] = mask
+        self._entries.move_to_end(index)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached bitmaps"""
+        self._entries.clear()
+    
+    def info(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'bytes': sum((mask.bit_length() + 7) // 8 for mask in self._entries.values())
+        }
+
+
+class CompactGraphIndex:
+    """
+    Immutable CSR snapshot of a directed graph with cached closures.
+    
+    Node IDs are interned in sorted order so that ascending bit positions in
+    a closure bitmap decode directly to a sorted list of concept IDs. The
+    index is rebuilt from scratch rather than mutated; callers invalidate it
+    when the underlying graph changes.
+    """
+    
+    def __init__(
+        self,
+        node_ids: Iterable[str],
+        edges: Iterable[Tuple[str, str]],
+        closure_cache_size: int = 256
+    ):
+        """
+        Build the index from node IDs and (source, target) pairs.
+        
+        Args:
+            node_ids: All node IDs in the graph
+            edges: Directed edges as (source_id, target_id) tuples
+            closure_cache_size: Maximum cached closure bitmaps per direction
+        """
+        self._ids: List[str] = sorted(set(node_ids))
+        self._index: Dict[str, int] = {
+            node_id: i for i, node_id in enumerate(self._ids)
+        }
+        
+        sources = array('i')
+        targets = array('i')
+        for source_id, target_id in edges:
+            sources.append(self._index[source_id])
+            targets.append(self._index[target_id])
+        
+        self._fwd_offsets, self._fwd_targets = self._build_csr(sources, targets)
+        self._rev_offsets, self._rev_targets = self._build_csr(targets, sources)
+        
+        self._ancestor_cache = BitsetClosureCache(closure_cache_size)
+        self._descendant_cache = BitsetClosureCache(closure_cache_size)
+    
+    @classmethod
+    def from_networkx(cls, graph: Any, closure_cache_size: int = 256) -> 'CompactGraphIndex':
+        """Build the index from a NetworkX DiGraph"""
+        return cls(graph.nodes(), graph.edges(), closure_cache_size)
+    
+    def _build_csr(self, rows: array, cols: array) -> Tuple[array, array]:
+        """Build CSR offset and column arrays from parallel row/column arrays"""
+        node_count = len(self._ids)
+        offsets = array('i', bytes(4 * (node_count + 1)))
+        
+        for row in rows:
+            offsets[row + 1] += 1
+        for i in range(node_count):
+            offsets[i + 1] += offsets[i]
+        
+        columns = array('i', bytes(4 * len(rows)))
+        cursor = array('i', offsets)
+        for row, col in zip(rows, cols):
+            columns[cursor[row]] = col
+            cursor[row] += 1
+        
+        return offsets, columns
+    
+    # =========================================================================
+    # Adjacency Queries
+    # =========================================================================
+    
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._index
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    @property
+    def edge_count(self) -> int:
+        """Get edge count"""
+        return len(self._fwd_targets)
+    
+    def successors(self, node_id: str) -> List[str]:
+        """Get direct successors of a node"""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        return [
+            self._ids[j]
+            for j in self._fwd_targets[self._fwd_offsets[i]:self._fwd_offsets[i + 1]]
+        ]
+    
+    def predecessors(self, node_id: str) -> List[str]:
+        """Get direct predecessors of a node"""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        return [
+            self._ids[j]
+            for j in self._rev_targets[self._rev_offsets[i]:self._rev_offsets[i + 1]]
+        ]
+    
+    # =========================================================================
+    # Transitive Closure
+    # =========================================================================
+    
+    def ancestors(self, node_id: str) -> List[str]:
+        """Get all transitive predecessors of a node, sorted by ID"""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        return self._decode(self.ancestor_mask(i))
+    
+    def descendants(self, node_id: str) -> List[str]:
+        """Get all transitive successors of a node, sorted by ID"""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        return self._decode(self.descendant_mask(i))
+    
+    def ancestor_mask(self, index: int) -> int:
+        """Get the ancestor bitmap for an interned node index"""
+        return self._closure_mask(
+            index, self._rev_offsets, self._rev_targets, self._ancestor_cache
+        )
+    
+    def descendant_mask(self, index: int) -> int:
+        """Get the descendant bitmap for an interned node index"""
+        return self._closure_mask(
+            index, self._fwd_offsets, self._fwd_targets, self._descendant_cache
+        )
+    
+    def _closure_mask(
+        self,
+        start: int,
+        offsets: array,
+        targets: array,
+        cache: BitsetClosureCache
+    ) -> int:
+        """
+        Compute the reachability bitmap from a node.
+        
+        Traversal stops at nodes whose own closure is already cached and
+        ORs that bitmap in instead. The start node is excluded from the
+        result, matching ``networkx.ancestors``/``descendants``.
+        """
+        cached = cache.get(start)
+        if cached is not None:
+            return cached
+        
+        visited = bytearray((len(self._ids) + 7) // 8)
+        merged = 0
+        stack = [start]
+        
+        while stack:
+            node = stack.pop()
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                byte, bit = neighbor >> 3, 1 << (neighbor & 7)
+                if visited[byte] & bit:
+                    continue
+                visited[byte] |= bit
+                
+                neighbor_mask = cache.peek(neighbor)
+                if neighbor_mask is not None:
+                    merged |= neighbor_mask
+                else:
+                    stack.append(neighbor)
+        
+        mask = (int.from_bytes(visited, 'little') | merged) & ~(1 << start)
+        cache.put(start, mask)
+        return mask
+    
+    def _decode(self, mask: int) -> List[str]:
+        """Convert a bitmap into the corresponding sorted node IDs"""
+        if not mask:
+            return []
+        
+        bits = bin(mask)[:1:-1]
+        ids = self._ids
+        result = []
+        position = bits.find('1')
+        while position != -1:
+            result.append(ids[position])
+            position = bits.find('1', position + 1)
+        return result
+    
+    def clear_cache(self) -> None:
+        """Drop all cached closure bitmaps"""
+        self._ancestor_cache.clear()
+        self._descendant_cache.clear()
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """Get closure cache statistics for both directions"""
+        return {
+            'ancestors': self._ancestor_cache.info(),
+            'descendants': self._descendant_cache.info()
+        }
+    
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the CSR arrays (excluding ID strings)"""
+        return sum(
+            a.itemsize * len(a)
+            for a in (self._fwd_offsets, self._fwd_targets,
+                      self._rev_offsets, self._rev_targets)
+        )
@@ -5,6 +5,11 @@ This module provides NetworkX-based graph operations for managing concept
 prerequisite relationships. It supports building, querying, and analyzing
 the knowledge dependency graph with periodic materialization to persistent storage.
 
+The NetworkX graph is always the engine's storage. The optional compact
+index (CSR adjacency plus closure bitmaps) is built from it and kept in
+addition to it, so enabling the index raises memory use in exchange for
+faster transitive prerequisite queries; it does not reduce the footprint.
+
 Licensed under the Apache License, Version 2.0
 """
 
@@ -12,9 +17,12 @@ from typing import List, Optional, Dict, Any, Set, Tuple, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
+import heapq
 import logging
 import json
+import math
 import pickle
+import threading
 
 try:
     import networkx as nx
@@ -23,9 +31,14 @@ except ImportError:
     NETWORKX_AVAILABLE = False
     logging.warning("NetworkX not installed. Graph operations will be limited.")
 
+from .compact import CompactGraphIndex
+
 
 logger = logging.getLogger(__name__)
 
+# Probability that a sampled centrality estimate exceeds its error bound
+CENTRALITY_FAILURE_PROBABILITY = 0.05
+
 
 class RelationshipType(str, Enum):
     """Types of relationships in the knowledge graph"""
@@ -107,6 +120,59 @@ class PathResult:
         }
 
 
+# Edge index key: (source_id, target_id, relationship_type)
+EdgeKey = Tuple[str, str, RelationshipType]
+
+
+@dataclass
+class GraphChangeset:
+    """A batch of graph mutations applied together by ``apply_changeset``"""
+    upserted_nodes: List[GraphNode] = field(default_factory=list)
+    removed_node_ids: List[str] = field(default_factory=list)
+    added_edges: List[GraphEdge] = field(default_factory=list)
+    removed_edges: List[Tuple[str, str, Optional[RelationshipType]]] = field(default_factory=list)
+    
+    @property
+    def is_empty(self) -> bool:
+        """Check if the changeset contains no mutations"""
+        return not (self.upserted_nodes or self.removed_node_ids or
+                    self.added_edges or self.removed_edges)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'upserted_nodes': [node.to_dict() for node in self.upserted_nodes],
+            'removed_node_ids': self.removed_node_ids,
+            'added_edges': [edge.to_dict() for edge in self.added_edges],
+            'removed_edges': [
+                [source_id, target_id, rel_type.value if rel_type else None]
+                for source_id, target_id, rel_type in self.removed_edges
+            ]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GraphChangeset':
+        """Create a changeset from its dictionary form"""
+        return cls(
+            upserted_nodes=[GraphNode(**node) for node in data.get('upserted_nodes', [])],
+            removed_node_ids=list(data.get('removed_node_ids', [])),
+            added_edges=[
+                GraphEdge(
+                    source_id=edge['source_id'],
+                    target_id=edge['target_id'],
+                    relationship_type=RelationshipType(edge['relationship_type']),
+                    strength=edge.get('strength', 1.0),
+                    metadata=edge.get('metadata', {})
+                )
+                for edge in data.get('added_edges', [])
+            ],
+            removed_edges=[
+                (source_id, target_id, RelationshipType(rel_type) if rel_type else None)
+                for source_id, target_id, rel_type in data.get('removed_edges', [])
+            ]
+        )
+
+
 class GraphStats:
     """Statistics about the dependency graph"""
     
@@ -116,8 +182,10 @@ class GraphStats:
         self.subject_counts: Dict[str, int] = {}
         self.difficulty_distribution: Dict[str, int] = {}
         self.cycle_count: int = 0
+        self.cycle_mode: str = "scc"  # 'scc' counts cyclic components, 'enumerate' simple cycles
         self.isolated_nodes: List[str] = []
         self.central_concepts: List[Dict[str, Any]] = []
+        self.centrality_status: str = "exact"  # 'exact', 'approximate', 'stale' or 'pending'
         self.last_refreshed: Optional[datetime] = None
         self.materialization_version: str = ""
     
@@ -129,8 +197,10 @@ class GraphStats:
             'subject_counts': self.subject_counts,
             'difficulty_distribution': self.difficulty_distribution,
             'cycle_count': self.cycle_count,
+            'cycle_mode': self.cycle_mode,
             'isolated_nodes': self.isolated_nodes,
             'central_concepts': self.central_concepts,
+            'centrality_status': self.centrality_status,
             'last_refreshed': self.last_refreshed.isoformat() if self.last_refreshed else None,
             'materialization_version': self.materialization_version
         }
@@ -144,20 +214,113 @@ class DependencyGraphEngine:
     learning path finding, and knowledge structure analysis. It supports
     periodic materialization to enable persistence without requiring a
     dedicated graph database.
+    
+    With ``compact_index=True``, transitive prerequisite and dependent
+    queries are answered from a CSR snapshot with cached closure bitmaps
+    (see ``CompactGraphIndex``) instead of traversing the NetworkX graph.
+    The index is kept alongside the NetworkX graph, so it trades extra
+    memory for faster closure queries.
+    
+    A topological order of the graph (minus known cycle-closing edges) is
+    maintained online, so ``add_edge`` detects cycle-creating edges without
+    a full-graph sweep and either flags or rejects them.
+    
+    Betweenness centrality is cached until the graph is next mutated. Large
+    graphs can use pivot sampling with a bounded additive error, and the
+    computation can be moved to a background thread so statistics calls
+    return the last known ranking instead of blocking.
     """
     
-    def __init__(self):
-        """Initialize the dependency graph engine"""
+    def __init__(
+        self,
+        compact_index: bool = False,
+        closure_cache_size: int = 256,
+        reject_cycles: bool = False,
+        centrality_error: Optional[float] = None,
+        centrality_exact_limit: int = 2000,
+        background_centrality: bool = False
+    ):
+        """
+        Initialize the dependency graph engine.
+        
+        Args:
+            compact_index: Serve recursive prerequisite queries from a compact index
+                held in addition to the NetworkX graph (more memory, faster closures)
+            closure_cache_size: Maximum closure bitmaps cached per direction
+            reject_cycles: Refuse edges that would create a cycle instead of flagging them
+            centrality_error: Additive error bound on normalized betweenness for
+                sampled centrality; None always computes it exactly
+            centrality_exact_limit: Graphs with at most this many nodes always
+                use exact centrality
+            background_centrality: Compute centrality for statistics in a
+                background thread instead of blocking
+        """
         if not NETWORKX_AVAILABLE:
             raise RuntimeError("NetworkX is required for graph operations. Install with: pip install networkx")
         
         self._graph: nx.DiGraph = nx.DiGraph()
         self._nodes: Dict[str, GraphNode] = {}
-        self._edges: List[GraphEdge] = []
+        self._edges: Dict[EdgeKey, GraphEdge] = {}
+        self._out_edges: Dict[str, Set[EdgeKey]] = {}  # source_id -> incident edge keys
+        self._in_edges: Dict[str, Set[EdgeKey]] = {}  # target_id -> incident edge keys
         self._subject_index: Dict[str, Set[str]] = {}  # subject_id -> set of concept IDs
         self._difficulty_index: Dict[str, Set[str]] = {}  # difficulty -> set of concept IDs
         self._last_built: Optional[datetime] = None
         self._materialization_version: str = ""
+        
+        # Longest-path depth index (concept ID -> depth)
+        self._depth_index: Dict[str, int] = {}
+        self._depth_has_cycles: bool = False
+        self._depth_dirty: bool = True
+        
+        # Compact CSR index, rebuilt lazily after mutations
+        self._use_compact_index = compact_index
+        self._closure_cache_size = closure_cache_size
+        self._compact: Optional[CompactGraphIndex] = None
+        
+        # Dynamic topological order over the graph minus cycle-closing edges
+        self._reject_cycles = reject_cycles
+        self._topo_order: Dict[str, int] = {}
+        self._next_order: int = 0
+        self._cycle_edges: Set[Tuple[str, str]] = set()
+        
+        # Betweenness centrality cache, valid for one mutation generation
+        self._generation: int = 0
+        self._centrality_error = centrality_error
+        self._centrality_exact_limit = centrality_exact_limit
+        self._background_centrality = background_centrality
+        self._centrality: Optional[Dict[str, float]] = None
+        self._centrality_generation: int = -1
+        self._centrality_approximate: bool = False
+        self._centrality_lock = threading.Lock()
+        self._centrality_worker: Optional[threading.Thread] = None
+        
+        # Callbacks notified of node changes, for indexes kept outside the engine
+        self._node_listeners: List[Callable[[Optional[str], Optional[GraphNode]], None]] = []
+    
+    def _invalidate_caches(self) -> None:
+        """Drop indexes derived from the graph structure after a mutation"""
+        self._compact = None
+        self._generation += 1
+    
+    def add_node_listener(
+        self,
+        listener: Callable[[Optional[str], Optional[GraphNode]], None]
+    ) -> None:
+        """
+        Register a callback for node changes.
+        
+        The listener is called as ``listener(node_id, node)`` after a node is
+        added or replaced, ``listener(node_id, None)`` after it is removed,
+        and ``listener(None, None)`` when the whole node set is replaced
+        (``build_graph`` and deserialization).
+        """
+        self._node_listeners.append(listener)
+    
+    def _notify_node(self, node_id: Optional[str], node: Optional[GraphNode]) -> None:
+        """Tell registered listeners about a node change"""
+        for listener in self._node_listeners:
+            listener(node_id, node)
     
     # =========================================================================
     # Graph Building and Maintenance
@@ -166,7 +329,8 @@ class DependencyGraphEngine:
     def build_graph(
         self,
         concepts: List[Dict[str, Any]],
-        relationships: List[Dict[str, Any]]
+        relationships: List[Dict[str, Any]],
+        cycle_mode: str = "scc"
     ) -> GraphStats:
         """
         Build the dependency graph from concept and relationship data.
@@ -174,15 +338,20 @@ class DependencyGraphEngine:
         Args:
             concepts: List of concept dictionaries with id, name, subject_id, etc.
             relationships: List of relationship dictionaries with source, target, type
-            
+            cycle_mode: How statistics report cycles ('scc' or 'enumerate')
+        
         Returns:
             GraphStats with graph statistics
         """
         self._graph.clear()
         self._nodes.clear()
         self._edges.clear()
+        self._out_edges.clear()
+        self._in_edges.clear()
         self._subject_index.clear()
         self._difficulty_index.clear()
+        self._invalidate_caches()
+        self._notify_node(None, None)
         
         # Add nodes
         for concept_data in concepts:
@@ -195,9 +364,11 @@ class DependencyGraphEngine:
         
         # Build indexes
         self._build_indexes()
+        self._build_depth_index()
+        self._build_topological_order()
         
         # Calculate statistics
-        stats = self._calculate_stats()
+        stats = self._calculate_stats(cycle_mode)
         self._last_built = datetime.now()
         
         return stats
@@ -222,6 +393,7 @@ class DependencyGraphEngine:
     
     def _add_node(self, node: GraphNode) -> None:
         """Add a node to the graph"""
+        self._invalidate_caches()
         self._nodes[node.id] = node
         self._graph.add_node(
             node.id,
@@ -232,6 +404,7 @@ class DependencyGraphEngine:
             duration_minutes=node.duration_minutes,
             tags=node.tags
         )
+        self._notify_node(node.id, node)
     
     def _add_edge_from_data(self, data: Dict[str, Any]) -> None:
         """Add an edge from relationship data"""
@@ -250,20 +423,27 @@ class DependencyGraphEngine:
             except ValueError:
                 rel_type = RelationshipType.PREREQUISITE
         
-        edge = GraphEdge(
+        self._store_edge(GraphEdge(
             source_id=source,
             target_id=target,
             relationship_type=rel_type,
             strength=strength,
             metadata=data.get('metadata', {})
-        )
-        self._edges.append(edge)
+        ))
+    
+    def _store_edge(self, edge: GraphEdge) -> None:
+        """Insert or replace an edge in the edge index and NetworkX graph"""
+        key = (edge.source_id, edge.target_id, edge.relationship_type)
+        self._edges[key] = edge
+        self._out_edges.setdefault(edge.source_id, set()).add(key)
+        self._in_edges.setdefault(edge.target_id, set()).add(key)
+        self._invalidate_caches()
         
         self._graph.add_edge(
-            source,
-            target,
-            relationship_type=rel_type.value,
-            strength=strength
+            edge.source_id,
+            edge.target_id,
+            relationship_type=edge.relationship_type.value,
+            strength=edge.strength
         )
     
     def _build_indexes(self) -> None:
@@ -280,9 +460,21 @@ class DependencyGraphEngine:
             self._difficulty_index[node.difficulty_level].add(node_id)
     
     def add_node(self, node: GraphNode) -> None:
-        """Add a single node to the graph"""
+        """Add a single node to the graph, replacing any node with the same ID"""
+        existing = self._nodes.get(node.id)
+        if existing:
+            self._subject_index.get(existing.subject_id, set()).discard(node.id)
+            self._difficulty_index.get(existing.difficulty_level, set()).discard(node.id)
+        
         self._add_node(node)
         
+        # Re-adding an existing node keeps its edges and therefore its depth
+        if not self._depth_dirty:
+            self._depth_index.setdefault(node.id, 0)
+        if node.id not in self._topo_order:
+            self._topo_order[node.id] = self._next_order
+            self._next_order += 1
+        
         # Update indexes
         if node.subject_id not in self._subject_index:
             self._subject_index[node.subject_id] = set()
@@ -302,6 +494,9 @@ class DependencyGraphEngine:
         """
         Add an edge between two nodes.
         
+        Adding an edge that already exists with the same relationship type
+        replaces it.
+        
         Args:
             source_id: Source node ID
             target_id: Target node ID
@@ -309,8 +504,25 @@ class DependencyGraphEngine:
             strength: Relationship strength (0.0 to 1.0)
             
         Returns:
-            True if edge was added successfully
+            True if edge was added successfully. Cycle-creating edges return
+            False when the engine rejects cycles, otherwise they are added and
+            recorded in ``get_cycle_edges()``.
         """
+        if not self._link_edge(GraphEdge(
+            source_id=source_id,
+            target_id=target_id,
+            relationship_type=relationship_type,
+            strength=strength
+        )):
+            return False
+        
+        self._raise_depths(source_id, target_id)
+        return True
+    
+    def _link_edge(self, edge: GraphEdge) -> bool:
+        """Check an edge against existing nodes and the topological order, then store it"""
+        source_id, target_id = edge.source_id, edge.target_id
+        
         if source_id not in self._nodes:
             logger.warning(f"Source node {source_id} not found")
             return False
@@ -319,21 +531,15 @@ class DependencyGraphEngine:
             logger.warning(f"Target node {target_id} not found")
             return False
         
-        edge = GraphEdge(
-            source_id=source_id,
-            target_id=target_id,
-            relationship_type=relationship_type,
-            strength=strength
-        )
-        self._edges.append(edge)
-        
-        self._graph.add_edge(
-            source_id,
-            target_id,
-            relationship_type=relationship_type.value,
-            strength=strength
-        )
+        if not self._graph.has_edge(source_id, target_id):
+            if not self._insert_ordered_edge(source_id, target_id):
+                if self._reject_cycles:
+                    logger.warning(f"Rejected edge {source_id} -> {target_id}: creates a cycle")
+                    return False
+                logger.warning(f"Edge {source_id} -> {target_id} creates a cycle")
+                self._cycle_edges.add((source_id, target_id))
         
+        self._store_edge(edge)
         return True
     
     def remove_node(self, node_id: str) -> bool:
@@ -341,24 +547,47 @@ class DependencyGraphEngine:
         if node_id not in self._nodes:
             return False
         
+        successors = self._unlink_node(node_id)
+        self._lower_depths(successors)
+        if self._cycle_edges:
+            self._readmit_cycle_edges()
+        
+        return True
+    
+    def _unlink_node(self, node_id: str) -> List[str]:
+        """
+        Remove a node and its incident edges in O(degree).
+        
+        Returns:
+            The node's former successors, whose depth may need lowering
+        """
         # Remove from indexes
-        node = self._nodes[node_id]
+        node = self._nodes.pop(node_id)
         if node.subject_id in self._subject_index:
             self._subject_index[node.subject_id].discard(node_id)
         if node.difficulty_level in self._difficulty_index:
             self._difficulty_index[node.difficulty_level].discard(node_id)
         
+        # Remove incident edges
+        for key in self._out_edges.pop(node_id, set()):
+            self._edges.pop(key, None)
+            self._in_edges.get(key[1], set()).discard(key)
+        for key in self._in_edges.pop(node_id, set()):
+            self._edges.pop(key, None)
+            self._out_edges.get(key[0], set()).discard(key)
+        
         # Remove node
-        del self._nodes[node_id]
+        self._invalidate_caches()
+        successors = [s for s in self._graph.successors(node_id) if s != node_id]
         self._graph.remove_node(node_id)
         
-        # Remove associated edges
-        self._edges = [
-            e for e in self._edges
-            if e.source_id != node_id and e.target_id != node_id
-        ]
+        if not self._depth_dirty:
+            self._depth_index.pop(node_id, None)
+        self._topo_order.pop(node_id, None)
+        self._cycle_edges = {e for e in self._cycle_edges if node_id not in e}
+        self._notify_node(node_id, None)
         
-        return True
+        return successors
     
     def remove_edge(
         self,
@@ -366,22 +595,122 @@ class DependencyGraphEngine:
         target_id: str,
         relationship_type: Optional[RelationshipType] = None
     ) -> bool:
-        """Remove an edge from the graph"""
-        for i, edge in enumerate(self._edges):
-            if (edge.source_id == source_id and
-                edge.target_id == target_id and
-                (relationship_type is None or edge.relationship_type == relationship_type)):
-                self._edges.pop(i)
-                
-                # Remove from NetworkX graph
-                try:
-                    self._graph.remove_edge(source_id, target_id)
-                except nx.NetworkXError:
-                    pass
-                
-                return True
+        """
+        Remove an edge from the graph.
+        
+        Args:
+            source_id: Source node ID
+            target_id: Target node ID
+            relationship_type: Type to remove, or None for every relationship
+                between the two nodes
+        
+        Returns:
+            True if at least one edge was removed
+        """
+        was_cycle_edge = (source_id, target_id) in self._cycle_edges
+        if not self._unlink_edges(source_id, target_id, relationship_type):
+            return False
+        
+        if not self._graph.has_edge(source_id, target_id):
+            if source_id != target_id:
+                self._lower_depths([target_id])
+            if not was_cycle_edge and self._cycle_edges:
+                self._readmit_cycle_edges()
+        
+        return True
+    
+    def _unlink_edges(
+        self,
+        source_id: str,
+        target_id: str,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> int:
+        """
+        Remove matching edges in O(out-degree of the source).
+        
+        The NetworkX edge is dropped once no relationship remains between
+        the two nodes.
+        
+        Returns:
+            Number of edges removed
+        """
+        outgoing = self._out_edges.get(source_id)
+        if not outgoing:
+            return 0
+        
+        keys = [
+            key for key in outgoing
+            if key[1] == target_id and
+            (relationship_type is None or key[2] == relationship_type)
+        ]
+        for key in keys:
+            del self._edges[key]
+            outgoing.discard(key)
+            self._in_edges[target_id].discard(key)
+        
+        if keys:
+            self._invalidate_caches()
+            if not any(key[1] == target_id for key in outgoing):
+                self._graph.remove_edge(source_id, target_id)
+                self._cycle_edges.discard((source_id, target_id))
+        
+        return len(keys)
+    
+    def apply_changeset(self, changeset: GraphChangeset) -> Dict[str, int]:
+        """
+        Apply a batch of mutations, recomputing derived indexes once.
+        
+        Mutations are applied in the order: node upserts, node removals,
+        edge additions, edge removals. Upserted nodes keep their existing
+        edges. The depth index is rebuilt and flagged cycle edges are
+        re-checked once at the end rather than after every mutation.
+        
+        Args:
+            changeset: The mutations to apply
+        
+        Returns:
+            Counts of applied mutations
+        """
+        summary = {
+            'nodes_added': 0,
+            'nodes_updated': 0,
+            'nodes_removed': 0,
+            'edges_added': 0,
+            'edges_removed': 0,
+            'edges_rejected': 0
+        }
+        
+        # Suspend incremental depth maintenance for the batch
+        self._depth_dirty = True
+        
+        for node in changeset.upserted_nodes:
+            if node.id in self._nodes:
+                summary['nodes_updated'] += 1
+            else:
+                summary['nodes_added'] += 1
+            self.add_node(node)
+        
+        for node_id in changeset.removed_node_ids:
+            if node_id in self._nodes:
+                self._unlink_node(node_id)
+                summary['nodes_removed'] += 1
+        
+        for edge in changeset.added_edges:
+            if self._link_edge(edge):
+                summary['edges_added'] += 1
+            else:
+                summary['edges_rejected'] += 1
+        
+        for source_id, target_id, relationship_type in changeset.removed_edges:
+            summary['edges_removed'] += self._unlink_edges(
+                source_id, target_id, relationship_type
+            )
+        
+        if self._cycle_edges and (summary['nodes_removed'] or summary['edges_removed']):
+            self._readmit_cycle_edges()
+        self._build_depth_index()
         
-        return False
+        return summary
     
     # =========================================================================
     # Prerequisite and Dependency Queries
@@ -408,6 +737,9 @@ class DependencyGraphEngine:
             return []
         
         if recursive:
+            if self._use_compact_index:
+                return self._get_compact_index().ancestors(concept_id)
+            
             # Use NetworkX ancestors for transitive closure
             prereqs = list(nx.ancestors(self._graph, concept_id))
             return sorted(prereqs)
@@ -416,15 +748,11 @@ class DependencyGraphEngine:
             prereqs = list(self._graph.predecessors(concept_id))
             
             if relationship_types:
-                filtered = []
-                for prereq_id in prereqs:
-                    for edge in self._edges:
-                        if (edge.source_id == prereq_id and
-                            edge.target_id == concept_id and
-                            edge.relationship_type in relationship_types):
-                            filtered.append(prereq_id)
-                            break
-                return filtered
+                matching = {
+                    key[0] for key in self._in_edges.get(concept_id, ())
+                    if key[2] in relationship_types
+                }
+                return [prereq_id for prereq_id in prereqs if prereq_id in matching]
             
             return prereqs
     
@@ -447,6 +775,9 @@ class DependencyGraphEngine:
             return []
         
         if recursive:
+            if self._use_compact_index:
+                return self._get_compact_index().descendants(concept_id)
+            
             # Use NetworkX descendants for transitive closure
             postreqs = list(nx.descendants(self._graph, concept_id))
             return sorted(postreqs)
@@ -457,18 +788,30 @@ class DependencyGraphEngine:
         """Get direct prerequisites with full metadata"""
         result = []
         
-        for edge in self._edges:
-            if edge.target_id == concept_id:
-                source = self._nodes.get(edge.source_id)
-                if source:
-                    result.append({
-                        'concept': source.to_dict(),
-                        'relationship_type': edge.relationship_type.value,
-                        'strength': edge.strength
-                    })
+        for key in sorted(self._in_edges.get(concept_id, ())):
+            edge = self._edges[key]
+            source = self._nodes.get(edge.source_id)
+            if source:
+                result.append({
+                    'concept': source.to_dict(),
+                    'relationship_type': edge.relationship_type.value,
+                    'strength': edge.strength
+                })
         
         return result
     
+    def _get_compact_index(self) -> CompactGraphIndex:
+        """Get the compact index, rebuilding it if the graph has changed"""
+        if self._compact is None:
+            self._compact = CompactGraphIndex.from_networkx(
+                self._graph, self._closure_cache_size
+            )
+        return self._compact
+    
+    def get_compact_index(self) -> CompactGraphIndex:
+        """Get the compact CSR index for the current graph"""
+        return self._get_compact_index()
+    
     # =========================================================================
     # Path Finding
     # =========================================================================
@@ -690,6 +1033,42 @@ class DependencyGraphEngine:
         
         return results
     
+    def find_cyclic_components(self) -> List[List[str]]:
+        """
+        Find strongly connected components that contain a cycle.
+        
+        Unlike ``detect_cycles``, this runs in O(V + E) regardless of how
+        many distinct cycles the components contain.
+        
+        Returns:
+            List of components, each a sorted list of concept IDs
+        """
+        components = []
+        
+        for component in nx.strongly_connected_components(self._graph):
+            if len(component) > 1:
+                components.append(sorted(component))
+            else:
+                node_id = next(iter(component))
+                if self._graph.has_edge(node_id, node_id):
+                    components.append([node_id])
+        
+        return components
+    
+    def get_cycle_edges(self) -> List[Tuple[str, str]]:
+        """
+        Get edges that closed a cycle when they were added.
+        
+        Returns:
+            Sorted list of (source_id, target_id) tuples
+        """
+        return sorted(self._cycle_edges)
+    
+    @property
+    def has_cycles(self) -> bool:
+        """Check if the graph contains a cycle"""
+        return bool(self._cycle_edges)
+    
     def find_isolated_concepts(self) -> List[Dict[str, Any]]:
         """
         Find concepts with no connections.
@@ -707,31 +1086,31 @@ class DependencyGraphEngine:
         
         return isolated
     
-    def find_central_concepts(self, top_n: int = 10) -> List[Dict[str, Any]]:
+    def find_central_concepts(self, top_n: int = 10, wait: bool = True) -> List[Dict[str, Any]]:
         """
         Find the most central concepts using betweenness centrality.
         
         Args:
             top_n: Number of top concepts to return
-            
+            wait: Block on computing centrality if the cached result is stale;
+                otherwise start a background computation and rank with the
+                last known result
+        
         Returns:
             List of central concept information
         """
         if len(self._graph) == 0:
             return []
         
-        # Calculate betweenness centrality
-        centrality = nx.betweenness_centrality(self._graph)
+        centrality = self.get_centrality(wait)
+        if not centrality:
+            return []
         
         # Sort by centrality
-        sorted_concepts = sorted(
-            centrality.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
+        top_concepts = heapq.nlargest(top_n, centrality.items(), key=lambda x: x[1])
         
         results = []
-        for concept_id, centrality_score in sorted_concepts:
+        for concept_id, centrality_score in top_concepts:
             node = self._nodes.get(concept_id)
             if node:
                 result = node.to_dict()
@@ -740,6 +1119,109 @@ class DependencyGraphEngine:
         
         return results
     
+    def get_centrality(self, wait: bool = True) -> Optional[Dict[str, float]]:
+        """
+        Get betweenness centrality for all concepts.
+        
+        Args:
+            wait: Compute synchronously if the cache is stale; otherwise
+                start a background computation and return the last result
+        
+        Returns:
+            Centrality by concept ID, or None if nothing has been computed yet
+        """
+        with self._centrality_lock:
+            if self._centrality_generation == self._generation:
+                return self._centrality
+            stale = self._centrality
+        
+        if not wait:
+            self._start_centrality_worker()
+            return stale
+        
+        generation = self._generation
+        sample_size = self._centrality_sample_size(len(self._graph))
+        centrality = self._compute_centrality(self._graph, sample_size)
+        self._store_centrality(centrality, generation, sample_size is not None)
+        return centrality
+    
+    def get_centrality_status(self) -> str:
+        """Get whether cached centrality is 'exact', 'approximate', 'stale' or 'pending'"""
+        with self._centrality_lock:
+            if self._centrality is None:
+                return 'pending'
+            if self._centrality_generation != self._generation:
+                return 'stale'
+            return 'approximate' if self._centrality_approximate else 'exact'
+    
+    def wait_for_centrality(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a running background centrality computation.
+        
+        Returns:
+            True if the cached centrality is current for the graph
+        """
+        worker = self._centrality_worker
+        if worker is not None:
+            worker.join(timeout)
+        return self._centrality_generation == self._generation
+    
+    def _centrality_sample_size(self, node_count: int) -> Optional[int]:
+        """
+        Get the number of pivots needed to meet the configured error bound.
+        
+        By Hoeffding's inequality with a union bound over all nodes, k pivots
+        keep every normalized score within ``centrality_error`` of the exact
+        value with probability 1 - CENTRALITY_FAILURE_PROBABILITY when
+        k >= ln(2n / p) / (2 * error^2). Returns None for exact computation.
+        """
+        if self._centrality_error is None or node_count <= self._centrality_exact_limit:
+            return None
+        
+        sample_size = math.ceil(
+            math.log(2 * node_count / CENTRALITY_FAILURE_PROBABILITY)
+            / (2 * self._centrality_error ** 2)
+        )
+        return sample_size if sample_size < node_count else None
+    
+    def _compute_centrality(self, graph: nx.DiGraph, sample_size: Optional[int]) -> Dict[str, float]:
+        """Compute exact or pivot-sampled betweenness centrality"""
+        if sample_size is None:
+            return nx.betweenness_centrality(graph)
+        return nx.betweenness_centrality(graph, k=sample_size, seed=0)
+    
+    def _store_centrality(self, centrality: Dict[str, float], generation: int, approximate: bool) -> None:
+        """Cache a centrality result unless a newer one is already cached"""
+        with self._centrality_lock:
+            if generation >= self._centrality_generation:
+                self._centrality = centrality
+                self._centrality_generation = generation
+                self._centrality_approximate = approximate
+    
+    def _start_centrality_worker(self) -> None:
+        """Compute centrality for the current graph in a background thread"""
+        with self._centrality_lock:
+            if self._centrality_worker is not None and self._centrality_worker.is_alive():
+                return
+            
+            # The worker runs on a copy so later mutations cannot race with it
+            generation = self._generation
+            graph = self._graph.copy()
+            sample_size = self._centrality_sample_size(len(graph))
+            
+            def run() -> None:
+                try:
+                    centrality = self._compute_centrality(graph, sample_size)
+                except Exception as e:
+                    logger.warning(f"Background centrality computation failed: {e}")
+                    return
+                self._store_centrality(centrality, generation, sample_size is not None)
+            
+            self._centrality_worker = threading.Thread(
+                target=run, name="graph-centrality", daemon=True
+            )
+            self._centrality_worker.start()
+    
     def find_foundational_concepts(self, top_n: int = 10) -> List[Dict[str, Any]]:
         """
         Find foundational concepts (prerequisites for many others).
@@ -778,7 +1260,8 @@ class DependencyGraphEngine:
         """
         Calculate the depth of a concept in the dependency tree.
         
-        Depth is the length of the longest path from any root node.
+        Depth is the length of the longest path from any root node. Concepts
+        that form a cycle share a single depth (see ``_build_depth_index``).
         
         Args:
             concept_id: The concept ID
@@ -789,20 +1272,242 @@ class DependencyGraphEngine:
         if concept_id not in self._graph:
             return -1
         
-        # Find all predecessors
-        predecessors = list(nx.ancestors(self._graph, concept_id))
+        self._ensure_depth_index()
+        return self._depth_index.get(concept_id, 0)
+    
+    def get_all_concept_depths(self) -> Dict[str, int]:
+        """
+        Get the depth of every concept in the graph.
+        
+        Returns:
+            Dictionary mapping concept ID to depth
+        """
+        self._ensure_depth_index()
+        return dict(self._depth_index)
+    
+    # =========================================================================
+    # Depth Index
+    # =========================================================================
+    
+    def _build_depth_index(self) -> None:
+        """
+        Compute the depth of every concept in a single topological pass.
         
-        if not predecessors:
-            return 0
+        The graph is condensed into its strongly connected components, so all
+        concepts on a cycle collapse into one level and share its depth.
+        Self-loops are ignored. Runs in O(V + E).
+        """
+        condensed = nx.condensation(self._graph)
+        component_depths: Dict[int, int] = {}
+        depth_index: Dict[str, int] = {}
+        has_cycles = False
+        
+        for component in nx.topological_sort(condensed):
+            depth = max(
+                (component_depths[pred] + 1 for pred in condensed.predecessors(component)),
+                default=0
+            )
+            component_depths[component] = depth
+            
+            members = condensed.nodes[component]['members']
+            if len(members) > 1:
+                has_cycles = True
+            for concept_id in members:
+                depth_index[concept_id] = depth
+        
+        self._depth_index = depth_index
+        self._depth_has_cycles = has_cycles
+        self._depth_dirty = False
+    
+    def _ensure_depth_index(self) -> None:
+        """Rebuild the depth index if a mutation invalidated it"""
+        if self._depth_dirty:
+            self._build_depth_index()
+    
+    def _raise_depths(self, source_id: str, target_id: str) -> None:
+        """
+        Propagate depth increases after the edge source -> target was added.
         
-        # Calculate longest path from any root
-        max_depth = 0
-        for prereq_id in predecessors:
-            prereq_depth = self.get_concept_depth(prereq_id)
-            if prereq_depth > max_depth:
-                max_depth = prereq_depth
+        Affected descendants are visited once each, in order of their previous
+        depth, which is a topological order of the acyclic graph. If the new
+        edge closes a cycle the index is invalidated and rebuilt lazily.
+        """
+        if self._depth_dirty or source_id == target_id:
+            return
+        if self._depth_has_cycles:
+            self._depth_dirty = True
+            return
+        
+        depths = self._depth_index
+        depths.setdefault(source_id, 0)
+        if depths[source_id] + 1 <= depths.get(target_id, 0):
+            depths.setdefault(target_id, 0)
+            return
+        
+        heap = [(depths.get(target_id, 0), target_id)]
+        queued = {target_id}
+        depths[target_id] = depths[source_id] + 1
         
-        return max_depth + 1
+        while heap:
+            _, node_id = heapq.heappop(heap)
+            child_depth = depths[node_id] + 1
+            
+            for successor in self._graph.successors(node_id):
+                if successor == node_id:
+                    continue
+                if successor == source_id:
+                    # The new edge closed a cycle
+                    self._depth_dirty = True
+                    return
+                if child_depth > depths.get(successor, 0):
+                    if successor not in queued:
+                        queued.add(successor)
+                        heapq.heappush(heap, (depths.get(successor, 0), successor))
+                    depths[successor] = child_depth
+    
+    def _lower_depths(self, start_ids: List[str]) -> None:
+        """
+        Recompute depths downstream of removed edges.
+        
+        Only descendants whose depth actually decreases are expanded, again
+        in order of their previous depth.
+        """
+        if self._depth_dirty:
+            return
+        if self._depth_has_cycles:
+            self._depth_dirty = True
+            return
+        
+        depths = self._depth_index
+        heap = [(depths.get(node_id, 0), node_id) for node_id in start_ids]
+        heapq.heapify(heap)
+        queued = set(start_ids)
+        
+        while heap:
+            _, node_id = heapq.heappop(heap)
+            depth = max(
+                (depths.get(pred, 0) + 1
+                 for pred in self._graph.predecessors(node_id) if pred != node_id),
+                default=0
+            )
+            if depth == depths.get(node_id):
+                continue
+            depths[node_id] = depth
+            
+            for successor in self._graph.successors(node_id):
+                if successor != node_id and successor not in queued:
+                    queued.add(successor)
+                    heapq.heappush(heap, (depths.get(successor, 0), successor))
+    
+    # =========================================================================
+    # Online Cycle Detection
+    # =========================================================================
+    
+    def _build_topological_order(self) -> None:
+        """
+        Compute a topological order and the set of cycle-closing edges.
+        
+        A depth-first search classifies every edge that points back to a node
+        on the current DFS stack as cycle-closing; the remaining edges form a
+        DAG whose reverse postorder becomes the initial order.
+        """
+        graph = self._graph
+        state: Dict[str, int] = {}  # 1 = on stack, 2 = finished
+        postorder: List[str] = []
+        cycle_edges: Set[Tuple[str, str]] = set()
+        
+        for root in graph.nodes():
+            if root in state:
+                continue
+            state[root] = 1
+            stack = [(root, iter(graph.successors(root)))]
+            
+            while stack:
+                node_id, successors = stack[-1]
+                for successor in successors:
+                    successor_state = state.get(successor)
+                    if successor_state is None:
+                        state[successor] = 1
+                        stack.append((successor, iter(graph.successors(successor))))
+                        break
+                    if successor_state == 1:
+                        cycle_edges.add((node_id, successor))
+                else:
+                    state[node_id] = 2
+                    postorder.append(node_id)
+                    stack.pop()
+        
+        postorder.reverse()
+        self._topo_order = {node_id: i for i, node_id in enumerate(postorder)}
+        self._next_order = len(postorder)
+        self._cycle_edges = cycle_edges
+    
+    def _insert_ordered_edge(self, source_id: str, target_id: str) -> bool:
+        """
+        Check a new edge against the topological order and repair it.
+        
+        Uses the Pearce-Kelly algorithm: when the edge violates the current
+        order, only nodes between the two endpoints' positions are searched
+        and reordered. Cycle-closing edges are ignored during the search.
+        
+        Returns:
+            False if the edge would close a cycle (the order is left unchanged)
+        """
+        if source_id == target_id:
+            return False
+        
+        order = self._topo_order
+        lower = order[target_id]
+        upper = order[source_id]
+        if upper < lower:
+            return True
+        
+        # Forward search from the target within the affected region
+        forward: List[str] = []
+        seen = {target_id}
+        stack = [target_id]
+        while stack:
+            node_id = stack.pop()
+            forward.append(node_id)
+            for successor in self._graph.successors(node_id):
+                if (node_id, successor) in self._cycle_edges:
+                    continue
+                if successor == source_id:
+                    return False
+                if successor not in seen and order[successor] < upper:
+                    seen.add(successor)
+                    stack.append(successor)
+        
+        # Backward search from the source within the affected region
+        backward: List[str] = []
+        seen = {source_id}
+        stack = [source_id]
+        while stack:
+            node_id = stack.pop()
+            backward.append(node_id)
+            for predecessor in self._graph.predecessors(node_id):
+                if (predecessor, node_id) in self._cycle_edges:
+                    continue
+                if predecessor not in seen and order[predecessor] > lower:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+        
+        # Reassign the pooled positions: ancestors first, then descendants
+        backward.sort(key=order.__getitem__)
+        forward.sort(key=order.__getitem__)
+        affected = backward + forward
+        positions = sorted(order[node_id] for node_id in affected)
+        for node_id, position in zip(affected, positions):
+            order[node_id] = position
+        
+        return True
+    
+    def _readmit_cycle_edges(self) -> None:
+        """Re-check flagged edges after a removal that may have broken their cycle"""
+        for edge in sorted(self._cycle_edges):
+            self._cycle_edges.discard(edge)
+            if not self._insert_ordered_edge(*edge):
+                self._cycle_edges.add(edge)
     
     # =========================================================================
     # Subject-Specific Queries
@@ -859,7 +1564,7 @@ class DependencyGraphEngine:
                 node_id: node.to_dict()
                 for node_id, node in self._nodes.items()
             },
-            'edges': [edge.to_dict() for edge in self._edges],
+            'edges': [edge.to_dict() for edge in self._edges.values()],
             'subject_index': {
                 subj: list(nodes)
                 for subj, nodes in self._subject_index.items()
@@ -874,7 +1579,7 @@ class DependencyGraphEngine:
         """Serialize the graph to binary format (pickle)"""
         return pickle.dumps({
             'nodes': self._nodes,
-            'edges': self._edges,
+            'edges': list(self._edges.values()),
             'subject_index': self._subject_index,
             'difficulty_index': self._difficulty_index,
             'graph': self._graph,
@@ -889,9 +1594,12 @@ class DependencyGraphEngine:
         # Clear existing
         self._nodes.clear()
         self._edges.clear()
+        self._out_edges.clear()
+        self._in_edges.clear()
         self._subject_index.clear()
         self._difficulty_index.clear()
         self._graph.clear()
+        self._notify_node(None, None)
         
         # Load nodes
         for node_id, node_data in data.get('nodes', {}).items():
@@ -908,35 +1616,43 @@ class DependencyGraphEngine:
         for edge_data in data.get('edges', []):
             try:
                 rel_type = RelationshipType(edge_data['relationship_type'])
-                edge = GraphEdge(
+                self._store_edge(GraphEdge(
                     source_id=edge_data['source_id'],
                     target_id=edge_data['target_id'],
                     relationship_type=rel_type,
-                    strength=edge_data.get('strength', 1.0)
-                )
-                self._edges.append(edge)
-                self._graph.add_edge(
-                    edge_data['source_id'],
-                    edge_data['target_id'],
-                    relationship_type=rel_type.value,
-                    strength=edge_data.get('strength', 1.0)
-                )
+                    strength=edge_data.get('strength', 1.0),
+                    metadata=edge_data.get('metadata', {})
+                ))
             except (KeyError, ValueError) as e:
                 logger.warning(f"Error loading edge: {e}")
         
         # Rebuild indexes
         self._build_indexes()
+        self._depth_dirty = True
+        self._invalidate_caches()
+        self._build_topological_order()
     
     def deserialize_binary(self, data: bytes) -> None:
         """Deserialize the graph from binary format"""
         loaded = pickle.loads(data)
         
         self._nodes = loaded['nodes']
-        self._edges = loaded['edges']
+        self._edges = {}
+        self._out_edges = {}
+        self._in_edges = {}
+        for edge in loaded['edges']:
+            key = (edge.source_id, edge.target_id, edge.relationship_type)
+            self._edges[key] = edge
+            self._out_edges.setdefault(edge.source_id, set()).add(key)
+            self._in_edges.setdefault(edge.target_id, set()).add(key)
         self._subject_index = loaded['subject_index']
         self._difficulty_index = loaded['difficulty_index']
         self._graph = loaded['graph']
         self._materialization_version = loaded.get('version', '')
+        self._depth_dirty = True
+        self._invalidate_caches()
+        self._build_topological_order()
+        self._notify_node(None, None)
     
     def set_materialization_version(self, version: str) -> None:
         """Set the materialization version"""
@@ -946,8 +1662,15 @@ class DependencyGraphEngine:
     # Statistics
     # =========================================================================
     
-    def _calculate_stats(self) -> GraphStats:
-        """Calculate graph statistics"""
+    def _calculate_stats(self, cycle_mode: str = "scc") -> GraphStats:
+        """
+        Calculate graph statistics.
+        
+        Args:
+            cycle_mode: 'scc' counts cyclic strongly connected components in
+                linear time; 'enumerate' counts every simple cycle, which can
+                grow combinatorially on graphs with a few bad back-edges
+        """
         stats = GraphStats()
         
         stats.node_count = len(self._nodes)
@@ -964,7 +1687,11 @@ class DependencyGraphEngine:
             stats.difficulty_distribution[difficulty] = len(nodes)
         
         # Cycle detection
-        stats.cycle_count = len(self.detect_cycles())
+        stats.cycle_mode = cycle_mode
+        if cycle_mode == "enumerate":
+            stats.cycle_count = len(self.detect_cycles())
+        else:
+            stats.cycle_count = len(self.find_cyclic_components())
         
         # Isolated nodes
         stats.isolated_nodes = [
@@ -972,14 +1699,17 @@ class DependencyGraphEngine:
             if self._graph.degree(node_id) == 0
         ]
         
-        # Central concepts
-        stats.central_concepts = self.find_central_concepts(10)
+        # Central concepts (possibly stale while a background update runs)
+        stats.central_concepts = self.find_central_concepts(
+            10, wait=not self._background_centrality
+        )
+        stats.centrality_status = self.get_centrality_status()
         
         return stats
     
-    def get_stats(self) -> GraphStats:
+    def get_stats(self, cycle_mode: str = "scc") -> GraphStats:
         """Get current graph statistics"""
-        return self._calculate_stats()
+        return self._calculate_stats(cycle_mode)
     
     def get_graph(self) -> nx.DiGraph:
         """Get the underlying NetworkX graph"""
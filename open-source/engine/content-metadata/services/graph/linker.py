@@ -9,10 +9,11 @@ subject areas.
 Licensed under the Apache License, Version 2.0
 """
 
-from typing import List, Optional, Dict, Any, Set, Tuple
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
 import logging
 import re
 from collections import defaultdict
@@ -22,6 +23,8 @@ from .engine import DependencyGraphEngine, GraphNode, RelationshipType, PathResu
 
 logger = logging.getLogger(__name__)
 
+_WORD_PATTERN = re.compile(r'\w+')
+
 
 class TransferabilityScore(Enum):
     """Levels of concept transferability between subjects"""
@@ -114,6 +117,155 @@ class SharedPrerequisite:
         }
 
 
+@dataclass
+class ConceptTerms:
+    """Pre-tokenized text features of a concept used for similarity scoring"""
+    name: str
+    words: Set[str]
+    tags: Set[str]
+    keywords: Set[str]
+    
+    @classmethod
+    def from_values(
+        cls,
+        name: str,
+        tags: Iterable[str],
+        keywords: Iterable[str]
+    ) -> 'ConceptTerms':
+        """Tokenize a concept's name and collect its tags and keywords"""
+        name = name.lower()
+        return cls(
+            name=name,
+            words=set(_WORD_PATTERN.findall(name)),
+            tags=set(tags),
+            keywords=set(keywords)
+        )
+    
+    @classmethod
+    def from_node(cls, node: GraphNode) -> 'ConceptTerms':
+        """Build terms from a graph node"""
+        return cls.from_values(node.name, node.tags, node.metadata.get('keywords', []))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConceptTerms':
+        """Build terms from a concept dictionary (top-level or metadata keywords)"""
+        keywords = data.get('keywords') or data.get('metadata', {}).get('keywords', [])
+        return cls.from_values(data.get('name', ''), data.get('tags', []), keywords)
+    
+    def index_terms(self) -> Set[str]:
+        """
+        Get the posting-list terms for this concept.
+        
+        Names without any word characters post under an empty word so that
+        identical word-less names still meet as candidates.
+        """
+        terms = {f"w:{word}" for word in self.words} or {"w:"}
+        terms.update(f"t:{tag}" for tag in self.tags)
+        terms.update(f"k:{keyword}" for keyword in self.keywords)
+        return terms
+
+
+class ConceptTermIndex:
+    """
+    Inverted index from concept terms to the concepts that contain them.
+    
+    Posting lists are kept per subject, so candidate targets for a
+    cross-subject comparison are read off the source concept's terms
+    instead of scanning every concept in the target subject. Known bridge
+    phrases are matched against each concept's name when it is indexed.
+    """
+    
+    def __init__(self, nodes: Iterable[GraphNode], phrases: Iterable[str] = ()):
+        """
+        Build the index.
+        
+        Args:
+            nodes: Concepts to index
+            phrases: Phrases to pre-match as substrings of concept names
+        """
+        self._terms: Dict[str, ConceptTerms] = {}
+        self._subjects: Dict[str, str] = {}
+        self._postings: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._phrase_matches: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._phrases: List[str] = list(phrases)
+        
+        for node in nodes:
+            self.add(node)
+    
+    def add(self, node: GraphNode) -> None:
+        """Index a concept, replacing any entry with the same ID"""
+        if node.id in self._terms:
+            self.remove(node.id)
+        
+        terms = ConceptTerms.from_node(node)
+        self._terms[node.id] = terms
+        self._subjects[node.id] = node.subject_id
+        
+        for term in terms.index_terms():
+            self._postings[term][node.subject_id].add(node.id)
+        
+        for phrase in self._phrases:
+            if phrase in terms.name:
+                self._phrase_matches[phrase][node.subject_id].add(node.id)
+    
+    def remove(self, concept_id: str) -> None:
+        """Drop a concept from the index"""
+        terms = self._terms.pop(concept_id, None)
+        if terms is None:
+            return
+        subject_id = self._subjects.pop(concept_id)
+        
+        for term in terms.index_terms():
+            self._discard(self._postings, term, subject_id, concept_id)
+        
+        for phrase in self._phrases:
+            if phrase in terms.name:
+                self._discard(self._phrase_matches, phrase, subject_id, concept_id)
+    
+    @staticmethod
+    def _discard(
+        table: Dict[str, Dict[str, Set[str]]],
+        key: str,
+        subject_id: str,
+        concept_id: str
+    ) -> None:
+        """Remove a concept from a posting list, pruning emptied entries"""
+        subjects = table.get(key)
+        if not subjects or subject_id not in subjects:
+            return
+        
+        members = subjects[subject_id]
+        members.discard(concept_id)
+        if not members:
+            del subjects[subject_id]
+            if not subjects:
+                del table[key]
+    
+    def get_terms(self, concept_id: str) -> Optional[ConceptTerms]:
+        """Get the indexed terms of a concept"""
+        return self._terms.get(concept_id)
+    
+    def candidates(self, concept_id: str, subject_id: str) -> Set[str]:
+        """Get concepts in a subject sharing at least one term with a concept"""
+        terms = self._terms.get(concept_id)
+        if terms is None:
+            return set()
+        
+        result: Set[str] = set()
+        for term in terms.index_terms():
+            subjects = self._postings.get(term)
+            if subjects and subject_id in subjects:
+                result |= subjects[subject_id]
+        return result
+    
+    def phrase_matches(self, phrase: str, subject_id: str) -> Set[str]:
+        """Get concepts in a subject whose name contains a pre-matched phrase"""
+        subjects = self._phrase_matches.get(phrase)
+        if not subjects:
+            return set()
+        return subjects.get(subject_id, set())
+
+
 class InterdisciplinaryLinker:
     """
     Service for identifying and managing cross-subject relationships.
@@ -121,8 +273,17 @@ class InterdisciplinaryLinker:
     This linker analyzes the knowledge graph to discover connections
     between different subjects, enabling interdisciplinary learning paths
     and concept transferability analysis.
+    
+    Candidate targets are generated from a term inverted index over the
+    graph's concepts, kept current by node change notifications from the
+    engine, so only concepts sharing a name word, tag or keyword (or a
+    known bridge phrase) with the source are scored.
     """
     
+    # Highest strength a pair can reach without sharing an indexed term:
+    # name substring containment alone scores 0.3, i.e. a weak RELATED link
+    UNINDEXED_MAX_STRENGTH = 0.3 * 0.7
+    
     # Known subject bridging relationships
     SUBJECT_BRIDGES = {
         ('mathematics', 'physics'): {
@@ -180,6 +341,30 @@ class InterdisciplinaryLinker:
         self.graph = graph_engine
         self._cached_links: Dict[str, CrossSubjectLink] = {}
         self._semantic_cache: Dict[str, Dict[str, Any]] = {}
+        self._term_index: Optional[ConceptTermIndex] = None
+        self.graph.add_node_listener(self._on_node_changed)
+    
+    def _get_term_index(self) -> ConceptTermIndex:
+        """Get the term index, building it on first use after a bulk load"""
+        if self._term_index is None:
+            phrases = {
+                phrase
+                for bridge in self.SUBJECT_BRIDGES.values()
+                for phrase in bridge['shared_concepts']
+            }
+            self._term_index = ConceptTermIndex(self.graph._nodes.values(), phrases)
+        return self._term_index
+    
+    def _on_node_changed(self, node_id: Optional[str], node: Optional[GraphNode]) -> None:
+        """Keep the term index in step with node additions and removals"""
+        if node_id is None:
+            # The engine replaced its nodes wholesale
+            self._term_index = None
+        elif self._term_index is not None:
+            if node is None:
+                self._term_index.remove(node_id)
+            else:
+                self._term_index.add(node)
     
     # =========================================================================
     # Concept Transferability Analysis
@@ -213,7 +398,7 @@ class InterdisciplinaryLinker:
         links = []
         
         # Get all subjects
-        subjects = self.graph._subject_index.keys()
+        subjects = list(self.graph._subject_index.keys())
         
         for subject_id in subjects:
             if subject_id == source_node.subject_id:
@@ -222,25 +407,82 @@ class InterdisciplinaryLinker:
             if target_subject_id and subject_id != target_subject_id:
                 continue
             
-            # Find potential matches in target subject
-            target_concepts = self.graph.get_concepts_by_subject(subject_id)
-            
-            for target_concept in target_concepts:
-                transferability = self._assess_transferability(
-                    source_node,
-                    target_concept,
-                    source_node.subject_id,
-                    subject_id
-                )
-                
-                if transferability.strength >= min_strength:
-                    links.append(transferability)
+            links.extend(self._find_links_in_subject(source_node, subject_id, min_strength))
         
         # Sort by strength
         links.sort(key=lambda x: x.strength, reverse=True)
         
         return links
     
+    def _find_links_in_subject(
+        self,
+        source_node: GraphNode,
+        subject_id: str,
+        min_strength: float
+    ) -> List[CrossSubjectLink]:
+        """
+        Score candidate concepts of one subject against a source concept.
+        
+        Candidates come from the term index unless ``min_strength`` is low
+        enough that a pair sharing no term could still qualify, in which
+        case every concept in the subject is scored.
+        """
+        index = self._get_term_index()
+        
+        if min_strength <= self.UNINDEXED_MAX_STRENGTH:
+            candidate_ids = set(self.graph._subject_index.get(subject_id, ()))
+        else:
+            candidate_ids = self._bridge_candidates(source_node, subject_id, index)
+            if candidate_ids is None:
+                candidate_ids = set(self.graph._subject_index.get(subject_id, ()))
+            else:
+                candidate_ids |= index.candidates(source_node.id, subject_id)
+        
+        links = []
+        for candidate_id in sorted(candidate_ids):
+            target_node = self.graph._nodes.get(candidate_id)
+            if target_node is None:
+                continue
+            
+            transferability = self._assess_transferability(
+                source_node,
+                target_node.to_dict(),
+                source_node.subject_id,
+                subject_id
+            )
+            
+            if transferability.strength >= min_strength:
+                links.append(transferability)
+        
+        return links
+    
+    def _bridge_candidates(
+        self,
+        source_node: GraphNode,
+        subject_id: str,
+        index: ConceptTermIndex
+    ) -> Optional[Set[str]]:
+        """
+        Get target candidates implied by a known subject bridge.
+            
+        Returns:
+            None if every concept in the subject matches through the bridge
+            (the source name contains a shared concept), otherwise the
+            concepts whose names contain one
+        """
+        subject_pair = tuple(sorted([source_node.subject_id, subject_id]))
+        bridge = self.SUBJECT_BRIDGES.get(subject_pair)
+        if not bridge:
+            return set()
+        
+        source_name = source_node.name.lower()
+        candidates: Set[str] = set()
+        for shared_concept in bridge['shared_concepts']:
+            if shared_concept in source_name:
+                return None
+            candidates |= index.phrase_matches(shared_concept, subject_id)
+        return candidates
+    
     def _assess_transferability(
         self,
         source: GraphNode,
@@ -383,37 +625,40 @@ class InterdisciplinaryLinker:
         target: Dict[str, Any]
     ) -> float:
         """Calculate semantic similarity between two concepts"""
-        score = 0.0
+        index = self._term_index
+        source_terms = index.get_terms(source.id) if index else None
+        target_terms = index.get_terms(target.get('id', '')) if index else None
         
-        # Name similarity (simplified)
-        source_name = source.name.lower()
-        target_name = target.get('name', '').lower()
+        # Fall back to tokenizing concepts the index does not (yet) cover
+        if source_terms is None or source_terms.name != source.name.lower():
+            source_terms = ConceptTerms.from_node(source)
+        if target_terms is None or target_terms.name != target.get('name', '').lower():
+            target_terms = ConceptTerms.from_dict(target)
+        
+        return self._score_terms(source_terms, target_terms)
+    
+    def _score_terms(self, source: ConceptTerms, target: ConceptTerms) -> float:
+        """Score name, tag and keyword overlap between two term sets"""
+        score = 0.0
         
-        # Check for exact or partial matches
-        if source_name == target_name:
+        # Check for exact or partial name matches
+        if source.name == target.name:
             score += 0.4
-        elif source_name in target_name or target_name in source_name:
+        elif source.name in target.name or target.name in source.name:
             score += 0.3
-        else:
+        elif source.words and target.words:
             # Word overlap
-            source_words = set(re.findall(r'\w+', source_name))
-            target_words = set(re.findall(r'\w+', target_name))
-            if source_words and target_words:
-                overlap = len(source_words & target_words)
-                score += min(0.2, overlap * 0.1)
+            overlap = len(source.words & target.words)
+            score += min(0.2, overlap * 0.1)
         
         # Tag overlap
-        source_tags = set(source.tags)
-        target_tags = set(target.get('tags', []))
-        if source_tags and target_tags:
-            tag_overlap = len(source_tags & target_tags)
+        if source.tags and target.tags:
+            tag_overlap = len(source.tags & target.tags)
             score += min(0.3, tag_overlap * 0.15)
         
         # Keyword overlap
-        source_keywords = set(source.metadata.get('keywords', []))
-        target_keywords = set(target.get('keywords', []))
-        if source_keywords and target_keywords:
-            keyword_overlap = len(source_keywords & target_keywords)
+        if source.keywords and target.keywords:
+            keyword_overlap = len(source.keywords & target.keywords)
             score += min(0.3, keyword_overlap * 0.15)
         
         return min(1.0, score)
@@ -831,12 +1076,23 @@ class InterdisciplinaryLinker:
         self._cached_links.clear()
         self._semantic_cache.clear()
     
-    def refresh_cache(self, concept_ids: Optional[List[str]] = None) -> int:
+    def refresh_cache(
+        self,
+        concept_ids: Optional[List[str]] = None,
+        workers: Optional[int] = None
+    ) -> int:
         """
         Refresh the cache for specific concepts or all.
         
+        With ``workers``, the refresh is split into independent (source
+        subject, target subject) units scored in worker processes, each on
+        a private engine holding only that pair's concepts, and the links
+        are merged into the cache afterwards.
+        
         Args:
             concept_ids: Specific concepts to refresh, or None for all
+            workers: Worker processes for the subject pairs; None refreshes
+                serially
             
         Returns:
             Number of cache entries refreshed
@@ -847,11 +1103,77 @@ class InterdisciplinaryLinker:
             self.clear_cache()
             concept_ids = list(self.graph._nodes.keys())
         
+        sources_by_subject: Dict[str, List[GraphNode]] = defaultdict(list)
         for concept_id in concept_ids:
-            links = self.find_transferable_concepts(concept_id)
+            node = self.graph.get_node(concept_id)
+            if node:
+                sources_by_subject[node.subject_id].append(node)
+        
+        units = [
+            (sources, target_subject)
+            for source_subject, sources in sources_by_subject.items()
+            for target_subject in self.graph._subject_index
+            if target_subject != source_subject
+        ]
+        
+        if not workers or workers <= 1 or len(units) <= 1:
+            for concept_id in concept_ids:
+                links = self.find_transferable_concepts(concept_id)
+                for link in links:
+                    cache_key = f"{link.source_concept_id}:{link.target_subject_id}"
+                    self._cached_links[cache_key] = link
+                    refreshed += 1
+            
+            return refreshed
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(
+                _score_subject_pair,
+                [sources for sources, _ in units],
+                [self._subject_nodes(target_subject) for _, target_subject in units],
+                [target_subject for _, target_subject in units]
+            ))
+        
+        for links in parts:
             for link in links:
                 cache_key = f"{link.source_concept_id}:{link.target_subject_id}"
                 self._cached_links[cache_key] = link
                 refreshed += 1
         
         return refreshed
+    
+    def _subject_nodes(self, subject_id: str) -> List[GraphNode]:
+        """Get the graph nodes of a subject in ID order"""
+        return [
+            self.graph._nodes[node_id]
+            for node_id in sorted(self.graph._subject_index.get(subject_id, ()))
+            if node_id in self.graph._nodes
+        ]
+
+
+def _score_subject_pair(
+    sources: List[GraphNode],
+    targets: List[GraphNode],
+    target_subject_id: str,
+    min_strength: float = 0.3
+) -> List[CrossSubjectLink]:
+    """
+    Score one (source subject, target subject) unit of a cache refresh.
+    
+    Runs in a worker process on a private engine holding only the unit's
+    concepts. Each source's links are ordered strongest first, as
+    ``find_transferable_concepts`` orders them, so merging them into the
+    cache keeps the entry a serial refresh would.
+    """
+    engine = DependencyGraphEngine()
+    engine.build_graph([], [])
+    for node in sources + targets:
+        engine.add_node(node)
+    
+    linker = InterdisciplinaryLinker(engine)
+    links: List[CrossSubjectLink] = []
+    for source in sources:
+        source_links = linker._find_links_in_subject(source, target_subject_id, min_strength)
+        source_links.sort(key=lambda x: x.strength, reverse=True)
+        links.extend(source_links)
+    return links
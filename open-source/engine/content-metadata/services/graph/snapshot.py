@@ -0,0 +1,587 @@
+"""
+Columnar Graph Snapshots for VisualVerse Content Metadata Layer
+
+This module provides a versioned, memory-mappable snapshot format for the
+dependency graph. Snapshots store an interned (sorted) concept ID table,
+CSR forward/reverse edge arrays and per-node attribute columns, so readers
+can ``mmap`` a snapshot and answer node and prerequisite queries without
+deserializing the whole graph. Incremental refreshes append changesets to a
+delta log next to the base snapshot instead of rewriting it.
+
+File layout (little-endian):
+
+    header      magic, format version, node/edge/section counts
+    sections    (name, offset, length) table followed by 8-byte aligned
+                sections: JSON metadata, ID/name/extra string tables,
+                categorical attribute codes, duration column and CSR arrays
+
+Licensed under the Apache License, Version 2.0
+"""
+
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterator
+from array import array
+from datetime import datetime
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+
+from .engine import (
+    DependencyGraphEngine,
+    GraphChangeset,
+    GraphEdge,
+    GraphNode,
+    RelationshipType
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+SNAPSHOT_MAGIC = b'VVGS'
+SNAPSHOT_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<4sHHIII')
+_SECTION = struct.Struct('<8sQQ')
+_ALIGNMENT = 8
+
+# Relationship types are stored as uint8 codes in declaration order
+_RELATIONSHIP_TYPES = list(RelationshipType)
+_RELATIONSHIP_CODES = {rel_type: code for code, rel_type in enumerate(_RELATIONSHIP_TYPES)}
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a snapshot file is missing, truncated or incompatible"""
+    pass
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+def _string_table(values: List[str]) -> Tuple[array, bytes]:
+    """Encode strings as an int64 offset array plus a UTF-8 blob"""
+    offsets = array('q', [0])
+    chunks = []
+    position = 0
+    for value in values:
+        encoded = value.encode('utf-8')
+        chunks.append(encoded)
+        position += len(encoded)
+        offsets.append(position)
+    return offsets, b''.join(chunks)
+
+
+def _category_codes(values: List[str]) -> Tuple[array, List[str]]:
+    """Encode categorical strings as int32 codes into a sorted value table"""
+    table = sorted(set(values))
+    lookup = {value: code for code, value in enumerate(table)}
+    return array('i', (lookup[value] for value in values)), table
+
+
+def write_snapshot(engine: DependencyGraphEngine, path: str) -> int:
+    """
+    Write a columnar snapshot of the graph.
+    
+    The file is written to a temporary path and atomically renamed, so
+    readers never observe a partially written snapshot.
+    
+    Args:
+        engine: The graph engine to snapshot
+        path: Destination file path
+    
+    Returns:
+        Size of the written file in bytes
+    """
+    graph = engine._graph
+    node_ids = sorted(graph.nodes())
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    nodes = [engine._nodes.get(node_id) for node_id in node_ids]
+    
+    # Node attribute columns; IDs only referenced by edges have no GraphNode
+    present = array('B', (1 if node else 0 for node in nodes))
+    names = [node.name if node else '' for node in nodes]
+    subject_codes, subjects = _category_codes([node.subject_id if node else '' for node in nodes])
+    difficulty_codes, difficulties = _category_codes([node.difficulty_level if node else '' for node in nodes])
+    type_codes, concept_types = _category_codes([node.concept_type if node else '' for node in nodes])
+    durations = array('i', (node.duration_minutes if node else 0 for node in nodes))
+    extras = [
+        json.dumps({'tags': node.tags, 'metadata': node.metadata}, separators=(',', ':'))
+        if node else ''
+        for node in nodes
+    ]
+    
+    # Forward CSR ordered by (source, target, type)
+    edges = sorted(
+        engine._edges.values(),
+        key=lambda e: (index[e.source_id], index[e.target_id], _RELATIONSHIP_CODES[e.relationship_type])
+    )
+    node_count, edge_count = len(node_ids), len(edges)
+    fwd_offsets = array('q', bytes(8 * (node_count + 1)))
+    fwd_targets = array('i', (index[e.target_id] for e in edges))
+    fwd_types = array('B', (_RELATIONSHIP_CODES[e.relationship_type] for e in edges))
+    fwd_strengths = array('f', (e.strength for e in edges))
+    edge_extras = [
+        json.dumps(e.metadata, separators=(',', ':')) if e.metadata else ''
+        for e in edges
+    ]
+    for e in edges:
+        fwd_offsets[index[e.source_id] + 1] += 1
+    for i in range(node_count):
+        fwd_offsets[i + 1] += fwd_offsets[i]
+    
+    # Reverse CSR points back into the forward edge arrays
+    rev_edges = sorted(range(edge_count), key=lambda k: (fwd_targets[k], k))
+    rev_offsets = array('q', bytes(8 * (node_count + 1)))
+    for k in rev_edges:
+        rev_offsets[fwd_targets[k] + 1] += 1
+    for i in range(node_count):
+        rev_offsets[i + 1] += rev_offsets[i]
+    sources = array('i', bytes(4 * edge_count))
+    for i in range(node_count):
+        for k in range(fwd_offsets[i], fwd_offsets[i + 1]):
+            sources[k] = i
+    rev_sources = array('i', (sources[k] for k in rev_edges))
+    rev_edge_ids = array('i', rev_edges)
+    
+    id_offsets, id_blob = _string_table(node_ids)
+    name_offsets, name_blob = _string_table(names)
+    extra_offsets, extra_blob = _string_table(extras)
+    edge_extra_offsets, edge_extra_blob = _string_table(edge_extras)
+    
+    meta = {
+        'materialization_version': engine._materialization_version,
+        'created_at': datetime.now().isoformat(),
+        'subjects': subjects,
+        'difficulties': difficulties,
+        'concept_types': concept_types,
+        'relationship_types': [rel_type.value for rel_type in _RELATIONSHIP_TYPES]
+    }
+    
+    sections = [
+        (b'meta', json.dumps(meta).encode('utf-8')),
+        (b'id_off', id_offsets), (b'id_blob', id_blob),
+        (b'name_off', name_offsets), (b'name_blb', name_blob),
+        (b'xtra_off', extra_offsets), (b'xtra_blb', extra_blob),
+        (b'present', present),
+        (b'subject', subject_codes), (b'diff', difficulty_codes),
+        (b'ctype', type_codes), (b'duration', durations),
+        (b'fwd_off', fwd_offsets), (b'fwd_dst', fwd_targets),
+        (b'fwd_type', fwd_types), (b'fwd_str', fwd_strengths),
+        (b'exta_off', edge_extra_offsets), (b'exta_blb', edge_extra_blob),
+        (b'rev_off', rev_offsets), (b'rev_src', rev_sources),
+        (b'rev_edge', rev_edge_ids)
+    ]
+    
+    payloads = []
+    for name, data in sections:
+        if isinstance(data, array):
+            if sys.byteorder != 'little':
+                data = array(data.typecode, data)
+                data.byteswap()
+            data = data.tobytes()
+        payloads.append((name, data))
+    
+    table_end = _HEADER.size + _SECTION.size * len(payloads)
+    offset = -(-table_end // _ALIGNMENT) * _ALIGNMENT
+    entries = []
+    for name, data in payloads:
+        entries.append((name, offset, len(data)))
+        offset += -(-len(data) // _ALIGNMENT) * _ALIGNMENT
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, 0,
+                             node_count, edge_count, len(payloads)))
+        for name, section_offset, length in entries:
+            f.write(_SECTION.pack(name, section_offset, length))
+        for (name, section_offset, length), (_, data) in zip(entries, payloads):
+            f.write(b'\0' * (section_offset - f.tell()))
+            f.write(data)
+        size = f.tell()
+    os.replace(tmp_path, path)
+    
+    return size
+
+
+def append_delta(path: str, changeset: GraphChangeset, version: str) -> None:
+    """
+    Append a changeset to a snapshot's delta log.
+    
+    Each record is one compact JSON line, so appends cost O(changeset)
+    and a torn final line from a crash is skipped on read.
+    
+    Args:
+        path: Delta log path
+        changeset: The mutations applied on top of the snapshot
+        version: Materialization version produced by this changeset
+    """
+    record = changeset.to_dict()
+    record['version'] = version
+    record['timestamp'] = datetime.now().isoformat()
+    
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_deltas(path: str) -> Iterator[Tuple[str, GraphChangeset]]:
+    """
+    Read (version, changeset) records from a delta log.
+    
+    Args:
+        path: Delta log path
+    
+    Yields:
+        Tuples of materialization version and changeset
+    """
+    if not path or not os.path.exists(path):
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt delta record {line_number} in {path}")
+                continue
+            yield record.get('version', ''), GraphChangeset.from_dict(record)
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+class GraphSnapshotReader:
+    """
+    Read-only, memory-mapped view of a columnar graph snapshot.
+    
+    Array sections are exposed as ``memoryview`` casts over the mapping, so
+    opening a snapshot costs O(1) regardless of graph size. Concept IDs are
+    resolved by binary search over the sorted ID table. Changesets from the
+    delta log are kept in a small in-memory overlay that is consulted
+    before the base arrays.
+    """
+    
+    def __init__(self, path: str, delta_path: Optional[str] = None):
+        """
+        Open a snapshot.
+        
+        Args:
+            path: Snapshot file path
+            delta_path: Optional delta log to overlay on the snapshot
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SnapshotFormatError(f"Snapshot {path} is empty")
+        self._view = memoryview(self._mmap)
+        self._sections: Dict[str, memoryview] = {}
+        
+        try:
+            self._parse_header()
+        except Exception:
+            self.close()
+            raise
+        
+        self.materialization_version: str = self.meta.get('materialization_version', '')
+        
+        # Delta overlay
+        self._upserted: Dict[str, GraphNode] = {}
+        self._deleted: Set[str] = set()
+        self._detached: Set[str] = set()  # nodes whose base edges are hidden
+        self._added: Dict[Tuple[str, str, RelationshipType], GraphEdge] = {}
+        self._removed_base: Set[Tuple[str, str, Optional[RelationshipType]]] = set()
+        self._deltas: List[GraphChangeset] = []
+        
+        for version, changeset in read_deltas(delta_path):
+            self._apply_overlay(changeset)
+            self._deltas.append(changeset)
+            self.materialization_version = version or self.materialization_version
+    
+    @property
+    def delta_count(self) -> int:
+        """Number of changesets overlaid on the base snapshot"""
+        return len(self._deltas)
+    
+    def _parse_header(self) -> None:
+        """Validate the header and map every section"""
+        if len(self._view) < _HEADER.size:
+            raise SnapshotFormatError(f"Snapshot {self.path} is truncated")
+        
+        magic, version, _, node_count, edge_count, section_count = _HEADER.unpack_from(self._view, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotFormatError(f"{self.path} is not a graph snapshot")
+        if version > SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotFormatError(
+                f"Snapshot format {version} is newer than supported ({SNAPSHOT_FORMAT_VERSION})"
+            )
+        if sys.byteorder != 'little':
+            raise SnapshotFormatError("Memory-mapped snapshots require a little-endian host")
+        
+        self.format_version = version
+        self.node_count = node_count
+        self.edge_count = edge_count
+        
+        for i in range(section_count):
+            name, offset, length = _SECTION.unpack_from(self._view, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(self._view):
+                raise SnapshotFormatError(f"Snapshot {self.path} is truncated")
+            self._sections[name.rstrip(b'\0').decode('ascii')] = self._view[offset:offset + length]
+        
+        self.meta: Dict[str, Any] = json.loads(bytes(self._sections['meta']).decode('utf-8'))
+        self._subjects = self.meta['subjects']
+        self._difficulties = self.meta['difficulties']
+        self._concept_types = self.meta['concept_types']
+        self._relationship_types = [RelationshipType(value) for value in self.meta['relationship_types']]
+        
+        cast = lambda name, code: self._sections[name].cast(code)
+        self._id_offsets = cast('id_off', 'q')
+        self._name_offsets = cast('name_off', 'q')
+        self._extra_offsets = cast('xtra_off', 'q')
+        self._present = cast('present', 'B')
+        self._subject_codes = cast('subject', 'i')
+        self._difficulty_codes = cast('diff', 'i')
+        self._type_codes = cast('ctype', 'i')
+        self._durations = cast('duration', 'i')
+        self._fwd_offsets = cast('fwd_off', 'q')
+        self._fwd_targets = cast('fwd_dst', 'i')
+        self._fwd_types = cast('fwd_type', 'B')
+        self._fwd_strengths = cast('fwd_str', 'f')
+        self._edge_extra_offsets = cast('exta_off', 'q')
+        self._rev_offsets = cast('rev_off', 'q')
+        self._rev_sources = cast('rev_src', 'i')
+        self._rev_edges = cast('rev_edge', 'i')
+    
+    def close(self) -> None:
+        """Release all views and unmap the file"""
+        for view in list(self.__dict__.values()):
+            if isinstance(view, memoryview):
+                view.release()
+        for view in self._sections.values():
+            view.release()
+        self._sections.clear()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+    
+    def __enter__(self) -> 'GraphSnapshotReader':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    # =========================================================================
+    # Base Table Access
+    # =========================================================================
+    
+    def _string(self, offsets: memoryview, blob: str, i: int) -> str:
+        """Decode entry i of a string table"""
+        return bytes(self._sections[blob][offsets[i]:offsets[i + 1]]).decode('utf-8')
+    
+    def _base_id(self, i: int) -> str:
+        """Decode the concept ID at base index i"""
+        return self._string(self._id_offsets, 'id_blob', i)
+    
+    def _base_index(self, node_id: str) -> int:
+        """Binary search the sorted ID table; returns -1 if absent"""
+        lo, hi = 0, self.node_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._base_id(mid) < node_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.node_count and self._base_id(lo) == node_id:
+            return lo
+        return -1
+    
+    def _base_node(self, i: int) -> Optional[GraphNode]:
+        """Materialize the GraphNode stored at base index i"""
+        if not self._present[i]:
+            return None
+        extra = json.loads(self._string(self._extra_offsets, 'xtra_blb', i))
+        return GraphNode(
+            id=self._base_id(i),
+            name=self._string(self._name_offsets, 'name_blb', i),
+            subject_id=self._subjects[self._subject_codes[i]],
+            difficulty_level=self._difficulties[self._difficulty_codes[i]],
+            concept_type=self._concept_types[self._type_codes[i]],
+            duration_minutes=self._durations[i],
+            tags=extra.get('tags', []),
+            metadata=extra.get('metadata', {})
+        )
+    
+    def _base_edge(self, k: int, source_id: str, target_id: str) -> GraphEdge:
+        """Materialize the GraphEdge stored at forward edge position k"""
+        extra = self._string(self._edge_extra_offsets, 'exta_blb', k)
+        return GraphEdge(
+            source_id=source_id,
+            target_id=target_id,
+            relationship_type=self._relationship_types[self._fwd_types[k]],
+            strength=self._fwd_strengths[k],
+            metadata=json.loads(extra) if extra else {}
+        )
+    
+    def _base_edge_visible(self, source_id: str, target_id: str, rel_type: RelationshipType) -> bool:
+        """Check whether a base edge survives the delta overlay"""
+        if source_id in self._detached or target_id in self._detached:
+            return False
+        if (source_id, target_id, None) in self._removed_base:
+            return False
+        if (source_id, target_id, rel_type) in self._removed_base:
+            return False
+        return (source_id, target_id, rel_type) not in self._added
+    
+    # =========================================================================
+    # Delta Overlay
+    # =========================================================================
+    
+    def _apply_overlay(self, changeset: GraphChangeset) -> None:
+        """Record a changeset in the overlay, in ``apply_changeset`` order"""
+        for node in changeset.upserted_nodes:
+            self._deleted.discard(node.id)
+            self._upserted[node.id] = node
+        
+        for node_id in changeset.removed_node_ids:
+            if not self.has_node(node_id):
+                continue
+            self._deleted.add(node_id)
+            self._detached.add(node_id)
+            self._upserted.pop(node_id, None)
+            for key in [k for k in self._added if node_id in (k[0], k[1])]:
+                del self._added[key]
+        
+        for edge in changeset.added_edges:
+            if self.has_node(edge.source_id) and self.has_node(edge.target_id):
+                self._added[(edge.source_id, edge.target_id, edge.relationship_type)] = edge
+        
+        for source_id, target_id, rel_type in changeset.removed_edges:
+            for key in [k for k in self._added
+                        if k[0] == source_id and k[1] == target_id and
+                        (rel_type is None or k[2] == rel_type)]:
+                del self._added[key]
+            self._removed_base.add((source_id, target_id, rel_type))
+    
+    # =========================================================================
+    # Queries
+    # =========================================================================
+    
+    def has_node(self, node_id: str) -> bool:
+        """Check if a concept exists"""
+        if node_id in self._upserted:
+            return True
+        if node_id in self._deleted:
+            return False
+        i = self._base_index(node_id)
+        return i >= 0 and bool(self._present[i])
+    
+    def get_node(self, node_id: str) -> Optional[GraphNode]:
+        """Get a concept by ID"""
+        if node_id in self._upserted:
+            return self._upserted[node_id]
+        if node_id in self._deleted:
+            return None
+        i = self._base_index(node_id)
+        return self._base_node(i) if i >= 0 else None
+    
+    def get_outgoing_edges(self, node_id: str) -> List[GraphEdge]:
+        """Get edges leaving a node"""
+        edges = []
+        i = self._base_index(node_id)
+        if i >= 0:
+            for k in range(self._fwd_offsets[i], self._fwd_offsets[i + 1]):
+                target_id = self._base_id(self._fwd_targets[k])
+                rel_type = self._relationship_types[self._fwd_types[k]]
+                if self._base_edge_visible(node_id, target_id, rel_type):
+                    edges.append(self._base_edge(k, node_id, target_id))
+        edges.extend(e for key, e in self._added.items() if key[0] == node_id)
+        return edges
+    
+    def get_incoming_edges(self, node_id: str) -> List[GraphEdge]:
+        """Get edges entering a node"""
+        edges = []
+        i = self._base_index(node_id)
+        if i >= 0:
+            for j in range(self._rev_offsets[i], self._rev_offsets[i + 1]):
+                k = self._rev_edges[j]
+                source_id = self._base_id(self._rev_sources[j])
+                rel_type = self._relationship_types[self._fwd_types[k]]
+                if self._base_edge_visible(source_id, node_id, rel_type):
+                    edges.append(self._base_edge(k, source_id, node_id))
+        edges.extend(e for key, e in self._added.items() if key[1] == node_id)
+        return edges
+    
+    def get_prerequisites(self, concept_id: str, recursive: bool = True) -> List[str]:
+        """Get prerequisites of a concept, mirroring ``DependencyGraphEngine``"""
+        return self._traverse(concept_id, recursive, self.get_incoming_edges, 'source_id')
+    
+    def get_postrequisites(self, concept_id: str, recursive: bool = True) -> List[str]:
+        """Get dependents of a concept, mirroring ``DependencyGraphEngine``"""
+        return self._traverse(concept_id, recursive, self.get_outgoing_edges, 'target_id')
+    
+    def _traverse(self, start: str, recursive: bool, edges_of, attribute: str) -> List[str]:
+        """Breadth-first traversal over the overlaid adjacency"""
+        if not recursive:
+            return sorted({getattr(e, attribute) for e in edges_of(start)})
+        
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for node_id in frontier:
+                for edge in edges_of(node_id):
+                    neighbor = getattr(edge, attribute)
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        seen.discard(start)
+        return sorted(seen)
+    
+    # =========================================================================
+    # Materialization
+    # =========================================================================
+    
+    def to_engine(self, **engine_options) -> DependencyGraphEngine:
+        """
+        Build a full ``DependencyGraphEngine`` from the snapshot and deltas.
+        
+        Args:
+            **engine_options: Keyword arguments for the engine constructor
+        
+        Returns:
+            A populated graph engine
+        """
+        nodes = {}
+        edges = []
+        for i in range(self.node_count):
+            node = self._base_node(i)
+            if node is not None:
+                nodes[node.id] = node.to_dict()
+            
+            source_id = self._base_id(i)
+            for k in range(self._fwd_offsets[i], self._fwd_offsets[i + 1]):
+                target_id = self._base_id(self._fwd_targets[k])
+                edges.append(self._base_edge(k, source_id, target_id).to_dict())
+        
+        engine = DependencyGraphEngine(**engine_options)
+        engine.deserialize({
+            'version': self.meta.get('materialization_version', ''),
+            'nodes': nodes,
+            'edges': edges
+        })
+        
+        for changeset in self._deltas:
+            engine.apply_changeset(changeset)
+        engine.set_materialization_version(self.materialization_version)
+        
+        return engine
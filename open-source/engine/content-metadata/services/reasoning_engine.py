@@ -8,7 +8,7 @@ automatic concept categorization.
 Licensed under the Apache License, Version 2.0
 """
 
-from typing import List, Optional, Dict, Any, Set, Tuple, Callable
+from typing import List, Optional, Dict, Any, Set, Tuple, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -25,6 +25,12 @@ except ImportError:
     NETWORKX_AVAILABLE = False
     logging.warning("NetworkX not required for reasoning engine - using custom graph implementation")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 from ..models.reasoning import (
     InferenceRule,
@@ -43,6 +49,9 @@ from ..models.reasoning import (
 
 logger = logging.getLogger(__name__)
 
+# Mersenne prime modulus for MinHash universal hashing
+_MINHASH_PRIME = (1 << 31) - 1
+
 
 class ReasoningStats:
     """Statistics for reasoning engine operations"""
@@ -87,12 +96,20 @@ class ReasoningEngine:
     This engine applies inference rules to derive implicit relationships,
     detect knowledge gaps, and perform similarity analysis on the
     knowledge graph.
+    
+    Transitive rules are evaluated semi-naively: each round joins only the
+    pairs derived in the previous round with the base edges. Inferred
+    relationships are indexed by (source, target, type) and rule, so
+    duplicate checks are constant time and ``update_inference`` can
+    re-derive just the sources affected by a few edge changes.
     """
     
     def __init__(self):
         """Initialize the reasoning engine"""
         self._rules: Dict[str, InferenceRule] = {}
         self._inferred_relationships: Dict[str, InferredRelationship] = {}
+        self._inference_index: Dict[Tuple[str, str, str], Dict[str, InferredRelationship]] = {}
+        self._inferences_by_source: Dict[str, Dict[str, InferredRelationship]] = {}
         self._knowledge_gaps: Dict[str, KnowledgeGap] = {}
         self._similarities: Dict[str, ConceptSimilarity] = {}
         self._clusters: Dict[str, ConceptCluster] = {}
@@ -175,20 +192,31 @@ class ReasoningEngine:
         
         # Add edges
         for rel in relationships:
-            source = rel.get('source', rel.get('source_concept_id'))
-            target = rel.get('target', rel.get('target_concept_id'))
-            rel_type = rel.get('type', rel.get('relationship_type', 'prerequisite'))
-            weight = rel.get('strength', rel.get('weight', 1.0))
-            
-            if source and target:
-                graph.add_edge(source, target, {
-                    'type': rel_type,
-                    'weight': weight,
-                    'is_explicit': True
-                })
+            self._add_relationship_edge(graph, rel)
         
         return graph
     
+    def _add_relationship_edge(
+        self,
+        graph: 'SimpleGraph',
+        rel: Dict[str, Any]
+    ) -> Optional[str]:
+        """Add an explicit edge from a relationship dictionary, returning its source"""
+        source = rel.get('source', rel.get('source_concept_id'))
+        target = rel.get('target', rel.get('target_concept_id'))
+        rel_type = rel.get('type', rel.get('relationship_type', 'prerequisite'))
+        weight = rel.get('strength', rel.get('weight', 1.0))
+        
+        if not (source and target):
+            return None
+        
+        graph.add_edge(source, target, {
+            'type': rel_type,
+            'weight': weight,
+            'is_explicit': True
+        })
+        return source
+    
     # =========================================================================
     # Inference Engine
     # =========================================================================
@@ -214,10 +242,7 @@ class ReasoningEngine:
         inferred = []
         
         # Get rules to apply
-        if rule_ids:
-            rules = [self._rules[r] for r in rule_ids if r in self._rules]
-        else:
-            rules = [r for r in self._rules.values() if r.is_active]
+        rules = self._select_rules(rule_ids)
         
         logger.info(f"Running inference with {len(rules)} rules")
         
@@ -234,7 +259,7 @@ class ReasoningEngine:
         
         # Store inferred relationships
         for inf in inferred:
-            self._inferred_relationships[inf.id] = inf
+            self._store_inference(inf)
         
         # Update statistics
         elapsed = (time.time() - start_time) * 1000
@@ -249,6 +274,108 @@ class ReasoningEngine:
             'warnings': self._stats.errors[-5:] if self._stats.errors else []
         }
     
+    def update_inference(
+        self,
+        graph: 'SimpleGraph',
+        added_relationships: Optional[List[Dict[str, Any]]] = None,
+        removed_relationships: Optional[List[Tuple[str, str]]] = None,
+        rule_ids: Optional[List[str]] = None
+    ) -> Tuple[List[InferredRelationship], Dict[str, Any]]:
+        """
+        Apply edge changes to a graph and incrementally re-run inference.
+        
+        Rules run in the same order as ``run_inference`` over the set of
+        touched concept pairs: the changed edges plus every pair where an
+        earlier rule added or retracted a virtual edge. Transitive rules are
+        re-derived only for sources that can reach a touched pair within the
+        rule's hop limit; symmetric and inverse rules re-check the pairs
+        themselves. Inferences whose premises no longer hold, or whose pair
+        is now taken by an explicit edge or an earlier rule, are retracted,
+        so the result matches a full ``run_inference`` on the new graph.
+        
+        Args:
+            graph: Graph previously passed to ``run_inference``
+            added_relationships: Relationship dictionaries to add
+            removed_relationships: (source, target) edges to remove
+            rule_ids: Optional specific rules to apply (None = all active)
+        
+        Returns:
+            Tuple of (new inferred_relationships, stats)
+        """
+        start_time = time.time()
+        inferred = []
+        retracted = []
+        touched: Set[Tuple[str, str]] = set()
+        
+        for source, target in removed_relationships or []:
+            if graph.remove_edge(source, target):
+                touched.add((source, target))
+        
+        for rel in added_relationships or []:
+            source = self._add_relationship_edge(graph, rel)
+            if source:
+                touched.add((source, rel.get('target', rel.get('target_concept_id'))))
+        
+        rules = self._select_rules(rule_ids)
+        rule_rank = {rule.id: rank for rank, rule in enumerate(rules)}
+        affected_count = 0
+        
+        for rule in rules:
+            rule_retracted: List[InferredRelationship] = []
+            try:
+                if rule.rule_type == InferenceRuleType.TRANSITIVE:
+                    changed_sources = {source for source, _ in touched}
+                    sources = self._affected_sources(graph, rule, changed_sources)
+                    affected_count += len(sources)
+                    derived = self._transitive_closure(graph, rule, sources)
+                    rule_retracted.extend(self._retract_stale_inferences(graph, rule, sources, derived))
+                    new_inferences = self._emit_transitive_inferences(
+                        graph, rule, derived, rule_rank, rule_retracted
+                    )
+                elif rule.rule_type in (InferenceRuleType.SYMMETRIC, InferenceRuleType.INVERSE):
+                    new_inferences = self._refresh_edge_rule(
+                        graph, rule, touched, rule_rank, rule_retracted
+                    )
+                else:
+                    new_inferences = self._apply_rule(graph, rule)
+                
+                inferred.extend(new_inferences)
+                self._stats.rules_executed[rule.id] += len(new_inferences)
+            
+            except Exception as e:
+                logger.error(f"Error applying rule {rule.id}: {e}")
+                self._stats.errors.append(f"Rule {rule.id}: {str(e)}")
+                new_inferences = []
+            
+            # Later rules must re-check pairs whose occupancy changed
+            retracted.extend(rule_retracted)
+            for inf in new_inferences + rule_retracted:
+                touched.add((inf.source_concept_id, inf.target_concept_id))
+        
+        for inf in inferred:
+            self._store_inference(inf)
+        
+        # Update statistics
+        elapsed = (time.time() - start_time) * 1000
+        self._stats.total_inferences += len(inferred)
+        self._stats.inference_time_ms = elapsed
+        self._stats.last_run = datetime.now()
+        
+        return inferred, {
+            'total_inferred': len(inferred),
+            'total_retracted': len(retracted),
+            'affected_sources': affected_count,
+            'inference_time_ms': elapsed,
+            'rules_applied': [rule.id for rule in rules],
+            'warnings': self._stats.errors[-5:] if self._stats.errors else []
+        }
+    
+    def _select_rules(self, rule_ids: Optional[List[str]]) -> List[InferenceRule]:
+        """Get the rules to apply (None = all active)"""
+        if rule_ids:
+            return [self._rules[r] for r in rule_ids if r in self._rules]
+        return [r for r in self._rules.values() if r.is_active]
+    
     def _apply_rule(
         self,
         graph: 'SimpleGraph',
@@ -276,55 +403,294 @@ class ReasoningEngine:
         rule: InferenceRule
     ) -> List[InferredRelationship]:
         """Apply transitive inference rule"""
+        derived = self._transitive_closure(graph, rule, graph.nodes())
+        return self._emit_transitive_inferences(graph, rule, derived)
+    
+    def _is_base_edge(self, edge_data: Dict[str, Any], rule: InferenceRule) -> bool:
+        """Check if an edge feeds a transitive rule (excluding the rule's own output)"""
+        return (
+            edge_data.get('type') == rule.source_predicate and
+            edge_data.get('rule_id') != rule.id
+        )
+    
+    def _transitive_closure(
+        self,
+        graph: 'SimpleGraph',
+        rule: InferenceRule,
+        sources: Iterable[str]
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Derive every pair reachable from the sources within max_hops.
+        
+        Semi-naive evaluation of T(x, z) :- T(x, y), E(y, z): each round
+        joins only the previous round's new pairs with the base edges, so
+        every pair is derived once, at its shortest hop count.
+        
+        Returns:
+            Mapping of (source, target) to the target's predecessor on a
+            shortest derivation path
+        """
+        edge_filter = lambda d: self._is_base_edge(d, rule)
+        successor_cache: Dict[str, List[str]] = {}
+        
+        def successors(node: str) -> List[str]:
+            result = successor_cache.get(node)
+            if result is None:
+                result = graph.get_successors(node, edge_filter)
+                successor_cache[node] = result
+            return result
+        
+        derived: Dict[Tuple[str, str], str] = {}
+        delta: List[Tuple[str, str]] = []
+        
+        for source in sources:
+            for target in successors(source):
+                derived[(source, target)] = source
+                delta.append((source, target))
+        
+        for _ in range(rule.max_hops - 1):
+            if not delta:
+                break
+            
+            new_delta = []
+            for source, middle in delta:
+                for target in successors(middle):
+                    pair = (source, target)
+                    if pair not in derived:
+                        derived[pair] = middle
+                        new_delta.append(pair)
+            delta = new_delta
+        
+        return derived
+    
+    def _emit_transitive_inferences(
+        self,
+        graph: 'SimpleGraph',
+        rule: InferenceRule,
+        derived: Dict[Tuple[str, str], str],
+        rule_rank: Optional[Dict[str, int]] = None,
+        retracted: Optional[List[InferredRelationship]] = None
+    ) -> List[InferredRelationship]:
+        """
+        Create inferences for derived pairs that are neither edges nor already inferred.
+        
+        With ``rule_rank``, a pair holding the virtual edge of a rule that
+        runs later is taken over and that inference is appended to
+        ``retracted``, as a full run would never have let the later rule
+        claim it.
+        """
         inferred = []
-        source_pred = rule.source_predicate
-        target_pred = rule.target_predicate or f"derived_{source_pred}"
-        
-        # Find all paths up to max_hops
-        for node in graph.nodes():
-            paths = graph.find_all_paths(
-                node,
-                max_length=rule.max_hops,
-                edge_filter=lambda d: d.get('type') == source_pred
+        target_pred = rule.target_predicate or f"derived_{rule.source_predicate}"
+        
+        for source, target in derived:
+            # Skip cycles back to the source and pairs with a direct edge
+            if source == target:
+                continue
+            if rule_rank is None:
+                if graph.has_edge(source, target):
+                    continue
+            elif not self._claim_pair(graph, rule, source, target, rule_rank, retracted):
+                continue
+            
+            # Check if we already inferred this
+            if self._find_existing_inference(source, target, target_pred):
+                continue
+            
+            path = self._derivation_path(derived, source, target)
+            inf = self._create_inferred_relationship(
+                source, target, target_pred, rule, path
             )
+            inferred.append(inf)
             
-            for path in paths:
-                if len(path) > 1:
-                    source = path[0]
-                    target = path[-1]
-                    
-                    # Check if direct edge already exists
-                    if not graph.has_edge(source, target):
-                        # Check if we already inferred this
-                        existing = self._find_existing_inference(
-                            source, target, target_pred
-                        )
-                        if not existing:
-                            inf = self._create_inferred_relationship(
-                                source, target, target_pred, rule, path
-                            )
-                            inferred.append(inf)
-                            
-                            # Add virtual edge to graph
-                            graph.add_edge(source, target, {
-                                'type': target_pred,
-                                'is_inferred': True,
-                                'rule_id': rule.id,
-                                'confidence': rule.confidence_weight * self._calculate_path_confidence(path)
-                            })
+            # Add virtual edge to graph
+            graph.add_edge(source, target, {
+                'type': target_pred,
+                'is_inferred': True,
+                'rule_id': rule.id,
+                'confidence': rule.confidence_weight * self._calculate_path_confidence(path)
+            })
+        
+        return inferred
+    
+    def _derivation_path(
+        self,
+        derived: Dict[Tuple[str, str], str],
+        source: str,
+        target: str
+    ) -> List[str]:
+        """Rebuild a shortest derivation path from predecessor links"""
+        path = [target]
+        node = target
+        while node != source:
+            node = derived[(source, node)]
+            path.append(node)
+        path.reverse()
+        return path
+    
+    def _affected_sources(
+        self,
+        graph: 'SimpleGraph',
+        rule: InferenceRule,
+        changed_sources: Set[str]
+    ) -> Set[str]:
+        """Get sources whose derivations may pass through a changed edge"""
+        edge_filter = lambda d: self._is_base_edge(d, rule)
+        affected = set(changed_sources)
+        frontier = list(changed_sources)
+        
+        for _ in range(rule.max_hops - 1):
+            next_frontier = []
+            for node in frontier:
+                for predecessor in graph.get_predecessors(node, edge_filter):
+                    if predecessor not in affected:
+                        affected.add(predecessor)
+                        next_frontier.append(predecessor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        
+        return affected
+    
+    def _retract_stale_inferences(
+        self,
+        graph: 'SimpleGraph',
+        rule: InferenceRule,
+        sources: Set[str],
+        derived: Dict[Tuple[str, str], str]
+    ) -> List[InferredRelationship]:
+        """Retract a transitive rule's inferences that no longer hold"""
+        retracted = []
+        edge_filter = lambda d: self._is_base_edge(d, rule)
+        
+        for source in sources:
+            for inf in list(self._inferences_by_source.get(source, {}).values()):
+                if inf.rule_id != rule.id:
+                    continue
+                
+                intact = all(
+                    edge_filter(graph.get_edge_data(step['from'], step['to']) or {})
+                    for step in inf.derivation_path
+                )
+                
+                # An edge added between the endpoints supersedes the inference
+                edge_data = graph.get_edge_data(source, inf.target_concept_id) or {}
+                superseded = edge_data.get('rule_id') != rule.id
+                
+                # Keep only inferences still derived along a shortest path
+                pair = (source, inf.target_concept_id)
+                if intact and not superseded and pair in derived:
+                    shortest = len(self._derivation_path(derived, *pair)) - 1
+                    if inf.hop_count == shortest:
+                        continue
+                
+                self._retract_inference(graph, inf)
+                retracted.append(inf)
+        
+        return retracted
+    
+    def _claim_pair(
+        self,
+        graph: 'SimpleGraph',
+        rule: InferenceRule,
+        source: str,
+        target: str,
+        rule_rank: Dict[str, int],
+        retracted: Optional[List[InferredRelationship]]
+    ) -> bool:
+        """
+        Check whether a rule may place its virtual edge on a pair.
+        
+        A pair is available when it is empty, holds this rule's own virtual
+        edge, or holds the virtual edge of a rule that runs later (which is
+        retracted). Explicit edges and earlier rules' edges block it.
+        """
+        edge_data = graph.get_edge_data(source, target)
+        if edge_data is None:
+            return True
+        if not edge_data.get('is_inferred'):
+            return False
+        
+        occupant = edge_data.get('rule_id')
+        if occupant == rule.id:
+            return True
+        if rule_rank.get(occupant, -1) <= rule_rank[rule.id]:
+            return False
+        
+        displaced = self._find_existing_inference(source, target, edge_data.get('type'), occupant)
+        if displaced is None:
+            graph.remove_edge(source, target)
+        else:
+            self._retract_inference(graph, displaced)
+            if retracted is not None:
+                retracted.append(displaced)
+        return True
+    
+    def _refresh_edge_rule(
+        self,
+        graph: 'SimpleGraph',
+        rule: InferenceRule,
+        pairs: Set[Tuple[str, str]],
+        rule_rank: Dict[str, int],
+        retracted: List[InferredRelationship]
+    ) -> List[InferredRelationship]:
+        """
+        Re-check a symmetric or inverse rule on the given concept pairs.
+        
+        These rules derive (target, source) from the single edge
+        (source, target), so each pair is checked in both directions: an
+        existing inference is retracted when its premise edge is gone or
+        changed type (or, for symmetric rules, its pair is now taken), and
+        a missing one is created when it now holds.
+        """
+        inferred = []
+        symmetric = rule.rule_type == InferenceRuleType.SYMMETRIC
+        if symmetric:
+            conclusion_pred = rule.source_predicate
+        else:
+            conclusion_pred = self._inverse_predicate(rule)
+        
+        premises = set()
+        for source, target in pairs:
+            premises.add((source, target))
+            premises.add((target, source))
+        
+        for source, target in sorted(premises):
+            premise = graph.get_edge_data(source, target)
+            holds = premise is not None and self._is_base_edge(premise, rule)
+            existing = self._find_existing_inference(target, source, conclusion_pred, rule.id)
+            
+            if symmetric and holds:
+                edge_data = graph.get_edge_data(target, source)
+                owned = edge_data is not None and edge_data.get('rule_id') == rule.id
+                if existing is None or not owned:
+                    holds = self._claim_pair(graph, rule, target, source, rule_rank, retracted)
+            
+            if existing is not None and not holds:
+                self._retract_inference(graph, existing)
+                retracted.append(existing)
+            elif existing is None and holds:
+                if symmetric:
+                    inferred.extend(self._apply_symmetric_rule(graph, rule, [(source, target, premise)]))
+                else:
+                    inferred.extend(self._apply_inverse_rule(graph, rule, [(source, target, premise)]))
         
         return inferred
     
     def _apply_symmetric_rule(
         self,
         graph: 'SimpleGraph',
-        rule: InferenceRule
+        rule: InferenceRule,
+        edges: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
     ) -> List[InferredRelationship]:
-        """Apply symmetric inference rule"""
+        """Apply symmetric inference rule (to all edges, or only the given ones)"""
         inferred = []
         pred = rule.source_predicate
         
-        for source, target, edge_data in graph.edges(data=True):
+        # Snapshot edges: inferred edges are added while iterating
+        if edges is None:
+            edges = list(graph.edges(data=True))
+        
+        for source, target, edge_data in edges:
             if edge_data.get('type') == pred:
                 # Check if inverse edge exists
                 if not graph.has_edge(target, source):
@@ -357,21 +723,18 @@ class ReasoningEngine:
     def _apply_inverse_rule(
         self,
         graph: 'SimpleGraph',
-        rule: InferenceRule
+        rule: InferenceRule,
+        edges: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
     ) -> List[InferredRelationship]:
-        """Apply inverse inference rule"""
+        """Apply inverse inference rule (to all edges, or only the given ones)"""
         inferred = []
         source_pred = rule.source_predicate
-        target_pred = rule.target_predicate or f"inverse_{source_pred}"
+        inferred_pred = self._inverse_predicate(rule)
         
-        inverse_map = {
-            'prerequisite': 'enables',
-            'leads_to': 'requires',
-            'component_of': 'has_component'
-        }
-        inferred_pred = inverse_map.get(source_pred, target_pred)
+        if edges is None:
+            edges = graph.edges(data=True)
         
-        for source, target, edge_data in graph.edges(data=True):
+        for source, target, edge_data in edges:
             if edge_data.get('type') == source_pred:
                 existing = self._find_existing_inference(
                     target, source, inferred_pred, rule.id
@@ -392,6 +755,16 @@ class ReasoningEngine:
         
         return inferred
     
+    def _inverse_predicate(self, rule: InferenceRule) -> str:
+        """Get the relationship type an inverse rule infers"""
+        inverse_map = {
+            'prerequisite': 'enables',
+            'leads_to': 'requires',
+            'component_of': 'has_component'
+        }
+        target_pred = rule.target_predicate or f"inverse_{rule.source_predicate}"
+        return inverse_map.get(rule.source_predicate, target_pred)
+    
     def _apply_similarity_rule(
         self,
         graph: 'SimpleGraph',
@@ -467,13 +840,40 @@ class ReasoningEngine:
         rule_id: Optional[str] = None
     ) -> Optional[InferredRelationship]:
         """Check if an inference already exists"""
-        for inf in self._inferred_relationships.values():
-            if (inf.source_concept_id == source and
-                inf.target_concept_id == target and
-                inf.relationship_type == rel_type and
-                (rule_id is None or inf.rule_id == rule_id)):
-                return inf
-        return None
+        by_rule = self._inference_index.get((source, target, rel_type))
+        if not by_rule:
+            return None
+        if rule_id is None:
+            return next(iter(by_rule.values()))
+        return by_rule.get(rule_id)
+    
+    def _store_inference(self, inf: InferredRelationship) -> None:
+        """Store an inference and index it"""
+        self._inferred_relationships[inf.id] = inf
+        key = (inf.source_concept_id, inf.target_concept_id, inf.relationship_type)
+        self._inference_index.setdefault(key, {}).setdefault(inf.rule_id, inf)
+        self._inferences_by_source.setdefault(inf.source_concept_id, {})[inf.id] = inf
+    
+    def _retract_inference(self, graph: 'SimpleGraph', inf: InferredRelationship) -> None:
+        """Remove an inference from the store and its virtual edge from the graph"""
+        self._inferred_relationships.pop(inf.id, None)
+        
+        key = (inf.source_concept_id, inf.target_concept_id, inf.relationship_type)
+        by_rule = self._inference_index.get(key)
+        if by_rule and by_rule.get(inf.rule_id) is inf:
+            del by_rule[inf.rule_id]
+            if not by_rule:
+                del self._inference_index[key]
+        
+        by_source = self._inferences_by_source.get(inf.source_concept_id)
+        if by_source:
+            by_source.pop(inf.id, None)
+            if not by_source:
+                del self._inferences_by_source[inf.source_concept_id]
+        
+        edge_data = graph.get_edge_data(inf.source_concept_id, inf.target_concept_id)
+        if edge_data and edge_data.get('is_inferred') and edge_data.get('rule_id') == inf.rule_id:
+            graph.remove_edge(inf.source_concept_id, inf.target_concept_id)
     
     # =========================================================================
     # Knowledge Gap Detection
@@ -800,23 +1200,60 @@ class ReasoningEngine:
         concept_ids: Optional[List[str]] = None,
         min_similarity: float = 0.6,
         max_cluster_size: int = 20,
-        min_cluster_size: int = 3
+        min_cluster_size: int = 3,
+        method: str = "exhaustive",
+        num_perm: int = 128,
+        lsh_bands: int = 32,
+        seed: int = 0,
+        max_bucket_size: int = 500
     ) -> List[ConceptCluster]:
-        """Discover concept clusters using similarity"""
+        """
+        Discover concept clusters using similarity.
+        
+        Args:
+            graph: Graph containing the concepts
+            concept_ids: Concepts to cluster (None = all nodes)
+            min_similarity: Minimum similarity for two concepts to be grouped
+            max_cluster_size: Maximum concepts per cluster
+            min_cluster_size: Minimum concepts for a cluster to be reported
+            method: 'exhaustive' scores every pair; 'lsh' only scores pairs
+                whose MinHash signatures collide in at least one LSH band
+            num_perm: MinHash signature length for 'lsh'
+            lsh_bands: LSH bands for 'lsh'; more bands (fewer rows each)
+                lowers the Jaccard level at which pairs become candidates
+            seed: Seed for the MinHash permutations
+            max_bucket_size: LSH buckets with more concepts than this are
+                split by the keys of further bands, so their members only
+                become candidates if they also agree there. Members that
+                agree on every band are all kept; pairs lost to splitting
+                are counted and logged
+        """
         # Get concepts to cluster
         if concept_ids is None:
             concept_ids = list(graph.nodes())
         
+        if method == "lsh":
+            candidate_pairs = self._minhash_candidate_pairs(
+                graph, concept_ids, num_perm, lsh_bands, seed, max_bucket_size
+            )
+        elif method == "exhaustive":
+            candidate_pairs = (
+                (cid_a, cid_b)
+                for i, cid_a in enumerate(concept_ids)
+                for cid_b in concept_ids[i + 1:]
+            )
+        else:
+            raise ValueError(f"Unknown clustering method: {method}")
+        
         # Calculate pairwise similarities
         similarities: Dict[Tuple[str, str], float] = {}
         
-        for i, cid_a in enumerate(concept_ids):
-            for cid_b in concept_ids[i + 1:]:
-                try:
-                    sim = self.calculate_similarity(graph, cid_a, cid_b, include_details=False)
-                    similarities[(cid_a, cid_b)] = sim.overall_score
-                except ValueError:
-                    pass
+        for cid_a, cid_b in candidate_pairs:
+            try:
+                sim = self.calculate_similarity(graph, cid_a, cid_b, include_details=False)
+                similarities[(cid_a, cid_b)] = sim.overall_score
+            except ValueError:
+                pass
         
         # Perform clustering using threshold-based approach
         clusters: List[Set[str]] = []
@@ -854,6 +1291,7 @@ class ReasoningEngine:
         
         # Convert to ConceptCluster objects
         result_clusters = []
+        position = {cid: i for i, cid in enumerate(concept_ids)}
         
         for i, concept_set in enumerate(clusters):
             if len(concept_set) < min_cluster_size:
@@ -861,6 +1299,10 @@ class ReasoningEngine:
             
             concept_list = list(concept_set)
             
+            # LSH only scored candidate pairs; score the rest of the cluster
+            if method == "lsh":
+                self._fill_cluster_similarities(graph, concept_list, position, similarities)
+            
             # Calculate cluster metrics
             cohesion = self._calculate_cluster_cohesion(concept_list, similarities)
             
@@ -894,7 +1336,7 @@ class ReasoningEngine:
                 primary_subject=max(subject_counts.items(), key=lambda x: x[1])[0] if subject_counts else '',
                 secondary_subjects=[k for k, v in subject_counts.items() if k != max(subject_counts.items(), key=lambda x: x[1])],
                 suggested_order=self._suggest_learning_order(concept_list, graph),
-                discovery_method="similarity_clustering"
+                discovery_method="similarity_clustering" if method == "exhaustive" else "minhash_lsh_clustering"
             )
             
             result_clusters.append(cluster)
@@ -904,6 +1346,210 @@ class ReasoningEngine:
         
         return result_clusters
     
+    def _minhash_candidate_pairs(
+        self,
+        graph: 'SimpleGraph',
+        concept_ids: List[str],
+        num_perm: int,
+        bands: int,
+        seed: int,
+        max_bucket_size: int
+    ) -> List[Tuple[str, str]]:
+        """
+        Generate candidate concept pairs with MinHash and LSH banding.
+        
+        Overall similarity is a weighted average of per-component Jaccard
+        scores, so any pair at or above a threshold has at least one
+        component (tags, keywords, objectives or neighbors) at or above it.
+        Each component is therefore hashed separately: its sets are interned
+        into a sparse concept x feature matrix (CSR index arrays), MinHash
+        signatures are computed from it, and two concepts become candidates
+        if all rows of any band agree in any component. Pairs are returned
+        in the same (i < j) order the exhaustive mode visits them.
+        
+        Buckets over ``max_bucket_size`` are split by further bands, which
+        keeps the candidate count near n * bands * max_bucket_size / 2 per
+        component instead of n^2. Only concepts with identical signatures
+        can still form larger buckets, and all of their pairs are kept.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for LSH clustering. Install with: pip install numpy")
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by lsh_bands ({bands})")
+        
+        components = [
+            lambda cid, data: data.get('tags', []),
+            lambda cid, data: data.get('keywords', []),
+            lambda cid, data: data.get('learning_objectives', []),
+            lambda cid, data: graph.get_neighbors(cid)
+        ]
+        node_data = [graph.get_node_data(cid) or {} for cid in concept_ids]
+        
+        candidates: Set[Tuple[int, int]] = set()
+        split_buckets = 0
+        dropped_pairs = 0
+        for component, features_of in enumerate(components):
+            # Sparse incidence matrix: row i holds the feature IDs of concept i
+            vocabulary: Dict[str, int] = {}
+            indptr = [0]
+            indices: List[int] = []
+            for concept_id, data in zip(concept_ids, node_data):
+                for feature in set(features_of(concept_id, data)):
+                    indices.append(vocabulary.setdefault(feature, len(vocabulary)))
+                indptr.append(len(indices))
+            
+            signatures = self._minhash_signatures(
+                np.asarray(indptr, dtype=np.int64),
+                np.asarray(indices, dtype=np.int64),
+                num_perm,
+                seed + component
+            )
+            
+            # Empty sets have zero Jaccard similarity with everything
+            rows = np.flatnonzero(np.diff(indptr) > 0)
+            if len(rows) > 1:
+                split, dropped = self._collect_lsh_pairs(
+                    signatures[rows], rows, bands, seed, max_bucket_size, candidates
+                )
+                split_buckets += split
+                dropped_pairs += dropped
+        
+        if split_buckets:
+            logger.warning(
+                f"Split {split_buckets} LSH buckets larger than {max_bucket_size} concepts "
+                f"by further bands; {dropped_pairs} bucket pairs that disagreed on those "
+                f"bands were not scored unless another band matched them"
+            )
+        
+        return [(concept_ids[i], concept_ids[j]) for i, j in sorted(candidates)]
+    
+    def _collect_lsh_pairs(
+        self,
+        signatures: 'np.ndarray',
+        rows: 'np.ndarray',
+        bands: int,
+        seed: int,
+        max_bucket_size: int,
+        candidates: Set[Tuple[int, int]]
+    ) -> Tuple[int, int]:
+        """
+        Add pairs of rows whose signatures agree on every row of some band.
+        
+        A bucket larger than ``max_bucket_size`` is split by the keys of the
+        following bands, one at a time, until each part fits. Parts that
+        agree on every band have identical signatures and are expanded in
+        full whatever their size.
+        
+        Returns:
+            Tuple of (buckets split for exceeding ``max_bucket_size``,
+            bucket pairs separated by the splits)
+        """
+        rows_per_band = signatures.shape[1] // bands
+        rng = np.random.default_rng(seed)
+        mixers = rng.integers(1, 1 << 62, size=rows_per_band, dtype=np.uint64) | np.uint64(1)
+        split_buckets = 0
+        dropped_pairs = 0
+        
+        def band_keys(band: int, members: 'np.ndarray') -> 'np.ndarray':
+            # Collapse the band to one key per member
+            band_values = signatures[members, band * rows_per_band:(band + 1) * rows_per_band]
+            return (band_values.astype(np.uint64) * mixers).sum(axis=1, dtype=np.uint64)
+        
+        def group_equal(keys: 'np.ndarray') -> List['np.ndarray']:
+            order = np.argsort(keys, kind='stable')
+            return np.split(order, np.flatnonzero(np.diff(keys[order])) + 1)
+        
+        everyone = np.arange(len(signatures))
+        for band in range(bands):
+            pending = [(bucket, 1) for bucket in group_equal(band_keys(band, everyone))]
+            
+            while pending:
+                bucket, agreed = pending.pop()
+                if len(bucket) < 2:
+                    continue
+                if len(bucket) > max_bucket_size and agreed < bands:
+                    if agreed == 1:
+                        split_buckets += 1
+                    parts = [
+                        bucket[part]
+                        for part in group_equal(band_keys((band + agreed) % bands, bucket))
+                    ]
+                    dropped_pairs += len(bucket) * (len(bucket) - 1) // 2 - sum(
+                        len(part) * (len(part) - 1) // 2 for part in parts
+                    )
+                    pending.extend((part, agreed + 1) for part in parts)
+                    continue
+                
+                members = sorted(rows[bucket].tolist())
+                for x, i in enumerate(members):
+                    for j in members[x + 1:]:
+                        candidates.add((i, j))
+        
+        return split_buckets, dropped_pairs
+    
+    def _minhash_signatures(
+        self,
+        indptr: 'np.ndarray',
+        indices: 'np.ndarray',
+        num_perm: int,
+        seed: int,
+        chunk_size: int = 1 << 22
+    ) -> 'np.ndarray':
+        """
+        Compute MinHash signatures for the rows of a CSR incidence matrix.
+        
+        Feature IDs are hashed with ``num_perm`` universal hash functions
+        (a * x + b) mod p and each row keeps the per-function minimum.
+        Rows are processed in chunks so that at most ``chunk_size`` hashed
+        values are materialized at once.
+        """
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.int64)
+        b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.int64)
+        
+        row_count = len(indptr) - 1
+        signatures = np.full((row_count, num_perm), _MINHASH_PRIME, dtype=np.int64)
+        
+        budget = max(1, chunk_size // num_perm)
+        start_row = 0
+        while start_row < row_count:
+            # Take rows until the chunk would exceed the hashed-value budget
+            end_row = int(np.searchsorted(indptr, indptr[start_row] + budget, side='right')) - 1
+            end_row = min(max(end_row, start_row + 1), row_count)
+            
+            lo, hi = indptr[start_row], indptr[end_row]
+            if hi > lo:
+                hashed = (indices[lo:hi, None] * a + b) % _MINHASH_PRIME
+                
+                lengths = np.diff(indptr[start_row:end_row + 1])
+                nonempty = np.flatnonzero(lengths)
+                offsets = (indptr[start_row:end_row][nonempty] - lo)
+                signatures[start_row + nonempty] = np.minimum.reduceat(hashed, offsets, axis=0)
+            
+            start_row = end_row
+        
+        return signatures
+    
+    def _fill_cluster_similarities(
+        self,
+        graph: 'SimpleGraph',
+        concepts: List[str],
+        position: Dict[str, int],
+        similarities: Dict[Tuple[str, str], float]
+    ) -> None:
+        """Score cluster member pairs that were not LSH candidates, in concept order"""
+        ordered = sorted(concepts, key=lambda cid: position.get(cid, 0))
+        
+        for i, cid_a in enumerate(ordered):
+            for cid_b in ordered[i + 1:]:
+                if (cid_a, cid_b) in similarities:
+                    continue
+                try:
+                    sim = self.calculate_similarity(graph, cid_a, cid_b, include_details=False)
+                    similarities[(cid_a, cid_b)] = sim.overall_score
+                except ValueError:
+                    pass
+    
     def _find_cluster(
         self,
         clusters: List[Set[str]],
@@ -1016,6 +1662,8 @@ class ReasoningEngine:
     def clear_cache(self) -> None:
         """Clear all cached data"""
         self._inferred_relationships.clear()
+        self._inference_index.clear()
+        self._inferences_by_source.clear()
         self._knowledge_gaps.clear()
         self._similarities.clear()
         self._clusters.clear()
@@ -1065,6 +1713,15 @@ class SimpleGraph:
         self._adjacency[source][target] = edge_data or {}
         self._reverse_adjacency[target][source] = edge_data or {}
     
+    def remove_edge(self, source: str, target: str) -> bool:
+        """Remove an edge, returning whether it existed"""
+        if target not in self._adjacency.get(source, {}):
+            return False
+        
+        del self._adjacency[source][target]
+        self._reverse_adjacency[target].pop(source, None)
+        return True
+    
     def has_edge(self, source: str, target: str) -> bool:
         """Check if edge exists"""
         return target in self._adjacency.get(source, {})
@@ -1086,6 +1743,28 @@ class SimpleGraph:
         """Get neighbors of a node"""
         return list(self._adjacency.get(node_id, {}).keys())
     
+    def get_successors(
+        self,
+        node_id: str,
+        edge_filter: Optional[Callable] = None
+    ) -> List[str]:
+        """Get direct successors, optionally only over edges passing a filter"""
+        return [
+            target for target, edge_data in self._adjacency.get(node_id, {}).items()
+            if edge_filter is None or edge_filter(edge_data)
+        ]
+    
+    def get_predecessors(
+        self,
+        node_id: str,
+        edge_filter: Optional[Callable] = None
+    ) -> List[str]:
+        """Get direct predecessors, optionally only over edges passing a filter"""
+        return [
+            source for source, edge_data in self._reverse_adjacency.get(node_id, {}).items()
+            if edge_filter is None or edge_filter(edge_data)
+        ]
+    
     def get_prerequisites(
         self,
         node_id: str,
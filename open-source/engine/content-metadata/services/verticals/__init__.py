@@ -106,6 +106,7 @@ try:
         PhysicsConstants,
         UnitConverter,
         NumericalIntegrator,
+        BatchedIntegrator,
         PhysicsFormula,
         PhysicsFormulaRegistry,
         PhysicsVisualConfig,
@@ -145,6 +146,8 @@ try:
         WaveAnimationConfig,
         CircuitAnimationConfig,
         PhysicsAnimation,
+        FrameBuffer,
+        AnimationCache,
         ProblemDifficulty,
         SolutionStatus,
         SolutionStep,
@@ -170,6 +173,7 @@ except ImportError:
     PhysicsConstants = None
     UnitConverter = None
     NumericalIntegrator = None
+    BatchedIntegrator = None
     PhysicsFormula = None
     PhysicsFormulaRegistry = None
     PhysicsVisualConfig = None
@@ -209,6 +213,8 @@ except ImportError:
     WaveAnimationConfig = None
     CircuitAnimationConfig = None
     PhysicsAnimation = None
+    FrameBuffer = None
+    AnimationCache = None
     ProblemDifficulty = None
     SolutionStatus = None
     SolutionStep = None
@@ -669,6 +675,7 @@ __all__ = [
     'PhysicsConstants',
     'UnitConverter',
     'NumericalIntegrator',
+    'BatchedIntegrator',
     'PhysicsFormula',
     'PhysicsFormulaRegistry',
     'PhysicsVisualConfig',
@@ -708,6 +715,8 @@ __all__ = [
     'WaveAnimationConfig',
     'CircuitAnimationConfig',
     'PhysicsAnimation',
+    'FrameBuffer',
+    'AnimationCache',
     'ProblemDifficulty',
     'SolutionStatus',
     'SolutionStep',
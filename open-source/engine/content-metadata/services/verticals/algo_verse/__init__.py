@@ -48,7 +48,10 @@ from .algo_animation_service import (
     AnimationFrame,
     GraphAnimationFrame,
     TreeAnimationFrame,
-    AnimationSequence
+    AnimationSequence,
+    FrameDelta,
+    FrameStream,
+    TrackedArray
 )
 
 from .algo_reasoning_engine import (
@@ -161,6 +164,9 @@ __all__ = [
     "GraphAnimationFrame",
     "TreeAnimationFrame",
     "AnimationSequence",
+    "FrameDelta",
+    "FrameStream",
+    "TrackedArray",
     
     # Reasoning Engine
     "AlgoVerseReasoningEngine",
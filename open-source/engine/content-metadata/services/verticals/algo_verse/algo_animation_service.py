@@ -16,11 +16,19 @@ Key Features:
 - Search algorithm animations (binary search, linear search)
 - Custom algorithm animation support
 - Frame state tracking and metadata
+- Delta/keyframe frame streams for large inputs
+
+Frame lists store a full copy of the data in every frame, which is O(n) per
+frame. For large inputs, ``stream_sorting_frames`` produces frames lazily as
+compact deltas (swap and set-index operations) with a full keyframe every
+``keyframe_interval`` frames, so a frame costs O(changes) and any frame can
+still be materialized by seeking from the nearest keyframe.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+import bisect
 import copy
 
 
@@ -166,6 +174,283 @@ class AnimationSequence:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+# Delta operations recorded between consecutive streamed frames
+OP_SET = "set"    # ("set", index, value)
+OP_SWAP = "swap"  # ("swap", i, j)
+
+
+class TrackedArray(list):
+    """
+    List that records index assignments for delta frames.
+    
+    Plain ``data[i] = value`` writes are logged as set operations, and the
+    ``a[i], a[j] = a[j], a[i]`` idiom collapses into a single swap. Any other
+    mutation (slice assignment, append, sort, ...) marks the array dirty, so
+    the next frame falls back to a keyframe.
+    
+    Attributes:
+        recorder: Delta recorder of the stream this array belongs to
+    """
+    
+    __slots__ = ('recorder', '_operations', '_dirty')
+    
+    def __init__(self, values: Any = (), recorder: Optional['_DeltaRecorder'] = None):
+        super().__init__(values)
+        self.recorder = recorder
+        self._operations: List[Tuple] = []
+        self._dirty = False
+    
+    def __setitem__(self, index, value):
+        if not isinstance(index, int):
+            super().__setitem__(index, value)
+            self._mark_dirty()
+            return
+        
+        if index < 0:
+            index += len(self)
+        previous = self[index]
+        super().__setitem__(index, value)
+        if self._dirty:
+            return
+        
+        operations = self._operations
+        if operations:
+            last = operations[-1]
+            # Second half of a tuple swap: a[i] took our old value, we take a[i]'s
+            if (last[0] == OP_SET and last[1] != index and value is last[3]
+                    and previous is last[2]):
+                operations[-1] = (OP_SWAP, last[1], index)
+                return
+        operations.append((OP_SET, index, value, previous))
+    
+    def _mark_dirty(self):
+        self._dirty = True
+        self._operations.clear()
+    
+    def take_operations(self) -> Optional[List[Tuple]]:
+        """
+        Get the operations recorded since the last call and reset the log.
+        
+        Returns:
+            Operations in ``OP_SET``/``OP_SWAP`` form, or None if the array
+            was mutated in a way that needs a keyframe
+        """
+        if self._dirty:
+            self._dirty = False
+            return None
+        
+        operations = [
+            op if op[0] == OP_SWAP else op[:3]
+            for op in self._operations
+        ]
+        self._operations.clear()
+        return operations
+
+
+def _tracked_method(name: str):
+    method = getattr(list, name)
+    
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._mark_dirty()
+        return result
+    
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert',
+              'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(TrackedArray, _name, _tracked_method(_name))
+
+
+@dataclass
+class FrameDelta:
+    """
+    A streamed sorting/search frame stored as a change to the previous frame.
+    
+    Attributes:
+        frame_number: Sequential number of this frame in the animation
+        operations: Swap/set operations turning the previous frame's data
+            into this frame's data
+        keyframe: Full copy of the data for keyframes, None otherwise
+        highlighted_indices: List of indices currently being highlighted
+        element_states: Mapping of indices to their visual states
+        message: Description of what operation is being performed
+        metadata: Additional frame-specific information
+        timestamp: Relative timestamp within the animation sequence
+    """
+    frame_number: int
+    operations: List[Tuple] = field(default_factory=list)
+    keyframe: Optional[List[Any]] = None
+    highlighted_indices: List[int] = field(default_factory=list)
+    element_states: Dict[int, ElementState] = field(default_factory=dict)
+    message: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0
+    
+    @property
+    def is_keyframe(self) -> bool:
+        return self.keyframe is not None
+    
+    def apply(self, state: List[Any]) -> List[Any]:
+        """Advance the previous frame's data (in place) to this frame's data."""
+        if self.keyframe is not None:
+            state[:] = self.keyframe
+            return state
+        
+        for op in self.operations:
+            if op[0] == OP_SWAP:
+                i, j = op[1], op[2]
+                state[i], state[j] = state[j], state[i]
+            else:
+                state[op[1]] = op[2]
+        return state
+    
+    def to_frame(self, state: List[Any]) -> AnimationFrame:
+        """Build a full AnimationFrame holding a copy of ``state``."""
+        return AnimationFrame(
+            frame_number=self.frame_number,
+            data_state=list(state),
+            highlighted_indices=self.highlighted_indices,
+            element_states=self.element_states,
+            message=self.message,
+            metadata=self.metadata,
+            timestamp=self.timestamp
+        )
+
+
+class _DeltaRecorder:
+    """Turns frames over TrackedArrays into keyframes and deltas."""
+    
+    def __init__(self, keyframe_interval: int):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._array: Optional[TrackedArray] = None
+        self._since_keyframe = 0
+    
+    def record(self, frame_number: int, data: TrackedArray, message: str,
+               metadata: Dict[str, Any]) -> FrameDelta:
+        operations = data.take_operations()
+        
+        # Keyframe on a schedule, after untracked mutations, and whenever the
+        # animation switches to showing a different array (e.g. radix output)
+        if (operations is None or data is not self._array
+                or self._since_keyframe + 1 >= self.keyframe_interval):
+            self._array = data
+            self._since_keyframe = 0
+            return FrameDelta(
+                frame_number=frame_number,
+                keyframe=list(data),
+                message=message,
+                metadata=metadata
+            )
+        
+        self._since_keyframe += 1
+        return FrameDelta(
+            frame_number=frame_number,
+            operations=operations,
+            message=message,
+            metadata=metadata
+        )
+
+
+class FrameStream:
+    """
+    Lazily generated delta/keyframe frame sequence.
+    
+    Iterating a stream runs the animation generator and yields FrameDelta
+    objects without retaining them, so memory stays bounded by the input
+    size. ``frames()`` yields full AnimationFrames the same way, and
+    ``seek()`` materializes any single frame by replaying from the nearest
+    keyframe.
+    
+    With ``cache=True`` the deltas generated so far are kept for seeking;
+    they are O(changes) per frame plus one keyframe every
+    ``keyframe_interval`` frames. With ``cache=False`` each seek re-runs the
+    generator from the start in constant memory.
+    """
+    
+    def __init__(self, factory: Callable[[], Iterator[FrameDelta]], cache: bool = True):
+        """
+        Create a stream.
+        
+        Args:
+            factory: Callable returning a fresh FrameDelta generator
+            cache: Whether to keep generated deltas for random access
+        """
+        self._factory = factory
+        self.cache = cache
+        self._deltas: List[FrameDelta] = []
+        self._keyframe_positions: List[int] = []
+        self._source: Optional[Iterator[FrameDelta]] = None
+        self._exhausted = False
+    
+    def __iter__(self) -> Iterator[FrameDelta]:
+        if self._exhausted:
+            return iter(self._deltas)
+        return self._factory()
+    
+    def frames(self) -> Iterator[AnimationFrame]:
+        """Yield fully materialized frames in order."""
+        state: List[Any] = []
+        for delta in self:
+            yield delta.to_frame(delta.apply(state))
+    
+    def seek(self, index: int) -> AnimationFrame:
+        """
+        Materialize the frame at a 0-based position.
+        
+        Raises:
+            IndexError: If the stream has fewer frames
+        """
+        if index < 0:
+            raise IndexError("Frame index must be non-negative")
+        
+        if not self.cache:
+            state: List[Any] = []
+            for position, delta in enumerate(self._factory()):
+                delta.apply(state)
+                if position == index:
+                    return delta.to_frame(state)
+            raise IndexError(f"Frame index out of range: {index}")
+        
+        self._fill_to(index)
+        if index >= len(self._deltas):
+            raise IndexError(f"Frame index out of range: {index}")
+        
+        start = self._keyframe_positions[bisect.bisect_right(self._keyframe_positions, index) - 1]
+        state = []
+        for position in range(start, index + 1):
+            self._deltas[position].apply(state)
+        return self._deltas[index].to_frame(state)
+    
+    def __len__(self) -> int:
+        """Total frame count (generates and caches the whole stream)."""
+        if not self.cache:
+            return sum(1 for _ in self._factory())
+        self._fill_to(None)
+        return len(self._deltas)
+    
+    def _fill_to(self, index: Optional[int]):
+        """Generate and cache deltas up to ``index`` (or to the end)."""
+        if self._exhausted:
+            return
+        if self._source is None:
+            self._source = self._factory()
+        
+        while index is None or len(self._deltas) <= index:
+            delta = next(self._source, None)
+            if delta is None:
+                self._exhausted = True
+                self._source = None
+                return
+            if delta.is_keyframe:
+                self._keyframe_positions.append(len(self._deltas))
+            self._deltas.append(delta)
+
+
 class AlgoVerseAnimationService:
     """
     Service for generating algorithm animation frames.
@@ -214,7 +499,7 @@ class AlgoVerseAnimationService:
         data: List[Any],
         message: str = "",
         metadata: Optional[Dict[str, Any]] = None
-    ) -> AnimationFrame:
+    ) -> Union[AnimationFrame, FrameDelta]:
         """
         Create a base animation frame with common attributes.
         
@@ -224,8 +509,14 @@ class AlgoVerseAnimationService:
             metadata: Additional frame-specific information
             
         Returns:
-            A new AnimationFrame instance
+            A new AnimationFrame instance, or a FrameDelta when ``data`` is
+            the TrackedArray of a frame stream
         """
+        if isinstance(data, TrackedArray) and data.recorder is not None:
+            return data.recorder.record(
+                self._next_frame_number(), data, message, metadata or {}
+            )
+        
         return AnimationFrame(
             frame_number=self._next_frame_number(),
             data_state=copy.deepcopy(data),
@@ -258,41 +549,98 @@ class AlgoVerseAnimationService:
         Raises:
             ValueError: If the algorithm is not supported
         """
-        if isinstance(algorithm, str):
-            try:
-                algorithm = SortingAlgorithm(algorithm.lower())
-            except ValueError:
-                raise ValueError(f"Unsupported sorting algorithm: {algorithm}")
+        algorithm = self._resolve_sorting_algorithm(algorithm)
         
         # Create a deep copy to avoid modifying original data
         working_data = copy.deepcopy(data)
-        frames = []
+        return list(self._iter_sorting_frames(working_data, algorithm, custom_comparator))
+    
+    def stream_sorting_frames(
+        self,
+        data: List[Union[int, float]],
+        algorithm: Union[str, SortingAlgorithm],
+        custom_comparator: Optional[callable] = None,
+        keyframe_interval: Optional[int] = None,
+        cache: bool = True
+    ) -> FrameStream:
+        """
+        Generate sorting animation frames lazily as keyframes and deltas.
         
+        Produces the same frames as ``create_sorting_frames`` without copying
+        the array into every frame: each FrameDelta carries the swap/set
+        operations since the previous frame, with a full keyframe every
+        ``keyframe_interval`` frames. Frames are numbered from 1 per stream.
+        
+        Args:
+            data: List of comparable elements to sort
+            algorithm: Sorting algorithm to animate (name or enum)
+            custom_comparator: Optional custom comparison function
+            keyframe_interval: Frames between keyframes (defaults to the
+                array length, keeping keyframe copies O(1) per frame amortized)
+            cache: Whether the stream keeps generated deltas for seeking
+        
+        Returns:
+            FrameStream over the sorting process
+        
+        Raises:
+            ValueError: If the algorithm is not supported
+        """
+        algorithm = self._resolve_sorting_algorithm(algorithm)
+        initial_data = list(data)
+        if keyframe_interval is None:
+            keyframe_interval = max(DEFAULT_KEYFRAME_INTERVAL, len(initial_data))
+        
+        def generate() -> Iterator[FrameDelta]:
+            working_data = TrackedArray(initial_data, _DeltaRecorder(keyframe_interval))
+            frames = self._iter_sorting_frames(working_data, algorithm, custom_comparator)
+            for frame_number, delta in enumerate(frames, 1):
+                delta.frame_number = frame_number
+                yield delta
+        
+        return FrameStream(generate, cache=cache)
+    
+    @staticmethod
+    def _resolve_sorting_algorithm(algorithm: Union[str, SortingAlgorithm]) -> SortingAlgorithm:
+        """Convert an algorithm name to its enum, rejecting unknown names."""
+        if isinstance(algorithm, str):
+            try:
+                return SortingAlgorithm(algorithm.lower())
+            except ValueError:
+                raise ValueError(f"Unsupported sorting algorithm: {algorithm}")
+        return algorithm
+    
+    def _iter_sorting_frames(
+        self,
+        working_data: List[Union[int, float]],
+        algorithm: SortingAlgorithm,
+        custom_comparator: Optional[callable] = None
+    ) -> Iterator[Union[AnimationFrame, FrameDelta]]:
+        """Generate initial, algorithm and final frames, sorting ``working_data`` in place."""
         # Add initial state frame
         initial_frame = self._create_base_frame(
             working_data,
             message=f"Starting {algorithm.value.replace('_', ' ').title()} on array of size {len(working_data)}",
             metadata={"phase": "initial"}
         )
-        frames.append(initial_frame)
+        yield initial_frame
         
         # Generate algorithm-specific frames
         if algorithm == SortingAlgorithm.BUBBLE_SORT:
-            frames.extend(self._animate_bubble_sort(working_data, custom_comparator))
+            yield from self._animate_bubble_sort(working_data, custom_comparator)
         elif algorithm == SortingAlgorithm.SELECTION_SORT:
-            frames.extend(self._animate_selection_sort(working_data, custom_comparator))
+            yield from self._animate_selection_sort(working_data, custom_comparator)
         elif algorithm == SortingAlgorithm.INSERTION_SORT:
-            frames.extend(self._animate_insertion_sort(working_data, custom_comparator))
+            yield from self._animate_insertion_sort(working_data, custom_comparator)
         elif algorithm == SortingAlgorithm.MERGE_SORT:
-            frames.extend(self._animate_merge_sort(working_data, custom_comparator))
+            yield from self._animate_merge_sort(working_data, custom_comparator)
         elif algorithm == SortingAlgorithm.QUICK_SORT:
-            frames.extend(self._animate_quick_sort(working_data, custom_comparator))
+            yield from self._animate_quick_sort(working_data, custom_comparator)
         elif algorithm == SortingAlgorithm.HEAP_SORT:
-            frames.extend(self._animate_heap_sort(working_data, custom_comparator))
+            yield from self._animate_heap_sort(working_data, custom_comparator)
         elif algorithm == SortingAlgorithm.RADIX_SORT:
-            frames.extend(self._animate_radix_sort(working_data))
+            yield from self._animate_radix_sort(working_data)
         elif algorithm == SortingAlgorithm.SHELL_SORT:
-            frames.extend(self._animate_shell_sort(working_data, custom_comparator))
+            yield from self._animate_shell_sort(working_data, custom_comparator)
         else:
             raise ValueError(f"Algorithm not yet implemented: {algorithm}")
         
@@ -306,17 +654,14 @@ class AlgoVerseAnimationService:
         for i in range(len(working_data)):
             final_frame.element_states[i] = ElementState.COMPLETED
         final_frame.highlighted_indices = list(range(len(working_data)))
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     def _animate_bubble_sort(
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for bubble sort animation."""
-        frames = []
         n = len(data)
         comparator = custom_comparator or (lambda a, b: a > b)
         
@@ -331,7 +676,7 @@ class AlgoVerseAnimationService:
                 comp_frame.highlighted_indices = [j, j + 1]
                 comp_frame.element_states[j] = ElementState.COMPARING
                 comp_frame.element_states[j + 1] = ElementState.COMPARING
-                frames.append(comp_frame)
+                yield comp_frame
                 
                 # Swap if needed
                 if comparator(data[j], data[j + 1]):
@@ -344,7 +689,7 @@ class AlgoVerseAnimationService:
                     swap_frame.highlighted_indices = [j, j + 1]
                     swap_frame.element_states[j] = ElementState.SWAPPING
                     swap_frame.element_states[j + 1] = ElementState.SWAPPING
-                    frames.append(swap_frame)
+                    yield swap_frame
                     
                     # Perform swap
                     data[j], data[j + 1] = data[j + 1], data[j]
@@ -356,7 +701,7 @@ class AlgoVerseAnimationService:
                         metadata={"phase": "after_swap", "indices": [j, j + 1]}
                     )
                     after_swap.highlighted_indices = [j, j + 1]
-                    frames.append(after_swap)
+                    yield after_swap
             
             # Mark the last element of this pass as sorted
             sorted_frame = self._create_base_frame(
@@ -365,17 +710,14 @@ class AlgoVerseAnimationService:
                 metadata={"phase": "pass_complete", "sorted_index": n - i - 1}
             )
             sorted_frame.element_states[n - i - 1] = ElementState.COMPLETED
-            frames.append(sorted_frame)
-        
-        return frames
+            yield sorted_frame
     
     def _animate_selection_sort(
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for selection sort animation."""
-        frames = []
         n = len(data)
         comparator = custom_comparator or (lambda a, b: a > b)
         
@@ -390,7 +732,7 @@ class AlgoVerseAnimationService:
             )
             find_min_frame.highlighted_indices = list(range(i, n))
             find_min_frame.element_states[i] = ElementState.ACTIVE
-            frames.append(find_min_frame)
+            yield find_min_frame
             
             for j in range(i + 1, n):
                 # Comparison with current minimum
@@ -402,7 +744,7 @@ class AlgoVerseAnimationService:
                 comp_frame.highlighted_indices = [min_idx, j]
                 comp_frame.element_states[min_idx] = ElementState.ACTIVE
                 comp_frame.element_states[j] = ElementState.COMPARING
-                frames.append(comp_frame)
+                yield comp_frame
                 
                 if comparator(data[min_idx], data[j]):
                     min_idx = j
@@ -415,7 +757,7 @@ class AlgoVerseAnimationService:
                     )
                     new_min_frame.highlighted_indices = [min_idx]
                     new_min_frame.element_states[min_idx] = ElementState.ACTIVE
-                    frames.append(new_min_frame)
+                    yield new_min_frame
             
             # Swap if minimum is not in correct position
             if min_idx != i:
@@ -427,7 +769,7 @@ class AlgoVerseAnimationService:
                 swap_frame.highlighted_indices = [i, min_idx]
                 swap_frame.element_states[i] = ElementState.SWAPPING
                 swap_frame.element_states[min_idx] = ElementState.SWAPPING
-                frames.append(swap_frame)
+                yield swap_frame
                 
                 data[i], data[min_idx] = data[min_idx], data[i]
                 
@@ -438,7 +780,7 @@ class AlgoVerseAnimationService:
                 )
                 after_swap.highlighted_indices = [i]
                 after_swap.element_states[i] = ElementState.COMPLETED
-                frames.append(after_swap)
+                yield after_swap
             else:
                 # Element already in correct position
                 correct_frame = self._create_base_frame(
@@ -447,17 +789,14 @@ class AlgoVerseAnimationService:
                     metadata={"phase": "correct_position", "index": i}
                 )
                 correct_frame.element_states[i] = ElementState.COMPLETED
-                frames.append(correct_frame)
-        
-        return frames
+                yield correct_frame
     
     def _animate_insertion_sort(
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for insertion sort animation."""
-        frames = []
         comparator = custom_comparator or (lambda a, b: a > b)
         
         for i in range(1, len(data)):
@@ -472,7 +811,7 @@ class AlgoVerseAnimationService:
             )
             insert_frame.highlighted_indices = list(range(i))
             insert_frame.element_states[i] = ElementState.ACTIVE
-            frames.append(insert_frame)
+            yield insert_frame
             
             # Move elements greater than key
             while j >= 0 and comparator(data[j], key):
@@ -485,7 +824,7 @@ class AlgoVerseAnimationService:
                 shift_frame.highlighted_indices = [j, j + 1, i]
                 shift_frame.element_states[j] = ElementState.SWAPPING
                 shift_frame.element_states[j + 1] = ElementState.SWAPPING
-                frames.append(shift_frame)
+                yield shift_frame
                 
                 data[j + 1] = data[j]
                 
@@ -495,7 +834,7 @@ class AlgoVerseAnimationService:
                     metadata={"phase": "after_shift", "position": j}
                 )
                 after_shift.highlighted_indices = list(range(j + 1, i + 1))
-                frames.append(after_shift)
+                yield after_shift
                 
                 j -= 1
             
@@ -510,17 +849,14 @@ class AlgoVerseAnimationService:
             insert_complete.highlighted_indices = list(range(i + 1))
             for k in range(i + 1):
                 insert_complete.element_states[k] = ElementState.COMPLETED
-            frames.append(insert_complete)
-        
-        return frames
+            yield insert_complete
     
     def _animate_merge_sort(
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for merge sort animation."""
-        frames = []
         
         def merge_sort_helper(arr: List[Union[int, float]], left: int, right: int):
             if left >= right:
@@ -535,32 +871,29 @@ class AlgoVerseAnimationService:
                 metadata={"phase": "divide", "left": left, "right": right, "mid": mid}
             )
             divide_frame.highlighted_indices = list(range(left, right + 1))
-            frames.append(divide_frame)
+            yield divide_frame
             
             # Sort left half
-            merge_sort_helper(arr if left == 0 else data, left, mid)
+            yield from merge_sort_helper(arr if left == 0 else data, left, mid)
             
             # Sort right half
-            merge_sort_helper(arr if left == 0 else data, mid + 1, right)
+            yield from merge_sort_helper(arr if left == 0 else data, mid + 1, right)
             
             # Merge step
-            self._animate_merge(
+            yield from self._animate_merge(
                 data if left == 0 else arr,
-                left, mid, right,
-                frames
+                left, mid, right
             )
         
-        merge_sort_helper(data, 0, len(data) - 1)
-        return frames
+        yield from merge_sort_helper(data, 0, len(data) - 1)
     
     def _animate_merge(
         self,
         arr: List[Union[int, float]],
         left: int,
         mid: int,
-        right: int,
-        frames: List[AnimationFrame]
-    ) -> None:
+        right: int
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for merge operation in merge sort."""
         # Create copies of both halves
         left_half = arr[left:mid + 1].copy()
@@ -573,7 +906,7 @@ class AlgoVerseAnimationService:
             metadata={"phase": "merge_start", "left": left, "mid": mid, "right": right}
         )
         merge_start.highlighted_indices = list(range(left, right + 1))
-        frames.append(merge_start)
+        yield merge_start
         
         i = j = 0
         k = left
@@ -588,7 +921,7 @@ class AlgoVerseAnimationService:
             comp_frame.highlighted_indices = [left + i, mid + 1 + j]
             comp_frame.element_states[left + i] = ElementState.COMPARING
             comp_frame.element_states[mid + 1 + j] = ElementState.COMPARING
-            frames.append(comp_frame)
+            yield comp_frame
             
             if left_half[i] <= right_half[j]:
                 arr[k] = left_half[i]
@@ -599,7 +932,7 @@ class AlgoVerseAnimationService:
                 )
                 placed_frame.highlighted_indices = [k]
                 placed_frame.element_states[k] = ElementState.COMPLETED
-                frames.append(placed_frame)
+                yield placed_frame
                 i += 1
             else:
                 arr[k] = right_half[j]
@@ -610,7 +943,7 @@ class AlgoVerseAnimationService:
                 )
                 placed_frame.highlighted_indices = [k]
                 placed_frame.element_states[k] = ElementState.COMPLETED
-                frames.append(placed_frame)
+                yield placed_frame
                 j += 1
             k += 1
         
@@ -624,7 +957,7 @@ class AlgoVerseAnimationService:
             )
             remaining_frame.highlighted_indices = [k]
             remaining_frame.element_states[k] = ElementState.COMPLETED
-            frames.append(remaining_frame)
+            yield remaining_frame
             i += 1
             k += 1
         
@@ -638,7 +971,7 @@ class AlgoVerseAnimationService:
             )
             remaining_frame.highlighted_indices = [k]
             remaining_frame.element_states[k] = ElementState.COMPLETED
-            frames.append(remaining_frame)
+            yield remaining_frame
             j += 1
             k += 1
         
@@ -651,15 +984,14 @@ class AlgoVerseAnimationService:
         merge_complete.highlighted_indices = list(range(left, right + 1))
         for idx in range(left, right + 1):
             merge_complete.element_states[idx] = ElementState.COMPLETED
-        frames.append(merge_complete)
+        yield merge_complete
     
     def _animate_quick_sort(
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for quick sort animation."""
-        frames = []
         
         def quick_sort_helper(arr: List[Union[int, float]], low: int, high: int):
             if low < high:
@@ -671,25 +1003,23 @@ class AlgoVerseAnimationService:
                 )
                 pivot_frame.highlighted_indices = list(range(low, high + 1))
                 pivot_frame.element_states[high] = ElementState.ACTIVE  # Using last element as pivot
-                frames.append(pivot_frame)
+                yield pivot_frame
                 
-                pivot_idx = self._animate_partition(arr, low, high, frames)
+                pivot_idx = yield from self._animate_partition(arr, low, high)
                 
                 # Recursively sort partitions
-                quick_sort_helper(arr, low, pivot_idx - 1)
-                quick_sort_helper(arr, pivot_idx + 1, high)
+                yield from quick_sort_helper(arr, low, pivot_idx - 1)
+                yield from quick_sort_helper(arr, pivot_idx + 1, high)
         
-        quick_sort_helper(data, 0, len(data) - 1)
-        return frames
+        yield from quick_sort_helper(data, 0, len(data) - 1)
     
     def _animate_partition(
         self,
         arr: List[Union[int, float]],
         low: int,
-        high: int,
-        frames: List[AnimationFrame]
-    ) -> int:
-        """Generate frames for partition operation in quick sort."""
+        high: int
+    ) -> Iterator[AnimationFrame]:
+        """Generate frames for partition operation in quick sort; returns the pivot index."""
         pivot = arr[high]
         i = low - 1
         
@@ -701,7 +1031,7 @@ class AlgoVerseAnimationService:
         )
         pivot_info.highlighted_indices = [high]
         pivot_info.element_states[high] = ElementState.ACTIVE
-        frames.append(pivot_info)
+        yield pivot_info
         
         for j in range(low, high):
             # Compare with pivot
@@ -713,7 +1043,7 @@ class AlgoVerseAnimationService:
             comp_frame.highlighted_indices = [j, high]
             comp_frame.element_states[j] = ElementState.COMPARING
             comp_frame.element_states[high] = ElementState.ACTIVE
-            frames.append(comp_frame)
+            yield comp_frame
             
             if arr[j] <= pivot:
                 i += 1
@@ -728,7 +1058,7 @@ class AlgoVerseAnimationService:
                     swap_frame.highlighted_indices = [i, j]
                     swap_frame.element_states[i] = ElementState.SWAPPING
                     swap_frame.element_states[j] = ElementState.SWAPPING
-                    frames.append(swap_frame)
+                    yield swap_frame
                     
                     arr[i], arr[j] = arr[j], arr[i]
                     
@@ -738,7 +1068,7 @@ class AlgoVerseAnimationService:
                         metadata={"phase": "after_pivot_swap"}
                     )
                     after_swap.highlighted_indices = list(range(low, i + 1))
-                    frames.append(after_swap)
+                    yield after_swap
             else:
                 not_moved = self._create_base_frame(
                     arr,
@@ -746,7 +1076,7 @@ class AlgoVerseAnimationService:
                     metadata={"phase": "pivot_not_moved", "value": arr[j]}
                 )
                 not_moved.highlighted_indices = [j]
-                frames.append(not_moved)
+                yield not_moved
         
         # Final swap to place pivot
         if i + 1 != high:
@@ -758,7 +1088,7 @@ class AlgoVerseAnimationService:
             final_swap.highlighted_indices = [i + 1, high]
             final_swap.element_states[i + 1] = ElementState.SWAPPING
             final_swap.element_states[high] = ElementState.SWAPPING
-            frames.append(final_swap)
+            yield final_swap
             
             arr[i + 1], arr[high] = arr[high], arr[i + 1]
         
@@ -769,7 +1099,7 @@ class AlgoVerseAnimationService:
         )
         pivot_placed.highlighted_indices = [i + 1]
         pivot_placed.element_states[i + 1] = ElementState.COMPLETED
-        frames.append(pivot_placed)
+        yield pivot_placed
         
         return i + 1
     
@@ -777,9 +1107,8 @@ class AlgoVerseAnimationService:
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for heap sort animation."""
-        frames = []
         n = len(data)
         
         # Build max heap
@@ -789,10 +1118,10 @@ class AlgoVerseAnimationService:
             metadata={"phase": "build_heap"}
         )
         build_heap_frame.highlighted_indices = list(range(n))
-        frames.append(build_heap_frame)
+        yield build_heap_frame
         
         for i in range(n // 2 - 1, -1, -1):
-            self._animate_heapify(data, n, i, frames)
+            yield from self._animate_heapify(data, n, i)
         
         # Extract elements from heap
         extract_frame = self._create_base_frame(
@@ -800,7 +1129,7 @@ class AlgoVerseAnimationService:
             message="Max heap built. Starting to extract elements in sorted order.",
             metadata={"phase": "extract_start"}
         )
-        frames.append(extract_frame)
+        yield extract_frame
         
         for i in range(n - 1, 0, -1):
             # Swap root (max element) with last element
@@ -812,7 +1141,7 @@ class AlgoVerseAnimationService:
             swap_frame.highlighted_indices = [0, i]
             swap_frame.element_states[0] = ElementState.SWAPPING
             swap_frame.element_states[i] = ElementState.SWAPPING
-            frames.append(swap_frame)
+            yield swap_frame
             
             data[0], data[i] = data[i], data[0]
             
@@ -823,10 +1152,10 @@ class AlgoVerseAnimationService:
             )
             after_swap.highlighted_indices = list(range(i, n))
             after_swap.element_states[i] = ElementState.COMPLETED
-            frames.append(after_swap)
+            yield after_swap
             
             # Heapify the reduced heap
-            self._animate_heapify(data, i, 0, frames)
+            yield from self._animate_heapify(data, i, 0)
         
         final_frame = self._create_base_frame(
             data,
@@ -835,17 +1164,14 @@ class AlgoVerseAnimationService:
         )
         for i in range(n):
             final_frame.element_states[i] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     def _animate_heapify(
         self,
         arr: List[Union[int, float]],
         n: int,
-        i: int,
-        frames: List[AnimationFrame]
-    ) -> None:
+        i: int
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for heapify operation."""
         largest = i
         left = 2 * i + 1
@@ -861,7 +1187,7 @@ class AlgoVerseAnimationService:
             heapify_frame.highlighted_indices.append(left)
         if right < n:
             heapify_frame.highlighted_indices.append(right)
-        frames.append(heapify_frame)
+        yield heapify_frame
         
         # Compare with left child
         if left < n and arr[left] > arr[largest]:
@@ -881,22 +1207,20 @@ class AlgoVerseAnimationService:
             swap_frame.highlighted_indices = [i, largest]
             swap_frame.element_states[i] = ElementState.SWAPPING
             swap_frame.element_states[largest] = ElementState.SWAPPING
-            frames.append(swap_frame)
+            yield swap_frame
             
             arr[i], arr[largest] = arr[largest], arr[i]
             
             # Recursively heapify affected sub-tree
-            self._animate_heapify(arr, n, largest, frames)
+            yield from self._animate_heapify(arr, n, largest)
     
     def _animate_radix_sort(
         self,
         data: List[Union[int, float]]
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for radix sort animation."""
-        frames = []
-        
         if not data:
-            return frames
+            return
         
         max_val = max(data)
         num_digits = len(str(int(max_val)))
@@ -907,10 +1231,12 @@ class AlgoVerseAnimationService:
                 message=f"Sorting by digit at position {d} (1's place = {d == 0}, 10's place = {d == 1}, etc.)",
                 metadata={"phase": "digit_start", "digit_position": d}
             )
-            frames.append(digit_frame)
+            yield digit_frame
             
-            # Counting sort by digit
+            # Counting sort by digit (streamed output shares the delta recorder)
             output = [0] * len(data)
+            if isinstance(data, TrackedArray):
+                output = TrackedArray(output, data.recorder)
             count = [0] * 10
             
             # Count occurrences
@@ -921,9 +1247,9 @@ class AlgoVerseAnimationService:
             count_frame = self._create_base_frame(
                 data,
                 message=f"Digit counts: {dict(enumerate(count))}",
-                metadata={"phase": "count_digits", "counts": count}
+                metadata={"phase": "count_digits", "counts": list(count)}
             )
-            frames.append(count_frame)
+            yield count_frame
             
             # Calculate positions
             for i in range(1, 10):
@@ -932,9 +1258,9 @@ class AlgoVerseAnimationService:
             position_frame = self._create_base_frame(
                 data,
                 message=f"Cumulative counts (positions): {count}",
-                metadata={"phase": "cumulative_counts", "counts": count}
+                metadata={"phase": "cumulative_counts", "counts": list(count)}
             )
-            frames.append(position_frame)
+            yield position_frame
             
             # Build output array
             for i in range(len(data) - 1, -1, -1):
@@ -948,7 +1274,7 @@ class AlgoVerseAnimationService:
                     metadata={"phase": "place", "value": data[i], "digit": digit}
                 )
                 place_frame.highlighted_indices = [count[digit]]
-                frames.append(place_frame)
+                yield place_frame
             
             data[:] = output[:]
             
@@ -957,7 +1283,7 @@ class AlgoVerseAnimationService:
                 message=f"Pass complete for digit position {d}. Current state: {data}",
                 metadata={"phase": "digit_complete"}
             )
-            frames.append(digit_complete)
+            yield digit_complete
         
         final_frame = self._create_base_frame(
             data,
@@ -966,17 +1292,14 @@ class AlgoVerseAnimationService:
         )
         for i in range(len(data)):
             final_frame.element_states[i] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     def _animate_shell_sort(
         self,
         data: List[Union[int, float]],
         custom_comparator: Optional[callable] = None
-    ) -> List[AnimationFrame]:
+    ) -> Iterator[AnimationFrame]:
         """Generate frames for shell sort animation."""
-        frames = []
         n = len(data)
         gap = n // 2
         pass_num = 1
@@ -989,7 +1312,7 @@ class AlgoVerseAnimationService:
                 metadata={"phase": "gap_start", "gap": gap, "pass": pass_num}
             )
             gap_frame.highlighted_indices = list(range(0, n, gap))
-            frames.append(gap_frame)
+            yield gap_frame
             
             for i in range(gap, n):
                 temp = data[i]
@@ -1002,7 +1325,7 @@ class AlgoVerseAnimationService:
                 )
                 insert_frame.highlighted_indices = list(range(i % gap, i + 1, gap))
                 insert_frame.element_states[i] = ElementState.ACTIVE
-                frames.append(insert_frame)
+                yield insert_frame
                 
                 while j >= gap and comparator(data[j - gap], temp):
                     shift_frame = self._create_base_frame(
@@ -1013,7 +1336,7 @@ class AlgoVerseAnimationService:
                     shift_frame.highlighted_indices = [j - gap, j]
                     shift_frame.element_states[j - gap] = ElementState.SWAPPING
                     shift_frame.element_states[j] = ElementState.SWAPPING
-                    frames.append(shift_frame)
+                    yield shift_frame
                     
                     data[j] = data[j - gap]
                     j -= gap
@@ -1026,7 +1349,7 @@ class AlgoVerseAnimationService:
                     metadata={"phase": "gap_insert_complete"}
                 )
                 after_insert.highlighted_indices = list(range(j, i + 1, gap))
-                frames.append(after_insert)
+                yield after_insert
             
             gap //= 2
             pass_num += 1
@@ -1038,9 +1361,7 @@ class AlgoVerseAnimationService:
         )
         for i in range(len(data)):
             final_frame.element_states[i] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     # ==================== GRAPH TRAVERSAL ANIMATIONS ====================
     
@@ -1060,6 +1381,32 @@ class AlgoVerseAnimationService:
             
         Returns:
             List of GraphAnimationFrame objects
+        
+        Raises:
+            ValueError: If the traversal type is not supported
+        """
+        return list(self.stream_graph_traversal_frames(graph, start_node, traversal_type))
+    
+    def stream_graph_traversal_frames(
+        self,
+        graph: Dict[Any, List[Any]],
+        start_node: Any,
+        traversal_type: Union[str, GraphTraversalType]
+    ) -> Iterator[GraphAnimationFrame]:
+        """
+        Generate graph traversal frames lazily.
+        
+        Frames are produced one at a time as the traversal advances, so a
+        consumer that renders or serializes each frame and drops it keeps
+        memory bounded by the graph size rather than the frame count.
+        
+        Args:
+            graph: Adjacency list representation of the graph
+            start_node: Starting node for traversal
+            traversal_type: Type of graph traversal (BFS, DFS, Dijkstra, Bellman-Ford)
+        
+        Returns:
+            Iterator of GraphAnimationFrame objects
             
         Raises:
             ValueError: If the traversal type is not supported
@@ -1085,9 +1432,8 @@ class AlgoVerseAnimationService:
         self,
         graph: Dict[Any, List[Any]],
         start_node: Any
-    ) -> List[GraphAnimationFrame]:
+    ) -> Iterator[GraphAnimationFrame]:
         """Generate frames for BFS traversal animation."""
-        frames = []
         visited = set()
         queue = []
         
@@ -1101,7 +1447,7 @@ class AlgoVerseAnimationService:
             metadata={"phase": "init", "start_node": start_node}
         )
         init_frame.node_states[start_node] = ElementState.ACTIVE
-        frames.append(init_frame)
+        yield init_frame
         
         # Add start node to queue
         visited.add(start_node)
@@ -1116,7 +1462,7 @@ class AlgoVerseAnimationService:
             metadata={"phase": "enqueue", "node": start_node}
         )
         queue_frame.node_states[start_node] = ElementState.ACTIVE
-        frames.append(queue_frame)
+        yield queue_frame
         
         while queue:
             current = queue.pop(0)
@@ -1133,11 +1479,11 @@ class AlgoVerseAnimationService:
             for node in visited:
                 process_frame.node_states[node] = ElementState.COMPLETED
             process_frame.node_states[current] = ElementState.ACTIVE
-            frames.append(process_frame)
             
             # Mark as visited (if not already in visited list)
-            if current not in frames[-1].visited_nodes:
-                frames[-1].visited_nodes.append(current)
+            if current not in process_frame.visited_nodes:
+                process_frame.visited_nodes.append(current)
+            yield process_frame
             
             # Explore neighbors
             neighbors = graph.get(current, [])
@@ -1156,7 +1502,7 @@ class AlgoVerseAnimationService:
                 if neighbor not in visited:
                     neighbors_frame.edge_states[(current, neighbor)] = ElementState.COMPARING
                     neighbors_frame.node_states[neighbor] = ElementState.COMPARING
-            frames.append(neighbors_frame)
+            yield neighbors_frame
             
             for neighbor in neighbors:
                 if neighbor not in visited:
@@ -1177,7 +1523,7 @@ class AlgoVerseAnimationService:
                     edge_traversed.node_states[current] = ElementState.COMPLETED
                     edge_traversed.edge_states[(current, neighbor)] = ElementState.ACTIVE
                     edge_traversed.node_states[neighbor] = ElementState.ACTIVE
-                    frames.append(edge_traversed)
+                    yield edge_traversed
         
         # Final frame
         final_frame = GraphAnimationFrame(
@@ -1190,17 +1536,14 @@ class AlgoVerseAnimationService:
         )
         for node in visited:
             final_frame.node_states[node] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     def _animate_dfs(
         self,
         graph: Dict[Any, List[Any]],
         start_node: Any
-    ) -> List[GraphAnimationFrame]:
+    ) -> Iterator[GraphAnimationFrame]:
         """Generate frames for DFS traversal animation."""
-        frames = []
         visited = set()
         stack = [start_node]
         
@@ -1214,7 +1557,7 @@ class AlgoVerseAnimationService:
             metadata={"phase": "init", "start_node": start_node}
         )
         init_frame.node_states[start_node] = ElementState.ACTIVE
-        frames.append(init_frame)
+        yield init_frame
         
         def dfs_visit(node: Any):
             visited.add(node)
@@ -1231,7 +1574,7 @@ class AlgoVerseAnimationService:
             for v in visited:
                 process_frame.node_states[v] = ElementState.COMPLETED
             process_frame.node_states[node] = ElementState.ACTIVE
-            frames.append(process_frame)
+            yield process_frame
             
             neighbors = graph.get(node, [])
             
@@ -1253,9 +1596,9 @@ class AlgoVerseAnimationService:
                     push_frame.node_states[node] = ElementState.COMPLETED
                     push_frame.edge_states[(node, neighbor)] = ElementState.ACTIVE
                     push_frame.node_states[neighbor] = ElementState.ACTIVE
-                    frames.append(push_frame)
+                    yield push_frame
                     
-                    dfs_visit(neighbor)
+                    yield from dfs_visit(neighbor)
                     
                     # Backtrack
                     backtrack_frame = GraphAnimationFrame(
@@ -1269,12 +1612,12 @@ class AlgoVerseAnimationService:
                     for v in visited:
                         backtrack_frame.node_states[v] = ElementState.COMPLETED
                     backtrack_frame.node_states[neighbor] = ElementState.COMPLETED
-                    frames.append(backtrack_frame)
+                    yield backtrack_frame
         
         while stack:
             node = stack.pop()
             if node not in visited:
-                dfs_visit(node)
+                yield from dfs_visit(node)
         
         # Final frame
         final_frame = GraphAnimationFrame(
@@ -1287,17 +1630,14 @@ class AlgoVerseAnimationService:
         )
         for node in visited:
             final_frame.node_states[node] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     def _animate_dijkstra(
         self,
         graph: Dict[Any, List[Tuple[Any, int]]],
         start_node: Any
-    ) -> List[GraphAnimationFrame]:
+    ) -> Iterator[GraphAnimationFrame]:
         """Generate frames for Dijkstra's algorithm animation."""
-        frames = []
         
         # Initialize distances
         dist = {node: float('inf') for node in graph}
@@ -1314,7 +1654,7 @@ class AlgoVerseAnimationService:
             metadata={"phase": "init", "start_node": start_node, "distances": dist}
         )
         init_frame.node_states[start_node] = ElementState.ACTIVE
-        frames.append(init_frame)
+        yield init_frame
         
         import heapq
         pq = [(0, start_node)]
@@ -1339,7 +1679,7 @@ class AlgoVerseAnimationService:
             for node in visited:
                 process_frame.node_states[node] = ElementState.COMPLETED
             process_frame.node_states[current] = ElementState.ACTIVE
-            frames.append(process_frame)
+            yield process_frame
             
             neighbors = graph.get(current, [])
             
@@ -1363,7 +1703,7 @@ class AlgoVerseAnimationService:
                 comp_frame.node_states[current] = ElementState.COMPLETED
                 comp_frame.edge_states[(current, neighbor)] = ElementState.COMPARING
                 comp_frame.node_states[neighbor] = ElementState.COMPARING
-                frames.append(comp_frame)
+                yield comp_frame
                 
                 if new_dist < dist[neighbor]:
                     dist[neighbor] = new_dist
@@ -1381,7 +1721,7 @@ class AlgoVerseAnimationService:
                     update_frame.node_states[current] = ElementState.COMPLETED
                     update_frame.edge_states[(current, neighbor)] = ElementState.ACTIVE
                     update_frame.node_states[neighbor] = ElementState.ACTIVE
-                    frames.append(update_frame)
+                    yield update_frame
                     
                     heapq.heappush(pq, (new_dist, neighbor))
                 else:
@@ -1396,7 +1736,7 @@ class AlgoVerseAnimationService:
                     for node in visited:
                         skip_frame.node_states[node] = ElementState.COMPLETED
                     skip_frame.node_states[current] = ElementState.COMPLETED
-                    frames.append(skip_frame)
+                    yield skip_frame
         
         # Final frame
         final_frame = GraphAnimationFrame(
@@ -1409,17 +1749,14 @@ class AlgoVerseAnimationService:
         )
         for node in visited:
             final_frame.node_states[node] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     def _animate_bellman_ford(
         self,
         graph: Dict[Any, List[Tuple[Any, int]]],
         start_node: Any
-    ) -> List[GraphAnimationFrame]:
+    ) -> Iterator[GraphAnimationFrame]:
         """Generate frames for Bellman-Ford algorithm animation."""
-        frames = []
         
         # Get all nodes
         nodes = set(graph.keys())
@@ -1441,7 +1778,7 @@ class AlgoVerseAnimationService:
             metadata={"phase": "init", "start_node": start_node}
         )
         init_frame.node_states[start_node] = ElementState.ACTIVE
-        frames.append(init_frame)
+        yield init_frame
         
         # Relaxation passes
         for i in range(len(nodes) - 1):
@@ -1453,7 +1790,7 @@ class AlgoVerseAnimationService:
                 message=f"Relaxation pass {i + 1} of {len(nodes) - 1}",
                 metadata={"phase": "pass", "pass_number": i + 1}
             )
-            frames.append(pass_frame)
+            yield pass_frame
             
             relaxations = 0
             for node in nodes:
@@ -1470,7 +1807,7 @@ class AlgoVerseAnimationService:
                         relax_frame.node_states[node] = ElementState.ACTIVE
                         relax_frame.node_states[neighbor] = ElementState.ACTIVE
                         relax_frame.edge_states[(node, neighbor)] = ElementState.ACTIVE
-                        frames.append(relax_frame)
+                        yield relax_frame
                         
                         dist[neighbor] = dist[node] + weight
                         relaxations += 1
@@ -1484,7 +1821,7 @@ class AlgoVerseAnimationService:
                     message=f"No relaxations in pass {i + 1}. Distances may be optimal.",
                     metadata={"phase": "no_relax", "pass": i + 1}
                 )
-                frames.append(no_relax)
+                yield no_relax
         
         # Final frame
         final_frame = GraphAnimationFrame(
@@ -1497,9 +1834,7 @@ class AlgoVerseAnimationService:
         )
         for node in nodes:
             final_frame.node_states[node] = ElementState.COMPLETED
-        frames.append(final_frame)
-        
-        return frames
+        yield final_frame
     
     # ==================== TREE TRAVERSAL ANIMATIONS ====================
     
@@ -1855,9 +2190,9 @@ class AlgoVerseAnimationService:
             current_node=None,
             path=[],
             message="Starting level-order traversal (Breadth-first, by levels)",
-            metadata={"phase": "init", "traversal": "level-order frames.append(init_frame"}
+            metadata={"phase": "init", "traversal": "level-order"}
         )
-       )
+        frames.append(init_frame)
         
         level = 0
         while queue:
@@ -2255,7 +2590,7 @@ class AlgoVerseAnimationService:
     
     def export_frames_to_dict(
         self,
-        frames: List[Union[AnimationFrame, GraphAnimationFrame, TreeAnimationFrame]]
+        frames: List[Union[AnimationFrame, GraphAnimationFrame, TreeAnimationFrame, FrameDelta]]
     ) -> List[Dict[str, Any]]:
         """
         Export animation frames to a list of dictionaries for serialization.
@@ -2266,12 +2601,31 @@ class AlgoVerseAnimationService:
         Returns:
             List of dictionaries representing the frames
         """
-        export_list = []
+        return list(self.iter_export_frames(frames))
+    
+    def iter_export_frames(
+        self,
+        frames: Iterable[Union[AnimationFrame, GraphAnimationFrame, TreeAnimationFrame, FrameDelta]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Export animation frames one dictionary at a time.
+        
+        Accepts any iterable, including frame streams and generators, so
+        large animations can be serialized without holding every frame.
+        Streamed FrameDeltas export ``keyframe`` or ``operations`` in place
+        of ``data_state``.
+        
+        Args:
+            frames: Animation frames to export
+        
+        Yields:
+            Dictionaries representing the frames
+        """
         for frame in frames:
             frame_dict = {
                 "frame_number": frame.frame_number,
                 "message": frame.message,
-                "timestamp": frame.timestamp,
+                "timestamp": getattr(frame, "timestamp", 0.0),
                 "metadata": frame.metadata,
             }
             
@@ -2281,6 +2635,15 @@ class AlgoVerseAnimationService:
                     "highlighted_indices": frame.highlighted_indices,
                     "element_states": {str(k): v.value for k, v in frame.element_states.items()}
                 })
+            elif isinstance(frame, FrameDelta):
+                if frame.keyframe is not None:
+                    frame_dict["keyframe"] = frame.keyframe
+                else:
+                    frame_dict["operations"] = [list(op) for op in frame.operations]
+                frame_dict.update({
+                    "highlighted_indices": frame.highlighted_indices,
+                    "element_states": {str(k): v.value for k, v in frame.element_states.items()}
+                })
             elif isinstance(frame, GraphAnimationFrame):
                 frame_dict.update({
                     "visited_nodes": frame.visited_nodes,
@@ -2297,6 +2660,4 @@ class AlgoVerseAnimationService:
                     "node_states": {str(k): v.value for k, v in frame.node_states.items()}
                 })
             
-            export_list.append(frame_dict)
-        
-        return export_list
+            yield frame_dict
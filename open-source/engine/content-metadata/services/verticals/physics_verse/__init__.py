@@ -26,6 +26,7 @@ from .physics_core import (
     PhysicsConstants,
     UnitConverter,
     NumericalIntegrator,
+    BatchedIntegrator,
     PhysicsFormula,
     PhysicsFormulaRegistry,
     PhysicsVisualConfig,
@@ -77,7 +78,9 @@ from .physics_animation_service import (
     MotionAnimationConfig,
     WaveAnimationConfig,
     CircuitAnimationConfig,
-    PhysicsAnimation
+    PhysicsAnimation,
+    FrameBuffer,
+    AnimationCache
 )
 
 from .physics_reasoning_engine import (
@@ -168,6 +171,7 @@ __all__ = [
     "PhysicsConstants",
     "UnitConverter",
     "NumericalIntegrator",
+    "BatchedIntegrator",
     "PhysicsFormula",
     "PhysicsFormulaRegistry",
     "PhysicsVisualConfig",
@@ -216,6 +220,8 @@ __all__ = [
     "WaveAnimationConfig",
     "CircuitAnimationConfig",
     "PhysicsAnimation",
+    "FrameBuffer",
+    "AnimationCache",
     
     # Reasoning Engine
     "PhysicsVerseReasoningEngine",
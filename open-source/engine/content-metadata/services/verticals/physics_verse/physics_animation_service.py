@@ -8,6 +8,7 @@ and interactive physics simulations with time-based parameter control.
 Key Features:
 - Motion animations with trajectory tracing
 - Wave propagation animations (mechanical and electromagnetic)
+- Vectorized closed-form frames in compact float32 frame buffers
 - Circuit transient analysis animations
 - Orbital motion animations
 - Collision and scattering animations
@@ -16,15 +17,22 @@ Key Features:
 Licensed under the Apache License, Version 2.0
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Union, Callable
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable, Sequence
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from math import sqrt, sin, cos, tan, pi, radians, degrees
+from math import sqrt, sin, cos, tan, pi, radians, degrees, exp
 import logging
 import time
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from .physics_core import (
     Vector2D,
     Vector3D,
@@ -37,6 +45,13 @@ from .physics_core import (
 logger = logging.getLogger(__name__)
 
 
+# Frames evaluated per vectorized block; bounds float64 temporaries
+FRAME_CHUNK = 256
+
+# Rough per-vector cost of object frames (Vector2D, its __dict__, dict entry)
+OBJECT_VECTOR_BYTES = 256
+
+
 class AnimationState(Enum):
     """States of an animation."""
     IDLE = "idle"
@@ -158,7 +173,7 @@ class PhysicsAnimation:
         animation_id: Unique identifier
         animation_type: Type of animation
         total_frames: Total number of frames
-        frames: List of animation frames
+        frames: Animation frames (a FrameBuffer for closed-form animations)
         config: Animation configuration
         metadata: Additional metadata
         duration: Total animation duration
@@ -166,12 +181,231 @@ class PhysicsAnimation:
     animation_id: str
     animation_type: AnimationType
     total_frames: int
-    frames: List[AnimationFrame]
+    frames: Sequence[AnimationFrame]
     config: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     duration: float = 0.0
 
 
+class FrameBuffer(Sequence):
+    """
+    Compact storage for closed-form animations.
+    
+    Particle positions and velocities live in ``(frames, particles, 2)``
+    float32 arrays and scalar curves (circuit voltages, currents, ...) in
+    per-frame float64 arrays. Indexing materializes an AnimationFrame on
+    demand, so a buffer can stand in for ``PhysicsAnimation.frames``;
+    frames returned are fresh copies and edits to them are not kept.
+    """
+    
+    def __init__(
+        self,
+        times: Any,
+        positions: Optional[Any] = None,
+        velocities: Optional[Any] = None,
+        properties: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        particle_ids: Optional[List[str]] = None
+    ):
+        """
+        Initialize a frame buffer.
+        
+        Args:
+            times: Frame timestamps, shape (frames,)
+            positions: Particle positions, shape (frames, particles, 2)
+            velocities: Particle velocities, same shape as positions
+            properties: Scalar curves keyed by name, each shape (frames,)
+            metadata: Metadata shared by every frame
+            particle_ids: Particle IDs (defaults to "p_0", "p_1", ...)
+        """
+        self.times = np.asarray(times, dtype=float)
+        self.positions = positions
+        self.velocities = velocities
+        self.properties = properties or {}
+        self.metadata = metadata or {}
+        
+        num_particles = positions.shape[1] if positions is not None else 0
+        self.particle_ids = particle_ids or [f"p_{j}" for j in range(num_particles)]
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._frame(i) for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        return self._frame(index)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the frame arrays."""
+        arrays = [self.times, self.positions, self.velocities, *self.properties.values()]
+        return sum(array.nbytes for array in arrays if array is not None)
+    
+    def _vectors(self, array: Optional[Any], index: int) -> Dict[str, Vector2D]:
+        if array is None:
+            return {}
+        return {
+            particle_id: Vector2D(x, y)
+            for particle_id, (x, y) in zip(self.particle_ids, array[index].tolist())
+        }
+    
+    def _frame(self, index: int) -> AnimationFrame:
+        timestamp = float(self.times[index])
+        state = PhysicsState(
+            time=timestamp,
+            positions=self._vectors(self.positions, index),
+            velocities=self._vectors(self.velocities, index),
+            additional_properties={
+                name: float(values[index]) for name, values in self.properties.items()
+            }
+        )
+        return AnimationFrame(
+            frame_number=index,
+            timestamp=timestamp,
+            state=state,
+            metadata=dict(self.metadata)
+        )
+    
+    def export_dicts(self) -> List[Dict[str, Any]]:
+        """Export every frame in the format of ``export_frames_to_dict``."""
+        times = self.times.tolist()
+        positions = self.positions.tolist() if self.positions is not None else None
+        velocities = self.velocities.tolist() if self.velocities is not None else None
+        properties = {name: values.tolist() for name, values in self.properties.items()}
+        
+        def vectors(rows: Optional[List[List[float]]], index: int) -> Dict[str, Dict[str, float]]:
+            if rows is None:
+                return {}
+            return {
+                particle_id: {"x": x, "y": y}
+                for particle_id, (x, y) in zip(self.particle_ids, rows[index])
+            }
+        
+        export_list = []
+        for i, timestamp in enumerate(times):
+            frame_dict = {
+                "frame_number": i,
+                "timestamp": timestamp,
+                "metadata": dict(self.metadata),
+                "positions": vectors(positions, i),
+                "velocities": vectors(velocities, i),
+                "trail": []
+            }
+            if properties:
+                frame_dict["additional_properties"] = {
+                    name: values[i] for name, values in properties.items()
+                }
+            export_list.append(frame_dict)
+        
+        return export_list
+
+
+class AnimationCache:
+    """
+    LRU-bounded store of generated animations.
+    
+    Bounded both by entry count and by approximate frame memory: buffered
+    animations report their array sizes, object frames are estimated per
+    stored vector. The most recently created or requested animations are
+    kept.
+    """
+    
+    def __init__(self, maxsize: int = 32, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the animation cache.
+        
+        Args:
+            maxsize: Maximum number of animations to retain
+            max_bytes: Maximum approximate frame memory to retain
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, PhysicsAnimation]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes: int = 0
+        self.evictions: int = 0
+    
+    def __contains__(self, animation_id: str) -> bool:
+        return animation_id in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def keys(self) -> List[str]:
+        """Get cached animation IDs, least recently used first"""
+        return list(self._entries)
+    
+    def get(self, animation_id: str) -> Optional[PhysicsAnimation]:
+        """Get a cached animation, marking it as recently used"""
+        animation = self._entries.get(animation_id)
+        if animation is not None:
+            self._entries.move_to_end(animation_id)
+        return animation
+    
+    def put(self, animation: PhysicsAnimation) -> None:
+        """Store an animation, evicting least recently used entries if full"""
+        animation_id = animation.animation_id
+        if animation_id in self._entries:
+            self._bytes -= self._sizes[animation_id]
+        
+        size = self.estimate_bytes(animation)
+        self._entries[animation_id] = animation
+        self._entries.move_to_end(animation_id)
+        self._sizes[animation_id] = size
+        self._bytes += size
+        self._evict()
+    
+    def resize(self, maxsize: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Change the bounds, evicting entries if needed"""
+        if maxsize is not None:
+            self.maxsize = maxsize
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self._evict()
+    
+    def clear(self) -> None:
+        """Drop all cached animations"""
+        self._entries.clear()
+        self._sizes.clear()
+        self._bytes = 0
+    
+    def info(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions
+        }
+    
+    @staticmethod
+    def estimate_bytes(animation: PhysicsAnimation) -> int:
+        """Approximate frame memory of an animation."""
+        if isinstance(animation.frames, FrameBuffer):
+            return animation.frames.nbytes
+        
+        vectors = sum(
+            len(frame.state.positions) + len(frame.state.velocities) + len(frame.trail) + 1
+            for frame in animation.frames
+        )
+        return vectors * OBJECT_VECTOR_BYTES
+    
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone exceeds max_bytes
+        while len(self._entries) > max(self.maxsize, 0) or (
+            self._bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            animation_id, _ = self._entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(animation_id)
+            self.evictions += 1
+
+
 class PhysicsVerseAnimationService:
     """
     PhysicsVerse animation service.
@@ -193,7 +427,10 @@ class PhysicsVerseAnimationService:
             config: Optional configuration dictionary
         """
         self.config = config or {}
-        self._animations: Dict[str, PhysicsAnimation] = {}
+        self._animations = AnimationCache(
+            maxsize=self.config.get("max_cached_animations", 32),
+            max_bytes=self.config.get("max_animation_cache_bytes", 256 * 1024 * 1024)
+        )
         self._current_animation: Optional[PhysicsAnimation] = None
         self._current_frame_index: int = 0
         self._animation_state: AnimationState = AnimationState.IDLE
@@ -209,6 +446,10 @@ class PhysicsVerseAnimationService:
             config: Configuration dictionary with service settings
         """
         self.config.update(config)
+        self._animations.resize(
+            maxsize=config.get("max_cached_animations"),
+            max_bytes=config.get("max_animation_cache_bytes")
+        )
         logger.info("PhysicsVerseAnimationService configured with settings: %s", list(config.keys()))
     
     # ==================== MOTION ANIMATIONS ====================
@@ -305,7 +546,7 @@ class PhysicsVerseAnimationService:
             duration=anim_config.duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     def create_projectile_motion_animation(
@@ -419,7 +660,7 @@ class PhysicsVerseAnimationService:
             duration=duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     # ==================== WAVE ANIMATIONS ====================
@@ -445,7 +686,6 @@ class PhysicsVerseAnimationService:
         """
         wave_config = config or WaveAnimationConfig()
         
-        frames = []
         k = 2 * pi / wavelength  # Wave number
         omega = 2 * pi * frequency  # Angular frequency
         
@@ -456,34 +696,49 @@ class PhysicsVerseAnimationService:
         duration = wave_config.duration
         num_frames = int(duration * wave_config.fps)
         
-        for i in range(num_frames):
-            t = i * dt
-            positions = []
-            velocities = []
-            
-            for j in range(num_points):
-                x = j * spacing
-                displacement = wave_config.amplitude * sin(k * x - omega * t + wave_config.phase)
-                positions.append(Vector2D(x, displacement))
-                # Vertical velocity
-                velocities.append(Vector2D(0, -wave_config.amplitude * omega * cos(k * x - omega * t + wave_config.phase)))
-            
-            state = PhysicsState(
-                time=t,
-                positions={f"p_{j}": positions[j] for j in range(num_points)},
-                velocities={f"p_{j}": velocities[j] for j in range(num_points)}
-            )
-            
-            frame = AnimationFrame(
-                frame_number=i,
-                timestamp=t,
-                state=state,
+        if NUMPY_AVAILABLE:
+            frames = self._traveling_wave_buffer(
+                amplitude=wave_config.amplitude,
+                wave_number=k,
+                angular_frequency=omega,
+                phase=wave_config.phase,
+                grid=np.arange(num_points) * spacing,
+                times=np.arange(num_frames) * dt,
                 metadata={
                     "type": wave_config.wave_type,
                     "direction": wave_config.propagation_direction
                 }
             )
-            frames.append(frame)
+        else:
+            frames = []
+            for i in range(num_frames):
+                t = i * dt
+                positions = []
+                velocities = []
+                
+                for j in range(num_points):
+                    x = j * spacing
+                    displacement = wave_config.amplitude * sin(k * x - omega * t + wave_config.phase)
+                    positions.append(Vector2D(x, displacement))
+                    # Vertical velocity
+                    velocities.append(Vector2D(0, -wave_config.amplitude * omega * cos(k * x - omega * t + wave_config.phase)))
+                
+                state = PhysicsState(
+                    time=t,
+                    positions={f"p_{j}": positions[j] for j in range(num_points)},
+                    velocities={f"p_{j}": velocities[j] for j in range(num_points)}
+                )
+                
+                frame = AnimationFrame(
+                    frame_number=i,
+                    timestamp=t,
+                    state=state,
+                    metadata={
+                        "type": wave_config.wave_type,
+                        "direction": wave_config.propagation_direction
+                    }
+                )
+                frames.append(frame)
         
         animation = PhysicsAnimation(
             animation_id=f"wave_{datetime.now().timestamp()}",
@@ -505,7 +760,7 @@ class PhysicsVerseAnimationService:
             duration=duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     def create_standing_wave_animation(
@@ -533,7 +788,6 @@ class PhysicsVerseAnimationService:
         """
         wave_config = config or WaveAnimationConfig()
         
-        frames = []
         k = 2 * pi / wavelength
         omega = 2 * pi * frequency
         
@@ -545,30 +799,44 @@ class PhysicsVerseAnimationService:
         x_max = max(node_positions + antinode_positions) + 0.5 * wavelength
         num_points = wave_config.particle_count
         
-        for i in range(num_frames):
-            t = i * dt
-            positions = []
-            
-            for j in range(num_points):
-                x = x_min + (x_max - x_min) * j / (num_points - 1)
-                displacement = 2 * amplitude * sin(k * x) * cos(omega * t)
-                positions.append(Vector2D(x, displacement))
-            
-            state = PhysicsState(
-                time=t,
-                positions={f"p_{j}": positions[j] for j in range(num_points)}
-            )
-            
-            frame = AnimationFrame(
-                frame_number=i,
-                timestamp=t,
-                state=state,
+        if NUMPY_AVAILABLE:
+            frames = self._standing_wave_buffer(
+                amplitude=amplitude,
+                wave_number=k,
+                angular_frequency=omega,
+                grid=np.linspace(x_min, x_max, num_points),
+                times=np.arange(num_frames) * dt,
                 metadata={
                     "nodes": node_positions,
                     "antinodes": antinode_positions
                 }
             )
-            frames.append(frame)
+        else:
+            frames = []
+            for i in range(num_frames):
+                t = i * dt
+                positions = []
+                
+                for j in range(num_points):
+                    x = x_min + (x_max - x_min) * j / (num_points - 1)
+                    displacement = 2 * amplitude * sin(k * x) * cos(omega * t)
+                    positions.append(Vector2D(x, displacement))
+                
+                state = PhysicsState(
+                    time=t,
+                    positions={f"p_{j}": positions[j] for j in range(num_points)}
+                )
+                
+                frame = AnimationFrame(
+                    frame_number=i,
+                    timestamp=t,
+                    state=state,
+                    metadata={
+                        "nodes": node_positions,
+                        "antinodes": antinode_positions
+                    }
+                )
+                frames.append(frame)
         
         animation = PhysicsAnimation(
             animation_id=f"standing_wave_{datetime.now().timestamp()}",
@@ -589,7 +857,7 @@ class PhysicsVerseAnimationService:
             duration=wave_config.duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     # ==================== CIRCUIT ANIMATIONS ====================
@@ -617,44 +885,68 @@ class PhysicsVerseAnimationService:
         
         tau = resistance * capacitance  # Time constant
         
-        frames = []
         dt = 1.0 / circuit_config.fps
         num_frames = int(circuit_config.duration * circuit_config.fps)
         
-        for i in range(num_frames):
-            t = i * dt
+        if NUMPY_AVAILABLE:
+            times = np.arange(num_frames) * dt
             
-            # Calculate circuit values
-            voltage_across_cap = voltage * (1 - exp(-t / tau))
+            # Calculate circuit values for every frame at once
+            voltage_across_cap = voltage * (1 - np.exp(-times / tau))
             voltage_across_res = voltage - voltage_across_cap
             current = voltage_across_res / resistance
-            charge = capacitance * voltage_across_cap
-            power = current * voltage_across_res
             
-            state = PhysicsState(
-                time=t,
-                positions={},
-                velocities={},
-                additional_properties={
+            frames = FrameBuffer(
+                times,
+                properties={
                     "capacitor_voltage": voltage_across_cap,
                     "resistor_voltage": voltage_across_res,
                     "current": current,
-                    "charge": charge,
-                    "power": power,
+                    "charge": capacitance * voltage_across_cap,
+                    "power": current * voltage_across_res,
                     "energy": 0.5 * capacitance * voltage_across_cap**2
-                }
-            )
-            
-            frame = AnimationFrame(
-                frame_number=i,
-                timestamp=t,
-                state=state,
+                },
                 metadata={
                     "time_constant": tau,
                     "target_voltage": voltage
                 }
             )
-            frames.append(frame)
+        else:
+            frames = []
+            for i in range(num_frames):
+                t = i * dt
+                
+                # Calculate circuit values
+                voltage_across_cap = voltage * (1 - exp(-t / tau))
+                voltage_across_res = voltage - voltage_across_cap
+                current = voltage_across_res / resistance
+                charge = capacitance * voltage_across_cap
+                power = current * voltage_across_res
+                
+                state = PhysicsState(
+                    time=t,
+                    positions={},
+                    velocities={},
+                    additional_properties={
+                        "capacitor_voltage": voltage_across_cap,
+                        "resistor_voltage": voltage_across_res,
+                        "current": current,
+                        "charge": charge,
+                        "power": power,
+                        "energy": 0.5 * capacitance * voltage_across_cap**2
+                    }
+                )
+                
+                frame = AnimationFrame(
+                    frame_number=i,
+                    timestamp=t,
+                    state=state,
+                    metadata={
+                        "time_constant": tau,
+                        "target_voltage": voltage
+                    }
+                )
+                frames.append(frame)
         
         animation = PhysicsAnimation(
             animation_id=f"rc_charging_{datetime.now().timestamp()}",
@@ -676,7 +968,7 @@ class PhysicsVerseAnimationService:
             duration=circuit_config.duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     def create_rl_circuit_animation(
@@ -702,41 +994,63 @@ class PhysicsVerseAnimationService:
         
         tau = inductance / resistance  # Time constant
         
-        frames = []
         dt = 1.0 / circuit_config.fps
         num_frames = int(circuit_config.duration * circuit_config.fps)
         
-        for i in range(num_frames):
-            t = i * dt
+        if NUMPY_AVAILABLE:
+            times = np.arange(num_frames) * dt
             
-            # Calculate circuit values
-            current = (voltage / resistance) * (1 - exp(-t / tau))
+            # Calculate circuit values for every frame at once
+            current = (voltage / resistance) * (1 - np.exp(-times / tau))
             voltage_across_res = current * resistance
-            voltage_across_ind = voltage - voltage_across_res
-            power = current * voltage
-            energy = 0.5 * inductance * current**2
             
-            state = PhysicsState(
-                time=t,
-                additional_properties={
+            frames = FrameBuffer(
+                times,
+                properties={
                     "current": current,
-                    "inductor_voltage": voltage_across_ind,
+                    "inductor_voltage": voltage - voltage_across_res,
                     "resistor_voltage": voltage_across_res,
-                    "power": power,
-                    "energy": energy
-                }
-            )
-            
-            frame = AnimationFrame(
-                frame_number=i,
-                timestamp=t,
-                state=state,
+                    "power": current * voltage,
+                    "energy": 0.5 * inductance * current**2
+                },
                 metadata={
                     "time_constant": tau,
                     "max_current": voltage / resistance
                 }
             )
-            frames.append(frame)
+        else:
+            frames = []
+            for i in range(num_frames):
+                t = i * dt
+                
+                # Calculate circuit values
+                current = (voltage / resistance) * (1 - exp(-t / tau))
+                voltage_across_res = current * resistance
+                voltage_across_ind = voltage - voltage_across_res
+                power = current * voltage
+                energy = 0.5 * inductance * current**2
+                
+                state = PhysicsState(
+                    time=t,
+                    additional_properties={
+                        "current": current,
+                        "inductor_voltage": voltage_across_ind,
+                        "resistor_voltage": voltage_across_res,
+                        "power": power,
+                        "energy": energy
+                    }
+                )
+                
+                frame = AnimationFrame(
+                    frame_number=i,
+                    timestamp=t,
+                    state=state,
+                    metadata={
+                        "time_constant": tau,
+                        "max_current": voltage / resistance
+                    }
+                )
+                frames.append(frame)
         
         animation = PhysicsAnimation(
             animation_id=f"rl_circuit_{datetime.now().timestamp()}",
@@ -756,7 +1070,7 @@ class PhysicsVerseAnimationService:
             duration=circuit_config.duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     # ==================== ORBITAL ANIMATIONS ====================
@@ -851,7 +1165,7 @@ class PhysicsVerseAnimationService:
             duration=anim_config.duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     # ==================== COLLISION ANIMATIONS ====================
@@ -973,7 +1287,7 @@ class PhysicsVerseAnimationService:
             duration=anim_config.duration
         )
         
-        self._animations[animation.animation_id] = animation
+        self._animations.put(animation)
         return animation
     
     # ==================== ANIMATION CONTROL ====================
@@ -991,7 +1305,7 @@ class PhysicsVerseAnimationService:
         if animation_id not in self._animations:
             return False
         
-        self._current_animation = self._animations[animation_id]
+        self._current_animation = self._animations.get(animation_id)
         self._current_frame_index = 0
         self._animation_state = AnimationState.PLAYING
         self._start_time = time.time()
@@ -1099,6 +1413,9 @@ class PhysicsVerseAnimationService:
         Returns:
             List of frame dictionaries
         """
+        if isinstance(animation.frames, FrameBuffer):
+            return animation.frames.export_dicts()
+        
         export_list = []
         
         for frame in animation.frames:
@@ -1136,7 +1453,7 @@ class PhysicsVerseAnimationService:
         if animation_id not in self._animations:
             return None
         
-        animation = self._animations[animation_id]
+        animation = self._animations.get(animation_id)
         
         return {
             "animation_id": animation.animation_id,
@@ -1153,9 +1470,66 @@ class PhysicsVerseAnimationService:
         List all cached animations.
         
         Returns:
-            List of animation IDs
+            List of animation IDs, least recently used first
+        """
+        return self._animations.keys()
+    
+    # ==================== FRAME BUFFERS ====================
+    
+    def _traveling_wave_buffer(
+        self,
+        amplitude: float,
+        wave_number: float,
+        angular_frequency: float,
+        phase: float,
+        grid: Any,
+        times: Any,
+        metadata: Dict[str, Any]
+    ) -> FrameBuffer:
         """
-        return list(self._animations.keys())
+        Evaluate y = A sin(kx - wt + phase) for every frame and particle.
+        
+        The spatial phase kx + phase is computed once over the grid; each
+        block of frames is then a single broadcast against the times.
+        """
+        num_frames, num_points = len(times), len(grid)
+        positions = np.empty((num_frames, num_points, 2), dtype=np.float32)
+        velocities = np.zeros((num_frames, num_points, 2), dtype=np.float32)
+        positions[:, :, 0] = grid
+        
+        spatial_phase = wave_number * grid + phase
+        for start in range(0, num_frames, FRAME_CHUNK):
+            stop = min(start + FRAME_CHUNK, num_frames)
+            theta = spatial_phase - angular_frequency * times[start:stop, None]
+            positions[start:stop, :, 1] = amplitude * np.sin(theta)
+            # Vertical velocity
+            velocities[start:stop, :, 1] = -amplitude * angular_frequency * np.cos(theta)
+        
+        return FrameBuffer(times, positions=positions, velocities=velocities, metadata=metadata)
+    
+    def _standing_wave_buffer(
+        self,
+        amplitude: float,
+        wave_number: float,
+        angular_frequency: float,
+        grid: Any,
+        times: Any,
+        metadata: Dict[str, Any]
+    ) -> FrameBuffer:
+        """
+        Evaluate y = 2A sin(kx) cos(wt) as an outer product of the spatial
+        profile and the temporal factor.
+        """
+        num_frames, num_points = len(times), len(grid)
+        positions = np.empty((num_frames, num_points, 2), dtype=np.float32)
+        positions[:, :, 0] = grid
+        
+        profile = 2 * amplitude * np.sin(wave_number * grid)
+        for start in range(0, num_frames, FRAME_CHUNK):
+            stop = min(start + FRAME_CHUNK, num_frames)
+            positions[start:stop, :, 1] = np.cos(angular_frequency * times[start:stop, None]) * profile
+        
+        return FrameBuffer(times, positions=positions, metadata=metadata)
     
     # ==================== NUMERICAL INTEGRATION ====================
     
@@ -18,6 +18,7 @@ import argparse
 import logging
 import sys
 import os
+from collections import Counter
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import json
@@ -26,7 +27,19 @@ import pickle
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.graph.engine import DependencyGraphEngine, GraphStats, RelationshipType
+from services.graph.engine import (
+    DependencyGraphEngine,
+    GraphChangeset,
+    GraphEdge,
+    GraphStats,
+    RelationshipType
+)
+from services.graph.snapshot import (
+    GraphSnapshotReader,
+    SNAPSHOT_FORMAT_VERSION,
+    append_delta,
+    write_snapshot
+)
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +48,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columnar snapshots and their delta logs; '.pkl' is the legacy pickle format
+SNAPSHOT_EXTENSION = '.vvgs'
+DELTA_EXTENSION = '.delta'
+SNAPSHOT_EXTENSIONS = (SNAPSHOT_EXTENSION, '.pkl')
+
 
 class GraphRefreshTask:
     """
@@ -47,7 +65,8 @@ class GraphRefreshTask:
     def __init__(
         self,
         storage_path: str = "/tmp/visualverse/graph_snapshots",
-        version: Optional[str] = None
+        version: Optional[str] = None,
+        max_delta_count: int = 20
     ):
         """
         Initialize the graph refresh task.
@@ -55,8 +74,11 @@ class GraphRefreshTask:
         Args:
             storage_path: Path to store graph snapshots
             version: Optional version string for this refresh
+            max_delta_count: Deltas appended to a snapshot before it is
+                compacted into a new full snapshot
         """
         self.storage_path = storage_path
+        self.max_delta_count = max_delta_count
         self.version = version or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.graph = DependencyGraphEngine()
         
@@ -143,59 +165,58 @@ class GraphRefreshTask:
         }
         
         # Load existing graph if available
-        self._load_latest_snapshot()
+        loaded = self._load_latest_snapshot()
+        
+        # Collect all mutations into one changeset so indexes are rebuilt once
+        changeset = GraphChangeset()
         
         # Add new concepts
-        if new_concepts:
-            from services.graph.engine import GraphNode
-            for concept_data in new_concepts:
-                node = self._create_node_from_data(concept_data)
-                self.graph.add_node(node)
-                summary['new_concepts'] += 1
-        
-        # Update existing concepts
-        if updated_concepts:
-            for concept_data in updated_concepts:
-                node_id = concept_data.get('id')
-                if node_id and self.graph.get_node(node_id):
-                    self.graph.remove_node(node_id)
-                    node = self._create_node_from_data(concept_data)
-                    self.graph.add_node(node)
-                    summary['updated_concepts'] += 1
+        for concept_data in new_concepts or []:
+            changeset.upserted_nodes.append(self._create_node_from_data(concept_data))
+            summary['new_concepts'] += 1
+        
+        # Update existing concepts in place, keeping their relationships
+        for concept_data in updated_concepts or []:
+            node_id = concept_data.get('id')
+            if node_id and self.graph.get_node(node_id):
+                changeset.upserted_nodes.append(self._create_node_from_data(concept_data))
+                summary['updated_concepts'] += 1
         
         # Delete concepts
-        if deleted_concept_ids:
-            for node_id in deleted_concept_ids:
-                if self.graph.remove_node(node_id):
-                    summary['deleted_concepts'] += 1
+        changeset.removed_node_ids.extend(deleted_concept_ids or [])
         
         # Add new relationships
-        if new_relationships:
-            for rel_data in new_relationships:
-                if self.graph.add_edge(
-                    rel_data.get('source'),
-                    rel_data.get('target'),
-                    RelationshipType(rel_data.get('type', 'prerequisite')),
-                    rel_data.get('strength', 1.0)
-                ):
-                    summary['new_relationships'] += 1
+        for rel_data in new_relationships or []:
+            changeset.added_edges.append(GraphEdge(
+                source_id=rel_data.get('source'),
+                target_id=rel_data.get('target'),
+                relationship_type=RelationshipType(rel_data.get('type', 'prerequisite')),
+                strength=rel_data.get('strength', 1.0)
+            ))
         
         # Delete relationships
-        if deleted_relationship_ids:
-            for source, target in deleted_relationship_ids:
-                if self.graph.remove_edge(source, target):
-                    summary['deleted_relationships'] += 1
+        for source, target in deleted_relationship_ids or []:
+            changeset.removed_edges.append((source, target, None))
+        
+        applied = self.graph.apply_changeset(changeset)
+        summary['deleted_concepts'] = applied['nodes_removed']
+        summary['new_relationships'] = applied['edges_added']
+        summary['deleted_relationships'] = applied['edges_removed']
         
-        # Check for cycles after updates
-        cycles = self.graph.detect_cycles()
-        summary['cycles_detected'] = len(cycles)
+        # Count cyclic components, as snapshot summaries do; edges that
+        # closed a cycle are flagged as they are added
+        summary['cycles_detected'] = len(self.graph.find_cyclic_components())
+        cycle_edges = self.graph.get_cycle_edges()
         
-        if cycles:
-            logger.warning(f"Cycles detected after incremental update: {cycles}")
+        if cycle_edges:
+            logger.warning(f"Cycle-closing edges after incremental update: {cycle_edges}")
         
-        # Save updated graph
+        # Append the changeset to the current snapshot's delta log
         self.graph.set_materialization_version(self.version)
-        self._save_snapshot()
+        if loaded:
+            self._save_delta(changeset)
+        else:
+            self._save_snapshot()
         
         self._refresh_end = datetime.now()
         self._changes_detected = sum(
@@ -204,7 +225,7 @@ class GraphRefreshTask:
         
         duration = (self._refresh_end - self._refresh_start).total_seconds()
         logger.info(
-            f"Incremental refresh complete in {duration:.2fs}. "
+            f"Incremental refresh complete in {duration:.2f}s. "
             f"Changes: {self._changes_detected}"
         )
         
@@ -229,16 +250,13 @@ class GraphRefreshTask:
         )
     
     def _save_snapshot(self) -> str:
-        """Save the current graph to storage"""
+        """Save the current graph to storage as a columnar snapshot"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_name = f"graph_{self.version}_{timestamp}"
         
-        # Save binary snapshot
-        binary_path = os.path.join(
-            self.storage_path,
-            f"graph_{self.version}_{timestamp}.pkl"
-        )
-        with open(binary_path, 'wb') as f:
-            f.write(self.graph.serialize_binary())
+        # Save columnar snapshot
+        snapshot_path = os.path.join(self.storage_path, base_name + SNAPSHOT_EXTENSION)
+        size = write_snapshot(self.graph, snapshot_path)
         
         # Save JSON metadata
         metadata = {
@@ -246,70 +264,178 @@ class GraphRefreshTask:
             'timestamp': timestamp,
             'node_count': self.graph.node_count,
             'edge_count': self.graph.edge_count,
-            'binary_file': os.path.basename(binary_path)
+            'snapshot_file': os.path.basename(snapshot_path),
+            'format': 'columnar',
+            'format_version': SNAPSHOT_FORMAT_VERSION,
+            'size_bytes': size,
+            'base_version': self.version,
+            'delta_file': base_name + DELTA_EXTENSION,
+            'delta_count': 0,
+            'summary': self._summarize_graph()
         }
-        metadata_path = os.path.join(
-            self.storage_path,
-            f"graph_{self.version}_{timestamp}.json"
-        )
+        metadata_path = os.path.join(self.storage_path, base_name + '.json')
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
         
-        # Update latest symlink
+        self._write_latest(metadata)
+        
+        logger.info(f"Saved graph snapshot to {snapshot_path} ({size} bytes)")
+        
+        return snapshot_path
+    
+    def _save_delta(self, changeset: GraphChangeset) -> str:
+        """
+        Append a changeset to the delta log of the latest snapshot.
+        
+        Falls back to a full snapshot when there is no columnar base to
+        append to, and compacts the log into a new snapshot once it holds
+        ``max_delta_count`` entries.
+        """
+        metadata = self._read_latest()
+        if (
+            not metadata
+            or metadata.get('format') != 'columnar'
+            or metadata.get('delta_count', 0) >= self.max_delta_count
+        ):
+            return self._save_snapshot()
+        
+        delta_path = os.path.join(self.storage_path, metadata['delta_file'])
+        append_delta(delta_path, changeset, self.version)
+        
+        metadata['version'] = self.version
+        metadata['node_count'] = self.graph.node_count
+        metadata['edge_count'] = self.graph.edge_count
+        metadata['delta_count'] = metadata.get('delta_count', 0) + 1
+        metadata['summary'] = self._summarize_graph()
+        self._write_latest(metadata)
+        
+        logger.info(
+            f"Appended delta {metadata['delta_count']} to {delta_path}"
+        )
+        
+        return delta_path
+    
+    def _summarize_graph(self) -> Dict[str, Any]:
+        """
+        Summary statistics stored with each snapshot's metadata.
+        
+        Status queries read these instead of loading the graph. Centrality
+        is left out since it is too expensive to compute on every save.
+        """
+        nodes = self.graph.get_all_nodes()
+        return {
+            'subject_counts': dict(Counter(node.subject_id for node in nodes)),
+            'difficulty_distribution': dict(Counter(node.difficulty_level for node in nodes)),
+            'cycles_detected': len(self.graph.find_cyclic_components()),
+            'isolated_nodes_count': len(self.graph.find_isolated_concepts()),
+            'refreshed_at': datetime.now().isoformat()
+        }
+    
+    def _read_latest(self) -> Optional[Dict[str, Any]]:
+        """Read the latest snapshot metadata, if any"""
         latest_path = os.path.join(self.storage_path, "latest.json")
-        with open(latest_path, 'w') as f:
+        if not os.path.exists(latest_path):
+            return None
+        
+        with open(latest_path, 'r') as f:
+            return json.load(f)
+    
+    def _write_latest(self, metadata: Dict[str, Any]) -> None:
+        """Atomically replace the latest snapshot pointer"""
+        latest_path = os.path.join(self.storage_path, "latest.json")
+        tmp_path = latest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
             json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, latest_path)
+    
+    def open_snapshot_reader(self) -> Optional[GraphSnapshotReader]:
+        """
+        Memory-map the latest columnar snapshot and its delta log.
+        
+        Readers answer node and prerequisite queries directly from the
+        mapped file, so API workers can share one snapshot without each
+        deserializing the full graph. The caller must close the reader.
         
-        logger.info(f"Saved graph snapshot to {binary_path}")
+        Returns:
+            GraphSnapshotReader, or None if no columnar snapshot exists
+        """
+        metadata = self._read_latest()
+        if not metadata or metadata.get('format') != 'columnar':
+            return None
         
-        return binary_path
+        snapshot_path = os.path.join(self.storage_path, metadata['snapshot_file'])
+        delta_path = os.path.join(self.storage_path, metadata['delta_file'])
+        return GraphSnapshotReader(snapshot_path, delta_path)
     
     def _load_latest_snapshot(self) -> bool:
         """Load the latest graph snapshot"""
-        latest_path = os.path.join(self.storage_path, "latest.json")
-        
-        if not os.path.exists(latest_path):
-            logger.info("No existing graph snapshot found")
-            return False
-        
         try:
-            with open(latest_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = self._read_latest()
+            if metadata is None:
+                logger.info("No existing graph snapshot found")
+                return False
             
-            binary_path = os.path.join(self.storage_path, metadata.get('binary_file', ''))
-            
-            if os.path.exists(binary_path):
+            if metadata.get('format') == 'columnar':
+                with self.open_snapshot_reader() as reader:
+                    self.graph = reader.to_engine()
+            else:
+                # Legacy pickle snapshot
+                binary_path = os.path.join(self.storage_path, metadata.get('binary_file', ''))
+                if not os.path.exists(binary_path):
+                    return False
                 with open(binary_path, 'rb') as f:
                     self.graph.deserialize_binary(f.read())
-                
-                logger.info(
-                    f"Loaded existing graph: {self.graph.node_count} nodes, "
-                    f"{self.graph.edge_count} edges"
-                )
-                return True
             
+            logger.info(
+                f"Loaded existing graph: {self.graph.node_count} nodes, "
+                f"{self.graph.edge_count} edges"
+            )
+            return True
+        
         except Exception as e:
             logger.warning(f"Error loading graph snapshot: {e}")
         
         return False
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current graph status"""
-        self._load_latest_snapshot()
+        """
+        Get current graph status.
         
-        stats = self.graph.get_stats()
+        Served from the latest snapshot's metadata without loading the
+        graph. Snapshots written before summaries were recorded fall back
+        to loading the graph and computing its statistics.
+        """
+        metadata = self._read_latest() or {}
+        summary = metadata.get('summary')
+        
+        if summary is None:
+            self._load_latest_snapshot()
+            stats = self.graph.get_stats()
+            summary = {
+                'subject_counts': stats.subject_counts,
+                'difficulty_distribution': stats.difficulty_distribution,
+                'cycles_detected': len(self.graph.find_cyclic_components()),
+                'isolated_nodes_count': len(stats.isolated_nodes),
+                'refreshed_at': stats.last_refreshed.isoformat() if stats.last_refreshed else None
+            }
+            node_count, edge_count = stats.node_count, stats.edge_count
+        else:
+            node_count = metadata.get('node_count', 0)
+            edge_count = metadata.get('edge_count', 0)
         
         return {
             'version': self.version,
-            'status': 'loaded' if not self.graph.is_empty else 'empty',
-            'node_count': stats.node_count,
-            'edge_count': stats.edge_count,
-            'subject_counts': stats.subject_counts,
-            'difficulty_distribution': stats.difficulty_distribution,
-            'cycles_detected': stats.cycle_count,
-            'isolated_nodes_count': len(stats.isolated_nodes),
-            'last_refreshed': stats.last_refreshed.isoformat() if stats.last_refreshed else None,
-            'snapshot_count': self._count_snapshots()
+            'status': 'loaded' if node_count else 'empty',
+            'node_count': node_count,
+            'edge_count': edge_count,
+            'subject_counts': summary['subject_counts'],
+            'difficulty_distribution': summary['difficulty_distribution'],
+            'cycles_detected': summary['cycles_detected'],
+            'isolated_nodes_count': summary['isolated_nodes_count'],
+            'last_refreshed': summary['refreshed_at'],
+            'snapshot_count': self._count_snapshots(),
+            'snapshot_format': metadata.get('format', 'pickle') if metadata else None,
+            'pending_deltas': metadata.get('delta_count', 0)
         }
     
     def _count_snapshots(self) -> int:
@@ -319,7 +445,7 @@ class GraphRefreshTask:
         
         return len([
             f for f in os.listdir(self.storage_path)
-            if f.endswith('.pkl')
+            if f.endswith(SNAPSHOT_EXTENSIONS)
         ])
     
     def cleanup_old_snapshots(self, keep_count: int = 5) -> int:
@@ -338,7 +464,7 @@ class GraphRefreshTask:
         # Get all snapshot files
         snapshots = [
             f for f in os.listdir(self.storage_path)
-            if f.endswith('.pkl')
+            if f.endswith(SNAPSHOT_EXTENSIONS)
         ]
         
         if len(snapshots) <= keep_count:
@@ -352,18 +478,18 @@ class GraphRefreshTask:
         # Remove old ones
         removed = 0
         for snapshot in snapshots[keep_count:]:
-            base_name = snapshot.replace('.pkl', '')
+            base_name = os.path.splitext(snapshot)[0]
             
-            # Remove associated JSON files
-            for ext in ['.pkl', '.json']:
+            # Remove associated JSON metadata and delta log
+            for ext in SNAPSHOT_EXTENSIONS + ('.json', DELTA_EXTENSION):
                 path = os.path.join(self.storage_path, base_name + ext)
                 if os.path.exists(path):
                     os.remove(path)
-                    removed += 1
+            removed += 1
         
-        logger.info(f"Cleaned up {removed // 2} old snapshots")
+        logger.info(f"Cleaned up {removed} old snapshots")
         
-        return removed // 2
+        return removed
 
 
 def get_sample_data() -> tuple:
@@ -9,6 +9,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
@@ -71,13 +72,28 @@ class BaseRecommendationEngine(ABC):
         pass
 
 class CollaborativeFilteringEngine(BaseRecommendationEngine):
-    """Collaborative filtering recommendation engine"""
+    """
+    Collaborative filtering recommendation engine.
     
-    def __init__(self, name: str = "collaborative_filtering"):
+    Interactions are stored as a sparse (CSR) user x item matrix. Training
+    keeps only each user's and each item's top-k most similar neighbors
+    (cosine similarity), so memory grows with users * k rather than users^2,
+    and a recommendation is one sparse vector-matrix product over the
+    user's neighbors followed by a partial sort of the candidate scores.
+    """
+    
+    def __init__(self, name: str = "collaborative_filtering", num_neighbors: int = 50):
         super().__init__(name)
-        self.user_item_matrix = None
-        self.similarity_matrix = None
-        self.content_similarity = None
+        self.num_neighbors = num_neighbors
+        self.user_item_matrix: Optional[sparse.csr_matrix] = None
+        self.similarity_matrix: Optional[sparse.csr_matrix] = None  # top-k user neighbors
+        self.content_similarity: Optional[sparse.csr_matrix] = None  # top-k item neighbors
+        self.user_ids: List[str] = []
+        self.content_ids: List[str] = []
+        self.user_index: Dict[str, int] = {}
+        self.content_index: Dict[str, int] = {}
+        self._scoring_matrix: Optional[sparse.csr_matrix] = None
+        self._popularity: Optional[np.ndarray] = None
         self.interaction_weights = {
             'view': 1.0,
             'like': 3.0,
@@ -91,28 +107,41 @@ class CollaborativeFilteringEngine(BaseRecommendationEngine):
         try:
             logger.info(f"Training collaborative filtering engine with {len(interactions)} interactions")
             
-            # Convert interactions to DataFrame
-            df = pd.DataFrame([
-                {
-                    'user_id': interaction.user_id,
-                    'content_id': interaction.content_id,
-                    'weight': self.interaction_weights.get(interaction.interaction_type, 1.0) * interaction.value,
-                    'timestamp': interaction.timestamp
-                }
-                for interaction in interactions
-            ])
-            
-            if df.empty:
+            if not interactions:
                 logger.warning("No interactions provided for training")
                 return
             
-            # Create user-item matrix
-            self.user_item_matrix = df.pivot_table(
-                index='user_id',
-                columns='content_id',
-                values='weight',
-                fill_value=0.0
+            # Intern user and content IDs in sorted order
+            self.user_ids = sorted({interaction.user_id for interaction in interactions})
+            self.content_ids = sorted({interaction.content_id for interaction in interactions})
+            self.user_index = {user_id: i for i, user_id in enumerate(self.user_ids)}
+            self.content_index = {content_id: i for i, content_id in enumerate(self.content_ids)}
+            
+            rows = np.fromiter(
+                (self.user_index[interaction.user_id] for interaction in interactions),
+                dtype=np.int64, count=len(interactions)
+            )
+            cols = np.fromiter(
+                (self.content_index[interaction.content_id] for interaction in interactions),
+                dtype=np.int64, count=len(interactions)
+            )
+            weights = np.fromiter(
+                (
+                    self.interaction_weights.get(interaction.interaction_type, 1.0) * interaction.value
+                    for interaction in interactions
+                ),
+                dtype=np.float64, count=len(interactions)
+            )
+            
+            # Create user-item matrix, averaging repeated interactions with an item
+            self.user_item_matrix = self._build_user_item_matrix(rows, cols, weights)
+            
+            # Numerator and denominator of the neighbor-weighted average in one matrix
+            interacted = (self.user_item_matrix > 0).astype(np.float64)
+            self._scoring_matrix = sparse.hstack(
+                [self.user_item_matrix, interacted], format='csr'
             )
+            self._popularity = np.asarray(self.user_item_matrix.sum(axis=0)).ravel()
             
             # Calculate user similarity using cosine similarity
             self._calculate_user_similarity()
@@ -127,6 +156,25 @@ class CollaborativeFilteringEngine(BaseRecommendationEngine):
             logger.error(f"Error training collaborative filtering engine: {e}")
             raise
     
+    def _build_user_item_matrix(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        weights: np.ndarray
+    ) -> sparse.csr_matrix:
+        """Build the CSR user-item matrix, averaging duplicate (user, item) weights"""
+        item_count = len(self.content_ids)
+        keys, inverse = np.unique(rows * item_count + cols, return_inverse=True)
+        sums = np.bincount(inverse, weights=weights)
+        counts = np.bincount(inverse)
+        
+        matrix = sparse.csr_matrix(
+            (sums / counts, (keys // item_count, keys % item_count)),
+            shape=(len(self.user_ids), item_count)
+        )
+        matrix.eliminate_zeros()
+        return matrix
+    
     def recommend(
         self,
         user_id: str,
@@ -140,48 +188,52 @@ class CollaborativeFilteringEngine(BaseRecommendationEngine):
             return []
         
         try:
-            if user_id not in self.user_item_matrix.index:
+            user_idx = self.user_index.get(user_id)
+            if user_idx is None:
                 # Cold start problem - return popular content
                 return self._get_popular_content(available_content, num_recommendations)
             
-            # Get user's interaction vector
-            user_vector = self.user_item_matrix.loc[user_id].values
-            user_similarities = self.similarity_matrix.loc[user_id].values if user_id in self.similarity_matrix.index else []
+            # Candidate items in request order, skipping unknown content
+            candidates = np.fromiter(
+                (
+                    self.content_index[content_id]
+                    for content_id in available_content
+                    if content_id in self.content_index
+                ),
+                dtype=np.int64
+            )
+            if len(candidates) == 0 or num_recommendations <= 0:
+                return []
             
-            # Calculate predicted scores for unrated items
-            scores = {}
-            for content_id in available_content:
-                if content_id not in self.user_item_matrix.columns:
-                    continue
-                
-                content_idx = list(self.user_item_matrix.columns).index(content_id)
-                
-                if user_vector[content_idx] > 0:
-                    continue  # Already interacted with this content
-                
-                # Calculate weighted average from similar users
-                numerator = 0.0
-                denominator = 0.0
-                
-                for other_user_idx, other_user_id in enumerate(self.user_item_matrix.index):
-                    if other_user_id == user_id:
-                        continue
-                    
-                    other_user_vector = self.user_item_matrix.iloc[other_user_idx].values
-                    similarity = user_similarities[other_user_idx] if len(user_similarities) > other_user_idx else 0.0
-                    
-                    if similarity > 0 and other_user_vector[content_idx] > 0:
-                        numerator += similarity * other_user_vector[content_idx]
-                        denominator += abs(similarity)
-                
-                if denominator > 0:
-                    scores[content_id] = numerator / denominator
+            # Weighted average over positively similar neighbors that rated each item
+            neighbor_weights = self.similarity_matrix[user_idx]
+            totals = (neighbor_weights @ self._scoring_matrix).toarray().ravel()
+            item_count = len(self.content_ids)
+            numerators = totals[:item_count][candidates]
+            denominators = totals[item_count:][candidates]
+            
+            # Skip content the user already interacted with
+            user_row = self.user_item_matrix[user_idx]
+            seen = np.zeros(item_count, dtype=bool)
+            seen[user_row.indices[user_row.data > 0]] = True
+            
+            valid = (denominators > 0) & ~seen[candidates]
+            positions = np.flatnonzero(valid)
+            if len(positions) == 0:
+                return []
+            scores = numerators[positions] / denominators[positions]
             
-            # Sort by score and return top recommendations
-            sorted_content = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+            # Partial sort for the top scores, then order them (ties keep request order)
+            if len(positions) > num_recommendations:
+                top = np.argpartition(-scores, num_recommendations - 1)[:num_recommendations]
+            else:
+                top = np.arange(len(positions))
+            top = top[np.lexsort((positions[top], -scores[top]))]
             
             recommendations = []
-            for content_id, score in sorted_content[:num_recommendations]:
+            for i in top:
+                content_id = self.content_ids[candidates[positions[i]]]
+                score = float(scores[i])
                 recommendations.append(Recommendation(
                     content_id=content_id,
                     score=score,
@@ -203,25 +255,21 @@ class CollaborativeFilteringEngine(BaseRecommendationEngine):
         content_metadata: Dict[str, Any],
         num_similar: int = 5
     ) -> List[Recommendation]:
-        """Find content similar to given content"""
-        if not self.is_trained or content_id not in self.content_similarity.index:
+        """Find content similar to given content (among its top-k neighbors)"""
+        if not self.is_trained or content_id not in self.content_index:
             return []
         
         try:
-            # Get similarity scores for the content
-            similarities = self.content_similarity.loc[content_id].sort_values(ascending=False)
-            
-            # Remove self-similarity and get top similar content
-            similar_content = []
-            for other_content_id, similarity in similarities.items():
-                if other_content_id != content_id and similarity > 0:
-                    similar_content.append((other_content_id, similarity))
+            # Get similarity scores for the content's neighbors
+            neighbors = self.content_similarity[self.content_index[content_id]]
+            order = np.lexsort((neighbors.indices, -neighbors.data))
             
             # Convert to recommendations
             recommendations = []
-            for content_id, score in similar_content[:num_similar]:
+            for i in order[:num_similar]:
+                score = float(neighbors.data[i])
                 recommendations.append(Recommendation(
-                    content_id=content_id,
+                    content_id=self.content_ids[neighbors.indices[i]],
                     score=score,
                     reason="Users who engaged with this content also engaged with similar content",
                     confidence=score,
@@ -236,73 +284,78 @@ class CollaborativeFilteringEngine(BaseRecommendationEngine):
             return []
     
     def _calculate_user_similarity(self):
-        """Calculate user-user similarity matrix"""
+        """Calculate top-k user-user cosine similarity"""
         try:
-            # Calculate cosine similarity between users
-            user_matrix = self.user_item_matrix.values
-            
-            # Calculate norms
-            norms = np.linalg.norm(user_matrix, axis=1, keepdims=True)
-            
-            # Calculate cosine similarity matrix
-            similarity_matrix = np.dot(user_matrix, user_matrix.T)
-            similarity_matrix = similarity_matrix / (norms * norms.T)
-            
-            # Replace NaN and inf with 0
-            similarity_matrix = np.nan_to_num(similarity_matrix, nan=0.0, posinf=0.0, neginf=0.0)
-            
-            # Convert to DataFrame
-            self.similarity_matrix = pd.DataFrame(
-                similarity_matrix,
-                index=self.user_item_matrix.index,
-                columns=self.user_item_matrix.index
-            )
-            
+            self.similarity_matrix = self._top_k_cosine(self.user_item_matrix)
         except Exception as e:
             logger.error(f"Error calculating user similarity: {e}")
-            self.similarity_matrix = pd.DataFrame()
+            self.similarity_matrix = sparse.csr_matrix((len(self.user_ids), len(self.user_ids)))
     
     def _calculate_content_similarity(self):
-        """Calculate content-content similarity matrix"""
+        """Calculate top-k content-content cosine similarity"""
         try:
-            # Calculate cosine similarity between content
-            content_matrix = self.user_item_matrix.T.values
-            
-            # Calculate norms
-            norms = np.linalg.norm(content_matrix, axis=0, keepdims=True)
-            
-            # Calculate cosine similarity matrix
-            similarity_matrix = np.dot(content_matrix.T, content_matrix)
-            similarity_matrix = similarity_matrix / (norms.T * norms)
-            
-            # Replace NaN and inf with 0
-            similarity_matrix = np.nan_to_num(similarity_matrix, nan=0.0, posinf=0.0, neginf=0.0)
-            
-            # Convert to DataFrame
-            self.content_similarity = pd.DataFrame(
-                similarity_matrix,
-                index=self.user_item_matrix.columns,
-                columns=self.user_item_matrix.columns
-            )
-            
+            self.content_similarity = self._top_k_cosine(self.user_item_matrix.T.tocsr())
         except Exception as e:
             logger.error(f"Error calculating content similarity: {e}")
-            self.content_similarity = pd.DataFrame()
+            self.content_similarity = sparse.csr_matrix((len(self.content_ids), len(self.content_ids)))
+    
+    def _top_k_cosine(self, matrix: sparse.csr_matrix, block_elements: int = 1 << 24) -> sparse.csr_matrix:
+        """
+        Keep each row's top-k positive cosine similarities to other rows.
+        
+        Rows are L2-normalized and multiplied against the whole matrix in
+        blocks sized so that each dense block holds at most
+        ``block_elements`` values; the full similarity matrix is never built.
+        """
+        row_count = matrix.shape[0]
+        k = min(self.num_neighbors, row_count - 1)
+        if k <= 0:
+            return sparse.csr_matrix((row_count, row_count))
+        
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        normalized = sparse.diags(inverse_norms) @ matrix
+        transposed = normalized.T.tocsc()
+        
+        block_rows = max(1, block_elements // row_count)
+        indptr = [0]
+        indices = []
+        data = []
+        
+        for start in range(0, row_count, block_rows):
+            end = min(start + block_rows, row_count)
+            block = (normalized[start:end] @ transposed).toarray()
+            block[np.arange(end - start), np.arange(start, end)] = 0.0  # no self-similarity
+            
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_values = np.take_along_axis(block, top, axis=1)
+            
+            for row_top, row_values in zip(top, top_values):
+                keep = row_values > 0
+                indices.append(row_top[keep])
+                data.append(row_values[keep])
+                indptr.append(indptr[-1] + int(keep.sum()))
+        
+        return sparse.csr_matrix(
+            (np.concatenate(data), np.concatenate(indices), np.asarray(indptr)),
+            shape=(row_count, row_count)
+        )
     
     def _get_popular_content(self, available_content: List[str], num_recommendations: int) -> List[Recommendation]:
         """Get popular content for cold start users"""
         try:
-            if self.user_item_matrix.empty:
+            if self._popularity is None or len(self._popularity) == 0:
                 return []
             
             # Calculate popularity scores
-            popularity_scores = self.user_item_matrix.sum(axis=0)
-            popular_content = popularity_scores.sort_values(ascending=False)
+            popular_content = np.argsort(-self._popularity, kind='stable')
+            available = set(available_content)
             
             recommendations = []
-            for content_id in popular_content.index[:num_recommendations]:
-                if content_id in available_content:
-                    score = float(popular_content[content_id])
+            for content_idx in popular_content[:num_recommendations]:
+                content_id = self.content_ids[content_idx]
+                if content_id in available:
+                    score = float(self._popularity[content_idx])
                     recommendations.append(Recommendation(
                         content_id=content_id,
                         score=score,
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+AlgoVerse Frame Stream Benchmark
+Compares full-copy frame lists (create_sorting_frames) with delta/keyframe
+frame streams (stream_sorting_frames) in AlgoVerseAnimationService, reporting
+frames per second and peak RSS. Each measurement runs in its own process so
+peak RSS is not shared between runs.
+
+Usage:
+    python scripts/benchmarks/algo_frame_stream_benchmark.py
+    python scripts/benchmarks/algo_frame_stream_benchmark.py --sizes 300 20000 --algorithms bubble_sort heap_sort
+"""
+
+import argparse
+import itertools
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add AlgoVerse vertical to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(
+    project_root / "open-source" / "engine" / "content-metadata" / "services" / "verticals" / "algo_verse"
+))
+
+from algo_animation_service import AlgoVerseAnimationService
+
+
+def generate_data(size, seed=42):
+    """Generate a shuffled array of distinct integers"""
+    data = list(range(size))
+    random.Random(seed).shuffle(data)
+    return data
+
+
+def measure(mode, algorithm, size, max_frames):
+    """Time one run in this process; returns frames, seconds and peak RSS (MB)"""
+    service = AlgoVerseAnimationService()
+    data = generate_data(size)
+
+    start = time.perf_counter()
+    if mode == "list":
+        frame_count = len(service.create_sorting_frames(data, algorithm))
+    else:
+        stream = service.stream_sorting_frames(data, algorithm, cache=False)
+        frame_count = sum(1 for _ in itertools.islice(stream, max_frames))
+    elapsed = time.perf_counter() - start
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"frames": frame_count, "seconds": elapsed, "peak_rss_mb": peak_rss_mb}
+
+
+def run_isolated(mode, algorithm, size, max_frames):
+    """Run one measurement in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", mode, algorithm, str(size), str(max_frames)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(algorithm, size, max_frames, run_list):
+    print(f"\n📊 {algorithm}, {size:,} elements")
+    print(f"   {'':<10}{'frames':>12}{'frames/s':>14}{'peak RSS (MB)':>16}")
+
+    modes = (["list"] if run_list else []) + ["stream"]
+    for mode in modes:
+        result = run_isolated(mode, algorithm, size, max_frames)
+        rate = result["frames"] / result["seconds"] if result["seconds"] else float("inf")
+        capped = "*" if mode == "stream" and result["frames"] >= max_frames else ""
+        print(f"   {mode:<10}{result['frames']:>11,}{capped:1}{rate:>14,.0f}{result['peak_rss_mb']:>16.1f}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        mode, algorithm, size, max_frames = sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5])
+        print(json.dumps(measure(mode, algorithm, size, max_frames)))
+        return
+
+    parser = argparse.ArgumentParser(description="AlgoVerse frame stream benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 10_000])
+    parser.add_argument('--algorithms', nargs='+', default=["bubble_sort", "quick_sort", "heap_sort"])
+    parser.add_argument('--max-frames', type=int, default=2_000_000,
+                        help="Stop streams after this many frames (marked with *)")
+    parser.add_argument('--skip-list-above', type=int, default=500)
+    args = parser.parse_args()
+
+    print("🚀 Full-copy frame lists vs delta/keyframe frame streams")
+    for algorithm in args.algorithms:
+        for size in args.sizes:
+            run(algorithm, size, args.max_frames, size <= args.skip_list_above)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Concept Clustering Benchmark
+Compares exhaustive pairwise clustering with MinHash/LSH candidate generation
+in ReasoningEngine.discover_clusters on synthetic tagged concept sets.
+
+Usage:
+    python scripts/benchmarks/cluster_lsh_benchmark.py
+    python scripts/benchmarks/cluster_lsh_benchmark.py --concepts 1000 5000 --skip-exhaustive-above 3000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add content metadata layer to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "open-source" / "engine" / "content-metadata"))
+
+from services.reasoning_engine import ReasoningEngine
+
+
+def generate_concepts(concept_count, topic_size=15, seed=42):
+    """Generate concepts whose tags, keywords and objectives come from shared topics"""
+    rng = random.Random(seed)
+    topics = [
+        [f"topic{t}_term{k}" for k in range(6)]
+        for t in range(max(1, concept_count // topic_size))
+    ]
+    concepts = {}
+    for i in range(concept_count):
+        topic = rng.choice(topics)
+        concepts[f"c{i}"] = {
+            'name': f"Concept {i}",
+            'tags': rng.sample(topic, 4),
+            'keywords': rng.sample(topic, 3),
+            'learning_objectives': [topic[0]]
+        }
+    return concepts
+
+
+def cluster_signature(clusters):
+    """Order-independent description of a clustering"""
+    return sorted(tuple(sorted(cluster.concept_ids)) for cluster in clusters)
+
+
+def run(concept_count, min_similarity, num_perm, bands, run_exhaustive):
+    concepts = generate_concepts(concept_count)
+    graph = ReasoningEngine().build_concept_graph(concepts, [])
+
+    lsh_engine = ReasoningEngine()
+    start = time.perf_counter()
+    lsh_clusters = lsh_engine.discover_clusters(
+        graph,
+        min_similarity=min_similarity,
+        method="lsh",
+        num_perm=num_perm,
+        lsh_bands=bands
+    )
+    lsh_time = time.perf_counter() - start
+    lsh_pairs = lsh_engine.get_statistics()['similarities_calculated']
+
+    print(f"\n📊 {concept_count:,} concepts")
+    print(f"   {'':<18}{'exhaustive':>14}{'lsh':>14}")
+
+    if run_exhaustive:
+        exhaustive_engine = ReasoningEngine()
+        start = time.perf_counter()
+        exhaustive_clusters = exhaustive_engine.discover_clusters(graph, min_similarity=min_similarity)
+        exhaustive_time = time.perf_counter() - start
+        exhaustive_pairs = exhaustive_engine.get_statistics()['similarities_calculated']
+
+        print(f"   {'time (s)':<18}{exhaustive_time:>14.2f}{lsh_time:>14.2f}")
+        print(f"   {'pairs scored':<18}{exhaustive_pairs:>14,}{lsh_pairs:>14,}")
+        print(f"   {'clusters':<18}{len(exhaustive_clusters):>14}{len(lsh_clusters):>14}")
+        same = cluster_signature(exhaustive_clusters) == cluster_signature(lsh_clusters)
+        print(f"   identical clusters: {'yes' if same else 'no'}")
+    else:
+        all_pairs = concept_count * (concept_count - 1) // 2
+        print(f"   {'time (s)':<18}{'-':>14}{lsh_time:>14.2f}")
+        print(f"   {'pairs scored':<18}{all_pairs:>14,}{lsh_pairs:>14,}")
+        print(f"   {'clusters':<18}{'-':>14}{len(lsh_clusters):>14}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concept clustering benchmark")
+    parser.add_argument('--concepts', type=int, nargs='+', default=[500, 2000, 20_000])
+    parser.add_argument('--min-similarity', type=float, default=0.5)
+    parser.add_argument('--num-perm', type=int, default=128)
+    parser.add_argument('--bands', type=int, default=32)
+    parser.add_argument('--skip-exhaustive-above', type=int, default=3000)
+    args = parser.parse_args()
+
+    print("🚀 Exhaustive vs MinHash/LSH concept clustering")
+    for concept_count in args.concepts:
+        run(
+            concept_count,
+            args.min_similarity,
+            args.num_perm,
+            args.bands,
+            concept_count <= args.skip_exhaustive_above
+        )
+
+
+if __name__ == "__main__":
+    main()
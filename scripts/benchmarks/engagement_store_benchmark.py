@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Engagement Store Benchmark
+Compares per-event dict lists (filter and regroup on every query) with the
+columnar EngagementSeries store behind the LXP EngagementAnalyzer, over a
+learner cohort sharing a fixed total number of events.
+
+Usage:
+    python scripts/benchmarks/engagement_store_benchmark.py
+    python scripts/benchmarks/engagement_store_benchmark.py --events 1000000 --learners 100
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add LXP analytics service to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "services" / "lxp" / "services" / "analytics"))
+
+from analytics_service import EngagementAnalyzer, TimeGranularity
+
+
+class ListEngagementHistory:
+    """Dict-per-event history queried by filtering the full list"""
+    
+    def __init__(self):
+        self.history = defaultdict(list)
+    
+    def record(self, learner_id, content_id, score, duration, timestamp):
+        self.history[learner_id].append({
+            'content_id': content_id,
+            'engagement_score': score,
+            'duration': duration,
+            'timestamp': timestamp
+        })
+    
+    def _recent(self, learner_id, days):
+        cutoff = datetime.now() - timedelta(days=days)
+        return [e for e in self.history[learner_id] if e['timestamp'] >= cutoff]
+    
+    def score(self, learner_id, days):
+        recent = self._recent(learner_id, days)
+        return sum(e['engagement_score'] for e in recent) / len(recent) if recent else 0.0
+    
+    def daily_trend(self, learner_id, days):
+        grouped = defaultdict(list)
+        for e in self._recent(learner_id, days):
+            grouped[e['timestamp'].date()].append(e['engagement_score'])
+        return [(day, sum(s) / len(s)) for day, s in sorted(grouped.items())]
+    
+    def peak_hours(self, learner_id, days):
+        grouped = defaultdict(list)
+        for e in self._recent(learner_id, days):
+            grouped[e['timestamp'].hour].append(e['engagement_score'])
+        return {hour: sum(s) / len(s) for hour, s in grouped.items()}
+
+
+def generate_events(event_count, learner_count, history_days=365, seed=42):
+    """Generate time-ordered engagement events spread over a cohort"""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=history_days)
+    step = history_days * 86400 / event_count
+    for i in range(event_count):
+        yield (
+            f"learner{rng.randrange(learner_count)}",
+            f"content{rng.randrange(500)}",
+            rng.random(),
+            rng.randrange(30, 1800),
+            start + timedelta(seconds=i * step)
+        )
+
+
+def time_queries(query, learner_ids):
+    """Average seconds per query over the given learners"""
+    start = time.perf_counter()
+    for learner_id in learner_ids:
+        query(learner_id)
+    return (time.perf_counter() - start) / len(learner_ids)
+
+
+def run(event_count, learner_count, days):
+    baseline = ListEngagementHistory()
+    analyzer = EngagementAnalyzer()
+    
+    start = time.perf_counter()
+    for event in generate_events(event_count, learner_count):
+        baseline.record(*event)
+    baseline_load = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for event in generate_events(event_count, learner_count):
+        analyzer.record_engagement(*event)
+    for series in analyzer.engagement_history.values():
+        series.times  # move buffered events into the columns and rollups
+    columnar_load = time.perf_counter() - start
+    
+    learner_ids = [f"learner{i}" for i in range(min(learner_count, 50))]
+    queries = [
+        ("engagement score",
+         lambda l: baseline.score(l, days),
+         lambda l: analyzer.calculate_engagement_score(l, days)),
+        ("daily trend",
+         lambda l: baseline.daily_trend(l, days),
+         lambda l: analyzer.get_engagement_trend(l, TimeGranularity.DAILY, days)),
+        ("peak hours",
+         lambda l: baseline.peak_hours(l, days),
+         lambda l: analyzer.identify_peak_engagement_times(l, days)),
+    ]
+    
+    print(f"\n📊 {event_count:,} events, {learner_count:,} learners, {days}-day window")
+    print(f"   {'':<20}{'dict lists':>14}{'columnar':>14}{'speedup':>10}")
+    print(f"   {'ingest (s)':<20}{baseline_load:>14.2f}{columnar_load:>14.2f}"
+          f"{baseline_load / columnar_load:>9.1f}x")
+    for name, baseline_query, columnar_query in queries:
+        baseline_time = time_queries(baseline_query, learner_ids)
+        columnar_time = time_queries(columnar_query, learner_ids)
+        print(f"   {name + ' (ms)':<20}{baseline_time * 1000:>14.3f}{columnar_time * 1000:>14.3f}"
+              f"{baseline_time / columnar_time:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Engagement store benchmark")
+    parser.add_argument('--events', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--learners', type=int, default=100)
+    parser.add_argument('--days', type=int, default=30)
+    args = parser.parse_args()
+    
+    print("🚀 Dict-list vs columnar engagement history")
+    for event_count in args.events:
+        run(event_count, args.learners, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Prerequisite Closure Benchmark
+Compares NetworkX ancestor/descendant queries with the compact CSR index
+on random prerequisite DAGs of increasing size.
+
+DependencyGraphEngine keeps its NetworkX graph when the compact index is
+enabled, so the compact column's memory is reported both for the index
+alone and for the engine as a whole (NetworkX graph plus index).
+
+Usage:
+    python scripts/benchmarks/graph_closure_benchmark.py
+    python scripts/benchmarks/graph_closure_benchmark.py --edges 10000 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add content metadata layer to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "open-source" / "engine" / "content-metadata"))
+
+import networkx as nx
+
+from services.graph.compact import CompactGraphIndex
+
+
+def generate_dag(edge_count, avg_degree=4, seed=42):
+    """Generate a random DAG with roughly edge_count edges"""
+    rng = random.Random(seed)
+    node_count = max(2, edge_count // avg_degree)
+    edges = set()
+    while len(edges) < edge_count:
+        target = rng.randrange(1, node_count)
+        # Prefer nearby sources so prerequisite chains are deep
+        source = max(0, target - 1 - int(rng.expovariate(1 / 50)))
+        edges.add((f"c{source}", f"c{target}"))
+    nodes = [f"c{i}" for i in range(node_count)]
+    return nodes, list(edges)
+
+
+def measure(build):
+    """Build a structure, returning it with elapsed seconds and peak bytes"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def time_queries(query, node_ids):
+    """Average seconds per query over the given nodes"""
+    start = time.perf_counter()
+    for node_id in node_ids:
+        query(node_id)
+    return (time.perf_counter() - start) / len(node_ids)
+
+
+def run(edge_count, query_count, cache_size):
+    nodes, edges = generate_dag(edge_count)
+    rng = random.Random(7)
+    # Repeat a working set of queries so the closure cache is exercised
+    working_set = rng.sample(nodes, min(len(nodes), max(1, query_count // 4)))
+    queries = [rng.choice(working_set) for _ in range(query_count)]
+
+    def build_nx():
+        graph = nx.DiGraph()
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from(edges)
+        return graph
+
+    graph, nx_build, nx_bytes = measure(build_nx)
+    compact, csr_build, csr_bytes = measure(
+        lambda: CompactGraphIndex(nodes, edges, cache_size)
+    )
+
+    nx_anc = time_queries(lambda n: sorted(nx.ancestors(graph, n)), queries)
+    csr_anc = time_queries(compact.ancestors, queries)
+    nx_desc = time_queries(lambda n: sorted(nx.descendants(graph, n)), queries)
+    csr_desc = time_queries(compact.descendants, queries)
+
+    print(f"\n📊 {len(nodes):,} concepts / {len(edges):,} edges")
+    print(f"   {'':<14}{'networkx':>14}{'compact':>14}")
+    print(f"   {'build (s)':<14}{nx_build:>14.3f}{csr_build:>14.3f}")
+    print(f"   {'memory (MB)':<14}{nx_bytes / 1e6:>14.1f}{csr_bytes / 1e6:>14.1f}")
+    print(f"   {'engine (MB)':<14}{nx_bytes / 1e6:>14.1f}{(nx_bytes + csr_bytes) / 1e6:>14.1f}")
+    print(f"   {'ancestors (ms)':<14}{nx_anc * 1e3:>14.3f}{csr_anc * 1e3:>14.3f}")
+    print(f"   {'descend. (ms)':<14}{nx_desc * 1e3:>14.3f}{csr_desc * 1e3:>14.3f}")
+    info = compact.cache_info()['ancestors']
+    print(f"   closure cache: {info['hits']} hits / {info['misses']} misses")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prerequisite closure benchmark")
+    parser.add_argument('--edges', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--cache-size', type=int, default=256)
+    args = parser.parse_args()
+
+    print("🚀 NetworkX vs compact CSR closure queries")
+    for edge_count in args.edges:
+        run(edge_count, args.queries, args.cache_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+PhysicsVerse Integrator Benchmark
+Compares per-body Vector2D integration (the PhysicsState dict path) with the
+NumPy structure-of-arrays BatchedIntegrator, reporting steps per second for
+each integration method and body count.
+
+Usage:
+    python scripts/benchmarks/physics_integrator_benchmark.py
+    python scripts/benchmarks/physics_integrator_benchmark.py --bodies 1000 100000 --methods semi_implicit_euler runge_kutta_4
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add PhysicsVerse vertical to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(
+    project_root / "open-source" / "engine" / "content-metadata" / "services" / "verticals" / "physics_verse"
+))
+
+from physics_core import BatchedIntegrator, IntegrationMethod, PhysicsState, Vector2D
+
+GRAVITY = -9.81
+DRAG = 0.1
+
+METHODS = {
+    "euler": IntegrationMethod.EULAR,
+    "semi_implicit_euler": IntegrationMethod.SEMI_IMPLICIT_EULAR,
+    "verlet": IntegrationMethod.VERLET,
+    "runge_kutta_4": IntegrationMethod.RUNGE_KUTTA_4,
+}
+
+
+def generate_bodies(count, seed=42):
+    """Random positions, velocities and masses"""
+    rng = np.random.default_rng(seed)
+    return rng.random((count, 2)) * 100, rng.normal(size=(count, 2)), rng.random(count) + 0.5
+
+
+def batched_force(t, positions, velocities, masses):
+    """Uniform gravity plus linear drag"""
+    forces = velocities * -DRAG
+    forces[..., 1] += GRAVITY * masses
+    return forces
+
+
+class ObjectIntegrator:
+    """Baseline: one Vector2D per body per stage, as PhysicsState is advanced today"""
+
+    def __init__(self, positions, velocities, masses, method):
+        self.ids = [f"body_{i}" for i in range(len(masses))]
+        self.state = PhysicsState(
+            positions={i: Vector2D(*p) for i, p in zip(self.ids, positions.tolist())},
+            velocities={i: Vector2D(*v) for i, v in zip(self.ids, velocities.tolist())},
+        )
+        self.masses = dict(zip(self.ids, masses.tolist()))
+        self.method = method
+
+    def accelerations(self, velocities):
+        return {
+            i: Vector2D(-DRAG * v.x / self.masses[i], GRAVITY - DRAG * v.y / self.masses[i])
+            for i, v in velocities.items()
+        }
+
+    def step(self, dt):
+        s = self.state
+        a = self.accelerations(s.velocities)
+        if self.method == IntegrationMethod.EULAR:
+            positions = {i: s.positions[i] + s.velocities[i] * dt for i in self.ids}
+            velocities = {i: s.velocities[i] + a[i] * dt for i in self.ids}
+        elif self.method == IntegrationMethod.VERLET:
+            half = {i: s.velocities[i] + a[i] * (dt / 2) for i in self.ids}
+            positions = {i: s.positions[i] + half[i] * dt for i in self.ids}
+            a_new = self.accelerations(half)
+            velocities = {i: half[i] + a_new[i] * (dt / 2) for i in self.ids}
+        elif self.method == IntegrationMethod.RUNGE_KUTTA_4:
+            v1, a1 = s.velocities, a
+            v2 = {i: s.velocities[i] + a1[i] * (dt / 2) for i in self.ids}
+            a2 = self.accelerations(v2)
+            v3 = {i: s.velocities[i] + a2[i] * (dt / 2) for i in self.ids}
+            a3 = self.accelerations(v3)
+            v4 = {i: s.velocities[i] + a3[i] * dt for i in self.ids}
+            a4 = self.accelerations(v4)
+            positions = {i: s.positions[i] + (v1[i] + v2[i] * 2 + v3[i] * 2 + v4[i]) * (dt / 6) for i in self.ids}
+            velocities = {i: s.velocities[i] + (a1[i] + a2[i] * 2 + a3[i] * 2 + a4[i]) * (dt / 6) for i in self.ids}
+        else:
+            velocities = {i: s.velocities[i] + a[i] * dt for i in self.ids}
+            positions = {i: s.positions[i] + velocities[i] * dt for i in self.ids}
+        self.state = PhysicsState(time=s.time + dt, positions=positions, velocities=velocities)
+
+
+def steps_per_second(integrator, dt, min_seconds):
+    """Step until min_seconds have elapsed (at least 3 steps)"""
+    integrator.step(dt)  # warm-up
+    steps = 0
+    start = time.perf_counter()
+    while steps < 3 or time.perf_counter() - start < min_seconds:
+        integrator.step(dt)
+        steps += 1
+    return steps / (time.perf_counter() - start)
+
+
+def run(count, method_names, dt, min_seconds, skip_objects_above):
+    print(f"\n📊 {count:,} bodies")
+    print(f"   {'method':<22}{'objects steps/s':>18}{'batched steps/s':>18}{'speedup':>10}")
+
+    positions, velocities, masses = generate_bodies(count)
+    for name in method_names:
+        method = METHODS[name]
+
+        batched = BatchedIntegrator(positions, velocities, masses, force=batched_force, method=method)
+        batched_rate = steps_per_second(batched, dt, min_seconds)
+
+        if count <= skip_objects_above:
+            objects = ObjectIntegrator(positions, velocities, masses, method)
+            object_rate = steps_per_second(objects, dt, min_seconds)
+            print(f"   {name:<22}{object_rate:>18,.1f}{batched_rate:>18,.1f}{batched_rate / object_rate:>9.0f}x")
+        else:
+            print(f"   {name:<22}{'skipped':>18}{batched_rate:>18,.1f}{'':>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PhysicsVerse integrator benchmark")
+    parser.add_argument('--bodies', type=int, nargs='+', default=[1_000, 100_000])
+    parser.add_argument('--methods', nargs='+', choices=list(METHODS), default=list(METHODS))
+    parser.add_argument('--dt', type=float, default=0.001)
+    parser.add_argument('--min-seconds', type=float, default=1.0,
+                        help="Minimum timed duration per measurement")
+    parser.add_argument('--skip-objects-above', type=int, default=1_000_000,
+                        help="Skip the Vector2D baseline above this many bodies")
+    args = parser.parse_args()
+
+    print("🚀 Vector2D dict integration vs NumPy batched integration")
+    for count in args.bodies:
+        run(count, args.methods, args.dt, args.min_seconds, args.skip_objects_above)
+
+
+if __name__ == "__main__":
+    main()
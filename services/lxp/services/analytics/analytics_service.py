@@ -11,8 +11,13 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import heapq
 import statistics
 import json
+import time
+
+import numpy as np
 
 
 class MetricType(Enum):
@@ -194,11 +199,291 @@ class AnalyticsReport:
         }
 
 
+@dataclass
+class CohortMetrics:
+    """Per-learner summary metrics for a cohort, as parallel arrays."""
+    learner_ids: List[str]
+    completion_rates: np.ndarray
+    average_scores: np.ndarray
+    average_engagement: np.ndarray
+    current_streaks: np.ndarray
+    skill_levels: List[Dict[str, float]]
+    
+    def __len__(self) -> int:
+        return len(self.learner_ids)
+
+
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+_MICROSECONDS_PER_HOUR = 3_600_000_000
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def _to_microseconds(timestamp: datetime) -> int:
+    """Convert a naive timestamp to microseconds since the (naive) epoch."""
+    return int(np.datetime64(timestamp, 'us').astype(np.int64))
+
+
+class EngagementSeries:
+    """
+    Columnar engagement history for one learner.
+    
+    Events are buffered in Python lists on append and moved in bulk into
+    parallel NumPy columns (timestamp, score, duration) on the next query,
+    so appends stay cheap and queries run vectorized. Column capacity
+    doubles as needed, so interleaved appends and queries stay amortized
+    O(1) per event. Columns are kept sorted by timestamp, making a time
+    window one ``searchsorted``. Daily, weekly and monthly rollups of score
+    sums and counts are updated with each bulk move, so trends read whole
+    periods from the rollups and only scan the columns for the partial
+    period at the start of the window.
+    """
+    
+    def __init__(self):
+        self._size = 0
+        self._time_column = np.empty(0, dtype=np.int64)  # microseconds since epoch
+        self._score_column = np.empty(0, dtype=np.float64)
+        self._duration_column = np.empty(0, dtype=np.int64)
+        self._content_ids: List[str] = []
+        
+        self._pending_times: List[datetime] = []
+        self._pending_scores: List[float] = []
+        self._pending_durations: List[int] = []
+        self._pending_content_ids: List[str] = []
+        self._max_timestamp: Optional[datetime] = None  # latest event appended so far
+        self._sorted = True
+        
+        # Rollups: period key -> [score sum, event count, duration sum]
+        self._rollups: Dict[TimeGranularity, Dict[Any, List[float]]] = {
+            TimeGranularity.DAILY: {},
+            TimeGranularity.WEEKLY: {},
+            TimeGranularity.MONTHLY: {}
+        }
+    
+    def __len__(self) -> int:
+        return self._size + len(self._pending_times)
+    
+    # Sorted, filled prefixes of the columns
+    @property
+    def _times(self) -> np.ndarray:
+        return self._time_column[:self._size]
+    
+    @property
+    def _scores(self) -> np.ndarray:
+        return self._score_column[:self._size]
+    
+    @property
+    def _durations(self) -> np.ndarray:
+        return self._duration_column[:self._size]
+    
+    def append(self, content_id: str, engagement_score: float, duration: int, timestamp: datetime):
+        """Append an event (amortized O(1))."""
+        if self._max_timestamp is None or timestamp >= self._max_timestamp:
+            self._max_timestamp = timestamp
+        else:
+            # Earlier than an event already buffered or flushed into the columns
+            self._sorted = False
+        
+        self._pending_times.append(timestamp)
+        self._pending_scores.append(engagement_score)
+        self._pending_durations.append(duration)
+        self._pending_content_ids.append(content_id)
+    
+    def _flush(self):
+        """Move buffered events into the columns and rollups."""
+        if not self._pending_times:
+            return
+        
+        times = np.array(self._pending_times, dtype='datetime64[us]').astype(np.int64)
+        scores = np.array(self._pending_scores, dtype=np.float64)
+        durations = np.array(self._pending_durations, dtype=np.int64)
+        
+        start, end = self._size, self._size + len(times)
+        if end > len(self._time_column):
+            capacity = max(64, end, 2 * len(self._time_column))
+            for name in ("_time_column", "_score_column", "_duration_column"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+        
+        self._time_column[start:end] = times
+        self._score_column[start:end] = scores
+        self._duration_column[start:end] = durations
+        self._size = end
+        self._content_ids.extend(self._pending_content_ids)
+        
+        self._pending_times.clear()
+        self._pending_scores.clear()
+        self._pending_durations.clear()
+        self._pending_content_ids.clear()
+        
+        if not self._sorted:
+            order = np.argsort(self._times, kind="stable")
+            self._time_column[:end] = self._times[order]
+            self._score_column[:end] = self._scores[order]
+            self._duration_column[:end] = self._durations[order]
+            self._content_ids = [self._content_ids[i] for i in order]
+            self._sorted = True
+        
+        # Days since epoch; 1970-01-01 was a Thursday (weekday 3)
+        days = times // _MICROSECONDS_PER_DAY
+        months = times.astype('datetime64[us]').astype('datetime64[M]').astype(np.int64)
+        self._add_to_rollup(TimeGranularity.DAILY, days + _EPOCH_ORDINAL, scores, durations)
+        self._add_to_rollup(TimeGranularity.WEEKLY, days - (days + 3) % 7 + _EPOCH_ORDINAL, scores, durations)
+        self._add_to_rollup(TimeGranularity.MONTHLY, months, scores, durations)
+    
+    def _add_to_rollup(
+        self,
+        granularity: TimeGranularity,
+        keys: np.ndarray,
+        scores: np.ndarray,
+        durations: np.ndarray
+    ):
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        score_sums = np.bincount(inverse, weights=scores)
+        counts = np.bincount(inverse)
+        duration_sums = np.bincount(inverse, weights=durations)
+        
+        rollup = self._rollups[granularity]
+        for key, score_sum, count, duration_sum in zip(
+            unique_keys.tolist(), score_sums.tolist(), counts.tolist(), duration_sums.tolist()
+        ):
+            if granularity == TimeGranularity.MONTHLY:
+                key = (1970 + key // 12, key % 12 + 1)
+            totals = rollup.get(key)
+            if totals is None:
+                rollup[key] = [score_sum, count, duration_sum]
+            else:
+                totals[0] += score_sum
+                totals[1] += count
+                totals[2] += duration_sum
+    
+    # Columns (sorted by timestamp)
+    @property
+    def times(self) -> np.ndarray:
+        """Event timestamps in microseconds since the epoch."""
+        self._flush()
+        return self._times
+    
+    @property
+    def scores(self) -> np.ndarray:
+        self._flush()
+        return self._scores
+    
+    @property
+    def durations(self) -> np.ndarray:
+        self._flush()
+        return self._durations
+    
+    @property
+    def content_ids(self) -> List[str]:
+        self._flush()
+        return self._content_ids
+    
+    def rollup(self, granularity: TimeGranularity) -> Dict[Any, List[float]]:
+        """
+        Get per-period [score sum, event count, duration sum] totals.
+        
+        Keys are date ordinals for daily and weekly (the Monday) rollups and
+        (year, month) tuples for monthly rollups.
+        """
+        self._flush()
+        return self._rollups[granularity]
+    
+    def index_at(self, timestamp: datetime) -> int:
+        """Get the index of the first event at or after a timestamp."""
+        return int(np.searchsorted(self.times, _to_microseconds(timestamp), side="left"))
+    
+    @staticmethod
+    def _period_key(timestamp: datetime, granularity: TimeGranularity) -> Any:
+        if granularity == TimeGranularity.DAILY:
+            return timestamp.toordinal()
+        if granularity == TimeGranularity.WEEKLY:
+            return timestamp.toordinal() - timestamp.weekday()
+        return (timestamp.year, timestamp.month)
+    
+    @staticmethod
+    def _next_key(key: Any, granularity: TimeGranularity) -> Any:
+        if granularity == TimeGranularity.DAILY:
+            return key + 1
+        if granularity == TimeGranularity.WEEKLY:
+            return key + 7
+        year, month = key
+        return (year + 1, 1) if month == 12 else (year, month + 1)
+    
+    @staticmethod
+    def _key_start(key: Any, granularity: TimeGranularity) -> datetime:
+        if granularity == TimeGranularity.MONTHLY:
+            return datetime(key[0], key[1], 1)
+        return datetime.fromordinal(key)
+    
+    # Aggregates
+    def mean_score_since(self, cutoff: datetime) -> float:
+        """Average score of events at or after a cutoff."""
+        start = self.index_at(cutoff)
+        if start >= len(self._times):
+            return 0.0
+        return float(self._scores[start:].mean())
+    
+    def totals_since(self, cutoff: datetime) -> Tuple[float, int]:
+        """Score sum and event count at or after a cutoff."""
+        start = self.index_at(cutoff)
+        return float(self._scores[start:].sum()), len(self._times) - start
+    
+    def hourly_means_since(self, cutoff: datetime) -> Dict[int, float]:
+        """Average score per hour of day for events at or after a cutoff."""
+        start = self.index_at(cutoff)
+        hours = (self._times[start:] // _MICROSECONDS_PER_HOUR) % 24
+        sums = np.bincount(hours, weights=self._scores[start:], minlength=24)
+        counts = np.bincount(hours, minlength=24)
+        return {
+            int(hour): float(sums[hour] / counts[hour])
+            for hour in np.flatnonzero(counts)
+        }
+    
+    def trend_since(self, cutoff: datetime, granularity: TimeGranularity) -> List[Tuple[datetime, float]]:
+        """
+        Average score per period for events at or after a cutoff.
+        
+        The period containing the cutoff is aggregated from the columns;
+        every later period is read from the rollup.
+        """
+        if granularity not in self._rollups:
+            granularity = TimeGranularity.MONTHLY
+        
+        rollup = self.rollup(granularity)
+        if len(self._times) == 0:
+            return []
+        
+        first_key = self._period_key(cutoff, granularity)
+        next_key = self._next_key(first_key, granularity)
+        
+        trend = []
+        start = self.index_at(cutoff)
+        end = self.index_at(self._key_start(next_key, granularity))
+        if end > start:
+            trend.append((
+                self._key_start(first_key, granularity),
+                float(self._scores[start:end].sum() / (end - start))
+            ))
+        
+        last_timestamp = datetime(1970, 1, 1) + timedelta(microseconds=int(self._times[-1]))
+        last_key = self._period_key(last_timestamp, granularity)
+        key = next_key
+        while key <= last_key:
+            totals = rollup.get(key)
+            if totals is not None:
+                trend.append((self._key_start(key, granularity), totals[0] / totals[1]))
+            key = self._next_key(key, granularity)
+        
+        return trend
+
+
 class EngagementAnalyzer:
     """Analyzes learner engagement patterns."""
     
     def __init__(self):
-        self.engagement_history: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.engagement_history: Dict[str, EngagementSeries] = defaultdict(EngagementSeries)
     
     def record_engagement(
         self,
@@ -209,12 +494,9 @@ class EngagementAnalyzer:
         timestamp: datetime
     ):
         """Record an engagement event."""
-        self.engagement_history[learner_id].append({
-            'content_id': content_id,
-            'engagement_score': engagement_score,
-            'duration': duration,
-            'timestamp': timestamp
-        })
+        self.engagement_history[learner_id].append(
+            content_id, engagement_score, duration, timestamp
+        )
     
     def calculate_engagement_score(
         self,
@@ -222,17 +504,12 @@ class EngagementAnalyzer:
         time_range_days: int = 30
     ) -> float:
         """Calculate average engagement score for a learner."""
-        cutoff = datetime.now() - timedelta(days=time_range_days)
-        recent_engagements = [
-            e for e in self.engagement_history[learner_id]
-            if e['timestamp'] >= cutoff
-        ]
-        
-        if not recent_engagements:
+        series = self.engagement_history.get(learner_id)
+        if series is None:
             return 0.0
         
-        scores = [e['engagement_score'] for e in recent_engagements]
-        return sum(scores) / len(scores)
+        cutoff = datetime.now() - timedelta(days=time_range_days)
+        return series.mean_score_since(cutoff)
     
     def get_engagement_trend(
         self,
@@ -241,41 +518,12 @@ class EngagementAnalyzer:
         days: int = 30
     ) -> List[Tuple[datetime, float]]:
         """Get engagement trend over time."""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent = [
-            e for e in self.engagement_history[learner_id]
-            if e['timestamp'] >= cutoff
-        ]
-        
-        # Group by time period
-        grouped = defaultdict(list)
-        for engagement in recent:
-            if granularity == TimeGranularity.DAILY:
-                key = engagement['timestamp'].date()
-            elif granularity == TimeGranularity.WEEKLY:
-                # Get Monday of the week
-                date = engagement['timestamp'].date()
-                monday = date - timedelta(days=date.weekday())
-                key = monday
-            else:  # MONTHLY
-                key = datetime(
-                    engagement['timestamp'].year,
-                    engagement['timestamp'].month,
-                    1
-                )
-            
-            grouped[key].append(engagement['engagement_score'])
+        series = self.engagement_history.get(learner_id)
+        if series is None:
+            return []
         
-        # Calculate averages
-        trend = []
-        for time_period, scores in sorted(grouped.items()):
-            avg_score = sum(scores) / len(scores)
-            if isinstance(time_period, datetime):
-                trend.append((time_period, avg_score))
-            else:
-                trend.append((datetime.combine(time_period, datetime.min.time()), avg_score))
-        
-        return trend
+        cutoff = datetime.now() - timedelta(days=days)
+        return series.trend_since(cutoff, granularity)
     
     def identify_peak_engagement_times(
         self,
@@ -283,24 +531,12 @@ class EngagementAnalyzer:
         days: int = 30
     ) -> Dict[int, float]:
         """Identify peak engagement times by hour of day."""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent = [
-            e for e in self.engagement_history[learner_id]
-            if e['timestamp'] >= cutoff
-        ]
-        
-        hourly_scores: Dict[int, List[float]] = defaultdict(list)
-        
-        for engagement in recent:
-            hour = engagement['timestamp'].hour
-            hourly_scores[hour].append(engagement['engagement_score'])
-        
-        # Calculate average engagement per hour
-        hourly_avg = {}
-        for hour, scores in hourly_scores.items():
-            hourly_avg[hour] = sum(scores) / len(scores)
+        series = self.engagement_history.get(learner_id)
+        if series is None:
+            return {}
         
-        return hourly_avg
+        cutoff = datetime.now() - timedelta(days=days)
+        return series.hourly_means_since(cutoff)
     
     def detect_engagement_patterns(
         self,
@@ -352,6 +588,7 @@ class ProgressTracker:
     def __init__(self):
         self.progress_records: Dict[str, List[ProgressSnapshot]] = defaultdict(list)
         self.content_status: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self.completed_counts: Dict[str, int] = defaultdict(int)
     
     def update_progress(
         self,
@@ -373,7 +610,15 @@ class ProgressTracker:
         )
         
         self.progress_records[learner_id].append(snapshot)
-        self.content_status[learner_id][content_id] = status
+        
+        statuses = self.content_status[learner_id]
+        previous = statuses.get(content_id)
+        if previous != status:
+            if previous == 'completed':
+                self.completed_counts[learner_id] -= 1
+            elif status == 'completed':
+                self.completed_counts[learner_id] += 1
+        statuses[content_id] = status
     
     def get_content_progress(
         self,
@@ -394,8 +639,7 @@ class ProgressTracker:
         total_content_items: int
     ) -> float:
         """Calculate overall progress percentage."""
-        status = self.content_status.get(learner_id, {})
-        completed = sum(1 for s in status.values() if s == 'completed')
+        completed = self.completed_counts.get(learner_id, 0)
         
         return (completed / total_content_items * 100) if total_content_items > 0 else 0.0
     
@@ -421,6 +665,16 @@ class ProgressTracker:
         
         return (completed / len(started_content) * 100) if started_content else 0.0
     
+    def get_completion_counts(
+        self,
+        learner_id: str
+    ) -> Tuple[int, int]:
+        """Get (completed, started) content counts for a learner."""
+        return (
+            self.completed_counts.get(learner_id, 0),
+            len(self.content_status.get(learner_id, ()))
+        )
+    
     def get_progress_trend(
         self,
         learner_id: str,
@@ -478,6 +732,10 @@ class PerformanceAnalyzer:
     def __init__(self):
         self.assessment_results: Dict[str, List[SkillAssessment]] = defaultdict(list)
         self.score_history: Dict[str, List[Tuple[datetime, float]]] = defaultdict(list)
+        
+        # Running aggregates so per-learner summaries skip the full history
+        self.score_totals: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        self.latest_skills: Dict[str, Dict[Tuple[str, str], SkillAssessment]] = defaultdict(dict)
     
     def record_assessment(
         self,
@@ -488,6 +746,23 @@ class PerformanceAnalyzer:
         self.score_history[assessment.learner_id].append(
             (assessment.timestamp, assessment.percentage_score)
         )
+        
+        totals = self.score_totals[assessment.learner_id]
+        totals[0] += assessment.percentage_score
+        totals[1] += 1
+        
+        latest = self.latest_skills[assessment.learner_id]
+        key = (assessment.skill_name, assessment.assessment_type)
+        if key not in latest or assessment.timestamp > latest[key].timestamp:
+            latest[key] = assessment
+    
+    def get_score_totals(
+        self,
+        learner_id: str
+    ) -> Tuple[float, int]:
+        """Get the (percentage score sum, assessment count) for a learner."""
+        totals = self.score_totals.get(learner_id)
+        return (totals[0], totals[1]) if totals else (0.0, 0)
     
     def get_average_score(
         self,
@@ -496,6 +771,10 @@ class PerformanceAnalyzer:
         days: Optional[int] = None
     ) -> float:
         """Calculate average score for a learner."""
+        if assessment_type is None and days is None:
+            score_sum, count = self.get_score_totals(learner_id)
+            return score_sum / count if count else 0.0
+        
         assessments = self.assessment_results.get(learner_id, [])
         
         if assessment_type:
@@ -532,16 +811,9 @@ class PerformanceAnalyzer:
         learner_id: str
     ) -> Dict[str, float]:
         """Get current skill levels for a learner."""
-        latest_skills: Dict[str, SkillAssessment] = {}
-        
-        for assessment in self.assessment_results.get(learner_id, []):
-            key = (assessment.skill_name, assessment.assessment_type)
-            if key not in latest_skills or assessment.timestamp > latest_skills[key].timestamp:
-                latest_skills[key] = assessment
-        
         return {
             assessment.skill_name: assessment.percentage_score
-            for assessment in latest_skills.values()
+            for assessment in self.latest_skills.get(learner_id, {}).values()
         }
     
     def get_skill_improvement(
@@ -766,12 +1038,100 @@ class SkillGapAnalyzer:
         return recommendations
 
 
+def _calculate_streaks(sorted_dates: List[Any], today: Any) -> Dict[str, int]:
+    """Calculate current and longest streaks from ascending activity dates."""
+    if not sorted_dates:
+        return {'current': 0, 'longest': 0}
+    
+    current_streak = 0
+    
+    # Check if streak is still active (activity today or yesterday)
+    if sorted_dates[-1] >= today - timedelta(days=1):
+        current_streak = 1
+        for i in range(len(sorted_dates) - 2, -1, -1):
+            if (sorted_dates[i + 1] - sorted_dates[i]).days == 1:
+                current_streak += 1
+            else:
+                break
+    
+    # Calculate longest streak
+    longest_streak = 1
+    current = 1
+    
+    for i in range(1, len(sorted_dates)):
+        if (sorted_dates[i] - sorted_dates[i - 1]).days == 1:
+            current += 1
+        else:
+            longest_streak = max(longest_streak, current)
+            current = 1
+    
+    longest_streak = max(longest_streak, current)
+    
+    return {'current': current_streak, 'longest': longest_streak}
+
+
+def _summarize_cohort_chunk(
+    totals: np.ndarray,
+    activity_dates: List[List[Any]],
+    today: Any
+) -> Dict[str, np.ndarray]:
+    """
+    Compute per-learner cohort metrics from raw totals.
+    
+    Module-level so chunks of a large cohort can run in worker processes.
+    
+    Args:
+        totals: (n, 6) array of completed, started, score sum, score count,
+            engagement sum and engagement count per learner
+        activity_dates: Ascending session dates per learner
+        today: Date the current streak is measured against
+    """
+    def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        out = np.zeros(len(numerator))
+        np.divide(numerator, denominator, out=out, where=denominator > 0)
+        return out
+    
+    return {
+        'completion_rates': ratio(totals[:, 0], totals[:, 1]) * 100,
+        'average_scores': ratio(totals[:, 2], totals[:, 3]),
+        'average_engagement': ratio(totals[:, 4], totals[:, 5]),
+        'current_streaks': np.array(
+            [_calculate_streaks(dates, today)['current'] for dates in activity_dates],
+            dtype=np.int64
+        )
+    }
+
+
 class AnalyticsService:
     """
     Main analytics service aggregating multiple analysis engines.
+    
+    Course reports are computed for the whole cohort in one batch and cached
+    per course together with the data watermark of the enrolled learners, so
+    repeated views are served without recomputation until a learner's data
+    changes or the report ages out.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        report_cache_ttl: float = 300.0,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = 50000
+    ):
+        """
+        Initialize the analytics service.
+        
+        Args:
+            report_cache_ttl: Seconds a cached course report stays valid even
+                without new data (time windows move on)
+            max_workers: Worker processes for cohort metrics; None computes
+                in-process
+            parallel_threshold: Minimum cohort size before using workers
+        """
+        self.report_cache_ttl = report_cache_ttl
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        
         self.engagement_analyzer = EngagementAnalyzer()
         self.progress_tracker = ProgressTracker()
         self.performance_analyzer = PerformanceAnalyzer()
@@ -782,6 +1142,26 @@ class AnalyticsService:
         self.content_analytics: Dict[str, ContentAnalytics] = {}
         self.course_analytics: Dict[str, CourseAnalytics] = {}
         self.reports: List[AnalyticsReport] = []
+        
+        # Sessions per learner in start order
+        self.sessions_by_learner: Dict[str, List[LearningSession]] = defaultdict(list)
+        
+        # Data watermarks: a learner's version is bumped on every change
+        self._data_version = 0
+        self._learner_versions: Dict[str, int] = {}
+        
+        # course_id -> (enrolled learners, watermark, created at, report)
+        self._report_cache: Dict[str, Tuple[Tuple[str, ...], int, float, AnalyticsReport]] = {}
+    
+    def _touch(self, learner_id: str):
+        """Advance a learner's data watermark."""
+        self._data_version += 1
+        self._learner_versions[learner_id] = self._data_version
+    
+    def get_data_watermark(self, learner_ids: List[str]) -> int:
+        """Get the latest data version across a set of learners."""
+        versions = self._learner_versions
+        return max((versions.get(learner_id, 0) for learner_id in learner_ids), default=0)
     
     # Session Management
     def start_session(
@@ -800,7 +1180,14 @@ class AnalyticsService:
             events=[]
         )
         
+        previous = self.sessions.get(session_id)
+        if previous is not None:
+            self.sessions_by_learner[previous.learner_id].remove(previous)
+            self._touch(previous.learner_id)
+        
         self.sessions[session_id] = session
+        self.sessions_by_learner[learner_id].append(session)
+        self._touch(learner_id)
         return session
     
     def end_session(
@@ -814,6 +1201,7 @@ class AnalyticsService:
             session.total_duration = int(
                 (session.end_time - session.start_time).total_seconds()
             )
+            self._touch(session.learner_id)
             return session
         return None
     
@@ -844,10 +1232,11 @@ class AnalyticsService:
         self.engagement_analyzer.record_engagement(
             learner_id, content_id, engagement_score, duration, datetime.now()
         )
+        self._touch(learner_id)
         
         # Also record in session
-        for session in self.sessions.values():
-            if session.learner_id == learner_id and session.is_active:
+        for session in self.sessions_by_learner.get(learner_id, []):
+            if session.is_active:
                 session.events.append({
                     'type': 'engagement',
                     'content_id': content_id,
@@ -894,6 +1283,7 @@ class AnalyticsService:
             learner_id, content_id, progress_percentage,
             time_spent_seconds, status, score
         )
+        self._touch(learner_id)
         
         # Update performance if assessment
         if score is not None and status == 'completed':
@@ -919,10 +1309,7 @@ class AnalyticsService:
     ) -> LearnerMetrics:
         """Get comprehensive progress metrics for a learner."""
         # Calculate session statistics
-        learner_sessions = [
-            s for s in self.sessions.values() 
-            if s.learner_id == learner_id
-        ]
+        learner_sessions = self.sessions_by_learner.get(learner_id, [])
         
         total_time = sum(s.total_duration for s in learner_sessions)
         avg_session = (
@@ -986,37 +1373,7 @@ class AnalyticsService:
         activity_dates: set
     ) -> Dict[str, int]:
         """Calculate current and longest streaks from activity dates."""
-        if not activity_dates:
-            return {'current': 0, 'longest': 0}
-        
-        sorted_dates = sorted(activity_dates)
-        
-        current_streak = 0
-        today = datetime.now().date()
-        
-        # Check if streak is still active (activity today or yesterday)
-        if sorted_dates[-1] >= today - timedelta(days=1):
-            current_streak = 1
-            for i in range(len(sorted_dates) - 2, -1, -1):
-                if (sorted_dates[i + 1] - sorted_dates[i]).days == 1:
-                    current_streak += 1
-                else:
-                    break
-        
-        # Calculate longest streak
-        longest_streak = 1
-        current = 1
-        
-        for i in range(1, len(sorted_dates)):
-            if (sorted_dates[i] - sorted_dates[i - 1]).days == 1:
-                current += 1
-            else:
-                longest_streak = max(longest_streak, current)
-                current = 1
-        
-        longest_streak = max(longest_streak, current)
-        
-        return {'current': current_streak, 'longest': longest_streak}
+        return _calculate_streaks(sorted(activity_dates), datetime.now().date())
     
     # Performance Methods
     def record_assessment_result(
@@ -1049,6 +1406,7 @@ class AnalyticsService:
         )
         
         self.performance_analyzer.record_assessment(assessment)
+        self._touch(learner_id)
     
     def _calculate_confidence(
         self,
@@ -1163,6 +1521,73 @@ class AnalyticsService:
         """Get analytics for specific content."""
         return self.content_analytics.get(content_id)
     
+    # Cohort Methods
+    def get_cohort_metrics(
+        self,
+        learner_ids: List[str],
+        days: int = 30
+    ) -> CohortMetrics:
+        """
+        Compute summary metrics for a cohort of learners in one batch.
+        
+        Per-learner totals are read from the analyzers' running aggregates
+        and turned into rates with array operations. Cohorts of at least
+        ``parallel_threshold`` learners are split across ``max_workers``
+        processes when workers are configured.
+        
+        Args:
+            learner_ids: Learners in the cohort
+            days: Engagement window
+        """
+        learner_ids = list(learner_ids)
+        cutoff = datetime.now() - timedelta(days=days)
+        today = datetime.now().date()
+        
+        totals = np.zeros((len(learner_ids), 6))
+        activity_dates = []
+        skill_levels = []
+        
+        engagement_history = self.engagement_analyzer.engagement_history
+        for row, learner_id in enumerate(learner_ids):
+            completed, started = self.progress_tracker.get_completion_counts(learner_id)
+            score_sum, score_count = self.performance_analyzer.get_score_totals(learner_id)
+            series = engagement_history.get(learner_id)
+            engagement_sum, engagement_count = (
+                series.totals_since(cutoff) if series is not None else (0.0, 0)
+            )
+            totals[row] = (
+                completed, started, score_sum, score_count, engagement_sum, engagement_count
+            )
+            
+            activity_dates.append(sorted({
+                session.start_time.date()
+                for session in self.sessions_by_learner.get(learner_id, [])
+            }))
+            skill_levels.append(self.performance_analyzer.get_skill_levels(learner_id))
+        
+        if self.max_workers and learner_ids and len(learner_ids) >= self.parallel_threshold:
+            chunk_size = -(-len(learner_ids) // self.max_workers)
+            bounds = range(0, len(learner_ids), chunk_size)
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                parts = list(executor.map(
+                    _summarize_cohort_chunk,
+                    [totals[i:i + chunk_size] for i in bounds],
+                    [activity_dates[i:i + chunk_size] for i in bounds],
+                    [today] * len(bounds)
+                ))
+            summary = {
+                key: np.concatenate([part[key] for part in parts])
+                for key in parts[0]
+            }
+        else:
+            summary = _summarize_cohort_chunk(totals, activity_dates, today)
+        
+        return CohortMetrics(
+            learner_ids=learner_ids,
+            skill_levels=skill_levels,
+            **summary
+        )
+    
     # Report Generation
     def generate_learner_report(
         self,
@@ -1231,36 +1656,69 @@ class AnalyticsService:
     def generate_course_report(
         self,
         course_id: str,
-        enrolled_learners: List[str]
+        enrolled_learners: List[str],
+        use_cache: bool = True
     ) -> AnalyticsReport:
-        """Generate a course-level analytics report."""
-        progress_rates = []
-        avg_scores = []
-        avg_engagement = []
-        skill_distributions: Dict[str, List[float]] = defaultdict(list)
+        """
+        Generate a course-level analytics report.
+        
+        The report is cached per course; it is reused while the enrollment
+        and the enrolled learners' data watermark are unchanged and the
+        report is younger than ``report_cache_ttl``.
+        """
+        enrollment = tuple(enrolled_learners)
+        if use_cache:
+            report = self._cached_course_report(course_id, enrollment)
+            if report is not None:
+                return report
+        
+        report = self._build_course_report(course_id, enrollment)
+        self.reports.append(report)
+        return report
+    
+    def _cached_course_report(
+        self,
+        course_id: str,
+        enrollment: Tuple[str, ...]
+    ) -> Optional[AnalyticsReport]:
+        """Get the cached course report if it is still valid for an enrollment."""
+        cached = self._report_cache.get(course_id)
+        if cached is None:
+            return None
         
-        for learner_id in enrolled_learners:
-            progress = self.get_learner_progress(learner_id)
-            performance = self.get_learner_performance(learner_id)
-            engagement = self.get_learner_engagement(learner_id)
-            
-            progress_rates.append(progress.completion_rate)
-            avg_scores.append(performance['average_score'])
-            avg_engagement.append(engagement['average_engagement'])
-            
-            for skill, level in progress.skill_levels.items():
+        cached_enrollment, cached_watermark, created_at, report = cached
+        if (
+            cached_enrollment == enrollment
+            and cached_watermark == self.get_data_watermark(enrollment)
+            and time.monotonic() - created_at < self.report_cache_ttl
+        ):
+            return report
+        return None
+    
+    def _build_course_report(
+        self,
+        course_id: str,
+        enrollment: Tuple[str, ...]
+    ) -> AnalyticsReport:
+        """Build a course report and store it in the report cache."""
+        watermark = self.get_data_watermark(enrollment)
+        cohort = self.get_cohort_metrics(enrollment)
+        
+        skill_distributions: Dict[str, List[float]] = defaultdict(list)
+        for skill_levels in cohort.skill_levels:
+            for skill, level in skill_levels.items():
                 skill_distributions[skill].append(level)
         
-        avg_progress = sum(progress_rates) / len(progress_rates) if progress_rates else 0
-        avg_score = sum(avg_scores) / len(avg_scores) if avg_scores else 0
-        avg_engage = sum(avg_engagement) / len(avg_engagement) if avg_engagement else 0
+        avg_progress = float(cohort.completion_rates.mean()) if len(cohort) else 0
+        avg_score = float(cohort.average_scores.mean()) if len(cohort) else 0
+        avg_engage = float(cohort.average_engagement.mean()) if len(cohort) else 0
         
-        active_count = sum(1 for e in avg_engagement if e > 0.3)
+        active_count = int((cohort.average_engagement > 0.3).sum())
         
         insights = [
             f"Average completion rate: {avg_progress:.1f}%",
             f"Average assessment score: {avg_score:.1f}%",
-            f"Active learners: {active_count}/{len(enrolled_learners)}"
+            f"Active learners: {active_count}/{len(enrollment)}"
         ]
         
         if avg_progress < 50:
@@ -1277,12 +1735,14 @@ class AnalyticsService:
             time_range_end=datetime.now(),
             data={
                 'course_id': course_id,
-                'enrolled_count': len(enrolled_learners),
+                'enrolled_count': len(enrollment),
                 'active_count': active_count,
                 'completion_rate': avg_progress,
                 'avg_score': avg_score,
                 'avg_engagement': avg_engage,
-                'skill_distributions': dict(skill_distributions)
+                'skill_distributions': dict(skill_distributions),
+                'dashboard': self._summarize_dashboard(cohort),
+                'data_watermark': watermark
             },
             summary=f"Course Analytics: {avg_progress:.1f}% avg completion, "
                    f"{avg_score:.1f}% avg score, {active_count} active learners",
@@ -1290,31 +1750,48 @@ class AnalyticsService:
             recommendations=[]
         )
         
-        self.reports.append(report)
+        self._report_cache[course_id] = (enrollment, watermark, time.monotonic(), report)
         return report
     
+    def invalidate_course_report(self, course_id: str):
+        """Drop the cached report for a course."""
+        self._report_cache.pop(course_id, None)
+    
     def get_dashboard_summary(
         self,
-        learner_ids: Optional[List[str]] = None
+        learner_ids: Optional[List[str]] = None,
+        course_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get dashboard summary for multiple learners."""
+        """
+        Get dashboard summary for multiple learners.
+        
+        With a ``course_id`` the summary comes from the course report cache;
+        ``learner_ids`` then defaults to the course's last reported enrollment.
+        Refilling the cache here does not add to the report history.
+        """
+        if course_id is not None:
+            if learner_ids is None:
+                cached = self._report_cache.get(course_id)
+                if cached is None:
+                    return self._summarize_dashboard(self.get_cohort_metrics([]))
+                learner_ids = cached[0]
+            
+            enrollment = tuple(learner_ids)
+            report = self._cached_course_report(course_id, enrollment)
+            if report is None:
+                report = self._build_course_report(course_id, enrollment)
+            return report.data['dashboard']
+        
         if learner_ids is None:
-            learner_ids = list(set(s.learner_id for s in self.sessions.values()))
-        
-        metrics = []
-        
-        for learner_id in learner_ids:
-            progress = self.get_learner_progress(learner_id)
-            metrics.append({
-                'learner_id': learner_id,
-                'completion_rate': progress.completion_rate,
-                'average_score': progress.average_score,
-                'engagement': progress.average_engagement,
-                'streak': progress.current_streak,
-                'total_time': progress.total_time_spent
-            })
-        
-        if not metrics:
+            learner_ids = [
+                learner_id for learner_id, sessions in self.sessions_by_learner.items() if sessions
+            ]
+        
+        return self._summarize_dashboard(self.get_cohort_metrics(learner_ids))
+    
+    def _summarize_dashboard(self, cohort: CohortMetrics) -> Dict[str, Any]:
+        """Build the dashboard summary from cohort metrics."""
+        if not len(cohort):
             return {
                 'total_learners': 0,
                 'avg_completion': 0,
@@ -1324,30 +1801,28 @@ class AnalyticsService:
                 'top_learners': []
             }
         
-        completion_rates = [m['completion_rate'] for m in metrics]
-        scores = [m['average_score'] for m in metrics]
-        engagements = [m['engagement'] for m in metrics]
-        streaks = [m['streak'] for m in metrics]
+        completion_rates = cohort.completion_rates.tolist()
+        scores = cohort.average_scores.tolist()
         
-        top_learners = sorted(
-            metrics,
-            key=lambda x: (x['completion_rate'], x['average_score']),
-            reverse=True
-        )[:5]
+        top_learners = heapq.nlargest(
+            5,
+            range(len(cohort)),
+            key=lambda i: (completion_rates[i], scores[i])
+        )
         
         return {
-            'total_learners': len(metrics),
-            'avg_completion': sum(completion_rates) / len(completion_rates),
-            'avg_score': sum(scores) / len(scores),
-            'avg_engagement': sum(engagements) / len(engagements),
-            'active_streaks': sum(1 for s in streaks if s > 0),
+            'total_learners': len(cohort),
+            'avg_completion': float(cohort.completion_rates.mean()),
+            'avg_score': float(cohort.average_scores.mean()),
+            'avg_engagement': float(cohort.average_engagement.mean()),
+            'active_streaks': int((cohort.current_streaks > 0).sum()),
             'top_learners': [
                 {
-                    'learner_id': l['learner_id'],
-                    'completion': l['completion_rate'],
-                    'score': l['average_score']
+                    'learner_id': cohort.learner_ids[i],
+                    'completion': completion_rates[i],
+                    'score': scores[i]
                 }
-                for l in top_learners
+                for i in top_learners
             ]
         }
 
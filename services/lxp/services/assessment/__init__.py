@@ -13,6 +13,10 @@ from .assessment_service import (
     AssessmentAttempt,
     AssessmentAnalytics,
     QuestionAnalytics,
+    AssessmentAggregates,
+    QuantileSketch,
+    IRTItemBank,
+    get_irt_parameters,
     QuestionType,
     AssessmentType,
     Difficulty,
@@ -28,6 +32,10 @@ __all__ = [
     "AssessmentAttempt",
     "AssessmentAnalytics",
     "QuestionAnalytics",
+    "AssessmentAggregates",
+    "QuantileSketch",
+    "IRTItemBank",
+    "get_irt_parameters",
     "QuestionType",
     "AssessmentType",
     "Difficulty",
@@ -10,7 +10,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 from collections import defaultdict
+from itertools import islice
+from bisect import bisect_left, bisect_right
+import heapq
 import json
+import math
 
 
 class QuestionType(Enum):
@@ -147,10 +151,264 @@ class AssessmentAnalytics:
     average_score: float = 0.0
     pass_rate: float = 0.0
     average_time_minutes: float = 0.0
+    score_std_dev: float = 0.0
+    median_time_minutes: float = 0.0
+    p90_time_minutes: float = 0.0
     question_analytics: Dict[str, QuestionAnalytics] = field(default_factory=dict)
     score_distribution: Dict[str, int] = field(default_factory=dict)
 
 
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch with bounded relative error.
+    
+    Positive values are counted in buckets whose boundaries grow
+    geometrically, so any quantile estimate is within ``relative_accuracy``
+    of the true value while memory depends only on the value range.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+    
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+    
+    def add(self, value: float):
+        """Count a value."""
+        if value <= 0:
+            self.zero_count += 1
+        else:
+            self.buckets[self._key(value)] += 1
+        self.count += 1
+    
+    def remove(self, value: float):
+        """Remove a previously added value."""
+        if value <= 0:
+            self.zero_count -= 1
+        else:
+            key = self._key(value)
+            self.buckets[key] -= 1
+            if self.buckets[key] <= 0:
+                del self.buckets[key]
+        self.count -= 1
+    
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile q (0-1)."""
+        if self.count <= 0:
+            return 0.0
+        
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Bucket midpoint in relative terms
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+@dataclass
+class AssessmentAggregates:
+    """Running aggregates over the completed attempts of one assessment."""
+    assessment_id: str
+    completed_count: int = 0
+    passed_count: int = 0
+    score_mean: float = 0.0
+    score_m2: float = 0.0  # Welford sum of squared deviations
+    total_time_seconds: float = 0.0
+    time_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    learners: set = field(default_factory=set)
+    
+    def add(self, score: float, time_seconds: float, passed: bool):
+        """Add a completed attempt."""
+        self.completed_count += 1
+        delta = score - self.score_mean
+        self.score_mean += delta / self.completed_count
+        self.score_m2 += delta * (score - self.score_mean)
+        self.total_time_seconds += time_seconds
+        self.time_sketch.add(time_seconds)
+        if passed:
+            self.passed_count += 1
+    
+    def remove(self, score: float, time_seconds: float, passed: bool):
+        """Remove a completed attempt (e.g. before re-scoring it)."""
+        if self.completed_count <= 1:
+            self.completed_count = 0
+            self.score_mean = 0.0
+            self.score_m2 = 0.0
+        else:
+            previous_mean = (self.completed_count * self.score_mean - score) / (self.completed_count - 1)
+            self.score_m2 = max(0.0, self.score_m2 - (score - previous_mean) * (score - self.score_mean))
+            self.score_mean = previous_mean
+            self.completed_count -= 1
+        self.total_time_seconds -= time_seconds
+        self.time_sketch.remove(time_seconds)
+        if passed:
+            self.passed_count -= 1
+    
+    @property
+    def score_variance(self) -> float:
+        return self.score_m2 / self.completed_count if self.completed_count else 0.0
+    
+    @property
+    def average_time_seconds(self) -> float:
+        return self.total_time_seconds / self.completed_count if self.completed_count else 0.0
+
+
+# Default IRT difficulty (b) for each difficulty level, on the ability scale
+DIFFICULTY_IRT_PARAMETERS: Dict[Difficulty, float] = {
+    Difficulty.EASY: -1.5,
+    Difficulty.MEDIUM: -0.5,
+    Difficulty.HARD: 0.5,
+    Difficulty.EXPERT: 1.5
+}
+
+
+def get_irt_parameters(question: Question) -> Tuple[float, float]:
+    """
+    Get 2PL item parameters (discrimination a, difficulty b) for a question.
+    
+    Calibrated values can be stored in ``metadata['irt_discrimination']``
+    and ``metadata['irt_difficulty']``; otherwise the difficulty level is
+    mapped onto the ability scale with unit discrimination.
+    """
+    discrimination = float(question.metadata.get('irt_discrimination', 1.0))
+    difficulty = float(question.metadata.get(
+        'irt_difficulty', DIFFICULTY_IRT_PARAMETERS.get(question.difficulty, 0.0)
+    ))
+    return discrimination, difficulty
+
+
+class IRTItemBank:
+    """
+    Precomputed 2PL item bank for maximum-information question selection.
+    
+    Items are split into at most ``DISCRIMINATION_BUCKETS`` buckets by
+    discrimination quantile and sorted by difficulty within each bucket.
+    Information falls off with the distance between ability and item
+    difficulty, so selection walks outward from the ability estimate in
+    every bucket, best-first by an upper bound on the information still
+    reachable, and stops as soon as no bucket can beat the best item found.
+    """
+    
+    # Ability grid for expected a posteriori estimation (standard normal prior)
+    ABILITY_GRID = [-4.0 + 0.1 * i for i in range(81)]
+    
+    # Upper limit on discrimination buckets searched per selection
+    DISCRIMINATION_BUCKETS = 16
+    
+    def __init__(self, questions: List[Question]):
+        self.parameters: Dict[str, Tuple[float, float]] = {}
+        for question in questions:
+            self.parameters[question.question_id] = get_irt_parameters(question)
+        
+        # Bucket boundaries at quantiles of the distinct discriminations
+        discriminations = sorted({abs(a) for a, _ in self.parameters.values()})
+        step = max(1, math.ceil(len(discriminations) / self.DISCRIMINATION_BUCKETS))
+        floors = discriminations[::step]
+        
+        grouped: Dict[int, List[Tuple[float, float, str]]] = defaultdict(list)
+        for question_id, (discrimination, difficulty) in self.parameters.items():
+            bucket = bisect_right(floors, abs(discrimination)) - 1
+            grouped[bucket].append((difficulty, discrimination, question_id))
+        
+        # (min |a|, max |a|, difficulties, discriminations, question IDs)
+        self.groups: List[Tuple[float, float, List[float], List[float], List[str]]] = []
+        for bucket in sorted(grouped):
+            items = sorted(grouped[bucket])
+            self.groups.append((
+                min(abs(a) for _, a, _ in items),
+                max(abs(a) for _, a, _ in items),
+                [difficulty for difficulty, _, _ in items],
+                [discrimination for _, discrimination, _ in items],
+                [question_id for _, _, question_id in items]
+            ))
+    
+    def __len__(self) -> int:
+        return len(self.parameters)
+    
+    @staticmethod
+    def probability(theta: float, discrimination: float, difficulty: float) -> float:
+        """Probability of a correct response under the 2PL model."""
+        logit = max(-30.0, min(30.0, discrimination * (theta - difficulty)))
+        return 1.0 / (1.0 + math.exp(-logit))
+    
+    @classmethod
+    def information(cls, theta: float, discrimination: float, difficulty: float) -> float:
+        """Fisher information of an item at ability theta."""
+        p = cls.probability(theta, discrimination, difficulty)
+        return discrimination * discrimination * p * (1.0 - p)
+    
+    def estimate_ability(self, responses: List[Tuple[str, bool]]) -> float:
+        """Expected a posteriori ability estimate from (question_id, is_correct) pairs."""
+        log_posterior = [-0.5 * theta * theta for theta in self.ABILITY_GRID]
+        
+        # Items sharing parameters contribute identical likelihood terms
+        outcomes: Dict[Tuple[float, float, bool], int] = defaultdict(int)
+        for question_id, is_correct in responses:
+            parameters = self.parameters.get(question_id)
+            if parameters is not None:
+                outcomes[(*parameters, is_correct)] += 1
+        
+        for (discrimination, difficulty, is_correct), count in outcomes.items():
+            for i, theta in enumerate(self.ABILITY_GRID):
+                p = self.probability(theta, discrimination, difficulty)
+                log_posterior[i] += count * math.log(p if is_correct else 1.0 - p)
+        
+        peak = max(log_posterior)
+        weights = [math.exp(value - peak) for value in log_posterior]
+        return sum(w * theta for w, theta in zip(weights, self.ABILITY_GRID)) / sum(weights)
+    
+    @classmethod
+    def _information_bound(cls, theta: float, group: Tuple, index: int) -> float:
+        """Upper bound on the information of any item in a group at or beyond index."""
+        min_discrimination, max_discrimination, difficulties = group[:3]
+        p = cls.probability(abs(theta - difficulties[index]), min_discrimination, 0.0)
+        return max_discrimination * max_discrimination * p * (1.0 - p)
+    
+    def select(self, theta: float, exclude: set) -> Optional[str]:
+        """Get the unanswered question with maximum information at theta."""
+        best_id = None
+        best_information = -1.0
+        
+        # Walk outward from theta in each group; entries are
+        # (-bound, group, index, step) and bounds only shrink as we move out
+        frontier = []
+        for g, group in enumerate(self.groups):
+            difficulties = group[2]
+            position = bisect_left(difficulties, theta)
+            for index, step in ((position - 1, -1), (position, 1)):
+                if 0 <= index < len(difficulties):
+                    frontier.append((-self._information_bound(theta, group, index), g, index, step))
+        heapq.heapify(frontier)
+        
+        while frontier and -frontier[0][0] > best_information:
+            _, g, index, step = heapq.heappop(frontier)
+            group = self.groups[g]
+            _, _, difficulties, discriminations, question_ids = group
+            
+            if question_ids[index] not in exclude:
+                information = self.information(theta, discriminations[index], difficulties[index])
+                if information > best_information:
+                    best_id = question_ids[index]
+                    best_information = information
+            
+            index += step
+            if 0 <= index < len(difficulties):
+                heapq.heappush(frontier, (-self._information_bound(theta, group, index), g, index, step))
+        
+        return best_id
+
+
 class AssessmentService:
     """
     Service for managing assessments, questions, and test delivery.
@@ -166,9 +424,20 @@ class AssessmentService:
         self.learner_attempts: Dict[str, List[str]] = defaultdict(list)
         self.assessment_analytics: Dict[str, AssessmentAnalytics] = {}
         
-        # Question bank by topic
+        # Attempt indexes and running aggregates, so analytics and attempt
+        # lookups never scan every attempt on the platform
+        self.learner_assessment_attempts: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self.assessment_aggregates: Dict[str, AssessmentAggregates] = {}
+        
+        # Question bank by assessment
         self.question_bank: Dict[str, List[str]] = defaultdict(list)
         
+        # Question indexes (insertion-ordered dicts used as ordered sets)
+        self.questions_by_difficulty: Dict[Tuple[str, Difficulty], Dict[str, None]] = defaultdict(dict)
+        self.questions_by_topic: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self.questions_by_skill: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._irt_banks: Dict[str, IRTItemBank] = {}
+        
         # Initialize sample assessments
         self._init_sample_assessments()
     
@@ -217,8 +486,7 @@ class AssessmentService:
         ]
         
         for q in sample_questions:
-            self.questions[q.question_id] = q
-            self.question_bank[q.assessment_id].append(q.question_id)
+            self._store_question(q)
     
     # Assessment Management
     def create_assessment(
@@ -303,11 +571,59 @@ class AssessmentService:
             skills_tested=skills_tested or []
         )
         
-        self.questions[question_id] = question
-        self.question_bank[assessment_id].append(question_id)
+        self._store_question(question)
         
         return question
     
+    def _store_question(self, question: Question):
+        """Store a question and add it to the question indexes."""
+        previous = self.questions.get(question.question_id)
+        if previous is not None:
+            self._unindex_question(previous, replacement=question)
+        
+        self.questions[question.question_id] = question
+        # A replaced question keeps its place in its assessment's bank
+        if previous is None or previous.assessment_id != question.assessment_id:
+            if previous is not None:
+                self.question_bank[previous.assessment_id].remove(question.question_id)
+            self.question_bank[question.assessment_id].append(question.question_id)
+        
+        self.questions_by_difficulty[(question.assessment_id, question.difficulty)][question.question_id] = None
+        for topic in question.topics:
+            self.questions_by_topic[topic][question.question_id] = None
+        for skill in question.skills_tested:
+            self.questions_by_skill[skill][question.question_id] = None
+        self._irt_banks.pop(question.assessment_id, None)
+    
+    def _unindex_question(self, question: Question, replacement: Optional[Question] = None):
+        """
+        Remove a question from the question indexes.
+        
+        Entries shared with ``replacement`` are kept so that a replaced
+        question keeps its original position in the index order.
+        """
+        key = (question.assessment_id, question.difficulty)
+        if replacement is None or key != (replacement.assessment_id, replacement.difficulty):
+            self.questions_by_difficulty[key].pop(question.question_id, None)
+        for topic in question.topics:
+            if replacement is None or topic not in replacement.topics:
+                self.questions_by_topic[topic].pop(question.question_id, None)
+        for skill in question.skills_tested:
+            if replacement is None or skill not in replacement.skills_tested:
+                self.questions_by_skill[skill].pop(question.question_id, None)
+        self._irt_banks.pop(question.assessment_id, None)
+    
+    def _get_irt_bank(self, assessment_id: str) -> IRTItemBank:
+        """Get the IRT item bank for an assessment, building it on first use."""
+        bank = self._irt_banks.get(assessment_id)
+        if bank is None:
+            bank = IRTItemBank([
+                self.questions[qid] for qid in self.question_bank.get(assessment_id, [])
+                if qid in self.questions
+            ])
+            self._irt_banks[assessment_id] = bank
+        return bank
+    
     def get_question(self, question_id: str) -> Optional[Question]:
         """Get a specific question."""
         return self.questions.get(question_id)
@@ -342,15 +658,14 @@ class AssessmentService:
         difficulty: Optional[Difficulty] = None
     ) -> List[Question]:
         """Get questions filtered by topic."""
-        questions = [
-            q for q in self.questions.values()
-            if topic in q.topics
-        ]
+        questions = (
+            self.questions[qid] for qid in self.questions_by_topic.get(topic, {})
+        )
         
         if difficulty:
-            questions = [q for q in questions if q.difficulty == difficulty]
+            questions = (q for q in questions if q.difficulty == difficulty)
         
-        return questions[:count]
+        return list(islice(questions, count))
     
     def get_questions_by_skill(
         self,
@@ -359,9 +674,9 @@ class AssessmentService:
     ) -> List[Question]:
         """Get questions testing a specific skill."""
         return [
-            q for q in self.questions.values()
-            if skill in q.skills_tested
-        ][:count]
+            self.questions[qid]
+            for qid in islice(self.questions_by_skill.get(skill, {}), count)
+        ]
     
     # Assessment Taking
     def start_assessment(
@@ -381,10 +696,7 @@ class AssessmentService:
         config = self.assessments[assessment_id]
         
         # Check attempt limit
-        existing_attempts = [
-            a for a in self.learner_attempts[learner_id]
-            if a in self.attempts and self.attempts[a].assessment_id == assessment_id
-        ]
+        existing_attempts = self.learner_assessment_attempts.get((learner_id, assessment_id), [])
         
         if len(existing_attempts) >= config.max_attempts:
             return None, "Maximum attempts reached"
@@ -410,15 +722,16 @@ class AssessmentService:
         
         self.attempts[attempt.attempt_id] = attempt
         self.learner_attempts[learner_id].append(attempt.attempt_id)
+        self.learner_assessment_attempts[(learner_id, assessment_id)].append(attempt.attempt_id)
+        
+        aggregates = self._get_aggregates(assessment_id)
+        aggregates.learners.add(learner_id)
         
         # Update analytics
         analytics = self.assessment_analytics.get(assessment_id)
         if analytics:
             analytics.total_attempts += 1
-            analytics.unique_attempts = len(set(
-                a.learner_id for a in self.attempts.values()
-                if a.assessment_id == assessment_id
-            ))
+            analytics.unique_attempts = len(aggregates.learners)
         
         return attempt, None
     
@@ -544,6 +857,12 @@ class AssessmentService:
             return None, "Attempt not found"
         
         attempt = self.attempts[attempt_id]
+        
+        # Previous result, if this attempt is being completed again
+        previous = None
+        if attempt.status == AssessmentStatus.COMPLETED:
+            previous = (attempt.percentage_score, attempt.time_spent_seconds, attempt.is_passed)
+        
         attempt.completed_at = datetime.now()
         attempt.status = AssessmentStatus.COMPLETED
         
@@ -577,7 +896,7 @@ class AssessmentService:
         attempt.feedback = self._generate_attempt_feedback(attempt)
         
         # Update assessment analytics
-        self._update_assessment_analytics(attempt)
+        self._update_assessment_analytics(attempt, previous)
         
         return attempt, None
     
@@ -657,11 +976,25 @@ class AssessmentService:
         total_time = qa.average_time_seconds * (qa.total_attempts - 1)
         qa.average_time_seconds = (total_time + answer.time_spent_seconds) / qa.total_attempts
     
+    def _get_aggregates(self, assessment_id: str) -> AssessmentAggregates:
+        """Get or create running aggregates for an assessment."""
+        aggregates = self.assessment_aggregates.get(assessment_id)
+        if aggregates is None:
+            aggregates = AssessmentAggregates(assessment_id=assessment_id)
+            self.assessment_aggregates[assessment_id] = aggregates
+        return aggregates
+    
     def _update_assessment_analytics(
         self,
-        attempt: AssessmentAttempt
+        attempt: AssessmentAttempt,
+        previous: Optional[Tuple[float, int, bool]] = None
     ):
-        """Update analytics for an assessment."""
+        """Update analytics for an assessment in constant time."""
+        aggregates = self._get_aggregates(attempt.assessment_id)
+        if previous is not None:
+            aggregates.remove(*previous)
+        aggregates.add(attempt.percentage_score, attempt.time_spent_seconds, attempt.is_passed)
+        
         analytics = self.assessment_analytics.get(attempt.assessment_id)
         if not analytics:
             return
@@ -669,41 +1002,23 @@ class AssessmentService:
         analytics.total_attempts += 1
         
         # Update completion rate
-        completed = sum(
-            1 for a in self.attempts.values()
-            if a.assessment_id == attempt.assessment_id and
-            a.status == AssessmentStatus.COMPLETED
-        )
+        completed = aggregates.completed_count
         analytics.completion_rate = completed / analytics.total_attempts * 100
         
-        # Update average score
-        scores = [
-            a.percentage_score for a in self.attempts.values()
-            if a.assessment_id == attempt.assessment_id and
-            a.status == AssessmentStatus.COMPLETED
-        ]
-        if scores:
-            analytics.average_score = sum(scores) / len(scores)
-        
-        # Update pass rate
-        passed = sum(
-            1 for a in self.attempts.values()
-            if a.assessment_id == attempt.assessment_id and
-            a.is_passed
-        )
+        # Update score and time statistics
         if completed > 0:
-            analytics.pass_rate = passed / completed * 100
-        
-        # Update average time
-        times = [
-            a.time_spent_seconds / 60 for a in self.attempts.values()
-            if a.assessment_id == attempt.assessment_id and
-            a.status == AssessmentStatus.COMPLETED
-        ]
-        if times:
-            analytics.average_time_minutes = sum(times) / len(times)
+            analytics.average_score = aggregates.score_mean
+            analytics.score_std_dev = math.sqrt(aggregates.score_variance)
+            analytics.pass_rate = aggregates.passed_count / completed * 100
+            analytics.average_time_minutes = aggregates.average_time_seconds / 60
+            analytics.median_time_minutes = aggregates.time_sketch.quantile(0.5) / 60
+            analytics.p90_time_minutes = aggregates.time_sketch.quantile(0.9) / 60
         
         # Update score distribution
+        if previous is not None:
+            previous_range = self._get_score_range(previous[0])
+            if analytics.score_distribution.get(previous_range, 0) > 0:
+                analytics.score_distribution[previous_range] -= 1
         score_range = self._get_score_range(attempt.percentage_score)
         analytics.score_distribution[score_range] = (
             analytics.score_distribution.get(score_range, 0) + 1
@@ -733,17 +1048,15 @@ class AssessmentService:
         assessment_id: Optional[str] = None
     ) -> List[AssessmentAttempt]:
         """Get all attempts for a learner."""
-        attempts = [
-            self.attempts[aid] for aid in self.learner_attempts.get(learner_id, [])
-            if aid in self.attempts
-        ]
-        
         if assessment_id:
-            attempts = [
-                a for a in attempts if a.assessment_id == assessment_id
-            ]
+            attempt_ids = self.learner_assessment_attempts.get((learner_id, assessment_id), [])
+        else:
+            attempt_ids = self.learner_attempts.get(learner_id, [])
         
-        return attempts
+        return [
+            self.attempts[aid] for aid in attempt_ids
+            if aid in self.attempts
+        ]
     
     def get_best_attempt(
         self,
@@ -840,13 +1153,46 @@ class AssessmentService:
     # Adaptive Testing
     def select_next_question_adaptive(
         self,
-        attempt_id: str
+        attempt_id: str,
+        method: str = "difficulty"
     ) -> Tuple[Optional[Question], Optional[str]]:
-        """Select the next question using adaptive difficulty."""
+        """
+        Select the next question using adaptive difficulty.
+        
+        Args:
+            attempt_id: Attempt to select a question for
+            method: "difficulty" steps between difficulty levels based on the
+                correct rate; "irt" estimates the learner's ability with a 2PL
+                model and picks the most informative unanswered question
+        """
         attempt = self.attempts.get(attempt_id)
         if not attempt:
             return None, "Attempt not found"
         
+        answered_ids = {a.question_id for a in attempt.answers}
+        
+        if method == "irt":
+            question = self._select_question_irt(attempt, answered_ids)
+        else:
+            question = self._select_question_by_difficulty(attempt, answered_ids)
+        questions = [question] if question else []
+        
+        if not questions:
+            # Fall back to any available question
+            questions = self.get_questions_for_assessment(
+                attempt.assessment_id,
+                count=1,
+                shuffle=True
+            )
+        
+        return (questions[0], None) if questions else (None, "No questions available")
+    
+    def _select_question_by_difficulty(
+        self,
+        attempt: AssessmentAttempt,
+        answered_ids: set
+    ) -> Optional[Question]:
+        """Select the first unanswered question at the performance-adjusted difficulty."""
         # Calculate current performance
         if not attempt.answers:
             # Start at configured difficulty
@@ -864,22 +1210,24 @@ class AssessmentService:
                 difficulty = Difficulty(attempt.current_question_index + 1)
         
         # Get questions at appropriate difficulty
-        questions = [
-            q for q in self.questions.values()
-            if q.assessment_id == attempt.assessment_id and
-            q.difficulty == difficulty and
-            q.question_id not in [a.question_id for a in attempt.answers]
-        ]
+        for qid in self.questions_by_difficulty.get((attempt.assessment_id, difficulty), {}):
+            if qid not in answered_ids:
+                return self.questions[qid]
         
-        if not questions:
-            # Fall back to any available question
-            questions = self.get_questions_for_assessment(
-                attempt.assessment_id,
-                count=1,
-                shuffle=True
-            )
-        
-        return (questions[0], None) if questions else (None, "No questions available")
+        return None
+    
+    def _select_question_irt(
+        self,
+        attempt: AssessmentAttempt,
+        answered_ids: set
+    ) -> Optional[Question]:
+        """Select the unanswered question with maximum information at the learner's ability."""
+        bank = self._get_irt_bank(attempt.assessment_id)
+        theta = bank.estimate_ability([(a.question_id, a.is_correct) for a in attempt.answers])
+        attempt.metadata["irt_ability"] = theta
+        
+        question_id = bank.select(theta, answered_ids)
+        return self.questions[question_id] if question_id is not None else None
     
     def get_skill_assessment(
         self,
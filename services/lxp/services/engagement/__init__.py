@@ -18,6 +18,7 @@ from .engagement_service import (
     GamificationEvent,
     create_engagement_service
 )
+from .leaderboard_index import LeaderboardIndex
 
 __all__ = [
     "EngagementService",
@@ -30,5 +31,6 @@ __all__ = [
     "NotificationType",
     "NotificationPriority",
     "GamificationEvent",
+    "LeaderboardIndex",
     "create_engagement_service"
 ]
@@ -12,6 +12,11 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import json
 
+from .leaderboard_index import LeaderboardIndex
+
+
+LEADERBOARD_TIME_RANGES = ("daily", "weekly", "all_time")
+
 
 class NotificationType(Enum):
     """Types of notifications."""
@@ -113,6 +118,9 @@ class LearnerGamification:
         self.daily_points[datetime.now().strftime("%Y-%m-%d")] = (
             self.daily_points.get(datetime.now().strftime("%Y-%m-%d"), 0) + points
         )
+        self.weekly_points[datetime.now().strftime("%Y-W%U")] = (
+            self.weekly_points.get(datetime.now().strftime("%Y-W%U"), 0) + points
+        )
         
         # Level up logic
         levels_gained = 0
@@ -183,6 +191,12 @@ class EngagementService:
         
         self.leaderboards: Dict[str, Leaderboard] = {}
         
+        # Ranked scores per leaderboard time range, updated as points arrive
+        self.leaderboard_indexes: Dict[str, LeaderboardIndex] = {
+            time_range: LeaderboardIndex(self._leaderboard_period(time_range))
+            for time_range in LEADERBOARD_TIME_RANGES
+        }
+        
         self.engagement_metrics: Dict[str, EngagementMetrics] = {}
         
         # Initialize default rules
@@ -359,9 +373,9 @@ class EngagementService:
     ) -> LearnerGamification:
         """Get or create gamification state for a learner."""
         if learner_id not in self.learner_gamification:
-            self.learner_gamification[learner_id] = LearnerGamification(
-                learner_id=learner_id
-            )
+            gamification = LearnerGamification(learner_id=learner_id)
+            self.learner_gamification[learner_id] = gamification
+            self._index_learner(learner_id, gamification)
         return self.learner_gamification[learner_id]
     
     def award_points(
@@ -411,6 +425,7 @@ class EngagementService:
         # Award points and check for level up
         if points_awarded > 0:
             _, levels_gained = gamification.add_xp(points_awarded)
+            self._update_leaderboard_scores(learner_id, gamification)
             
             # Check for badges
             badges_earned = self._check_badges(gamification)
@@ -571,40 +586,88 @@ class EngagementService:
         self.leaderboards[leaderboard_id] = leaderboard
         return leaderboard
     
+    @staticmethod
+    def _leaderboard_time_range(time_range: str) -> str:
+        """Map a leaderboard time range to the index ranking it."""
+        return time_range if time_range in ("daily", "weekly") else "all_time"
+    
+    @staticmethod
+    def _leaderboard_period(time_range: str) -> Optional[str]:
+        """Get the period a time range currently ranks."""
+        if time_range == "daily":
+            return datetime.now().strftime("%Y-%m-%d")
+        if time_range == "weekly":
+            return datetime.now().strftime("%Y-W%U")
+        return None
+    
+    def _get_leaderboard_index(self, time_range: str) -> LeaderboardIndex:
+        """Get the index for a time range, rolling it over to the current period."""
+        time_range = self._leaderboard_time_range(time_range)
+        index = self.leaderboard_indexes[time_range]
+        period = self._leaderboard_period(time_range)
+        if index.period != period:
+            index.roll_over(period)
+        
+        # Pick up learners added to learner_gamification directly
+        if len(index) != len(self.learner_gamification):
+            for learner_id, gamification in self.learner_gamification.items():
+                if learner_id not in index:
+                    self._index_learner(learner_id, gamification)
+        return index
+    
+    def _index_learner(
+        self,
+        learner_id: str,
+        gamification: LearnerGamification
+    ):
+        """Add a learner to every leaderboard index in join order."""
+        for time_range, index in self.leaderboard_indexes.items():
+            if learner_id not in index:
+                index.add(
+                    learner_id,
+                    order=len(index),
+                    score=self._score_for_time_range(time_range, gamification)
+                )
+    
+    def _update_leaderboard_scores(
+        self,
+        learner_id: str,
+        gamification: LearnerGamification
+    ):
+        """Move a learner on every leaderboard index after a points change."""
+        for time_range in LEADERBOARD_TIME_RANGES:
+            index = self._get_leaderboard_index(time_range)
+            index.set_score(learner_id, self._score_for_time_range(time_range, gamification))
+    
     def update_leaderboard(
         self,
-        leaderboard_id: str
+        leaderboard_id: str,
+        limit: Optional[int] = None
     ) -> Optional[Leaderboard]:
-        """Update leaderboard with current scores."""
+        """
+        Refresh leaderboard entries from the ranked index.
+        
+        Args:
+            leaderboard_id: Leaderboard to refresh
+            limit: Number of top entries to materialize (all when None)
+        """
         leaderboard = self.leaderboards.get(leaderboard_id)
         if not leaderboard:
             return None
         
-        # Get all gamification data
-        entries = []
-        for learner_id, gamification in self.learner_gamification.items():
-            score = self._calculate_leaderboard_score(
-                leaderboard, gamification
-            )
-            
-            entry = LeaderboardEntry(
+        index = self._get_leaderboard_index(leaderboard.time_range)
+        
+        leaderboard.entries = [
+            LeaderboardEntry(
                 learner_id=learner_id,
                 learner_name=f"Learner {learner_id[:8]}",  # Placeholder
                 score=score,
-                rank=0,
+                rank=rank,
                 previous_rank=0,
                 trend="stable"
             )
-            entries.append(entry)
-        
-        # Sort by score
-        entries.sort(key=lambda e: e.score, reverse=True)
-        
-        # Assign ranks
-        for i, entry in enumerate(entries):
-            entry.rank = i + 1
-        
-        leaderboard.entries = entries
+            for rank, (learner_id, score) in enumerate(index.top(limit), 1)
+        ]
         leaderboard.updated_at = datetime.now()
         
         return leaderboard
@@ -615,10 +678,18 @@ class EngagementService:
         gamification: LearnerGamification
     ) -> float:
         """Calculate score for leaderboard."""
-        if leaderboard.time_range == "daily":
+        return self._score_for_time_range(leaderboard.time_range, gamification)
+    
+    def _score_for_time_range(
+        self,
+        time_range: str,
+        gamification: LearnerGamification
+    ) -> float:
+        """Calculate a learner's score for a leaderboard time range."""
+        if time_range == "daily":
             today = datetime.now().strftime("%Y-%m-%d")
             return gamification.daily_points.get(today, 0)
-        elif leaderboard.time_range == "weekly":
+        elif time_range == "weekly":
             week = datetime.now().strftime("%Y-W%U")
             return gamification.weekly_points.get(week, 0)
         else:
@@ -629,17 +700,8 @@ class EngagementService:
         leaderboard_id: str,
         limit: int = 10
     ) -> Optional[Leaderboard]:
-        """Get a leaderboard."""
-        leaderboard = self.leaderboards.get(leaderboard_id)
-        if not leaderboard:
-            return None
-        
-        # Update if needed
-        if datetime.now() - leaderboard.updated_at > timedelta(hours=1):
-            self.update_leaderboard(leaderboard_id)
-        
-        leaderboard.entries = leaderboard.entries[:limit]
-        return leaderboard
+        """Get a leaderboard with its top entries."""
+        return self.update_leaderboard(leaderboard_id, limit)
     
     def get_learner_rank(
         self,
@@ -647,14 +709,23 @@ class EngagementService:
         learner_id: str
     ) -> Optional[LeaderboardEntry]:
         """Get a learner's rank on a leaderboard."""
-        leaderboard = self.get_leaderboard(leaderboard_id)
+        leaderboard = self.leaderboards.get(leaderboard_id)
         if not leaderboard:
             return None
         
-        for entry in leaderboard.entries:
-            if entry.learner_id == learner_id:
-                return entry
-        return None
+        index = self._get_leaderboard_index(leaderboard.time_range)
+        rank = index.rank(learner_id)
+        if rank is None:
+            return None
+        
+        return LeaderboardEntry(
+            learner_id=learner_id,
+            learner_name=f"Learner {learner_id[:8]}",  # Placeholder
+            score=index.score(learner_id),
+            rank=rank,
+            previous_rank=0,
+            trend="stable"
+        )
     
     # Engagement Tracking
     def track_engagement(
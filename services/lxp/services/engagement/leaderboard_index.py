@@ -0,0 +1,212 @@
+"""
+Learner Experience Platform - Leaderboard Index
+
+Order-statistic index behind the engagement leaderboards. Learners are kept
+in an indexable skip list ordered by descending score, ties broken by the
+order in which learners joined, so a score change and a rank lookup cost
+O(log n) and reading the top k entries costs O(log n + k).
+
+Windowed boards (daily, weekly) carry the period they currently rank. On
+rollover only the learners that scored during the ending period are moved
+back to zero; everyone else is already there.
+"""
+
+from typing import Dict, List, Optional, Tuple, Set
+import random
+
+
+MAX_LEVEL = 32
+
+
+class _Node:
+    """Skip list node; ``width[i]`` counts level-0 steps to ``forward[i]``."""
+    
+    __slots__ = ('key', 'learner_id', 'forward', 'width')
+    
+    def __init__(self, key: Optional[Tuple[float, int]], learner_id: Optional[str], level: int):
+        self.key = key
+        self.learner_id = learner_id
+        self.forward: List[Optional['_Node']] = [None] * level
+        self.width: List[int] = [1] * level
+
+
+class LeaderboardIndex:
+    """
+    Ranked learner scores for one leaderboard time range.
+    
+    Ranks are 1-based and unique: learners with equal scores are ordered by
+    the ``order`` they were added with, matching a stable descending sort.
+    """
+    
+    def __init__(self, period: Optional[str] = None, seed: Optional[int] = None):
+        """
+        Create an empty index.
+        
+        Args:
+            period: Period currently ranked (e.g. "2024-03-14"), None for
+                all-time boards
+            seed: Seed for skip list level selection
+        """
+        self.period = period
+        self._head = _Node(None, None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed)
+        
+        self._keys: Dict[str, Tuple[float, int]] = {}
+        self._scored: Set[str] = set()  # learners with a non-zero score
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __contains__(self, learner_id: str) -> bool:
+        return learner_id in self._keys
+    
+    # Updates
+    def add(self, learner_id: str, order: int, score: float = 0):
+        """Add a learner; ``order`` breaks ties between equal scores."""
+        if learner_id in self._keys:
+            self.set_score(learner_id, score)
+            return
+        
+        key = (-score, order)
+        self._keys[learner_id] = key
+        self._insert(key, learner_id)
+        if score:
+            self._scored.add(learner_id)
+    
+    def set_score(self, learner_id: str, score: float):
+        """Move a learner to a new score."""
+        key = self._keys[learner_id]
+        if key[0] == -score:
+            return
+        
+        self._remove(key)
+        new_key = (-score, key[1])
+        self._keys[learner_id] = new_key
+        self._insert(new_key, learner_id)
+        
+        if score:
+            self._scored.add(learner_id)
+        else:
+            self._scored.discard(learner_id)
+    
+    def roll_over(self, period: str):
+        """Start a new period, resetting every learner who scored to zero."""
+        for learner_id in list(self._scored):
+            self.set_score(learner_id, 0)
+        self.period = period
+    
+    # Queries
+    def score(self, learner_id: str) -> Optional[float]:
+        """Get a learner's current score."""
+        key = self._keys.get(learner_id)
+        return -key[0] if key is not None else None
+    
+    def rank(self, learner_id: str) -> Optional[int]:
+        """Get a learner's 1-based rank."""
+        key = self._keys.get(learner_id)
+        if key is None:
+            return None
+        
+        node = self._head
+        position = 0
+        for i in range(self._level - 1, -1, -1):
+            next_node = node.forward[i]
+            while next_node is not None and next_node.key <= key:
+                position += node.width[i]
+                node = next_node
+                next_node = node.forward[i]
+        return position
+    
+    def top(self, limit: Optional[int] = None, offset: int = 0) -> List[Tuple[str, float]]:
+        """
+        Get (learner_id, score) pairs in rank order.
+        
+        Args:
+            limit: Maximum entries to return (all when None)
+            offset: Number of leading ranks to skip
+        """
+        if offset >= self._size:
+            return []
+        
+        # Descend to the node just before the first requested rank
+        node = self._head
+        position = 0
+        for i in range(self._level - 1, -1, -1):
+            while node.forward[i] is not None and position + node.width[i] <= offset:
+                position += node.width[i]
+                node = node.forward[i]
+        
+        entries = []
+        node = node.forward[0]
+        while node is not None and (limit is None or len(entries) < limit):
+            entries.append((node.learner_id, -node.key[0]))
+            node = node.forward[0]
+        return entries
+    
+    # Skip list internals
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._random.getrandbits(1):
+            level += 1
+        return level
+    
+    def _insert(self, key: Tuple[float, int], learner_id: str):
+        level = self._random_level()
+        if level > self._level:
+            for i in range(self._level, level):
+                self._head.forward[i] = None
+                self._head.width[i] = self._size + 1
+            self._level = level
+        
+        update: List[_Node] = [self._head] * self._level
+        positions = [0] * self._level
+        node = self._head
+        position = 0
+        for i in range(self._level - 1, -1, -1):
+            next_node = node.forward[i]
+            while next_node is not None and next_node.key < key:
+                position += node.width[i]
+                node = next_node
+                next_node = node.forward[i]
+            update[i] = node
+            positions[i] = position
+        
+        new_node = _Node(key, learner_id, level)
+        new_position = position + 1
+        for i in range(self._level):
+            previous = update[i]
+            if i < level:
+                span = new_position - positions[i]
+                new_node.forward[i] = previous.forward[i]
+                new_node.width[i] = previous.width[i] - span + 1
+                previous.forward[i] = new_node
+                previous.width[i] = span
+            else:
+                previous.width[i] += 1
+        
+        self._size += 1
+    
+    def _remove(self, key: Tuple[float, int]):
+        update: List[_Node] = [self._head] * self._level
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            next_node = node.forward[i]
+            while next_node is not None and next_node.key < key:
+                node = next_node
+                next_node = node.forward[i]
+            update[i] = node
+        
+        target = update[0].forward[0]
+        for i in range(self._level):
+            previous = update[i]
+            if previous.forward[i] is target:
+                previous.width[i] += target.width[i] - 1
+                previous.forward[i] = target.forward[i]
+            else:
+                previous.width[i] -= 1
+        
+        self._size -= 1
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
@@ -0,0 +1,262 @@
+"""
+Learner Experience Platform - Progress Journal
+
+Sharded, append-only persistence for the progress tracking service. Every
+change is appended to the journal of the shard owning the user as one
+compact JSON line, so a write costs O(change) instead of rewriting the whole
+state. Shards are periodically compacted into a snapshot, which bounds the
+number of records replayed at startup.
+
+On-disk layout::
+
+    <directory>/manifest.json
+    <directory>/shard-007/snapshot.json      # state covering journals <= generation
+    <directory>/shard-007/journal-000012.log # records appended after rotation
+
+Compaction rotates the active journal first, so writers never wait for a
+snapshot to be written. A crash between rotation and snapshot replacement
+leaves the rotated journal on disk, and it is replayed on the next load.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple, IO
+import json
+import logging
+import os
+import threading
+import zlib
+
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_FILE = "manifest.json"
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_PREFIX = "journal-"
+JOURNAL_SUFFIX = ".log"
+
+
+class ProgressJournal:
+    """
+    Per-user sharded write-ahead journal with snapshot compaction.
+    
+    The journal only stores opaque JSON records and snapshot payloads; the
+    progress service decides what they contain and how they are applied.
+    Callers serialize appends and rotations (the service holds its lock
+    for both); snapshot writes may run concurrently on another thread.
+    """
+    
+    def __init__(self, directory: str, num_shards: int = 16, fsync: bool = False):
+        """
+        Open (or create) a journal directory.
+        
+        Args:
+            directory: Root directory for shards
+            num_shards: Shard count for a new journal; an existing journal
+                keeps the shard count recorded in its manifest
+            fsync: Whether to fsync after every append (survives power loss,
+                not just process crashes)
+        """
+        self.directory = directory
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+        
+        self.num_shards = self._read_manifest(num_shards)
+        
+        self._generations: List[int] = [1] * self.num_shards
+        self._snapshot_generations: List[int] = [0] * self.num_shards
+        self._record_counts: List[int] = [0] * self.num_shards
+        self._handles: Dict[int, IO[str]] = {}
+        self._snapshot_lock = threading.Lock()
+    
+    def _read_manifest(self, num_shards: int) -> int:
+        """Get the shard count from the manifest, writing it for a new journal."""
+        manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+        
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                stored = json.load(f).get("num_shards", num_shards)
+            if stored != num_shards:
+                logger.info(
+                    f"Journal at {self.directory} has {stored} shards; ignoring num_shards={num_shards}"
+                )
+            return stored
+        
+        self._write_json_atomic(manifest_path, {"num_shards": num_shards, "format_version": 1})
+        return num_shards
+    
+    @property
+    def is_empty(self) -> bool:
+        """Whether no shard has a snapshot or journal on disk yet."""
+        for shard in range(self.num_shards):
+            shard_dir = self._shard_dir(shard)
+            if os.path.isdir(shard_dir) and os.listdir(shard_dir):
+                return False
+        return True
+    
+    def shard_for(self, user_id: str) -> int:
+        """Get the shard owning a user (stable across processes)."""
+        return zlib.crc32(user_id.encode('utf-8')) % self.num_shards
+    
+    def record_count(self, shard: int) -> int:
+        """Get the number of records appended to a shard since its last compaction."""
+        return self._record_counts[shard]
+    
+    def _shard_dir(self, shard: int) -> str:
+        return os.path.join(self.directory, f"shard-{shard:03d}")
+    
+    def _journal_path(self, shard: int, generation: int) -> str:
+        return os.path.join(self._shard_dir(shard), f"{JOURNAL_PREFIX}{generation:06d}{JOURNAL_SUFFIX}")
+    
+    def _journal_generations(self, shard: int) -> List[int]:
+        """Get the generations of all journal files of a shard, ascending."""
+        shard_dir = self._shard_dir(shard)
+        if not os.path.isdir(shard_dir):
+            return []
+        
+        generations = []
+        for name in os.listdir(shard_dir):
+            if name.startswith(JOURNAL_PREFIX) and name.endswith(JOURNAL_SUFFIX):
+                try:
+                    generations.append(int(name[len(JOURNAL_PREFIX):-len(JOURNAL_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(generations)
+    
+    # Writing
+    def append(self, user_id: str, record: Dict[str, Any]) -> int:
+        """
+        Append a record to the journal of the user's shard.
+        
+        Returns:
+            The shard the record was written to
+        """
+        shard = self.shard_for(user_id)
+        handle = self._handles.get(shard)
+        if handle is None:
+            os.makedirs(self._shard_dir(shard), exist_ok=True)
+            handle = open(self._journal_path(shard, self._generations[shard]), 'a', encoding='utf-8')
+            self._handles[shard] = handle
+        
+        handle.write(json.dumps(record, separators=(',', ':'), default=str) + "\n")
+        handle.flush()
+        if self.fsync:
+            os.fsync(handle.fileno())
+        
+        self._record_counts[shard] += 1
+        return shard
+    
+    def rotate(self, shard: int) -> int:
+        """
+        Close the active journal of a shard and start a new one.
+        
+        Returns:
+            The generation of the closed journal; a snapshot taken at the
+            same moment covers every journal up to and including it
+        """
+        handle = self._handles.pop(shard, None)
+        if handle is not None:
+            handle.close()
+        
+        generation = self._generations[shard]
+        self._generations[shard] = generation + 1
+        self._record_counts[shard] = 0
+        return generation
+    
+    def write_snapshot(self, shard: int, generation: int, state: Dict[str, Any]):
+        """
+        Atomically replace a shard snapshot and drop the journals it covers.
+        
+        A snapshot older than the one already on disk is discarded, so
+        overlapping compactions of the same shard cannot lose records.
+        
+        Args:
+            shard: Shard index
+            generation: Last journal generation included in ``state``
+            state: Snapshot payload
+        """
+        with self._snapshot_lock:
+            if generation <= self._snapshot_generations[shard]:
+                return
+            
+            os.makedirs(self._shard_dir(shard), exist_ok=True)
+            self._write_json_atomic(
+                os.path.join(self._shard_dir(shard), SNAPSHOT_FILE),
+                {"generation": generation, "state": state}
+            )
+            self._snapshot_generations[shard] = generation
+            
+            for journal_generation in self._journal_generations(shard):
+                if journal_generation <= generation:
+                    try:
+                        os.remove(self._journal_path(shard, journal_generation))
+                    except OSError as e:
+                        logger.warning(f"Failed to remove compacted journal: {e}")
+    
+    def _write_json_atomic(self, path: str, payload: Dict[str, Any]):
+        """Write JSON to a temporary file and rename it into place."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'), default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    # Reading
+    def load(self) -> List[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Read every shard for replay.
+        
+        Journals newer than the snapshot are returned in append order. A
+        torn final line (from a crash mid-write) is skipped. Afterwards new
+        appends go to a fresh journal generation.
+        
+        Returns:
+            Per shard, a (snapshot state or None, journal records) tuple
+        """
+        shards = []
+        
+        for shard in range(self.num_shards):
+            snapshot_generation = 0
+            state = None
+            snapshot_path = os.path.join(self._shard_dir(shard), SNAPSHOT_FILE)
+            
+            if os.path.exists(snapshot_path):
+                try:
+                    with open(snapshot_path, 'r', encoding='utf-8') as f:
+                        snapshot = json.load(f)
+                    snapshot_generation = snapshot.get("generation", 0)
+                    state = snapshot.get("state")
+                except Exception as e:
+                    logger.warning(f"Failed to load snapshot for shard {shard}: {e}")
+            
+            records = []
+            generations = [g for g in self._journal_generations(shard) if g > snapshot_generation]
+            for generation in generations:
+                records.extend(self._read_journal(self._journal_path(shard, generation)))
+            
+            self._generations[shard] = max(generations + [snapshot_generation]) + 1
+            self._snapshot_generations[shard] = snapshot_generation
+            self._record_counts[shard] = len(records)
+            shards.append((state, records))
+        
+        return shards
+    
+    def _read_journal(self, path: str) -> List[Dict[str, Any]]:
+        """Parse a journal file, skipping lines that fail to decode."""
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal record {path}:{line_number}")
+        return records
+    
+    def close(self):
+        """Close all open journal files."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
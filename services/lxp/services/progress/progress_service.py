@@ -1,4 +1,5 @@
-# Learner Experience Platform - Progress Tracking Service
+"""
+Learner Experience Platform - Progress Tracking Service
 
 This module provides comprehensive progress tracking capabilities for the
 VisualVerse Learner Experience Platform, including session management,
@@ -13,16 +14,26 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor, Future
+from bisect import bisect_left, bisect_right
 import json
 import logging
+import os
 import threading
 
 from .analytics_service import LearningAnalyticsService, EventType
+from .progress_journal import ProgressJournal
+from .session_archive import SessionArchive
 
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp written by ``to_dict``."""
+    return datetime.fromisoformat(value) if value else None
+
+
 class ProgressStatus(str, Enum):
     """Status of learning progress."""
     NOT_STARTED = "not_started"
@@ -104,6 +115,27 @@ class LearnerProgress:
             "updatedAt": self.updated_at.isoformat()
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LearnerProgress":
+        return cls(
+            user_id=data["userId"],
+            total_time_spent=data.get("totalTimeSpent", 0),
+            sessions_completed=data.get("sessionsCompleted", 0),
+            current_streak=data.get("currentStreak", 0),
+            longest_streak=data.get("longestStreak", 0),
+            concepts_started=data.get("conceptsStarted", 0),
+            concepts_completed=data.get("conceptsCompleted", 0),
+            concepts_mastered=data.get("conceptsMastered", 0),
+            average_score=data.get("averageScore", 0.0),
+            last_activity=_parse_datetime(data.get("lastActivity")),
+            domains_explored=list(data.get("domainsExplored", [])),
+            achievements_earned=data.get("achievementsEarned", 0),
+            level=data.get("level", 1),
+            xp_points=data.get("xpPoints", 0),
+            created_at=_parse_datetime(data.get("createdAt")) or datetime.utcnow(),
+            updated_at=_parse_datetime(data.get("updatedAt")) or datetime.utcnow()
+        )
+    
     def add_xp(self, points: int) -> Tuple[int, int]:
         """
         Add XP points and return (new_total, new_level).
@@ -170,6 +202,73 @@ class SessionData:
             "notes": self.notes,
             "metadata": self.metadata
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionData":
+        return cls(
+            id=data["id"],
+            user_id=data["userId"],
+            content_id=data["contentId"],
+            start_time=_parse_datetime(data["startTime"]),
+            end_time=_parse_datetime(data.get("endTime")),
+            time_spent=data.get("timeSpent", 0),
+            interactions=data.get("interactions", 0),
+            completed=data.get("completed", False),
+            score=data.get("score", 0.0),
+            mastery_level=data.get("masteryLevel", 0.0),
+            notes=data.get("notes", ""),
+            metadata=dict(data.get("metadata") or {})
+        )
+
+
+class UserSessionTimeline:
+    """
+    Session IDs of one user ordered by start time.
+    
+    Parallel sorted lists support "latest N" and time-range lookups with a
+    binary search plus a slice, i.e. O(log n + k).
+    """
+    
+    __slots__ = ("start_times", "session_ids")
+    
+    def __init__(self):
+        self.start_times: List[datetime] = []
+        self.session_ids: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.session_ids)
+    
+    def add(self, session: SessionData):
+        """Insert a session after any others with the same start time."""
+        position = bisect_right(self.start_times, session.start_time)
+        self.start_times.insert(position, session.start_time)
+        self.session_ids.insert(position, session.id)
+    
+    def remove(self, session: SessionData):
+        """Remove a session."""
+        position = bisect_left(self.start_times, session.start_time)
+        end = bisect_right(self.start_times, session.start_time)
+        for i in range(position, end):
+            if self.session_ids[i] == session.id:
+                del self.start_times[i]
+                del self.session_ids[i]
+                return
+    
+    def latest(self, limit: int) -> List[str]:
+        """Get up to ``limit`` session IDs, most recent first."""
+        if limit <= 0:
+            return []
+        return self.session_ids[:-limit - 1:-1]
+    
+    def between(self, start: datetime, end: datetime) -> List[str]:
+        """Get IDs of sessions started within [start, end], oldest first."""
+        return self.session_ids[
+            bisect_left(self.start_times, start):bisect_right(self.start_times, end)
+        ]
+    
+    def before(self, cutoff: datetime) -> List[str]:
+        """Get IDs of sessions started before a cutoff, oldest first."""
+        return self.session_ids[:bisect_left(self.start_times, cutoff)]
 
 
 @dataclass
@@ -219,6 +318,23 @@ class ConceptProgress:
             "weaknesses": self.weaknesses,
             "nextReview": self.next_review.isoformat() if self.next_review else None
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConceptProgress":
+        return cls(
+            user_id=data["userId"],
+            concept_id=data["conceptId"],
+            status=ProgressStatus(data.get("status", ProgressStatus.NOT_STARTED.value)),
+            attempts=data.get("attempts", 0),
+            last_attempt=_parse_datetime(data.get("lastAttempt")),
+            time_spent=data.get("timeSpent", 0),
+            average_score=data.get("averageScore", 0.0),
+            mastery_level=data.get("masteryLevel", 0.0),
+            hints_used=data.get("hintsUsed", 0),
+            strengths=list(data.get("strengths", [])),
+            weaknesses=list(data.get("weaknesses", [])),
+            next_review=_parse_datetime(data.get("nextReview"))
+        )
 
 
 @dataclass
@@ -263,6 +379,21 @@ class ProgressMilestone:
             "xpReward": self.xp_reward
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProgressMilestone":
+        return cls(
+            id=data["id"],
+            user_id=data["userId"],
+            title=data["title"],
+            description=data.get("description", ""),
+            category=data.get("category", ""),
+            target_value=data["targetValue"],
+            current_value=data.get("currentValue", 0),
+            completed=data.get("completed", False),
+            completed_at=_parse_datetime(data.get("completedAt")),
+            xp_reward=data.get("xpReward", 100)
+        )
+    
     @property
     def progress_percentage(self) -> float:
         """Get progress percentage."""
@@ -306,6 +437,19 @@ class Achievement:
             "earnedAt": self.earned_at.isoformat(),
             "xpValue": self.xp_value
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Achievement":
+        return cls(
+            id=data["id"],
+            user_id=data["userId"],
+            achievement_type=data["achievementType"],
+            title=data["title"],
+            description=data.get("description", ""),
+            icon_url=data.get("iconUrl"),
+            earned_at=_parse_datetime(data.get("earnedAt")) or datetime.utcnow(),
+            xp_value=data.get("xpValue", 50)
+        )
 
 
 @dataclass
@@ -376,16 +520,36 @@ class ProgressTrackingService:
     - Concept-level progress
     - Achievements and milestones
     - Progress reports and analytics
+    
+    Changes are persisted to a per-user sharded journal (see
+    ``ProgressJournal``); shards whose journal grows past
+    ``compact_threshold`` records are compacted into snapshots.
     """
     
-    def __init__(self, storage_dir: str = None):
+    def __init__(self, storage_dir: str = None, num_shards: int = 16,
+                 compact_threshold: int = 10000,
+                 background_compaction: bool = True, fsync: bool = False,
+                 session_retention_days: Optional[int] = None):
         """
         Initialize the progress tracking service.
         
         Args:
             storage_dir: Directory for persisting data
+            num_shards: Number of journal shards (fixed once a journal exists)
+            compact_threshold: Journal records per shard before compaction
+            background_compaction: Compact on a background thread instead of
+                in the writing call
+            fsync: Fsync every journal append
+            session_retention_days: Keep sessions newer than this many days
+                in memory and move older ones to the session archive
+                (None keeps every session in memory)
         """
         self.storage_dir = storage_dir or "/tmp/visualverse-lxp/progress"
+        self.num_shards = num_shards
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+        self.fsync = fsync
+        self.session_retention_days = session_retention_days
         
         # In-memory storage (would be database in production)
         self.learner_progress: Dict[str, LearnerProgress] = {}
@@ -394,35 +558,78 @@ class ProgressTrackingService:
         self.milestones: Dict[str, List[ProgressMilestone]] = {}
         self.achievements: Dict[str, List[Achievement]] = {}
         self.active_sessions: Dict[str, SessionData] = {}
+        self.user_sessions: Dict[str, UserSessionTimeline] = {}  # user_id -> sessions by start time
         
         # Analytics integration
         self.analytics_service = None
         
         self.lock = threading.RLock()
         
+        # Journal state
+        self.journal: Optional[ProgressJournal] = None
+        self.session_archive: Optional[SessionArchive] = None
+        self._shard_users: Dict[int, set] = {}
+        self._pending_compactions: Dict[int, Future] = {}
+        self._compaction_executor: Optional[ThreadPoolExecutor] = None
+        
         # Load existing data
         self._load_state()
         
+        if self.session_retention_days is not None:
+            self.archive_sessions()
+        
         logger.info("ProgressTrackingService initialized")
     
     def _load_state(self):
-        """Load persisted state from storage."""
-        import os
+        """Load persisted state by replaying shard snapshots and journals."""
         os.makedirs(self.storage_dir, exist_ok=True)
         
+        self.journal = ProgressJournal(
+            os.path.join(self.storage_dir, "journal"),
+            num_shards=self.num_shards,
+            fsync=self.fsync
+        )
+        self.num_shards = self.journal.num_shards
+        self.session_archive = SessionArchive(
+            os.path.join(self.storage_dir, "archive"),
+            num_shards=self.num_shards
+        )
+        
+        if self.journal.is_empty:
+            # Migrate state written by the previous whole-file format
+            if self._load_legacy_state():
+                self._save_state()
+            return
+        
+        for shard, (state, records) in enumerate(self.journal.load()):
+            if state:
+                self._apply_snapshot(state)
+            for record in records:
+                try:
+                    self._apply_record(record)
+                except Exception as e:
+                    logger.warning(f"Failed to replay journal record in shard {shard}: {e}")
+        
+        self._index_shard_users()
+    
+    def _load_legacy_state(self) -> bool:
+        """Load the legacy per-collection JSON files, if present."""
         progress_file = f"{self.storage_dir}/learner_progress.json"
         sessions_file = f"{self.storage_dir}/sessions.json"
         concepts_file = f"{self.storage_dir}/concept_progress.json"
         milestones_file = f"{self.storage_dir}/milestones.json"
         achievements_file = f"{self.storage_dir}/achievements.json"
         
+        found = False
+        
         if os.path.exists(progress_file):
             try:
                 with open(progress_file, 'r') as f:
                     data = json.load(f)
                     self.learner_progress = {
-                        uid: LearnerProgress(**p) for uid, p in data.items()
+                        uid: LearnerProgress.from_dict(p) for uid, p in data.items()
                     }
+                found = True
             except Exception as e:
                 logger.warning(f"Failed to load progress: {e}")
         
@@ -430,9 +637,9 @@ class ProgressTrackingService:
             try:
                 with open(sessions_file, 'r') as f:
                     data = json.load(f)
-                    self.sessions = {
-                        sid: SessionData(**s) for sid, s in data.items()
-                    }
+                    for s in data.values():
+                        self._store_session(SessionData.from_dict(s))
+                found = True
             except Exception as e:
                 logger.warning(f"Failed to load sessions: {e}")
         
@@ -443,9 +650,10 @@ class ProgressTrackingService:
                     self.concept_progress = {}
                     for uid, concepts in data.items():
                         self.concept_progress[uid] = {
-                            cid: ConceptProgress(**cp) 
+                            cid: ConceptProgress.from_dict(cp)
                             for cid, cp in concepts.items()
                         }
+                found = True
             except Exception as e:
                 logger.warning(f"Failed to load concept progress: {e}")
         
@@ -454,9 +662,10 @@ class ProgressTrackingService:
                 with open(milestones_file, 'r') as f:
                     data = json.load(f)
                     self.milestones = {
-                        uid: [ProgressMilestone(**m) for m in ms] 
+                        uid: [ProgressMilestone.from_dict(m) for m in ms]
                         for uid, ms in data.items()
                     }
+                found = True
             except Exception as e:
                 logger.warning(f"Failed to load milestones: {e}")
         
@@ -465,59 +674,203 @@ class ProgressTrackingService:
                 with open(achievements_file, 'r') as f:
                     data = json.load(f)
                     self.achievements = {
-                        uid: [Achievement(**a) for a in achs] 
+                        uid: [Achievement.from_dict(a) for a in achs]
                         for uid, achs in data.items()
                     }
+                found = True
             except Exception as e:
                 logger.warning(f"Failed to load achievements: {e}")
+        
+        return found
+    
+    def _all_user_ids(self) -> set:
+        """Get every user with persisted state."""
+        return (
+            set(self.learner_progress) | set(self.user_sessions) |
+            set(self.concept_progress) | set(self.milestones) | set(self.achievements)
+        )
+    
+    def _index_shard_users(self):
+        """Assign every known user to its journal shard."""
+        for user_id in self._all_user_ids():
+            self._shard_users.setdefault(self.journal.shard_for(user_id), set()).add(user_id)
     
     def _save_state(self):
-        """Persist state to storage."""
-        import os
-        from pathlib import Path
+        """Persist the full state by compacting every journal shard."""
+        with self.lock:
+            self._index_shard_users()
+            for shard in range(self.num_shards):
+                self._compact_shard(shard)
+    
+    # Journal
+    def _store_session(self, session: SessionData):
+        """Add or replace a session, indexing it by user and start time."""
+        timeline = self.user_sessions.get(session.user_id)
+        if timeline is None:
+            timeline = self.user_sessions[session.user_id] = UserSessionTimeline()
         
-        Path(self.storage_dir).mkdir(parents=True, exist_ok=True)
+        existing = self.sessions.get(session.id)
+        if existing is not None:
+            if existing.start_time == session.start_time:
+                self.sessions[session.id] = session
+                return
+            timeline.remove(existing)
         
-        progress_file = f"{self.storage_dir}/learner_progress.json"
-        sessions_file = f"{self.storage_dir}/sessions.json"
-        concepts_file = f"{self.storage_dir}/concept_progress.json"
-        milestones_file = f"{self.storage_dir}/milestones.json"
-        achievements_file = f"{self.storage_dir}/achievements.json"
+        timeline.add(session)
+        self.sessions[session.id] = session
+    
+    def _discard_session(self, session_id: str):
+        """Drop a session from memory and the user index."""
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return
         
-        with open(progress_file, 'w') as f:
-            json.dump(
-                {uid: p.to_dict() for uid, p in self.learner_progress.items()},
-                f, indent=2
-            )
+        timeline = self.user_sessions.get(session.user_id)
+        if timeline is not None:
+            timeline.remove(session)
+            if not timeline:
+                del self.user_sessions[session.user_id]
+    
+    def _upsert_by_id(self, items: List[Any], item: Any):
+        """Replace the list entry with the same id, or append it."""
+        for i, existing in enumerate(items):
+            if existing.id == item.id:
+                items[i] = item
+                return
+        items.append(item)
+    
+    def _apply_record(self, record: Dict[str, Any]):
+        """Apply one journal record to the in-memory state."""
+        record_type = record["type"]
+        data = record.get("data")
         
-        with open(sessions_file, 'w') as f:
-            json.dump(
-                {sid: s.to_dict() for sid, s in self.sessions.items()},
-                f, indent=2
-            )
+        if record_type == "progress":
+            progress = LearnerProgress.from_dict(data)
+            self.learner_progress[progress.user_id] = progress
+        elif record_type == "session":
+            self._store_session(SessionData.from_dict(data))
+        elif record_type == "interaction":
+            session = self.sessions.get(record["session"])
+            if session:
+                session.interactions += 1
+                if record.get("counted"):
+                    key = record["interaction"]
+                    session.metadata[key] = session.metadata.get(key, 0) + 1
+        elif record_type == "session_archived":
+            self._discard_session(record["session"])
+        elif record_type == "concept":
+            cp = ConceptProgress.from_dict(data)
+            self.concept_progress.setdefault(cp.user_id, {})[cp.concept_id] = cp
+        elif record_type == "milestone":
+            milestone = ProgressMilestone.from_dict(data)
+            self._upsert_by_id(self.milestones.setdefault(milestone.user_id, []), milestone)
+        elif record_type == "achievement":
+            achievement = Achievement.from_dict(data)
+            self._upsert_by_id(self.achievements.setdefault(achievement.user_id, []), achievement)
+        else:
+            logger.warning(f"Unknown journal record type: {record_type}")
+    
+    def _apply_snapshot(self, state: Dict[str, Any]):
+        """Load a shard snapshot into the in-memory state."""
+        for data in state.get("progress", []):
+            self._apply_record({"type": "progress", "data": data})
+        for data in state.get("sessions", []):
+            self._store_session(SessionData.from_dict(data))
+        for data in state.get("concepts", []):
+            self._apply_record({"type": "concept", "data": data})
+        for data in state.get("milestones", []):
+            self._apply_record({"type": "milestone", "data": data})
+        for data in state.get("achievements", []):
+            self._apply_record({"type": "achievement", "data": data})
+    
+    def _journal_record(self, user_id: str, record: Dict[str, Any]):
+        """Append a record to the user's journal shard, compacting it when full."""
+        if self.journal is None:
+            return
         
-        with open(concepts_file, 'w') as f:
-            json.dump(
-                {
-                    uid: {cid: cp.to_dict() for cid, cp in concepts.items()}
-                    for uid, concepts in self.concept_progress.items()
-                },
-                f, indent=2
-            )
+        with self.lock:
+            try:
+                shard = self.journal.append(user_id, record)
+            except OSError as e:
+                logger.error(f"Failed to journal {record.get('type')} for user {user_id}: {e}")
+                return
+            
+            self._shard_users.setdefault(shard, set()).add(user_id)
+            if self.journal.record_count(shard) >= self.compact_threshold:
+                self._schedule_compaction(shard)
+    
+    def _journal_entity(self, user_id: str, record_type: str, entity: Any):
+        """Journal the current state of an entity."""
+        self._journal_record(user_id, {"type": record_type, "data": entity.to_dict()})
+    
+    def _serialize_shard(self, shard: int) -> Dict[str, Any]:
+        """Serialize the state of every user in a shard."""
+        state = {"progress": [], "sessions": [], "concepts": [], "milestones": [], "achievements": []}
         
-        with open(milestones_file, 'w') as f:
-            json.dump(
-                {uid: [m.to_dict() for m in ms] 
-                 for uid, ms in self.milestones.items()},
-                f, indent=2
+        for user_id in self._shard_users.get(shard, ()):
+            if user_id in self.learner_progress:
+                state["progress"].append(self.learner_progress[user_id].to_dict())
+            timeline = self.user_sessions.get(user_id)
+            if timeline is not None:
+                state["sessions"].extend(
+                    self.sessions[sid].to_dict() for sid in timeline.session_ids
+                )
+            state["concepts"].extend(
+                cp.to_dict() for cp in self.concept_progress.get(user_id, {}).values()
             )
+            state["milestones"].extend(m.to_dict() for m in self.milestones.get(user_id, []))
+            state["achievements"].extend(a.to_dict() for a in self.achievements.get(user_id, []))
+        
+        return state
+    
+    def _compact_shard(self, shard: int):
+        """Snapshot a shard and drop the journals the snapshot covers."""
+        with self.lock:
+            state = self._serialize_shard(shard)
+            generation = self.journal.rotate(shard)
+        
+        # The rotated journal stays on disk until the snapshot replaces it
+        self.journal.write_snapshot(shard, generation, state)
+    
+    def _schedule_compaction(self, shard: int):
+        """Compact a shard now or on the background compaction thread."""
+        if not self.background_compaction:
+            self._compact_shard(shard)
+            return
+        
+        pending = self._pending_compactions.get(shard)
+        if pending is not None and not pending.done():
+            return
         
-        with open(achievements_file, 'w') as f:
-            json.dump(
-                {uid: [a.to_dict() for a in achs] 
-                 for uid, achs in self.achievements.items()},
-                f, indent=2
+        if self._compaction_executor is None:
+            self._compaction_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="progress-compaction"
             )
+        self._pending_compactions[shard] = self._compaction_executor.submit(
+            self._run_compaction, shard
+        )
+    
+    def _run_compaction(self, shard: int):
+        try:
+            self._compact_shard(shard)
+        except Exception as e:
+            logger.error(f"Failed to compact progress shard {shard}: {e}")
+    
+    def flush(self):
+        """Wait for pending background compactions."""
+        for future in list(self._pending_compactions.values()):
+            future.result()
+        self._pending_compactions.clear()
+    
+    def close(self):
+        """Finish background compactions and close the journal."""
+        self.flush()
+        if self._compaction_executor is not None:
+            self._compaction_executor.shutdown(wait=True)
+            self._compaction_executor = None
+        if self.journal is not None:
+            with self.lock:
+                self.journal.close()
     
     def set_analytics_service(self, service):
         """Set the analytics service for event tracking."""
@@ -537,7 +890,7 @@ class ProgressTrackingService:
         with self.lock:
             if user_id not in self.learner_progress:
                 self.learner_progress[user_id] = LearnerProgress(user_id=user_id)
-                self._save_state()
+                self._journal_entity(user_id, "progress", self.learner_progress[user_id])
             
             return self.learner_progress[user_id]
     
@@ -578,7 +931,8 @@ class ProgressTrackingService:
             )
             
             self.active_sessions[user_id] = session
-            self.sessions[session.id] = session
+            self._store_session(session)
+            self._journal_entity(user_id, "session", session)
             
             # Ensure learner progress exists
             self.get_or_create_progress(user_id)
@@ -605,6 +959,13 @@ class ProgressTrackingService:
             if metadata:
                 session.metadata[interaction_type] = session.metadata.get(interaction_type, 0) + 1
             
+            self._journal_record(user_id, {
+                "type": "interaction",
+                "session": session.id,
+                "interaction": interaction_type,
+                "counted": bool(metadata)
+            })
+            
             # Track analytics event
             if self.analytics_service:
                 self.analytics_service.track_event(
@@ -658,7 +1019,9 @@ class ProgressTrackingService:
             if session.user_id in self.active_sessions:
                 del self.active_sessions[session.user_id]
             
-            self._save_state()
+            self._journal_entity(session.user_id, "session", session)
+            if session.user_id in self.learner_progress:
+                self._journal_entity(session.user_id, "progress", self.learner_progress[session.user_id])
             
             # Track session completion
             if self.analytics_service:
@@ -781,7 +1144,7 @@ class ProgressTrackingService:
                 metadata=metadata or {}
             )
             
-            self.sessions[session.id] = session
+            self._store_session(session)
             
             # Ensure learner progress exists
             progress = self.get_or_create_progress(user_id)
@@ -802,7 +1165,8 @@ class ProgressTrackingService:
                     "Completed 5 lessons in one day!"
                 )
             
-            self._save_state()
+            self._journal_entity(user_id, "session", session)
+            self._journal_entity(user_id, "progress", progress)
             return session
     
     def get_active_session(self, user_id: str) -> Optional[SessionData]:
@@ -810,13 +1174,86 @@ class ProgressTrackingService:
         return self.active_sessions.get(user_id)
     
     def get_user_sessions(self, user_id: str, limit: int = 50) -> List[SessionData]:
-        """Get recent sessions for a user."""
-        user_sessions = [
-            s for s in self.sessions.values() 
-            if s.user_id == user_id
-        ]
-        user_sessions.sort(key=lambda s: s.start_time, reverse=True)
-        return user_sessions[:limit]
+        """Get recent (in-memory) sessions for a user, most recent first."""
+        timeline = self.user_sessions.get(user_id)
+        if timeline is None:
+            return []
+        return [self.sessions[sid] for sid in timeline.latest(limit)]
+    
+    def get_sessions_between(self, user_id: str, start_date: datetime,
+                             end_date: datetime) -> List[SessionData]:
+        """
+        Get a user's sessions started within a date range, oldest first.
+        
+        Sessions older than the retention window are read from the archive.
+        
+        Args:
+            user_id: User identifier
+            start_date: Range start (inclusive)
+            end_date: Range end (inclusive)
+        
+        Returns:
+            List of SessionData
+        """
+        with self.lock:
+            timeline = self.user_sessions.get(user_id)
+            sessions = [
+                self.sessions[sid] for sid in timeline.between(start_date, end_date)
+            ] if timeline is not None else []
+        
+        if self.session_archive is not None:
+            hot_ids = {s.id for s in sessions}
+            archived = [
+                SessionData.from_dict(data)
+                for data in self.session_archive.read(user_id, start_date, end_date)
+                if data["id"] not in hot_ids
+            ]
+            if archived:
+                sessions = sorted(archived + sessions, key=lambda s: s.start_time)
+        
+        return sessions
+    
+    def archive_sessions(self, older_than: Optional[datetime] = None) -> int:
+        """
+        Move sessions started before a cutoff to the session archive.
+        
+        Active sessions are never archived. Archived sessions are written to
+        cold storage before being journaled as removed, so a crash in between
+        can only duplicate (never lose) a session.
+        
+        Args:
+            older_than: Cutoff; defaults to now minus the retention window
+        
+        Returns:
+            Number of sessions archived
+        """
+        if older_than is None:
+            if self.session_retention_days is None:
+                return 0
+            older_than = datetime.utcnow() - timedelta(days=self.session_retention_days)
+        
+        with self.lock:
+            active_ids = {s.id for s in self.active_sessions.values()}
+            expired = [
+                self.sessions[sid]
+                for timeline in self.user_sessions.values()
+                for sid in timeline.before(older_than)
+                if sid not in active_ids
+            ]
+            if not expired:
+                return 0
+            
+            self.session_archive.append((s.to_dict() for s in expired), older_than)
+            
+            for session in expired:
+                self._discard_session(session.id)
+                self._journal_record(session.user_id, {
+                    "type": "session_archived",
+                    "session": session.id
+                })
+        
+        logger.info(f"Archived {len(expired)} sessions started before {older_than.isoformat()}")
+        return len(expired)
     
     # Concept Progress Management
     def _update_concept_progress(self, session: SessionData):
@@ -864,6 +1301,8 @@ class ProgressTrackingService:
             if cp.status in [ProgressStatus.COMPLETED, ProgressStatus.MASTERED]:
                 days_until_review = [1, 3, 7, 14, 30][min(cp.attempts - 1, 4)]
                 cp.next_review = datetime.utcnow() + timedelta(days=days_until_review)
+            
+            self._journal_entity(session.user_id, "concept", cp)
     
     def get_concept_progress(self, user_id: str, concept_id: str) -> Optional[ConceptProgress]:
         """
@@ -926,8 +1365,9 @@ class ProgressTrackingService:
                 progress = self.learner_progress[user_id]
                 progress.achievements_earned += 1
                 progress.add_xp(xp_value)
+                self._journal_entity(user_id, "progress", progress)
             
-            self._save_state()
+            self._journal_entity(user_id, "achievement", achievement)
             
             logger.info(f"Achievement awarded: {title} to user {user_id}")
             return achievement
@@ -1015,7 +1455,7 @@ class ProgressTrackingService:
                 self.milestones[user_id] = []
             
             self.milestones[user_id].append(milestone)
-            self._save_state()
+            self._journal_entity(user_id, "milestone", milestone)
             
             return milestone
     
@@ -1047,8 +1487,9 @@ class ProgressTrackingService:
                         # Award XP
                         if user_id in self.learner_progress:
                             self.learner_progress[user_id].add_xp(milestone.xp_reward)
+                            self._journal_entity(user_id, "progress", self.learner_progress[user_id])
                     
-                    self._save_state()
+                    self._journal_entity(user_id, "milestone", milestone)
                     return milestone
             
             return None
@@ -1087,12 +1528,7 @@ class ProgressTrackingService:
                 start_date = start_date or end_date - timedelta(weeks=1)
             
             # Get sessions in range
-            user_sessions = [
-                s for s in self.sessions.values()
-                if s.user_id == user_id and 
-                s.start_time >= start_date and 
-                s.start_time <= end_date
-            ]
+            user_sessions = self.get_sessions_between(user_id, start_date, end_date)
             
             # Calculate metrics
             total_time = sum(s.time_spent for s in user_sessions)
@@ -1190,17 +1626,18 @@ class ProgressTrackingService:
 ProgressTrackingService.lock = __import__('threading').RLock()
 
 
-def create_progress_service(storage_dir: str = None) -> ProgressTrackingService:
+def create_progress_service(storage_dir: str = None, **kwargs) -> ProgressTrackingService:
     """
     Create and return the global progress tracking service.
     
     Args:
         storage_dir: Optional storage directory
-        
+        **kwargs: Journal options passed to ProgressTrackingService
+    
     Returns:
         ProgressTrackingService instance
     """
-    return ProgressTrackingService(storage_dir)
+    return ProgressTrackingService(storage_dir, **kwargs)
 
 
 __all__ = [
@@ -1212,6 +1649,7 @@ __all__ = [
     "ProgressMilestone",
     "Achievement",
     "ProgressReport",
+    "UserSessionTimeline",
     "ProgressTrackingService",
     "create_progress_service"
 ]
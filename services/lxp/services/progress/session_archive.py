@@ -0,0 +1,147 @@
+"""
+Learner Experience Platform - Session Archive
+
+Cold storage for learning sessions that fall outside the in-memory
+retention window. Sessions are appended as JSON lines to partitions keyed
+by start month and user shard, so reading one user's history for a period
+only touches the partitions that can contain it.
+
+On-disk layout::
+
+    <directory>/archive.json                     # archive watermark
+    <directory>/2024-03/shard-007.jsonl          # sessions started in March 2024
+"""
+
+from typing import Dict, List, Optional, Any, Iterable
+from datetime import datetime
+import json
+import logging
+import os
+import threading
+import zlib
+
+
+logger = logging.getLogger(__name__)
+
+
+ARCHIVE_MANIFEST = "archive.json"
+
+
+class SessionArchive:
+    """
+    Month/shard partitioned archive of serialized sessions.
+    
+    Records are the ``SessionData.to_dict`` form. Appends are idempotent from
+    the reader's point of view: a session archived twice (e.g. after a crash
+    between archiving and journaling) is returned once.
+    """
+    
+    def __init__(self, directory: str, num_shards: int = 16):
+        """
+        Open (or create) an archive directory.
+        
+        Args:
+            directory: Root directory for partitions
+            num_shards: Number of user shards per month partition
+        """
+        self.directory = directory
+        self.num_shards = num_shards
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        
+        self.archived_before: Optional[datetime] = None
+        manifest_path = os.path.join(directory, ARCHIVE_MANIFEST)
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, 'r') as f:
+                    manifest = json.load(f)
+                self.num_shards = manifest.get("num_shards", num_shards)
+                if manifest.get("archived_before"):
+                    self.archived_before = datetime.fromisoformat(manifest["archived_before"])
+            except Exception as e:
+                logger.warning(f"Failed to read session archive manifest: {e}")
+    
+    def _shard_for(self, user_id: str) -> int:
+        return zlib.crc32(user_id.encode('utf-8')) % self.num_shards
+    
+    def _partition_path(self, month: str, shard: int) -> str:
+        return os.path.join(self.directory, month, f"shard-{shard:03d}.jsonl")
+    
+    @staticmethod
+    def _months_between(start: datetime, end: datetime) -> List[str]:
+        """Get the YYYY-MM partition keys covering a date range."""
+        months = []
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            months.append(f"{year:04d}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
+    
+    def append(self, sessions: Iterable[Dict[str, Any]], archived_before: datetime):
+        """
+        Append serialized sessions and advance the archive watermark.
+        
+        Args:
+            sessions: Sessions in ``SessionData.to_dict`` form
+            archived_before: Cutoff used to select the sessions; reports
+                reaching earlier than this need to read the archive
+        """
+        partitions: Dict[str, List[str]] = {}
+        for data in sessions:
+            path = self._partition_path(data["startTime"][:7], self._shard_for(data["userId"]))
+            partitions.setdefault(path, []).append(json.dumps(data, separators=(',', ':')))
+        
+        with self._lock:
+            for path, lines in partitions.items():
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            
+            if self.archived_before is None or archived_before > self.archived_before:
+                self.archived_before = archived_before
+                self._write_manifest()
+    
+    def _write_manifest(self):
+        manifest_path = os.path.join(self.directory, ARCHIVE_MANIFEST)
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                "num_shards": self.num_shards,
+                "archived_before": self.archived_before.isoformat() if self.archived_before else None
+            }, f)
+        os.replace(tmp_path, manifest_path)
+    
+    def read(self, user_id: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Get a user's archived sessions that started within a range.
+        
+        Returns:
+            Serialized sessions ordered by start time
+        """
+        if self.archived_before is None or start >= self.archived_before:
+            return []
+        
+        end = min(end, self.archived_before)
+        shard = self._shard_for(user_id)
+        found: Dict[str, Dict[str, Any]] = {}
+        
+        for month in self._months_between(start, end):
+            path = self._partition_path(month, shard)
+            if not os.path.exists(path):
+                continue
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if data.get("userId") != user_id:
+                        continue
+                    start_time = datetime.fromisoformat(data["startTime"])
+                    if start <= start_time <= end:
+                        found[data["id"]] = data
+        
+        return sorted(found.values(), key=lambda data: data["startTime"])
@@ -9,9 +9,16 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-import math
+import logging
+import threading
 from collections import defaultdict
 
+import numpy as np
+from scipy import sparse
+
+
+logger = logging.getLogger(__name__)
+
 
 class RecommendationType(Enum):
     """Types of recommendations supported by the service."""
@@ -215,12 +222,41 @@ class ContentSimilarityEngine:
 
 
 class CollaborativeFilteringEngine:
-    """Engine for collaborative filtering recommendations."""
+    """
+    Engine for collaborative filtering recommendations.
     
-    def __init__(self):
+    Ratings are kept per learner and as item -> learner inverted lists with
+    running sums, so item averages update in O(1). Item-item Pearson
+    similarities are stored as rows of positively correlated items. A new
+    rating only marks the rows it can change as stale (the rated item and
+    every other item the learner rated); stale rows are recomputed on
+    demand, or in batches by ``refresh_similarities``, which
+    ``start_background_refresh`` runs periodically.
+    """
+    
+    def __init__(self, refresh_block_size: int = 256):
+        """
+        Initialize the engine.
+        
+        Args:
+            refresh_block_size: Items per sparse product in batch refreshes
+        """
         self.user_item_matrix: Dict[str, Dict[str, float]] = {}
-        self.item_similarity_cache: Dict[Tuple[str, str], float] = {}
+        self.item_user_ratings: Dict[str, Dict[str, float]] = {}
+        self.item_rating_totals: Dict[str, List[float]] = {}  # item -> [sum, count]
         self.popular_items: Dict[str, float] = {}
+        
+        # item -> [(item, similarity)] with similarity > 0, best first
+        self.item_similarity_rows: Dict[str, List[Tuple[str, float]]] = {}
+        self.refresh_block_size = refresh_block_size
+        
+        self._item_ids: List[str] = []
+        self._item_index: Dict[str, int] = {}
+        self._stale_items: Dict[str, int] = {}  # item -> version it went stale at
+        self._version = 0
+        self._lock = threading.RLock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
     
     def record_interaction(
         self, 
@@ -230,73 +266,251 @@ class CollaborativeFilteringEngine:
         timestamp: Optional[datetime] = None
     ):
         """Record a learner-content interaction."""
-        if learner_id not in self.user_item_matrix:
-            self.user_item_matrix[learner_id] = {}
-        
-        self.user_item_matrix[learner_id][content_id] = rating
-        
-        # Update popular items
-        avg_rating = self._calculate_average_rating(content_id)
-        self.popular_items[content_id] = avg_rating
+        with self._lock:
+            learner_ratings = self.user_item_matrix.setdefault(learner_id, {})
+            previous = learner_ratings.get(content_id)
+            if previous == rating:
+                return
+            
+            learner_ratings[content_id] = rating
+            
+            if content_id not in self._item_index:
+                self._item_index[content_id] = len(self._item_ids)
+                self._item_ids.append(content_id)
+                self.item_user_ratings[content_id] = {}
+                self.item_rating_totals[content_id] = [0.0, 0]
+            self.item_user_ratings[content_id][learner_id] = rating
+            
+            totals = self.item_rating_totals[content_id]
+            if previous is None:
+                totals[0] += rating
+                totals[1] += 1
+            else:
+                totals[0] += rating - previous
+            
+            # Update popular items
+            self.popular_items[content_id] = self._calculate_average_rating(content_id)
+            
+            # Every similarity involving this learner's items may have moved
+            self._version += 1
+            for item_id in learner_ratings:
+                self._stale_items[item_id] = self._version
     
     def _calculate_average_rating(self, content_id: str) -> float:
         """Calculate average rating for an item."""
-        ratings = []
-        for user_matrix in self.user_item_matrix.values():
-            if content_id in user_matrix:
-                ratings.append(user_matrix[content_id])
+        totals = self.item_rating_totals.get(content_id)
+        return totals[0] / totals[1] if totals and totals[1] else 0.0
+    
+    @staticmethod
+    def _pearson(
+        count: np.ndarray,
+        sum1: np.ndarray,
+        sum2: np.ndarray,
+        sum_sq1: np.ndarray,
+        sum_sq2: np.ndarray,
+        sum_product: np.ndarray
+    ) -> np.ndarray:
+        """
+        Pearson correlations from co-rating sums over common users.
         
-        return sum(ratings) / len(ratings) if ratings else 0.0
+        Pairs with fewer than two common users or a constant side get 0.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = sum_product - sum1 * sum2 / count
+            variance1 = sum_sq1 - sum1 * sum1 / count
+            variance2 = sum_sq2 - sum2 * sum2 / count
+            similarity = covariance / np.sqrt(variance1 * variance2)
+        
+        # Variances that only survive as rounding error mean constant ratings
+        defined = (
+            (count >= 2)
+            & (variance1 > 1e-10 * sum_sq1)
+            & (variance2 > 1e-10 * sum_sq2)
+        )
+        similarity = np.where(defined, similarity, 0.0)
+        similarity[np.abs(similarity) < 1e-12] = 0.0
+        return np.clip(similarity, -1.0, 1.0)
     
-    def _calculate_item_similarity(
-        self, 
-        item1: str, 
-        item2: str
-    ) -> float:
-        """Calculate similarity between two items based on user interactions."""
-        cache_key = (item1, item2) if item1 < item2 else (item2, item1)
-        
-        if cache_key in self.item_similarity_cache:
-            return self.item_similarity_cache[cache_key]
-        
-        # Get ratings for both items
-        ratings1 = {}
-        ratings2 = {}
-        
-        for user_id, user_matrix in self.user_item_matrix.items():
-            if item1 in user_matrix:
-                ratings1[user_id] = user_matrix[item1]
-            if item2 in user_matrix:
-                ratings2[user_id] = user_matrix[item2]
-        
-        # Find common users
-        common_users = set(ratings1.keys()) & set(ratings2.keys())
-        
-        if len(common_users) < 2:
-            similarity = 0.0
-        else:
-            # Pearson correlation
-            values1 = [ratings1[u] for u in common_users]
-            values2 = [ratings2[u] for u in common_users]
-            
-            mean1 = sum(values1) / len(values1)
-            mean2 = sum(values2) / len(values2)
-            
-            numerator = sum(
-                (values1[i] - mean1) * (values2[i] - mean2) 
-                for i in range(len(common_users))
-            )
+    def _build_row(self, columns: np.ndarray, similarities: np.ndarray) -> List[Tuple[str, float]]:
+        """Keep positive similarities, best first, ties in item order."""
+        positive = similarities > 0
+        columns = columns[positive]
+        similarities = similarities[positive]
+        order = np.lexsort((columns, -similarities))
+        return [(self._item_ids[columns[k]], float(similarities[k])) for k in order]
+    
+    def _compute_row(self, content_id: str) -> List[Tuple[str, float]]:
+        """Compute one similarity row from the learners who rated the item."""
+        raters = self.item_user_ratings.get(content_id)
+        if not raters:
+            return []
+        
+        # Gather (other item, rating of content, rating of other) triples;
+        # ratings are centered on item means, which Pearson ignores, to
+        # keep the one-pass sums well conditioned
+        others: List[int] = []
+        values1: List[float] = []
+        values2: List[float] = []
+        for learner_id, rating in raters.items():
+            for item_id, other_rating in self.user_item_matrix[learner_id].items():
+                if item_id != content_id:
+                    others.append(self._item_index[item_id])
+                    values1.append(rating)
+                    values2.append(other_rating)
+        if not others:
+            return []
+        
+        columns, inverse = np.unique(np.asarray(others, dtype=np.int64), return_inverse=True)
+        means = np.array([
+            self._calculate_average_rating(self._item_ids[column]) for column in columns
+        ])
+        x = np.asarray(values1) - self._calculate_average_rating(content_id)
+        y = np.asarray(values2) - means[inverse]
+        
+        size = len(columns)
+        similarities = self._pearson(
+            np.bincount(inverse, minlength=size).astype(np.float64),
+            np.bincount(inverse, weights=x, minlength=size),
+            np.bincount(inverse, weights=y, minlength=size),
+            np.bincount(inverse, weights=x * x, minlength=size),
+            np.bincount(inverse, weights=y * y, minlength=size),
+            np.bincount(inverse, weights=x * y, minlength=size)
+        )
+        return self._build_row(columns, similarities)
+    
+    def _snapshot_matrices(self) -> Tuple[sparse.csc_matrix, sparse.csc_matrix, sparse.csc_matrix]:
+        """
+        Build the learner x item rating, indicator and squared rating matrices.
+        
+        Ratings are shifted per item to be at least 1, which Pearson ignores,
+        so no co-rating sum computed from them can cancel to zero.
+        """
+        learner_rows = {learner_id: k for k, learner_id in enumerate(self.user_item_matrix)}
+        
+        rows, columns, values = [], [], []
+        for column, item_id in enumerate(self._item_ids):
+            ratings = self.item_user_ratings[item_id]
+            rows.extend(learner_rows[learner_id] for learner_id in ratings)
+            columns.extend([column] * len(ratings))
+            values.extend(ratings.values())
+        
+        rows_array = np.asarray(rows, dtype=np.int64)
+        columns_array = np.asarray(columns, dtype=np.int64)
+        values_array = np.asarray(values, dtype=np.float64)
+        minimums = np.full(len(self._item_ids), np.inf)
+        np.minimum.at(minimums, columns_array, values_array)
+        values_array = values_array - minimums[columns_array] + 1.0
+        
+        shape = (len(learner_rows), len(self._item_ids))
+        ratings = sparse.csc_matrix((values_array, (rows_array, columns_array)), shape=shape)
+        indicator = sparse.csc_matrix((np.ones_like(values_array), (rows_array, columns_array)), shape=shape)
+        return ratings, indicator, ratings.multiply(ratings).tocsc()
+    
+    def _compute_rows_batch(
+        self,
+        matrices: Tuple[sparse.csc_matrix, sparse.csc_matrix, sparse.csc_matrix],
+        target_columns: np.ndarray
+    ) -> Dict[int, List[Tuple[str, float]]]:
+        """
+        Compute similarity rows for many items with sparse products.
+        
+        With R the learner x item rating matrix and B its indicator, every
+        co-rating sum for items (i, j) is an entry of a product of their
+        columns: count = B'B, sums = R'B and B'R, squares = (R*R)'B and
+        B'(R*R), cross products = R'R. All six share the co-rating pattern,
+        so their data arrays line up entry for entry.
+        """
+        ratings, indicator, squares = matrices
+        computed = {}
+        
+        for start in range(0, len(target_columns), self.refresh_block_size):
+            block = target_columns[start:start + self.refresh_block_size]
+            block_ratings = ratings[:, block].T.tocsr()
+            block_indicator = indicator[:, block].T.tocsr()
+            block_squares = squares[:, block].T.tocsr()
             
-            std1 = math.sqrt(sum((v - mean1) ** 2 for v in values1))
-            std2 = math.sqrt(sum((v - mean2) ** 2 for v in values2))
+            products = [
+                block_indicator @ indicator,
+                block_ratings @ indicator,
+                block_indicator @ ratings,
+                block_squares @ indicator,
+                block_indicator @ squares,
+                block_ratings @ ratings
+            ]
+            for product in products:
+                product.sort_indices()
+            count = products[0]
             
-            if std1 == 0 or std2 == 0:
-                similarity = 0.0
-            else:
-                similarity = numerator / (std1 * std2)
+            for offset, column in enumerate(block):
+                lo, hi = count.indptr[offset], count.indptr[offset + 1]
+                others = count.indices[lo:hi]
+                similarities = self._pearson(*(product.data[lo:hi] for product in products))
+                similarities[others == column] = 0.0
+                computed[int(column)] = self._build_row(others, similarities)
+        
+        return computed
+    
+    def refresh_similarities(self, full: bool = False) -> int:
+        """
+        Recompute stale similarity rows in one batch.
         
-        self.item_similarity_cache[cache_key] = similarity
-        return similarity
+        Ratings are snapshotted under the lock and the products run outside
+        it; a row that went stale again meanwhile stays stale.
+        
+        Args:
+            full: Recompute every row, not just the stale ones
+        
+        Returns:
+            Number of rows refreshed
+        """
+        with self._lock:
+            targets = list(self._item_ids) if full else [
+                item_id for item_id in self._stale_items if item_id in self._item_index
+            ]
+            if not targets:
+                return 0
+            
+            snapshot_versions = {item_id: self._stale_items.get(item_id) for item_id in targets}
+            matrices = self._snapshot_matrices()
+        
+        target_columns = np.array([self._item_index[item_id] for item_id in targets], dtype=np.int64)
+        computed = self._compute_rows_batch(matrices, target_columns)
+        
+        with self._lock:
+            refreshed = 0
+            for column, row in computed.items():
+                item_id = self._item_ids[column]
+                if self._stale_items.get(item_id) == snapshot_versions[item_id]:
+                    self.item_similarity_rows[item_id] = row
+                    self._stale_items.pop(item_id, None)
+                    refreshed += 1
+            return refreshed
+    
+    def start_background_refresh(self, interval_seconds: float = 60.0):
+        """Refresh stale similarity rows periodically on a daemon thread."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        
+        self._stop_refresh.clear()
+        
+        def run():
+            while not self._stop_refresh.wait(interval_seconds):
+                try:
+                    self.refresh_similarities()
+                except Exception as e:
+                    logger.error(f"Similarity refresh failed: {e}")
+        
+        self._refresh_thread = threading.Thread(
+            target=run, name="similarity-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+    
+    def stop_background_refresh(self):
+        """Stop the periodic similarity refresh."""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
     
     def get_similar_items(
         self, 
@@ -304,16 +518,11 @@ class CollaborativeFilteringEngine:
         top_k: int = 10
     ) -> List[Tuple[str, float]]:
         """Get items similar to the given content."""
-        similarities = []
-        
-        for item_id in self.popular_items.keys():
-            if item_id != content_id:
-                sim = self._calculate_item_similarity(content_id, item_id)
-                if sim > 0:
-                    similarities.append((item_id, sim))
-        
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        with self._lock:
+            if content_id in self._stale_items or content_id not in self.item_similarity_rows:
+                self.item_similarity_rows[content_id] = self._compute_row(content_id)
+                self._stale_items.pop(content_id, None)
+            return self.item_similarity_rows[content_id][:top_k]
     
     def predict_rating(
         self, 
@@ -534,7 +743,7 @@ class RecommendationService:
             recommendation_types: Types of recommendations to include
             max_items: Maximum number of recommendations to return
             context: Additional context for recommendations
-            
+        
         Returns:
             A RecommendationSet containing personalized recommendations
         """
@@ -14,11 +14,13 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from decimal import Decimal, ROUND_HALF_UP
+from bisect import bisect_left, bisect_right
 import json
 import uuid
 import hashlib
 import logging
 import threading
+import time
 import re
 
 from visualverse.platform.packages.shared_types import (
@@ -517,14 +519,22 @@ class LicensingService:
         payment_methods: Dictionary of payment methods by ID
         fee_config: Platform fee configuration
         lock: Thread lock for concurrent operations
+        validation_cache_ttl: Seconds a context-free license check is cached
+    
+    Licenses are indexed by (user, product) and by user, and revenue shares
+    by creator in creation order, so license checks and earnings reports
+    never scan the whole platform. The indexes are maintained on issue,
+    revoke and transaction completion.
     """
     
-    def __init__(self, storage_dir: str = None):
+    def __init__(self, storage_dir: str = None, validation_cache_ttl: float = 5.0):
         """
         Initialize the licensing service.
         
         Args:
             storage_dir: Directory for persisting data
+            validation_cache_ttl: Seconds to cache context-free validation
+                results (0 disables the cache)
         """
         self.storage_dir = storage_dir or "/tmp/visualverse-licensing"
         
@@ -538,9 +548,19 @@ class LicensingService:
         
         self.fee_config = PlatformFeeConfig()
         self.lock = threading.RLock()
+        self.validation_cache_ttl = validation_cache_ttl
+        
+        # Secondary indexes
+        self._licenses_by_user_product: Dict[Tuple[str, str], List[str]] = {}
+        self._licenses_by_user: Dict[str, List[str]] = {}
+        self._shares_by_creator: Dict[str, Tuple[List[datetime], List[str]]] = {}
+        
+        # (user_id, product_id) -> (cached until, monotonic clock), result
+        self._validation_cache: Dict[Tuple[str, str], Tuple[float, Tuple[bool, str, Optional[License]]]] = {}
         
         # Load existing data
         self._load_state()
+        self._rebuild_indexes()
         
         logger.info("LicensingService initialized")
     
@@ -644,6 +664,63 @@ class LicensingService:
             with open(balances_file, 'w') as f:
                 json.dump(self.creator_balances, f, indent=2)
     
+    # Secondary indexes
+    def _rebuild_indexes(self):
+        """Rebuild license and revenue share indexes from the stores."""
+        self._licenses_by_user_product = {}
+        self._licenses_by_user = {}
+        self._shares_by_creator = {}
+        self._validation_cache = {}
+        
+        for license in self.licenses.values():
+            self._index_license(license)
+        
+        for share in sorted(self.revenue_shares.values(), key=lambda r: r.created_at):
+            self._index_revenue_share(share)
+    
+    def _index_license(self, license: License):
+        """Add a license to the user and user+product indexes."""
+        self._licenses_by_user_product.setdefault(
+            (license.user_id, license.product_id), []
+        ).append(license.id)
+        self._licenses_by_user.setdefault(license.user_id, []).append(license.id)
+        self._validation_cache.pop((license.user_id, license.product_id), None)
+    
+    def _index_revenue_share(self, share: RevenueShare):
+        """Add a revenue share to its creator's date-ordered index."""
+        dates, share_ids = self._shares_by_creator.setdefault(share.creator_id, ([], []))
+        position = bisect_right(dates, share.created_at)
+        dates.insert(position, share.created_at)
+        share_ids.insert(position, share.id)
+    
+    def _pair_licenses(self, user_id: str, product_id: str) -> List[License]:
+        """Get a user's licenses for a product in issue order."""
+        return [
+            self.licenses[license_id]
+            for license_id in self._licenses_by_user_product.get((user_id, product_id), ())
+            if license_id in self.licenses
+        ]
+    
+    def invalidate_license_cache(self, user_id: str = None, product_id: str = None):
+        """
+        Drop cached validation results.
+        
+        Args:
+            user_id: Limit to one user (with product_id, to one pair)
+            product_id: Limit to one product
+        """
+        if user_id is not None and product_id is not None:
+            self._validation_cache.pop((user_id, product_id), None)
+            return
+        
+        if user_id is None and product_id is None:
+            self._validation_cache.clear()
+            return
+        
+        for key in list(self._validation_cache):
+            if (user_id is None or key[0] == user_id) and (product_id is None or key[1] == product_id):
+                self._validation_cache.pop(key, None)
+    
     # Product management
     def create_product(self, project_id: str, seller_id: str, title: str,
                        description: str = "", price: float = 0.0,
@@ -804,6 +881,7 @@ class LicensingService:
                 currency=transaction.currency
             )
             self.revenue_shares[revenue_share.id] = revenue_share
+            self._index_revenue_share(revenue_share)
             
             # Auto-issue license for the product
             product = self.products.get(transaction.product_id)
@@ -902,11 +980,10 @@ class LicensingService:
             
             # Check for existing license
             existing = None
-            for license in self.licenses.values():
-                if license.user_id == user_id and license.product_id == product_id:
-                    if license.is_valid():
-                        existing = license
-                        break
+            for license in self._pair_licenses(user_id, product_id):
+                if license.is_valid():
+                    existing = license
+                    break
             
             if existing:
                 # Extend or update existing license
@@ -917,6 +994,7 @@ class LicensingService:
                 if restrictions:
                     existing.restrictions.update(restrictions)
                 existing.updated_at = datetime.utcnow()
+                self.invalidate_license_cache(user_id, product_id)
                 return existing
             
             license = License(
@@ -931,6 +1009,7 @@ class LicensingService:
             )
             
             self.licenses[license.id] = license
+            self._index_license(license)
             self._save_state()
             
             logger.info(f"License issued: {license.id}")
@@ -941,6 +1020,12 @@ class LicensingService:
         """
         Validate a user's license for a product.
         
+        Checks the user's licenses for the product in issue order and
+        accepts the first usable one; otherwise the reason reported is that
+        of the earliest license. Results without a usage context are cached
+        for ``validation_cache_ttl`` seconds (never past a license's expiry,
+        and not for use-limited licenses, whose counts change on use).
+        
         Args:
             user_id: User to validate
             product_id: Product to check
@@ -949,26 +1034,63 @@ class LicensingService:
         Returns:
             Tuple of (is_valid, reason, license)
         """
-        for license in self.licenses.values():
-            if license.user_id == user_id and license.product_id == product_id:
-                if not license.is_active:
-                    return False, "License is inactive", None
-                
-                if license.expires_at and datetime.utcnow() > license.expires_at:
-                    return False, "License has expired", None
-                
-                can_use, reason = license.can_use(context)
-                if not can_use:
-                    return False, reason, None
-                
-                return True, "License is valid", license
-        
-        return False, "No license found", None
+        key = (user_id, product_id)
+        cacheable = context is None and self.validation_cache_ttl > 0
+        
+        if cacheable:
+            cached = self._validation_cache.get(key)
+            if cached is not None:
+                if time.monotonic() < cached[0]:
+                    return cached[1]
+                self._validation_cache.pop(key, None)
+        
+        licenses = self._pair_licenses(user_id, product_id)
+        result = None
+        for license in licenses:
+            allowed, reason = self._check_license(license, context)
+            if allowed:
+                result = (True, reason, license)
+                break
+            if result is None:
+                result = (False, reason, None)
+        if result is None:
+            result = (False, "No license found", None)
+        
+        if cacheable and not any(license.max_uses for license in licenses):
+            cached_until = time.monotonic() + self.validation_cache_ttl
+            now = datetime.utcnow()
+            for license in licenses:
+                if license.expires_at and license.expires_at >= now:
+                    cached_until = min(
+                        cached_until,
+                        time.monotonic() + (license.expires_at - now).total_seconds()
+                    )
+            self._validation_cache[key] = (cached_until, result)
+        
+        return result
+    
+    def _check_license(self, license: License,
+                       context: Dict[str, Any] = None) -> Tuple[bool, str]:
+        """Check one license, returning (allowed, reason)."""
+        if not license.is_active:
+            return False, "License is inactive"
+        
+        if license.expires_at and datetime.utcnow() > license.expires_at:
+            return False, "License has expired"
+        
+        can_use, reason = license.can_use(context)
+        if not can_use:
+            return False, reason
+        
+        return True, "License is valid"
     
     def revoke_user_license(self, user_id: str, product_id: str) -> bool:
         """
         Revoke a user's license for a product.
         
+        Every active license the user holds for the product is revoked and
+        cached validation results for the pair are dropped.
+        
         Args:
             user_id: User whose license to revoke
             product_id: Product to revoke access for
@@ -977,17 +1099,26 @@ class LicensingService:
             True if revoked, False if not found
         """
         with self.lock:
-            for license in self.licenses.values():
-                if license.user_id == user_id and license.product_id == product_id:
+            licenses = self._pair_licenses(user_id, product_id)
+            if not licenses:
+                return False
+            
+            for license in licenses:
+                if license.is_active:
                     license.is_active = False
-                    self._save_state()
                     logger.info(f"License revoked: {license.id}")
-                    return True
-            return False
+            
+            self.invalidate_license_cache(user_id, product_id)
+            self._save_state()
+            return True
     
     def get_user_licenses(self, user_id: str) -> List[License]:
         """Get all licenses for a user."""
-        return [l for l in self.licenses.values() if l.user_id == user_id and l.is_active]
+        return [
+            self.licenses[license_id]
+            for license_id in self._licenses_by_user.get(user_id, ())
+            if license_id in self.licenses and self.licenses[license_id].is_active
+        ]
     
     # Subscription management
     def create_subscription(self, user_id: str, tier: str) -> Subscription:
@@ -1095,11 +1226,13 @@ class LicensingService:
         transaction_count = 0
         product_sales: Dict[str, int] = {}
         
-        for share in self.revenue_shares.values():
-            if share.creator_id != creator_id:
-                continue
-            
-            if not (start_date <= share.created_at <= end_date):
+        dates, share_ids = self._shares_by_creator.get(creator_id, ([], []))
+        first = bisect_left(dates, start_date)
+        last = bisect_right(dates, end_date)
+        
+        for share_id in share_ids[first:last]:
+            share = self.revenue_shares.get(share_id)
+            if share is None:
                 continue
             
             total_earnings += share.gross_amount
@@ -19,6 +19,7 @@ from .version_control import (
     create_commit_hash,
     get_version_control_service
 )
+from .object_pack import ObjectPack
 
 __version__ = "1.0.0"
 
@@ -30,5 +31,6 @@ __all__ = [
     "MergeResult",
     "ConflictType",
     "create_commit_hash",
-    "get_version_control_service"
+    "get_version_control_service",
+    "ObjectPack"
 ]
@@ -12,7 +12,8 @@ Version: 1.0.0
 import hashlib
 import json
 import difflib
-from typing import Dict, List, Optional, Any, Tuple, Set
+from collections.abc import MutableMapping
+from typing import Dict, List, Optional, Any, Tuple, Set, Callable, Iterator
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
@@ -26,6 +27,8 @@ from visualverse.platform.packages.shared_types import (
     Branch as DomainBranch,
 )
 
+from .object_pack import ObjectPack, OBJ_BLOB, OBJ_TREE, OBJ_COMMIT
+
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +180,15 @@ class TreeEntry:
             "size": self.size
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TreeEntry':
+        return cls(
+            path=data["path"],
+            hash=data["hash"],
+            is_directory=data.get("isDirectory", False),
+            size=data.get("size", 0)
+        )
+
 
 @dataclass
 class Tree:
@@ -286,6 +298,71 @@ def create_file_hash(content: str) -> str:
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
 
+class _PackedObjectMap(MutableMapping):
+    """
+    Dict-like view of one object kind in an ObjectPack.
+    
+    Objects are decoded from the pack on first access and cached, so opening
+    a repository costs an index read rather than a parse of every object.
+    Assigning a key appends the object to the pack; stored objects are
+    immutable and cannot be deleted.
+    """
+    
+    def __init__(self, pack: ObjectPack, kind: int,
+                 encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        self._pack = pack
+        self._kind = kind
+        self._encode = encode
+        self._decode = decode
+        self._cache: Dict[str, Any] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._cache.get(key)
+        if value is None:
+            data = self._pack.get(self._kind, key)
+            if data is None:
+                raise KeyError(key)
+            value = self._decode(data)
+            self._cache[key] = value
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        self._pack.put(self._kind, key, self._encode(value))
+        self._cache[key] = value
+    
+    def __delitem__(self, key: str):
+        raise TypeError("Stored objects are immutable")
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache or self._pack.contains(self._kind, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return self._pack.keys(self._kind)
+    
+    def __len__(self) -> int:
+        return self._pack.count(self._kind)
+
+
+def _encode_commit(commit: Commit) -> bytes:
+    return json.dumps(commit.to_dict(), separators=(',', ':')).encode('utf-8')
+
+
+def _decode_commit(data: bytes) -> Commit:
+    return Commit.from_dict(json.loads(data))
+
+
+def _encode_tree(tree: Tree) -> bytes:
+    return json.dumps(tree.to_dict(), separators=(',', ':')).encode('utf-8')
+
+
+def _decode_tree(data: bytes) -> Tree:
+    payload = json.loads(data)
+    return Tree(
+        hash=payload["hash"],
+        entries=[TreeEntry.from_dict(e) for e in payload["entries"]]
+    )
+
+
 class VersionControlService:
     """
     Core version control service providing Git-like operations.
@@ -301,25 +378,33 @@ class VersionControlService:
     
     Attributes:
         storage_dir: Directory for storing version data
-        commits: Dictionary of commits by hash
+        objects: Pack holding blobs, trees and commits
+        commits: Mapping of commits by hash, backed by the object pack
         branches: Dictionary of branches by name
-        trees: Dictionary of content trees by hash
+        trees: Mapping of content trees by hash, backed by the object pack
         lock: Thread lock for concurrent operations
     """
     
-    def __init__(self, storage_dir: str = None):
+    def __init__(self, storage_dir: str = None, fsync: bool = False):
         """
         Initialize the version control service.
         
         Args:
             storage_dir: Directory for persisting version data
+            fsync: Whether to fsync the object pack after every write
         """
         self.storage_dir = Path(storage_dir) if storage_dir else Path("/tmp/visualverse-vcs")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         
-        self.commits: Dict[str, Commit] = {}
+        # Blobs, trees and commits are content-addressed objects in one pack
+        self.objects = ObjectPack(str(self.storage_dir), fsync=fsync)
+        self.commits: MutableMapping = _PackedObjectMap(
+            self.objects, OBJ_COMMIT, _encode_commit, _decode_commit
+        )
+        self.trees: MutableMapping = _PackedObjectMap(
+            self.objects, OBJ_TREE, _encode_tree, _decode_tree
+        )
         self.branches: Dict[str, Branch] = {}
-        self.trees: Dict[str, Tree] = {}
         self.refs: Dict[str, str] = {}  # Symbolic references (HEAD, tags, etc.)
         
         self.lock = threading.RLock()
@@ -335,14 +420,15 @@ class VersionControlService:
         branches_file = self.storage_dir / "branches.json"
         refs_file = self.storage_dir / "refs.json"
         
+        # Move commits from the legacy whole-history file into the pack
         if commits_file.exists():
             try:
                 with open(commits_file, 'r') as f:
                     data = json.load(f)
-                    self.commits = {
-                        h: Commit.from_dict(c) 
-                        for h, c in data.items()
-                    }
+                for h, c in data.items():
+                    self.commits[h] = Commit.from_dict(c)
+                commits_file.rename(commits_file.with_suffix(".json.migrated"))
+                logger.info(f"Migrated {len(data)} commits into the object pack")
             except Exception as e:
                 logger.warning(f"Failed to load commits: {e}")
         
@@ -365,26 +451,33 @@ class VersionControlService:
                 logger.warning(f"Failed to load refs: {e}")
     
     def _save_state(self):
-        """Persist state to storage."""
+        """
+        Persist branches and refs to storage.
+        
+        Commits, trees and blobs are appended to the object pack as they are
+        created, so only the (small) mutable references are rewritten here.
+        """
         with self.lock:
-            commits_file = self.storage_dir / "commits.json"
             branches_file = self.storage_dir / "branches.json"
             refs_file = self.storage_dir / "refs.json"
             
-            with open(commits_file, 'w') as f:
-                json.dump(
-                    {h: c.to_dict() for h, c in self.commits.items()}, 
-                    f, indent=2
-                )
-            
-            with open(branches_file, 'w') as f:
-                json.dump(
-                    {n: b.to_dict() for n, b in self.branches.items()}, 
-                    f, indent=2
-                )
-            
-            with open(refs_file, 'w') as f:
-                json.dump(self.refs, f, indent=2)
+            self._write_json_atomic(
+                branches_file,
+                {n: b.to_dict() for n, b in self.branches.items()}
+            )
+            self._write_json_atomic(refs_file, self.refs)
+    
+    @staticmethod
+    def _write_json_atomic(path: Path, payload: Dict[str, Any]):
+        """Write JSON to a temporary file and rename it into place."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, indent=2)
+        tmp_path.replace(path)
+    
+    def close(self):
+        """Close the object pack."""
+        self.objects.close()
     
     def init_repository(self, project_id: str, author_id: str, 
                         author_name: str, author_email: str) -> Commit:
@@ -463,10 +556,15 @@ class VersionControlService:
                 head_ref = self.refs.get("HEAD", f"refs/heads/{project_id}")
                 parent_hash = self.refs.get(head_ref)
             
-            # Create tree from content
+            parent = self.commits.get(parent_hash) if parent_hash else None
+            parent_files = self._tree_files(parent.tree_hash) if parent else {}
+            
+            # Create tree from content, storing only blobs not already packed
             entries = []
             for path, file_content in content.items():
                 file_hash = create_file_hash(file_content)
+                if not self.objects.contains(OBJ_BLOB, file_hash):
+                    self.objects.put(OBJ_BLOB, file_hash, file_content.encode('utf-8'))
                 entries.append(TreeEntry(
                     path=path,
                     hash=file_hash,
@@ -482,10 +580,26 @@ class VersionControlService:
             tree = Tree(hash=tree_hash, entries=entries)
             self.trees[tree_hash] = tree
             
-            # Calculate stats
-            files_changed = len(content)
-            additions = sum(content[fp].count('\n') for fp in content)
+            # Calculate stats against the parent snapshot; only files whose
+            # hash changed are read and diffed
+            files_changed = 0
+            additions = 0
             deletions = 0
+            for entry in entries:
+                parent_entry = parent_files.pop(entry.path, None)
+                if parent_entry is not None and parent_entry.hash == entry.hash:
+                    continue
+                
+                files_changed += 1
+                base_content = self._read_blob(parent_entry.hash) if parent_entry else ""
+                added, deleted, _ = self._line_changes(base_content or "", content[entry.path], entry.path)
+                additions += added
+                deletions += deleted
+            
+            for parent_entry in parent_files.values():
+                # Removed files
+                files_changed += 1
+                deletions += len((self._read_blob(parent_entry.hash) or "").splitlines())
             
             # Create commit
             commit_hash = create_commit_hash(
@@ -689,26 +803,25 @@ class VersionControlService:
         if compare is None:
             raise ValueError(f"Compare commit not found: {compare_commit}")
         
-        base_tree = self.trees.get(base.tree_hash)
-        compare_tree = self.trees.get(compare.tree_hash)
-        
-        if base_tree is None or compare_tree is None:
+        if base.tree_hash not in self.trees or compare.tree_hash not in self.trees:
             raise ValueError("Tree not found for one of the commits")
         
         # Build file maps
-        base_files = {e.path: e.hash for e in base_tree.entries}
-        compare_files = {e.hash: e.path for e in compare_tree.entries}
+        base_files = self._tree_files(base.tree_hash)
+        compare_files = self._tree_files(compare.tree_hash)
         
         files = []
         total_additions = 0
         total_deletions = 0
         
         # Find all paths
-        all_paths = set(base_files.keys()) | set(compare_files.values())
+        all_paths = sorted(set(base_files) | set(compare_files))
         
         for path in all_paths:
-            base_hash = base_files.get(path)
-            compare_hash = compare_files.get(path)
+            base_entry = base_files.get(path)
+            compare_entry = compare_files.get(path)
+            base_hash = base_entry.hash if base_entry else None
+            compare_hash = compare_entry.hash if compare_entry else None
             
             if base_hash == compare_hash:
                 continue  # No change
@@ -720,29 +833,16 @@ class VersionControlService:
                 "deletions": 0
             }
             
-            # Calculate line changes if both versions exist
-            if base_hash and compare_hash:
-                base_content = self._get_file_content(base.tree_hash, path)
-                compare_content = self._get_file_content(compare.tree_hash, path)
-                
-                if base_content and compare_content:
-                    diff = list(difflib.unified_diff(
-                        base_content.splitlines(keepends=True),
-                        compare_content.splitlines(keepends=True),
-                        fromfile=f"a/{path}",
-                        tofile=f"b/{path}",
-                        lineterm=''
-                    ))
-                    
-                    additions = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
-                    deletions = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
-                    
-                    file_diff["additions"] = additions
-                    file_diff["deletions"] = deletions
-                    file_diff["diff"] = diff
-                    
-                    total_additions += additions
-                    total_deletions += deletions
+            base_content = self._read_blob(base_hash) if base_hash else ""
+            compare_content = self._read_blob(compare_hash) if compare_hash else ""
+            
+            if base_content is not None and compare_content is not None:
+                additions, deletions, diff = self._line_changes(base_content, compare_content, path)
+                file_diff["additions"] = additions
+                file_diff["deletions"] = deletions
+                file_diff["diff"] = diff
+                total_additions += additions
+                total_deletions += deletions
             
             files.append(file_diff)
         
@@ -754,18 +854,77 @@ class VersionControlService:
             total_deletions=total_deletions
         )
     
-    def _get_file_content(self, tree_hash: str, path: str) -> Optional[str]:
-        """Get file content from a tree."""
+    @staticmethod
+    def _line_changes(base_content: str, compare_content: str,
+                      path: str) -> Tuple[int, int, List[str]]:
+        """Get (additions, deletions, unified diff lines) between two file versions."""
+        diff = list(difflib.unified_diff(
+            base_content.splitlines(keepends=True),
+            compare_content.splitlines(keepends=True),
+            fromfile=f"a/{path}",
+            tofile=f"b/{path}",
+            lineterm=''
+        ))
+        
+        additions = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
+        deletions = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
+        return additions, deletions, diff
+    
+    def _tree_files(self, tree_hash: str) -> Dict[str, TreeEntry]:
+        """Get the file entries of a tree by path."""
         tree = self.trees.get(tree_hash)
         if tree is None:
+            return {}
+        return {e.path: e for e in tree.entries if not e.is_directory}
+    
+    def _read_blob(self, file_hash: str) -> Optional[str]:
+        """Get file content from the object pack."""
+        data = self.objects.get(OBJ_BLOB, file_hash)
+        return data.decode('utf-8') if data is not None else None
+    
+    def _get_file_content(self, tree_hash: str, path: str) -> Optional[str]:
+        """Get file content from a tree."""
+        entry = self._tree_files(tree_hash).get(path)
+        if entry is None:
             return None
+        return self._read_blob(entry.hash)
+    
+    def get_file_content(self, commit_hash: str, path: str) -> Optional[str]:
+        """
+        Get the content of a file at a commit.
         
-        for entry in tree.entries:
-            if entry.path == path and not entry.is_directory:
-                # In a real implementation, we'd store file content in blob objects
-                return f"# Content for {path}\nHash: {entry.hash}"
+        Args:
+            commit_hash: Commit to read from
+            path: File path relative to project root
         
-        return None
+        Returns:
+            File content or None if the file does not exist at that commit
+        """
+        commit = self.commits.get(commit_hash)
+        if commit is None:
+            return None
+        return self._get_file_content(commit.tree_hash, path)
+    
+    def get_tree_content(self, commit_hash: str) -> Dict[str, str]:
+        """
+        Get the contents of all files at a commit.
+        
+        Args:
+            commit_hash: Commit to read from
+        
+        Returns:
+            Dictionary mapping file paths to content
+        """
+        commit = self.commits.get(commit_hash)
+        if commit is None:
+            raise ValueError(f"Commit not found: {commit_hash}")
+        
+        content = {}
+        for path, entry in self._tree_files(commit.tree_hash).items():
+            file_content = self._read_blob(entry.hash)
+            if file_content is not None:
+                content[path] = file_content
+        return content
     
     def merge(self, target_branch: str, source_branch: str,
               author_id: str, author_name: str, author_email: str) -> MergeResult:
@@ -906,7 +1065,7 @@ class VersionControlService:
             if base and target and source:
                 if target.hash != source.hash:
                     # Both modified - check if both actually changed content
-                    if target.hash != base.hash or source.hash != base.hash:
+                    if target.hash != base.hash and source.hash != base.hash:
                         conflicts.append({
                             "type": ConflictType.CONTENT_CONFLICT.value,
                             "path": path,
@@ -935,36 +1094,27 @@ class VersionControlService:
             source = source_files.get(path)
             
             if target and not source:
-                # Deleted in source - keep target
-                if target.hash != base.hash:
-                    merged[path] = f"# Content from target\n# Original: {base.hash}\n# Target: {target.hash}"
+                # Deleted in source - keep target if it changed there
+                if base is None or target.hash != base.hash:
+                    merged[path] = self._read_blob(target.hash)
             elif source and not target:
-                # Deleted in target - take source
-                merged[path] = f"# Content from source\n# Original: {base.hash}\n# Source: {source.hash}"
+                # Deleted in target - take source if it changed there
+                if base is None or source.hash != base.hash:
+                    merged[path] = self._read_blob(source.hash)
             elif target and source:
-                if target.hash == source.hash:
-                    # No change in either
-                    merged[path] = f"# Content unchanged\n# Hash: {target.hash}"
-                elif target.hash == base.hash:
+                if target.hash == source.hash or source.hash == (base.hash if base else None):
+                    # Unchanged, or only target changed
+                    merged[path] = self._read_blob(target.hash)
+                elif target.hash == (base.hash if base else None):
                     # Only source changed
-                    merged[path] = f"# Content from source\n# Base: {base.hash}\n# Source: {source.hash}"
-                elif source.hash == base.hash:
-                    # Only target changed
-                    merged[path] = f"# Content from target\n# Base: {base.hash}\n# Target: {target.hash}"
+                    merged[path] = self._read_blob(source.hash)
                 else:
                     # Both changed differently - use target as base (simplified)
-                    merged[path] = f"# MERGE CONFLICT in {path}\n# Target version selected\n# Target: {target.hash}\n# Source: {source.hash}"
-            elif base and not (target or source):
-                # Deleted in both
-                pass  # Don't include in merged result
-            else:
-                # New file
-                if source:
-                    merged[path] = f"# New content from source\n# Source: {source.hash}"
-                elif target:
-                    merged[path] = f"# New content from target\n# Target: {target.hash}"
+                    merged[path] = self._read_blob(target.hash)
+            # Deleted in both - don't include in merged result
         
-        return merged
+        # Blobs missing from the pack (e.g. commits migrated without contents)
+        return {path: content for path, content in merged.items() if content is not None}
     
     def revert(self, commit_hash: str, author_id: str, author_name: str,
                author_email: str) -> Commit:
@@ -989,7 +1139,7 @@ class VersionControlService:
             head_ref = self.refs.get("HEAD")
             current_hash = self.refs.get(head_ref) if head_ref else None
             
-            # Create revert commit
+            # Create revert commit restoring the target snapshot
             message = f"Revert to commit {commit_hash[:8]}"
             
             return self.commit(
@@ -998,7 +1148,7 @@ class VersionControlService:
                 author_name=author_name,
                 author_email=author_email,
                 message=message,
-                content={},  # Would need to extract actual content
+                content=self.get_tree_content(commit_hash),
                 parent_hash=current_hash,
                 domain=target_commit.domain
             )
@@ -0,0 +1,91 @@
+"""
+Load VisualVerse modules by file path for tests.
+
+Most engine and service trees live in hyphenated directories that are not
+importable packages, so tests load the module (or package) under test
+directly from the source tree.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def load_module(name, relative_path, package=False):
+    """
+    Load a module or package from a path relative to the project root.
+
+    Args:
+        name: Name to register the module under in ``sys.modules``
+        relative_path: Path of the module file, or of the package directory
+            when ``package`` is true
+        package: Load ``relative_path/__init__.py`` as a package so its
+            relative imports resolve
+
+    Returns:
+        The loaded module (cached after the first load)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = PROJECT_ROOT / relative_path
+    if package:
+        spec = importlib.util.spec_from_file_location(
+            name, path / "__init__.py", submodule_search_locations=[str(path)]
+        )
+    else:
+        spec = importlib.util.spec_from_file_location(name, path)
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def load_namespace(name, relative_path):
+    """
+    Register a directory as a package without running its ``__init__``.
+
+    Lets modules that import ``name.submodule`` resolve it when the
+    package's ``__init__`` eagerly imports unrelated, heavier services.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    package = types.ModuleType(name)
+    package.__path__ = [str(PROJECT_ROOT / relative_path)]
+    sys.modules[name] = package
+    return package
+
+
+def stub_module(name, **attributes):
+    """
+    Register a placeholder module for a dependency the tests do not exercise.
+
+    Only names the module under test imports need to be provided. Names a
+    registered module already defines are kept, so test modules sharing a
+    placeholder can each add the names they need.
+
+    Args:
+        name: Dotted module name to register in ``sys.modules``
+        **attributes: Names to expose from the placeholder
+
+    Returns:
+        The registered module
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = types.ModuleType(name)
+        sys.modules[name] = module
+
+    for key, value in attributes.items():
+        if not hasattr(module, key):
+            setattr(module, key, value)
+    return module
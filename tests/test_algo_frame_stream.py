@@ -0,0 +1,105 @@
+"""
+Tests for the delta/keyframe sorting frame streams of AlgoVerseAnimationService.
+"""
+
+import random
+
+import pytest
+
+from tests.module_loader import load_module
+
+algo = load_module(
+    "visualverse_algo_animation",
+    "open-source/engine/content-metadata/services/verticals/algo_verse/algo_animation_service.py"
+)
+
+ALGORITHMS = [algorithm.value for algorithm in algo.SortingAlgorithm]
+
+
+def frame_fields(frame):
+    return (
+        frame.frame_number, frame.data_state, frame.highlighted_indices,
+        frame.element_states, frame.message, frame.metadata, frame.timestamp
+    )
+
+
+def reference_frames(service, data, algorithm):
+    service.reset_frame_counter()
+    return [frame_fields(frame) for frame in service.create_sorting_frames(data, algorithm)]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("keyframe_interval", [1, 2, 7, None])
+def test_streamed_frames_match_frame_lists(algorithm, keyframe_interval):
+    rng = random.Random(algorithm)
+    data = [rng.randrange(200) for _ in range(12)]
+    original = list(data)
+    service = algo.AlgoVerseAnimationService()
+    expected = reference_frames(service, data, algorithm)
+
+    cached = service.stream_sorting_frames(data, algorithm, keyframe_interval=keyframe_interval)
+    uncached = service.stream_sorting_frames(
+        data, algorithm, keyframe_interval=keyframe_interval, cache=False
+    )
+
+    assert [frame_fields(frame) for frame in cached.frames()] == expected
+    assert len(cached) == len(uncached) == len(expected)
+
+    # Seek out of order so cached seeks start from different keyframes
+    positions = list(range(len(expected)))
+    rng.shuffle(positions)
+    for position in positions:
+        assert frame_fields(cached.seek(position)) == expected[position]
+    for position in positions[:10]:
+        assert frame_fields(uncached.seek(position)) == expected[position]
+
+    # Once exhausted, cached streams replay their stored deltas
+    assert [frame_fields(frame) for frame in cached.frames()] == expected
+    assert data == original
+    with pytest.raises(IndexError):
+        cached.seek(len(expected))
+    with pytest.raises(IndexError):
+        uncached.seek(len(expected))
+
+
+def test_deltas_hold_operations_between_keyframes():
+    service = algo.AlgoVerseAnimationService()
+    stream = service.stream_sorting_frames([5, 4, 3, 2, 1], "bubble_sort", keyframe_interval=4)
+    deltas = list(stream)
+
+    keyframes = [position for position, delta in enumerate(deltas) if delta.is_keyframe]
+    assert keyframes == list(range(0, len(deltas), 4))
+    swaps = [op for delta in deltas for op in delta.operations if op[0] == algo.OP_SWAP]
+    assert swaps and all(op[0] in (algo.OP_SWAP, algo.OP_SET)
+                         for delta in deltas for op in delta.operations)
+
+
+def test_radix_output_array_switch_forces_keyframes():
+    service = algo.AlgoVerseAnimationService()
+    data = [170, 45, 75, 90, 802, 24, 2, 66]
+    deltas = list(service.stream_sorting_frames(data, "radix_sort", keyframe_interval=1000))
+
+    # The first placement into the output array, and the copy back, are keyframes
+    for previous, delta in zip(deltas, deltas[1:]):
+        if delta.metadata.get("phase") == "place" and previous.metadata.get("phase") != "place":
+            assert delta.is_keyframe
+        if delta.metadata.get("phase") == "digit_complete":
+            assert delta.is_keyframe
+    assert algo.FrameStream(lambda: iter(deltas)).seek(len(deltas) - 1).data_state == sorted(data)
+
+
+def test_tracked_array_records_sets_swaps_and_untracked_mutations():
+    array = algo.TrackedArray([1, 2, 3, 4])
+    array[0], array[3] = array[3], array[0]
+    array[-1] = 9
+    assert array.take_operations() == [(algo.OP_SWAP, 0, 3), (algo.OP_SET, 3, 9)]
+    assert array.take_operations() == []
+
+    array.append(5)
+    array[0] = 7
+    assert array.take_operations() is None
+    array[1:3] = [0, 0]
+    assert array.take_operations() is None
+    array[1] = 8
+    assert array.take_operations() == [(algo.OP_SET, 1, 8)]
+    assert array == [7, 8, 0, 9, 5]
@@ -0,0 +1,61 @@
+"""
+Tests for course report caching in the LXP AnalyticsService.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from tests.module_loader import load_module
+
+analytics = load_module(
+    "visualverse_lxp_analytics", "services/lxp/services/analytics/analytics_service.py"
+)
+
+
+def make_service():
+    service = analytics.AnalyticsService()
+    for i, learner_id in enumerate(["l1", "l2", "l3"]):
+        service.start_session(f"s{i}", learner_id)
+        service.track_engagement(learner_id, "intro", 0.5 + 0.1 * i, 600)
+    return service
+
+
+def test_dashboard_for_unreported_course_is_empty_and_not_cached():
+    service = make_service()
+    summary = service.get_dashboard_summary(course_id="unknown")
+
+    assert summary['total_learners'] == 0
+    assert summary['top_learners'] == []
+    assert "unknown" not in service._report_cache
+    assert service.reports == []
+
+
+def test_course_report_is_reused_until_learner_data_changes():
+    service = make_service()
+    report = service.generate_course_report("course", ["l1", "l2"])
+    assert service.generate_course_report("course", ["l1", "l2"]) is report
+    assert service.get_dashboard_summary(course_id="course") is report.data['dashboard']
+
+    service.track_engagement("l1", "intro", 0.9, 300)
+    refreshed = service.generate_course_report("course", ["l1", "l2"])
+    assert refreshed is not report
+    assert service.reports == [report, refreshed]
+
+    # A different enrollment is a cache miss
+    assert service.generate_course_report("course", ["l1"]) is not refreshed
+
+
+def test_dashboard_cache_refills_do_not_grow_report_history():
+    service = make_service()
+    report = service.generate_course_report("course", ["l1", "l2", "l3"])
+
+    for score in (0.2, 0.4, 0.6):
+        service.track_engagement("l2", "intro", score, 120)
+        summary = service.get_dashboard_summary(course_id="course")
+        assert summary == service._summarize_dashboard(
+            service.get_cohort_metrics(["l1", "l2", "l3"])
+        )
+
+    assert service.reports == [report]
+    assert service._report_cache["course"][3].data['dashboard'] is summary
@@ -0,0 +1,142 @@
+"""
+Tests for IRT adaptive question selection and running aggregates in
+AssessmentService.
+"""
+
+import random
+import statistics
+
+import pytest
+
+from tests.module_loader import load_module
+
+assessment = load_module(
+    "visualverse_assessment_service", "services/lxp/services/assessment/assessment_service.py"
+)
+
+
+def make_questions(rng, count):
+    return [
+        assessment.Question(
+            question_id=f"q{i}",
+            assessment_id="adaptive",
+            question_type=assessment.QuestionType.MULTIPLE_CHOICE,
+            content=f"Question {i}",
+            difficulty=rng.choice(list(assessment.Difficulty)),
+            metadata={
+                'irt_discrimination': rng.uniform(0.3, 2.5),
+                'irt_difficulty': rng.gauss(0.0, 1.2)
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def test_discriminations_are_bucketed():
+    bank = assessment.IRTItemBank(make_questions(random.Random(1), 2000))
+    assert len(bank) == 2000
+    assert len(bank.groups) <= assessment.IRTItemBank.DISCRIMINATION_BUCKETS
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_select_returns_maximum_information_item(seed):
+    rng = random.Random(seed)
+    questions = make_questions(rng, rng.randint(1, 300))
+    bank = assessment.IRTItemBank(questions)
+
+    for _ in range(10):
+        theta = rng.uniform(-3.0, 3.0)
+        exclude = {q.question_id for q in questions if rng.random() < 0.4}
+        selected = bank.select(theta, exclude)
+
+        available = [q.question_id for q in questions if q.question_id not in exclude]
+        if not available:
+            assert selected is None
+            continue
+
+        best = max(bank.information(theta, *bank.parameters[qid]) for qid in available)
+        assert selected not in exclude
+        assert bank.information(theta, *bank.parameters[selected]) == pytest.approx(best, abs=1e-12)
+
+
+def assert_matches_statistics(aggregates, attempts):
+    scores = [score for score, _, _ in attempts]
+    times = [time_seconds for _, time_seconds, _ in attempts]
+    assert aggregates.completed_count == len(attempts)
+    assert aggregates.passed_count == sum(passed for _, _, passed in attempts)
+    if not attempts:
+        assert aggregates.score_mean == 0.0
+        assert aggregates.score_variance == 0.0
+        assert aggregates.time_sketch.quantile(0.5) == 0.0
+        return
+
+    assert aggregates.score_mean == pytest.approx(statistics.fmean(scores), abs=1e-9)
+    assert aggregates.score_variance == pytest.approx(statistics.pvariance(scores), abs=1e-6)
+    assert aggregates.average_time_seconds == pytest.approx(statistics.fmean(times), abs=1e-6)
+
+    # The sketch returns the value at rank q * (n - 1) within its relative accuracy
+    sketch = aggregates.time_sketch
+    ordered = sorted(times)
+    assert sketch.quantile(0.5) == pytest.approx(statistics.median_low(times), rel=sketch.relative_accuracy)
+    for q in (0.0, 0.25, 0.9, 1.0):
+        expected = ordered[int(q * (len(ordered) - 1))]
+        assert sketch.quantile(q) == pytest.approx(expected, rel=sketch.relative_accuracy)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_aggregates_match_statistics_after_add_rescore_and_remove(seed):
+    rng = random.Random(seed)
+    aggregates = assessment.AssessmentAggregates(assessment_id="a")
+    attempts = []
+
+    def random_attempt():
+        score = round(rng.uniform(0, 100), 1)
+        # Zero times land in the sketch's zero bucket
+        time_seconds = 0.0 if rng.random() < 0.1 else rng.uniform(30, 3600)
+        return score, time_seconds, score >= 60
+
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.5 or not attempts:
+            attempt = random_attempt()
+            aggregates.add(*attempt)
+            attempts.append(attempt)
+        elif action < 0.8:
+            # Re-score: remove the old result, then add the new one
+            index = rng.randrange(len(attempts))
+            aggregates.remove(*attempts[index])
+            attempts[index] = random_attempt()
+            aggregates.add(*attempts[index])
+        else:
+            aggregates.remove(*attempts.pop(rng.randrange(len(attempts))))
+        assert_matches_statistics(aggregates, attempts)
+
+    while attempts:
+        aggregates.remove(*attempts.pop())
+        assert_matches_statistics(aggregates, attempts)
+
+
+def test_replacing_a_question_keeps_the_bank_unique():
+    service = assessment.AssessmentService()
+    for i in range(3):
+        service.add_question(
+            f"q{i}", "quiz", assessment.QuestionType.MULTIPLE_CHOICE, f"Question {i}", "a",
+            topics=["algebra"]
+        )
+
+    # Replacing in place keeps the bank order; moving changes the bank
+    service.add_question(
+        "q1", "quiz", assessment.QuestionType.MULTIPLE_CHOICE, "Question 1, revised", "b",
+        difficulty=assessment.Difficulty.HARD, topics=["algebra"]
+    )
+    assert service.question_bank["quiz"] == ["q0", "q1", "q2"]
+    assert [q.content for q in service.get_questions_for_assessment("quiz", shuffle=False)] == [
+        "Question 0", "Question 1, revised", "Question 2"
+    ]
+    assert len(service._get_irt_bank("quiz")) == 3
+
+    service.add_question("q0", "final", assessment.QuestionType.MULTIPLE_CHOICE, "Question 0", "a")
+    assert service.question_bank["quiz"] == ["q1", "q2"]
+    assert service.question_bank["final"] == ["q0"]
+    assert len(service._get_irt_bank("quiz")) == 2
+    assert [q.question_id for q in service.get_questions_for_assessment("final")] == ["q0"]
@@ -0,0 +1,131 @@
+"""
+Tests for the structure-of-arrays BatchedIntegrator in PhysicsVerse.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tests.module_loader import load_module
+
+physics_core = load_module(
+    "visualverse_physics_core",
+    "open-source/engine/content-metadata/services/verticals/physics_verse/physics_core.py"
+)
+
+VERLET = physics_core.IntegrationMethod.VERLET
+
+
+def spring(stiffness):
+    return lambda t, x, v, m: -stiffness * x
+
+
+def damped_spring(t, x, v, m):
+    return -4.0 * x - 0.3 * v
+
+
+def make_batch(force=damped_spring, seed=0):
+    rng = np.random.default_rng(seed)
+    return physics_core.BatchedIntegrator(
+        rng.normal(size=(3, 8, 2)),
+        rng.normal(size=(3, 8, 2)),
+        masses=rng.uniform(0.5, 2.0, size=(3, 8)),
+        force=force,
+        method=VERLET
+    )
+
+
+def fresh_copy(batch):
+    """A new integrator at the same state, with no cached accelerations."""
+    return physics_core.BatchedIntegrator(
+        batch.positions, batch.velocities, batch.masses,
+        force=batch.force, method=batch.method, time=batch.time
+    )
+
+
+def test_verlet_reuses_accelerations_between_steps():
+    calls = []
+
+    def counted(t, x, v, m):
+        calls.append(t)
+        return damped_spring(t, x, v, m)
+
+    batch = make_batch(force=counted)
+    batch.run(dt=0.01, steps=20)
+    assert len(calls) == 21
+
+
+def test_verlet_matches_a_fresh_integrator_each_step():
+    # Position-only force: the cached a(t+dt) is exactly what a fresh step computes
+    batch = make_batch(force=spring(4.0))
+    for _ in range(30):
+        reference = fresh_copy(batch)
+        batch.step(0.01)
+        reference.step(0.01)
+        np.testing.assert_allclose(batch.positions, reference.positions)
+        np.testing.assert_allclose(batch.velocities, reference.velocities)
+
+
+@pytest.mark.parametrize("edit", [
+    lambda batch: batch.positions.__setitem__((0, 0), [5.0, -5.0]),
+    lambda batch: setattr(batch, "positions", batch.positions * 0.5),
+    lambda batch: batch.velocities.__imul__(-1.0),
+    lambda batch: setattr(batch, "time", batch.time + 1.0),
+    lambda batch: setattr(batch, "force", spring(9.0)),
+])
+def test_verlet_recomputes_after_external_state_changes(edit):
+    batch = make_batch()
+    batch.run(dt=0.01, steps=5)
+
+    edit(batch)
+    reference = fresh_copy(batch)
+    batch.step(0.01)
+    reference.step(0.01)
+
+    np.testing.assert_allclose(batch.positions, reference.positions)
+    np.testing.assert_allclose(batch.velocities, reference.velocities)
+
+
+def test_verlet_conserves_spring_energy():
+    batch = physics_core.BatchedIntegrator(
+        np.ones((100, 1, 1)), np.zeros((100, 1, 1)), force=spring(1.0), method=VERLET
+    )
+
+    def energy():
+        return batch.kinetic_energy() + 0.5 * np.sum(batch.positions ** 2, axis=(-2, -1))
+
+    initial = energy()
+    batch.run(dt=0.01, steps=2000)
+    np.testing.assert_allclose(energy(), initial, rtol=1e-4)
+
+
+def dict_state(count):
+    Vector2D = physics_core.Vector2D
+    return physics_core.PhysicsState(
+        time=0.5,
+        positions={f"b{i}": Vector2D(i * 0.5, -i) for i in range(count)},
+        velocities={f"b{i}": Vector2D(1.0, i * 0.25) for i in range(count)},
+        accelerations={f"b{i}": Vector2D(0.0, -9.81) for i in range(count)}
+    )
+
+
+def drag_derivative(state):
+    return physics_core.PhysicsState(
+        time=state.time,
+        positions=dict(state.velocities),
+        velocities={k: physics_core.Vector2D(0.0, -9.81) - v * 0.1 for k, v in state.velocities.items()}
+    )
+
+
+@pytest.mark.parametrize("count", [1, 7, 8, 30])
+def test_runge_kutta_4_paths_agree_around_the_array_threshold(count):
+    integrator = physics_core.NumericalIntegrator
+    state = dict_state(count)
+
+    result = integrator.runge_kutta_4(state, drag_derivative, 0.01)
+    expected = integrator._runge_kutta_4_objects(state, drag_derivative, 0.01)
+
+    assert result.time == expected.time
+    for field in ("positions", "velocities"):
+        actual = {k: (v.x, v.y) for k, v in getattr(result, field).items()}
+        assert actual == {k: (v.x, v.y) for k, v in getattr(expected, field).items()}
@@ -0,0 +1,159 @@
+"""
+Tests for the sparse top-k CollaborativeFilteringEngine against dense brute force.
+"""
+
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pandas")
+
+from tests.module_loader import load_module
+
+engines = load_module(
+    "visualverse_recommendation_engines",
+    "open-source/engine/recommendation-engine/engines/recommendation_engines.py"
+)
+
+INTERACTION_TYPES = ["view", "like", "complete", "share", "rate"]
+
+
+def random_interactions(seed, user_count=25, item_count=30, density=0.2):
+    """Random interactions plus users and items whose only interactions weigh zero"""
+    rng = np.random.default_rng(seed)
+    interactions = []
+    for u in range(user_count):
+        for i in range(item_count):
+            if rng.random() < density:
+                # Some pairs are repeated so averaging is exercised
+                for _ in range(rng.integers(1, 3)):
+                    interactions.append(engines.UserInteraction(
+                        user_id=f"u{u:02d}",
+                        content_id=f"i{i:02d}",
+                        interaction_type=INTERACTION_TYPES[rng.integers(len(INTERACTION_TYPES))],
+                        timestamp=datetime(2024, 1, 1),
+                        value=float(rng.uniform(0.1, 2.0))
+                    ))
+    interactions.append(engines.UserInteraction("u_idle", "i00", "view", datetime(2024, 1, 1), 0.0))
+    interactions.append(engines.UserInteraction("u00", "i_unrated", "view", datetime(2024, 1, 1), 0.0))
+    return interactions
+
+
+def dense_ratings(engine, interactions):
+    sums = np.zeros((len(engine.user_ids), len(engine.content_ids)))
+    counts = np.zeros_like(sums)
+    for interaction in interactions:
+        u = engine.user_index[interaction.user_id]
+        i = engine.content_index[interaction.content_id]
+        sums[u, i] += engine.interaction_weights[interaction.interaction_type] * interaction.value
+        counts[u, i] += 1
+    return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+
+def dense_top_k(matrix, k):
+    """Each row's top-k positive cosine neighbours as {column: similarity}"""
+    norms = np.linalg.norm(matrix, axis=1)
+    safe = np.where(norms > 0, norms, 1.0)
+    similarity = (matrix / safe[:, None]) @ (matrix / safe[:, None]).T
+    np.fill_diagonal(similarity, 0.0)
+    neighbours = []
+    for row in similarity:
+        order = np.argsort(-row, kind="stable")[:k]
+        neighbours.append({int(j): row[j] for j in order if row[j] > 0})
+    return neighbours
+
+
+def sparse_rows(matrix):
+    return [
+        dict(zip(matrix[r].indices.tolist(), matrix[r].data))
+        for r in range(matrix.shape[0])
+    ]
+
+
+def assert_neighbours_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for actual_row, expected_row in zip(actual, expected):
+        assert sorted(actual_row) == sorted(expected_row)
+        for column, value in expected_row.items():
+            assert actual_row[column] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("num_neighbors", [3, 10, 100])
+def test_top_k_neighbours_match_dense_cosine(seed, num_neighbors):
+    interactions = random_interactions(seed)
+    engine = engines.CollaborativeFilteringEngine(num_neighbors=num_neighbors)
+    engine.train(interactions, {})
+    ratings = dense_ratings(engine, interactions)
+
+    users = len(engine.user_ids)
+    items = len(engine.content_ids)
+    assert_neighbours_equal(
+        sparse_rows(engine.similarity_matrix), dense_top_k(ratings, min(num_neighbors, users - 1))
+    )
+    assert_neighbours_equal(
+        sparse_rows(engine.content_similarity), dense_top_k(ratings.T, min(num_neighbors, items - 1))
+    )
+
+    # Small blocks take the same path in several pieces
+    blocked = engine._top_k_cosine(engine.user_item_matrix, block_elements=users * 3)
+    assert_neighbours_equal(sparse_rows(blocked), sparse_rows(engine.similarity_matrix))
+
+    # Users and items without ratings have no neighbours
+    assert engine.similarity_matrix[engine.user_index["u_idle"]].nnz == 0
+    assert engine.content_similarity[engine.content_index["i_unrated"]].nnz == 0
+
+
+def dense_recommend(engine, ratings, user_id, available, count):
+    u = engine.user_index[user_id]
+    neighbours = dense_top_k(ratings, min(engine.num_neighbors, len(engine.user_ids) - 1))[u]
+    scored = []
+    for position, content_id in enumerate(available):
+        i = engine.content_index.get(content_id)
+        if i is None or ratings[u, i] > 0:
+            continue
+        numerator = sum(weight * ratings[v, i] for v, weight in neighbours.items())
+        denominator = sum(weight for v, weight in neighbours.items() if ratings[v, i] > 0)
+        if denominator > 0:
+            scored.append((-numerator / denominator, position, content_id))
+    return [(content_id, -score) for score, _, content_id in sorted(scored)[:count]]
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("num_neighbors", [3, 10])
+def test_recommendations_match_dense_scoring(seed, num_neighbors):
+    interactions = random_interactions(seed)
+    engine = engines.CollaborativeFilteringEngine(num_neighbors=num_neighbors)
+    engine.train(interactions, {})
+    ratings = dense_ratings(engine, interactions)
+
+    rng = np.random.default_rng(seed)
+    available = list(engine.content_ids) + ["unknown"]
+    rng.shuffle(available)
+
+    for user_id in engine.user_ids:
+        for count in (1, 5, 50):
+            recommendations = engine.recommend(user_id, [], available, count)
+            expected = dense_recommend(engine, ratings, user_id, available, count)
+            assert [rec.content_id for rec in recommendations] == [cid for cid, _ in expected]
+            assert [rec.score for rec in recommendations] == pytest.approx(
+                [score for _, score in expected]
+            )
+
+    # A user without ratings has no neighbours and gets nothing to rank
+    assert engine.recommend("u_idle", [], available, 5) == []
+
+
+def test_unknown_users_get_popular_content():
+    interactions = random_interactions(0)
+    engine = engines.CollaborativeFilteringEngine()
+    engine.train(interactions, {})
+    ratings = dense_ratings(engine, interactions)
+
+    recommendations = engine.recommend("stranger", [], engine.content_ids, 5)
+
+    popularity = ratings.sum(axis=0)
+    expected = [engine.content_ids[i] for i in np.argsort(-popularity, kind="stable")[:5]]
+    assert [rec.content_id for rec in recommendations] == expected
@@ -0,0 +1,338 @@
+"""
+Tests for the incrementally maintained indexes of DependencyGraphEngine.
+"""
+
+import random
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+from tests.module_loader import load_module
+
+graph = load_module(
+    "visualverse_graph", "open-source/engine/content-metadata/services/graph", package=True
+)
+
+
+def make_node(node_id):
+    return graph.GraphNode(
+        id=node_id,
+        name=node_id,
+        subject_id="math",
+        difficulty_level="beginner",
+        concept_type="theoretical",
+        duration_minutes=30
+    )
+
+
+def make_engine(node_count, **options):
+    engine = graph.DependencyGraphEngine(**options)
+    engine.build_graph(
+        [{"id": f"c{i}", "name": f"c{i}", "subject_id": "math"} for i in range(node_count)],
+        []
+    )
+    return engine
+
+
+def rebuilt_depths(engine):
+    fresh = graph.DependencyGraphEngine()
+    fresh.deserialize(engine.serialize())
+    return fresh.get_all_concept_depths()
+
+
+def test_depth_index_matches_rebuild_after_random_mutations():
+    rng = random.Random(1)
+    engine = make_engine(30)
+    node_ids = [f"c{i}" for i in range(30)]
+
+    for step in range(400):
+        source, target = rng.sample(node_ids, 2)
+        action = rng.random()
+        if action < 0.6:
+            engine.add_edge(source, target)
+        elif action < 0.9:
+            engine.remove_edge(source, target)
+        else:
+            engine.remove_node(source)
+            engine.add_node(make_node(source))
+
+        if step % 20 == 0:
+            assert engine.get_all_concept_depths() == rebuilt_depths(engine)
+
+    assert engine.get_all_concept_depths() == rebuilt_depths(engine)
+
+
+def test_depth_is_longest_path_from_a_root():
+    engine = make_engine(4)
+    engine.add_edge("c0", "c1")
+    engine.add_edge("c1", "c2")
+    engine.add_edge("c0", "c2")
+    assert engine.get_concept_depth("c2") == 2
+
+    engine.remove_edge("c1", "c2")
+    assert engine.get_concept_depth("c2") == 1
+    assert engine.get_concept_depth("c3") == 0
+    assert engine.get_concept_depth("missing") == -1
+
+
+def test_concepts_on_a_cycle_share_a_depth():
+    engine = make_engine(4)
+    engine.add_edge("c0", "c1")
+    engine.add_edge("c1", "c2")
+    engine.add_edge("c2", "c1")
+    engine.add_edge("c2", "c3")
+
+    depths = engine.get_all_concept_depths()
+    assert depths["c1"] == depths["c2"] == 1
+    assert depths["c3"] == 2
+
+
+def test_online_cycle_detection_matches_networkx():
+    rng = random.Random(3)
+    engine = make_engine(25)
+    node_ids = [f"c{i}" for i in range(25)]
+
+    for _ in range(300):
+        source, target = rng.sample(node_ids, 2)
+        if rng.random() < 0.7:
+            engine.add_edge(source, target)
+        else:
+            engine.remove_edge(source, target)
+
+        acyclic = nx.is_directed_acyclic_graph(engine.get_graph())
+        assert engine.has_cycles == (not acyclic)
+
+
+def test_topological_order_respects_acyclic_edges():
+    rng = random.Random(5)
+    engine = make_engine(40, reject_cycles=True)
+    node_ids = [f"c{i}" for i in range(40)]
+
+    for _ in range(300):
+        engine.add_edge(*rng.sample(node_ids, 2))
+
+    assert not engine.has_cycles
+    assert nx.is_directed_acyclic_graph(engine.get_graph())
+    for source, target in engine.get_graph().edges():
+        assert engine._topo_order[source] < engine._topo_order[target]
+
+
+def test_reject_cycles_refuses_cycle_closing_edge():
+    engine = make_engine(3, reject_cycles=True)
+    assert engine.add_edge("c0", "c1")
+    assert engine.add_edge("c1", "c2")
+    assert not engine.add_edge("c2", "c0")
+    assert not engine.get_graph().has_edge("c2", "c0")
+
+
+def test_flagged_cycle_edge_is_cleared_when_cycle_breaks():
+    engine = make_engine(3)
+    engine.add_edge("c0", "c1")
+    engine.add_edge("c1", "c2")
+    assert engine.add_edge("c2", "c0")
+    assert engine.get_cycle_edges() == [("c2", "c0")]
+
+    engine.remove_edge("c0", "c1")
+    assert engine.get_cycle_edges() == []
+    assert not engine.has_cycles
+
+
+def test_compact_closure_matches_networkx_under_mutations():
+    rng = random.Random(11)
+    engine = make_engine(30, compact_index=True, closure_cache_size=8)
+    node_ids = [f"c{i}" for i in range(30)]
+
+    for step in range(300):
+        source, target = rng.sample(node_ids, 2)
+        if rng.random() < 0.65:
+            engine.add_edge(source, target)
+        else:
+            engine.remove_edge(source, target)
+
+        nx_graph = engine.get_graph()
+        for node_id in rng.sample(node_ids, 6):
+            assert engine.get_prerequisites(node_id) == sorted(nx.ancestors(nx_graph, node_id))
+            assert engine.get_postrequisites(node_id) == sorted(nx.descendants(nx_graph, node_id))
+
+    assert engine.has_cycles
+
+
+def test_compact_closure_reuses_cached_bitmaps():
+    rng = random.Random(17)
+    nx_graph = nx.gnp_random_graph(60, 0.05, seed=17, directed=True)
+    nx_graph = nx.relabel_nodes(nx_graph, {i: f"c{i}" for i in nx_graph})
+    assert not nx.is_directed_acyclic_graph(nx_graph)
+
+    index = graph.CompactGraphIndex.from_networkx(nx_graph, closure_cache_size=1000)
+    order = list(nx_graph)
+    rng.shuffle(order)
+
+    # Later queries merge the bitmaps of earlier ones instead of re-traversing
+    for node_id in order:
+        assert index.ancestors(node_id) == sorted(nx.ancestors(nx_graph, node_id))
+        assert index.descendants(node_id) == sorted(nx.descendants(nx_graph, node_id))
+
+    info = index.cache_info()
+    assert info['ancestors']['size'] == info['descendants']['size'] == 60
+    misses = info['descendants']['misses']
+    for node_id in order:
+        assert index.descendants(node_id) == sorted(nx.descendants(nx_graph, node_id))
+    assert index.cache_info()['descendants']['misses'] == misses
+    assert index.cache_info()['descendants']['hits'] >= 60
+
+    # A bounded cache evicts but still answers correctly
+    small = graph.CompactGraphIndex.from_networkx(nx_graph, closure_cache_size=4)
+    for node_id in order:
+        assert small.descendants(node_id) == sorted(nx.descendants(nx_graph, node_id))
+    assert small.cache_info()['descendants']['size'] == 4
+
+
+def random_dag_engine(node_count, edge_count, seed, **options):
+    rng = random.Random(seed)
+    edges = set()
+    while len(edges) < edge_count:
+        edges.add(tuple(sorted(rng.sample(range(node_count), 2))))
+
+    engine = graph.DependencyGraphEngine(**options)
+    engine.build_graph(
+        [{"id": f"c{i}", "name": f"c{i}", "subject_id": "math"} for i in range(node_count)],
+        [{"source": f"c{a}", "target": f"c{b}"} for a, b in sorted(edges)]
+    )
+    return engine
+
+
+def test_cached_centrality_matches_networkx_and_invalidates():
+    engine = random_dag_engine(30, 60, seed=7)
+    assert engine.get_centrality_status() == 'exact'
+
+    centrality = engine.get_centrality()
+    assert centrality == pytest.approx(nx.betweenness_centrality(engine.get_graph()))
+    assert engine.get_centrality() is centrality
+
+    engine.add_edge("c0", "c29")
+    assert engine.get_centrality_status() == 'stale'
+    assert engine.get_centrality() == pytest.approx(
+        nx.betweenness_centrality(engine.get_graph())
+    )
+    assert engine.get_centrality_status() == 'exact'
+
+
+def test_sampled_centrality_stays_within_error_bound():
+    engine = random_dag_engine(
+        400, 1200, seed=9, centrality_error=0.2, centrality_exact_limit=50
+    )
+    assert engine._centrality_sample_size(400) is not None
+    assert engine.get_centrality_status() == 'approximate'
+
+    exact = nx.betweenness_centrality(engine.get_graph())
+    sampled = engine.get_centrality()
+    assert max(abs(sampled[node_id] - exact[node_id]) for node_id in exact) <= 0.2
+
+
+def test_background_centrality_serves_last_result_until_ready():
+    engine = random_dag_engine(30, 60, seed=13, background_centrality=True)
+    assert engine.wait_for_centrality(timeout=30)
+    assert engine.get_centrality_status() == 'exact'
+
+    first = engine.get_centrality(wait=False)
+    engine.add_edge("c0", "c29")
+    assert engine.get_centrality(wait=False) is first
+    assert engine.wait_for_centrality(timeout=30)
+    assert engine.get_centrality(wait=False) == pytest.approx(
+        nx.betweenness_centrality(engine.get_graph())
+    )
+
+
+RELATIONSHIP_TYPES = [
+    graph.RelationshipType.PREREQUISITE,
+    graph.RelationshipType.BUILDS_ON,
+    graph.RelationshipType.RELATED_TO,
+]
+
+
+def assert_edge_index_consistent(engine):
+    keys = set(engine._edges)
+    assert all(
+        (edge.source_id, edge.target_id, edge.relationship_type) == key
+        for key, edge in engine._edges.items()
+    )
+    assert {(source, target) for source, target, _ in keys} == set(engine.get_graph().edges())
+    assert set().union(*engine._out_edges.values()) == keys
+    assert set().union(*engine._in_edges.values()) == keys
+    for node_id, out_keys in engine._out_edges.items():
+        assert all(key[0] == node_id for key in out_keys)
+    for node_id, in_keys in engine._in_edges.items():
+        assert all(key[1] == node_id for key in in_keys)
+
+
+def test_edge_index_tracks_random_changesets():
+    rng = random.Random(21)
+    engine = make_engine(20)
+    node_ids = [f"c{i}" for i in range(20)]
+    expected = set()
+
+    for _ in range(150):
+        changeset = graph.GraphChangeset()
+        removed_nodes = set()
+        for _ in range(rng.randint(0, 2)):
+            node_id = rng.choice(node_ids)
+            if rng.random() < 0.5:
+                changeset.upserted_nodes.append(make_node(node_id))
+            else:
+                changeset.removed_node_ids.append(node_id)
+                removed_nodes.add(node_id)
+        for _ in range(rng.randint(0, 5)):
+            source, target = rng.sample(node_ids, 2)
+            changeset.added_edges.append(graph.GraphEdge(
+                source_id=source, target_id=target, relationship_type=rng.choice(RELATIONSHIP_TYPES)
+            ))
+        for _ in range(rng.randint(0, 3)):
+            source, target = rng.sample(node_ids, 2)
+            changeset.removed_edges.append((source, target, rng.choice(RELATIONSHIP_TYPES + [None])))
+
+        # Mirror the changeset's documented order on a plain set of keys
+        present = set(engine._nodes) | {node.id for node in changeset.upserted_nodes}
+        present -= removed_nodes
+        expected = {key for key in expected if key[0] in present and key[1] in present}
+        for edge in changeset.added_edges:
+            if edge.source_id in present and edge.target_id in present:
+                expected.add((edge.source_id, edge.target_id, edge.relationship_type))
+        for source, target, rel_type in changeset.removed_edges:
+            expected = {
+                key for key in expected
+                if not (key[:2] == (source, target) and rel_type in (None, key[2]))
+            }
+
+        engine.apply_changeset(changeset)
+        for node_id in removed_nodes - {node.id for node in changeset.upserted_nodes}:
+            engine.add_node(make_node(node_id))
+
+        assert set(engine._edges) == expected
+        assert_edge_index_consistent(engine)
+
+
+def test_direct_prerequisites_filter_by_relationship_type():
+    engine = make_engine(4)
+    engine.add_edge("c0", "c3", graph.RelationshipType.PREREQUISITE)
+    engine.add_edge("c1", "c3", graph.RelationshipType.BUILDS_ON)
+    engine.add_edge("c2", "c3", graph.RelationshipType.PREREQUISITE)
+    engine.add_edge("c2", "c3", graph.RelationshipType.RELATED_TO)
+
+    def direct(*types):
+        return sorted(engine.get_prerequisites("c3", recursive=False, relationship_types=list(types)))
+
+    assert direct(graph.RelationshipType.PREREQUISITE) == ["c0", "c2"]
+    assert direct(graph.RelationshipType.BUILDS_ON) == ["c1"]
+    assert direct(graph.RelationshipType.RELATED_TO, graph.RelationshipType.BUILDS_ON) == ["c1", "c2"]
+    assert direct() == ["c0", "c1", "c2"]
+
+    # Removing one type keeps the pair linked through the other
+    engine.remove_edge("c2", "c3", graph.RelationshipType.PREREQUISITE)
+    assert direct(graph.RelationshipType.PREREQUISITE) == ["c0"]
+    assert direct(graph.RelationshipType.RELATED_TO) == ["c2"]
+    assert engine.get_graph().has_edge("c2", "c3")
+
+    engine.remove_edge("c2", "c3")
+    assert not engine.get_graph().has_edge("c2", "c3")
+    assert_edge_index_consistent(engine)
@@ -0,0 +1,127 @@
+"""
+Tests for the columnar EngagementSeries used by the LXP analytics service.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tests.module_loader import load_module
+
+analytics = load_module(
+    "visualverse_lxp_analytics", "services/lxp/services/analytics/analytics_service.py"
+)
+
+START = datetime(2024, 1, 1)
+
+
+def random_events(seed, count):
+    rng = random.Random(seed)
+    return [
+        (
+            f"content-{rng.randrange(8)}",
+            rng.random(),
+            rng.randrange(30, 3600),
+            START + timedelta(minutes=rng.randrange(0, 180 * 24 * 60))
+        )
+        for _ in range(count)
+    ]
+
+
+def assert_sorted_columns(series, events):
+    ordered = sorted(events, key=lambda event: event[3])
+    assert series.times.tolist() == [
+        analytics._to_microseconds(event[3]) for event in ordered
+    ]
+    assert sorted(zip(series.times.tolist(), series.scores.tolist())) == sorted(
+        (analytics._to_microseconds(event[3]), event[1]) for event in events
+    )
+
+
+def test_append_earlier_than_flushed_maximum_keeps_columns_sorted():
+    series = analytics.EngagementSeries()
+    events = [
+        ("a", 0.1, 60, START + timedelta(days=10)),
+        ("b", 0.2, 60, START + timedelta(days=5)),
+    ]
+    for event in events:
+        series.append(*event)
+    assert_sorted_columns(series, events)
+
+    # Later than the last append, but earlier than the flushed maximum
+    event = ("c", 0.3, 60, START + timedelta(days=7))
+    series.append(*event)
+    events.append(event)
+    assert_sorted_columns(series, events)
+    assert series.content_ids == ["b", "c", "a"]
+
+
+def test_interleaved_appends_and_queries_stay_sorted():
+    series = analytics.EngagementSeries()
+    events = []
+    for i, event in enumerate(random_events(seed=1, count=500)):
+        series.append(*event)
+        events.append(event)
+        if i % 37 == 0:
+            assert_sorted_columns(series, events)
+    assert_sorted_columns(series, events)
+    assert len(series) == 500
+
+
+def test_window_queries_match_brute_force():
+    events = random_events(seed=2, count=800)
+    series = analytics.EngagementSeries()
+    for event in events:
+        series.append(*event)
+
+    for days in (0, 30, 95, 179, 400):
+        cutoff = START + timedelta(days=days, hours=5)
+        window = [event for event in events if event[3] >= cutoff]
+        scores = [event[1] for event in window]
+
+        score_sum, count = series.totals_since(cutoff)
+        assert count == len(window)
+        assert score_sum == pytest.approx(sum(scores))
+        assert series.mean_score_since(cutoff) == pytest.approx(
+            sum(scores) / len(scores) if scores else 0.0
+        )
+
+        hourly = {}
+        for event in window:
+            hourly.setdefault(event[3].hour, []).append(event[1])
+        assert series.hourly_means_since(cutoff) == pytest.approx(
+            {hour: sum(values) / len(values) for hour, values in hourly.items()}
+        )
+
+
+@pytest.mark.parametrize("granularity", [
+    analytics.TimeGranularity.DAILY,
+    analytics.TimeGranularity.WEEKLY,
+    analytics.TimeGranularity.MONTHLY
+])
+def test_trend_matches_brute_force(granularity):
+    events = random_events(seed=3, count=600)
+    series = analytics.EngagementSeries()
+    for event in events[:300]:
+        series.append(*event)
+    series.rollup(granularity)
+    for event in events[300:]:
+        series.append(*event)
+
+    cutoff = START + timedelta(days=41, hours=13)
+    periods = {}
+    for event in events:
+        if event[3] >= cutoff:
+            key = analytics.EngagementSeries._period_key(event[3], granularity)
+            periods.setdefault(key, []).append(event[1])
+
+    expected = [
+        (analytics.EngagementSeries._key_start(key, granularity), sum(values) / len(values))
+        for key, values in sorted(periods.items())
+    ]
+    trend = series.trend_since(cutoff, granularity)
+    assert [period for period, _ in trend] == [period for period, _ in expected]
+    assert [mean for _, mean in trend] == pytest.approx([mean for _, mean in expected])
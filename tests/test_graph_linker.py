@@ -0,0 +1,128 @@
+"""
+Tests for candidate generation in InterdisciplinaryLinker.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("networkx")
+
+from tests.module_loader import load_module
+
+graph = load_module(
+    "visualverse_graph", "open-source/engine/content-metadata/services/graph", package=True
+)
+
+SUBJECTS = ["mathematics", "physics", "chemistry", "computer_science"]
+WORDS = [
+    "calculus", "functions", "vectors", "energy", "forces", "logic",
+    "algorithms", "rate", "equations", "motion", "derivatives", "recursion"
+]
+
+
+def random_node(rng, node_id):
+    return graph.GraphNode(
+        id=node_id,
+        name=" ".join(rng.sample(WORDS, rng.randint(1, 3))),
+        subject_id=rng.choice(SUBJECTS),
+        difficulty_level="intermediate",
+        concept_type="theoretical",
+        duration_minutes=30,
+        tags=rng.sample(["core", "applied", "modeling", "proof"], rng.randint(0, 2)),
+        metadata={"keywords": rng.sample(WORDS, rng.randint(0, 2))}
+    )
+
+
+def make_engine(rng, node_count):
+    engine = graph.DependencyGraphEngine()
+    engine.build_graph([], [])
+    for i in range(node_count):
+        engine.add_node(random_node(rng, f"c{i}"))
+    return engine
+
+
+def link_keys(links):
+    return [(link.source_concept_id, link.target_concept_id, link.strength) for link in links]
+
+
+def brute_force_links(linker, concept_id, min_strength):
+    """Score every concept in every other subject, as before the term index"""
+    source = linker.graph.get_node(concept_id)
+    links = []
+    for subject_id in SUBJECTS:
+        if subject_id == source.subject_id:
+            continue
+        for target in linker.graph.get_concepts_by_subject(subject_id):
+            link = linker._assess_transferability(source, target, source.subject_id, subject_id)
+            if link.strength >= min_strength:
+                links.append(link)
+    links.sort(key=lambda x: x.strength, reverse=True)
+    return links
+
+
+def test_indexed_candidates_match_brute_force():
+    rng = random.Random(17)
+    engine = make_engine(rng, 60)
+    linker = graph.InterdisciplinaryLinker(engine)
+
+    for concept_id in sorted(engine._nodes):
+        for min_strength in (0.1, 0.3, 0.5):
+            assert sorted(link_keys(linker.find_transferable_concepts(concept_id, min_strength=min_strength))) == \
+                sorted(link_keys(brute_force_links(linker, concept_id, min_strength)))
+
+
+def test_term_index_is_updated_in_place_on_node_changes():
+    rng = random.Random(23)
+    engine = make_engine(rng, 40)
+    linker = graph.InterdisciplinaryLinker(engine)
+    index = linker._get_term_index()
+
+    for step in range(60):
+        node_id = f"c{rng.randrange(50)}"
+        if rng.random() < 0.3 and engine.get_node(node_id):
+            engine.remove_node(node_id)
+        else:
+            engine.add_node(random_node(rng, node_id))
+        engine.add_edge(f"c{rng.randrange(50)}", f"c{rng.randrange(50)}")
+
+        # Mutations patch the existing index rather than discarding it
+        assert linker._get_term_index() is index
+
+    rebuilt = graph.InterdisciplinaryLinker(engine)._get_term_index()
+    assert index._terms == rebuilt._terms
+    assert index._subjects == rebuilt._subjects
+    assert index._postings == rebuilt._postings
+    assert index._phrase_matches == rebuilt._phrase_matches
+
+    for concept_id in sorted(engine._nodes):
+        assert sorted(link_keys(linker.find_transferable_concepts(concept_id))) == \
+            sorted(link_keys(brute_force_links(linker, concept_id, 0.3)))
+
+
+def test_bulk_reload_rebuilds_the_term_index():
+    rng = random.Random(29)
+    engine = make_engine(rng, 20)
+    linker = graph.InterdisciplinaryLinker(engine)
+    linker._get_term_index()
+
+    engine.build_graph([{"id": "solo", "name": "vectors", "subject_id": "physics"}], [])
+    assert linker._term_index is None
+    assert set(linker._get_term_index()._terms) == {"solo"}
+
+
+def test_parallel_refresh_matches_serial_refresh():
+    rng = random.Random(23)
+    engine = make_engine(rng, 80)
+
+    serial = graph.InterdisciplinaryLinker(engine)
+    parallel = graph.InterdisciplinaryLinker(engine)
+    assert parallel.refresh_cache(workers=3) == serial.refresh_cache()
+    assert serial._cached_links
+    assert parallel._cached_links == serial._cached_links
+
+    subset = [f"c{i}" for i in range(0, 80, 7)]
+    serial.clear_cache()
+    parallel.clear_cache()
+    assert parallel.refresh_cache(subset, workers=2) == serial.refresh_cache(subset)
+    assert parallel._cached_links == serial._cached_links
@@ -0,0 +1,171 @@
+"""
+Tests for columnar graph snapshots, delta logs and the graph refresh task.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("networkx")
+
+from tests.module_loader import load_module, load_namespace
+
+CONTENT_METADATA = "open-source/engine/content-metadata"
+
+# graph_refresh imports ``services.graph``; the services package __init__
+# pulls in the database-backed services, which these tests do not need
+load_namespace("services", f"{CONTENT_METADATA}/services")
+graph = load_module("services.graph", f"{CONTENT_METADATA}/services/graph", package=True)
+graph_refresh = load_module("visualverse_graph_refresh", f"{CONTENT_METADATA}/tasks/graph_refresh.py")
+
+
+def make_node(node_id, subject_id="math"):
+    return graph.GraphNode(
+        id=node_id,
+        name=node_id,
+        subject_id=subject_id,
+        difficulty_level="beginner",
+        concept_type="theoretical",
+        duration_minutes=30
+    )
+
+
+def edge_set(engine):
+    return {
+        (edge.source_id, edge.target_id, edge.relationship_type, edge.strength)
+        for edge in engine._edges.values()
+    }
+
+
+def random_changeset(rng, node_ids):
+    changeset = graph.GraphChangeset()
+    for _ in range(rng.randint(1, 3)):
+        node_id = f"c{rng.randrange(40)}"
+        changeset.upserted_nodes.append(make_node(node_id, rng.choice(["math", "physics"])))
+        node_ids.add(node_id)
+    if rng.random() < 0.3 and node_ids:
+        removed = rng.choice(sorted(node_ids))
+        changeset.removed_node_ids.append(removed)
+        node_ids.discard(removed)
+    for _ in range(rng.randint(0, 4)):
+        if len(node_ids) > 1:
+            source, target = rng.sample(sorted(node_ids), 2)
+            changeset.added_edges.append(graph.GraphEdge(
+                source_id=source,
+                target_id=target,
+                relationship_type=rng.choice(list(graph.RelationshipType)),
+                strength=rng.choice([0.5, 1.0])
+            ))
+    return changeset
+
+
+def test_snapshot_plus_deltas_matches_engine(tmp_path):
+    rng = random.Random(11)
+    engine = graph.DependencyGraphEngine()
+    engine.build_graph(
+        [{"id": f"c{i}", "name": f"c{i}", "subject_id": "math"} for i in range(20)],
+        [{"source": f"c{i}", "target": f"c{i + 1}"} for i in range(19)]
+    )
+    snapshot_path = str(tmp_path / "graph.vvgs")
+    delta_path = str(tmp_path / "graph.delta")
+    graph.write_snapshot(engine, snapshot_path)
+
+    node_ids = {f"c{i}" for i in range(20)}
+    for i in range(8):
+        changeset = random_changeset(rng, node_ids)
+        if i % 3 == 2:
+            source, target, rel_type = next(iter(engine._edges))
+            changeset.removed_edges.append((source, target, rel_type))
+        engine.apply_changeset(changeset)
+        graph.append_delta(delta_path, changeset, f"v{i}")
+
+    with graph.GraphSnapshotReader(snapshot_path, delta_path) as reader:
+        assert reader.delta_count == 8
+        assert reader.materialization_version == "v7"
+
+        for node_id in sorted(node_ids | {f"c{i}" for i in range(40)}):
+            assert reader.has_node(node_id) == (engine.get_node(node_id) is not None)
+            if engine.get_node(node_id) is not None:
+                assert reader.get_node(node_id) == engine.get_node(node_id)
+                assert reader.get_prerequisites(node_id) == engine.get_prerequisites(node_id)
+                assert reader.get_postrequisites(node_id) == engine.get_postrequisites(node_id)
+
+        restored = reader.to_engine()
+
+    assert {node.id: node for node in restored.get_all_nodes()} == \
+        {node.id: node for node in engine.get_all_nodes()}
+    assert edge_set(restored) == edge_set(engine)
+    assert restored.get_all_concept_depths() == engine.get_all_concept_depths()
+
+
+def make_task(tmp_path, max_delta_count=3):
+    return graph_refresh.GraphRefreshTask(
+        storage_path=str(tmp_path), version="v1", max_delta_count=max_delta_count
+    )
+
+
+def test_status_is_served_from_snapshot_metadata(tmp_path):
+    concepts, relationships = graph_refresh.get_sample_data()
+    make_task(tmp_path).run_full_refresh(concepts, relationships)
+
+    task = make_task(tmp_path)
+
+    def fail_load():
+        raise AssertionError("get_status loaded the graph")
+
+    task._load_latest_snapshot = fail_load
+    status = task.get_status()
+
+    reference = make_task(tmp_path)
+    reference.graph.build_graph(concepts, relationships)
+    stats = reference.graph.get_stats()
+
+    assert status['status'] == 'loaded'
+    assert status['node_count'] == stats.node_count
+    assert status['edge_count'] == stats.edge_count
+    assert status['subject_counts'] == stats.subject_counts
+    assert status['difficulty_distribution'] == stats.difficulty_distribution
+    assert status['cycles_detected'] == stats.cycle_count
+    assert status['isolated_nodes_count'] == len(stats.isolated_nodes)
+    assert status['last_refreshed'] is not None
+    assert status['pending_deltas'] == 0
+
+
+def test_status_tracks_deltas_and_compaction(tmp_path):
+    concepts, relationships = graph_refresh.get_sample_data()
+    make_task(tmp_path).run_full_refresh(concepts, relationships)
+
+    for i in range(3):
+        make_task(tmp_path).run_incremental_refresh(new_concepts=[
+            {"id": f"extra_{i}", "name": f"Extra {i}", "subject_id": "extra"}
+        ])
+        status = make_task(tmp_path).get_status()
+        assert status['pending_deltas'] == i + 1
+        assert status['node_count'] == len(concepts) + i + 1
+        assert status['subject_counts']['extra'] == i + 1
+
+    # The log holds max_delta_count entries, so the next refresh compacts it
+    make_task(tmp_path).run_incremental_refresh(new_concepts=[
+        {"id": "extra_3", "name": "Extra 3", "subject_id": "extra"}
+    ])
+    status = make_task(tmp_path).get_status()
+    assert status['pending_deltas'] == 0
+    assert status['node_count'] == len(concepts) + 4
+
+
+def test_incremental_summary_counts_cyclic_components(tmp_path):
+    concepts = [{"id": f"c{i}", "name": f"c{i}", "subject_id": "math"} for i in range(6)]
+    make_task(tmp_path).run_full_refresh(concepts, [])
+
+    # Two separate cycles, one of them closed by two edges
+    summary = make_task(tmp_path).run_incremental_refresh(new_relationships=[
+        {"source": "c0", "target": "c1"},
+        {"source": "c1", "target": "c0"},
+        {"source": "c2", "target": "c3"},
+        {"source": "c3", "target": "c4"},
+        {"source": "c4", "target": "c2"},
+        {"source": "c4", "target": "c3"},
+    ])
+
+    assert summary['cycles_detected'] == 2
+    assert make_task(tmp_path).get_status()['cycles_detected'] == 2
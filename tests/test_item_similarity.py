@@ -0,0 +1,106 @@
+"""
+Tests for incremental item-item Pearson similarities in the LXP
+CollaborativeFilteringEngine.
+"""
+
+import math
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from tests.module_loader import load_module
+
+recommendation = load_module(
+    "visualverse_lxp_recommendation",
+    "services/lxp/services/recommendation/recommendation_service.py"
+)
+
+# Correlations this close to zero may round either way between the paths
+EPSILON = 1e-9
+
+
+def brute_force_row(ratings, item_order, content_id):
+    """Positive Pearson similarities over common raters"""
+    raters = {learner: items[content_id] for learner, items in ratings.items() if content_id in items}
+    row = []
+    for other in item_order:
+        if other == content_id:
+            continue
+        common = [learner for learner in raters if other in ratings[learner]]
+        if len(common) < 2:
+            continue
+        x = [raters[learner] for learner in common]
+        y = [ratings[learner][other] for learner in common]
+        mean_x, mean_y = sum(x) / len(x), sum(y) / len(y)
+        covariance = sum((a - mean_x) * (b - mean_y) for a, b in zip(x, y))
+        variance_x = sum((a - mean_x) ** 2 for a in x)
+        variance_y = sum((b - mean_y) ** 2 for b in y)
+        if variance_x == 0 or variance_y == 0:
+            continue
+        similarity = covariance / math.sqrt(variance_x * variance_y)
+        if similarity > EPSILON:
+            row.append((other, similarity))
+    return row
+
+
+def significant(row):
+    return [(item_id, similarity) for item_id, similarity in row if similarity > EPSILON]
+
+
+def assert_rows_equal(actual, expected):
+    """Same items and similarities; order is only checked by value, since equal
+    correlations can differ in the last bit between the two computations"""
+    actual = significant(actual)
+    similarities = [similarity for _, similarity in actual]
+    assert similarities == sorted(similarities, reverse=True)
+    assert dict(actual) == pytest.approx(dict(expected), abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_similarities_match_brute_force(seed):
+    rng = random.Random(seed)
+    engine = recommendation.CollaborativeFilteringEngine(refresh_block_size=4)
+    learners = [f"l{i}" for i in range(15)]
+    items = [f"c{i}" for i in range(12)]
+    ratings = {}
+    item_order = []
+
+    for step in range(300):
+        learner = rng.choice(learners)
+        if ratings.get(learner) and rng.random() < 0.3:
+            # Update an existing rating
+            content_id = rng.choice(sorted(ratings[learner]))
+        else:
+            content_id = rng.choice(items)
+        rating = rng.choice([1.0, 1.5, 2.0, 3.0, 3.5, 4.0, 5.0])
+        engine.record_interaction(learner, content_id, rating)
+        ratings.setdefault(learner, {})[content_id] = rating
+        if content_id not in item_order:
+            item_order.append(content_id)
+
+        if step % 7 == 0:
+            # On-demand recompute of one (possibly stale) row
+            probe = rng.choice(item_order)
+            assert_rows_equal(
+                engine.get_similar_items(probe, top_k=len(items)),
+                brute_force_row(ratings, item_order, probe)
+            )
+
+        if step % 25 == 24:
+            # Batch refresh of every stale row, without going through get_similar_items
+            engine.refresh_similarities(full=step % 50 == 49)
+            assert not engine._stale_items
+            for content_id in item_order:
+                assert_rows_equal(
+                    engine.item_similarity_rows.get(content_id, []),
+                    brute_force_row(ratings, item_order, content_id)
+                )
+
+    for content_id in item_order:
+        assert_rows_equal(
+            engine.get_similar_items(content_id, top_k=len(items)),
+            brute_force_row(ratings, item_order, content_id)
+        )
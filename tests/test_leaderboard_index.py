@@ -0,0 +1,133 @@
+"""
+Tests for the order-statistic skip list behind engagement leaderboards.
+"""
+
+import random
+
+from tests.module_loader import load_module, load_namespace
+
+load_namespace("visualverse_lxp_engagement", "services/lxp/services/engagement")
+leaderboard_index = load_module(
+    "visualverse_lxp_engagement.leaderboard_index",
+    "services/lxp/services/engagement/leaderboard_index.py"
+)
+engagement = load_module(
+    "visualverse_lxp_engagement.engagement_service",
+    "services/lxp/services/engagement/engagement_service.py"
+)
+
+
+def expected_ranking(scores, orders):
+    """Stable descending sort by score, ties in join order."""
+    return sorted(scores, key=lambda learner_id: (-scores[learner_id], orders[learner_id]))
+
+
+def assert_widths_consistent(index):
+    """Every forward pointer's width equals the level-0 steps it skips."""
+    positions = {}
+    node, position = index._head, 0
+    while node is not None:
+        positions[id(node)] = position
+        node, position = node.forward[0], position + 1
+
+    node = index._head
+    while node is not None:
+        for level in range(min(len(node.forward), index._level)):
+            target = node.forward[level]
+            if target is not None:
+                assert node.width[level] == positions[id(target)] - positions[id(node)]
+        node = node.forward[0]
+
+
+def test_ranks_match_a_sorted_list_under_random_updates():
+    rng = random.Random(1)
+    index = leaderboard_index.LeaderboardIndex(seed=1)
+    scores, orders = {}, {}
+
+    for step in range(2000):
+        learner_id = f"l{rng.randrange(150)}"
+        score = rng.choice([0, rng.randrange(1, 40), rng.randrange(1, 5000)])
+        if learner_id not in index:
+            orders[learner_id] = len(orders)
+            index.add(learner_id, order=orders[learner_id], score=score)
+        else:
+            index.set_score(learner_id, score)
+        scores[learner_id] = score
+
+        if step % 100 == 0:
+            ranking = expected_ranking(scores, orders)
+            assert len(index) == len(ranking)
+            assert [learner_id for learner_id, _ in index.top()] == ranking
+            for rank, learner_id in enumerate(ranking, 1):
+                assert index.rank(learner_id) == rank
+                assert index.score(learner_id) == scores[learner_id]
+            assert_widths_consistent(index)
+
+
+def test_top_pages_through_ranks():
+    index = leaderboard_index.LeaderboardIndex(seed=2)
+    scores, orders = {}, {}
+    for i in range(57):
+        scores[f"l{i}"] = (i * 37) % 11
+        orders[f"l{i}"] = i
+        index.add(f"l{i}", order=i, score=scores[f"l{i}"])
+
+    ranking = [(learner_id, scores[learner_id]) for learner_id in expected_ranking(scores, orders)]
+    for offset in (0, 1, 10, 56, 57, 80):
+        for limit in (None, 0, 1, 10):
+            end = None if limit is None else offset + limit
+            assert index.top(limit, offset) == ranking[offset:end]
+
+
+def test_equal_scores_rank_in_join_order():
+    index = leaderboard_index.LeaderboardIndex(seed=3)
+    for order, learner_id in enumerate(["a", "b", "c"]):
+        index.add(learner_id, order=order, score=10)
+
+    index.set_score("a", 11)
+    index.set_score("a", 10)
+    assert [learner_id for learner_id, _ in index.top()] == ["a", "b", "c"]
+    assert index.rank("c") == 3
+    assert index.rank("missing") is None
+
+
+def test_roll_over_resets_only_scored_learners():
+    index = leaderboard_index.LeaderboardIndex(period="2024-03-14", seed=4)
+    for order in range(20):
+        index.add(f"l{order}", order=order, score=order % 3)
+
+    index.roll_over("2024-03-15")
+    assert index.period == "2024-03-15"
+    assert index.top() == [(f"l{order}", 0) for order in range(20)]
+    assert not index._scored
+    assert_widths_consistent(index)
+
+
+def test_service_ranks_match_total_points():
+    rng = random.Random(5)
+    service = engagement.EngagementService()
+    service.create_leaderboard("all", "All time", "Total points", "points", time_range="all_time")
+    # Uncapped rules only, so every award changes the learner's points
+    service.gamification_rules = {
+        f"rule-{i}": engagement.GamificationRule(
+            rule_id=f"rule-{i}", event_type=event, base_points=5 * (i + 1)
+        )
+        for i, event in enumerate(engagement.GamificationEvent)
+    }
+    events = list(engagement.GamificationEvent)
+
+    learner_ids = [f"learner-{i}" for i in range(40)]
+    for _ in range(300):
+        service.award_points(rng.choice(learner_ids), rng.choice(events))
+
+    scores = {
+        learner_id: gamification.total_points
+        for learner_id, gamification in service.learner_gamification.items()
+    }
+    orders = {learner_id: i for i, learner_id in enumerate(service.learner_gamification)}
+    ranking = expected_ranking(scores, orders)
+
+    leaderboard = service.get_leaderboard("all", limit=10)
+    assert [entry.learner_id for entry in leaderboard.entries] == ranking[:10]
+    for rank, learner_id in enumerate(ranking, 1):
+        assert service.get_learner_rank("all", learner_id).rank == rank
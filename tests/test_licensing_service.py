@@ -0,0 +1,220 @@
+"""
+Tests for the license and revenue share indexes of the licensing service.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from tests.module_loader import load_module, stub_module
+
+# Domain types are only re-exported by the service, not used by these paths
+stub_module(
+    "visualverse.platform.packages.shared_types",
+    User=object, Product=object, Transaction=object, License=object, LicenseType=object
+)
+licensing = load_module(
+    "visualverse_licensing_service", "services/platform/services/licensing/licensing_service.py"
+)
+
+
+@pytest.fixture
+def service(tmp_path):
+    return licensing.LicensingService(storage_dir=str(tmp_path), validation_cache_ttl=60.0)
+
+
+def make_products(service, count, seller_id="creator-1"):
+    return [
+        service.create_product(f"proj-{i}", seller_id, f"Product {i}", price=10.0 + i).id
+        for i in range(count)
+    ]
+
+
+def assert_license_indexes(service):
+    """Both license indexes match a linear scan of the store."""
+    by_pair, by_user = {}, {}
+    for license in service.licenses.values():
+        by_pair.setdefault((license.user_id, license.product_id), []).append(license.id)
+        by_user.setdefault(license.user_id, []).append(license.id)
+
+    assert service._licenses_by_user_product == by_pair
+    assert service._licenses_by_user == by_user
+
+    for user_id in by_user:
+        expected = [
+            license for license in service.licenses.values()
+            if license.user_id == user_id and license.is_active
+        ]
+        assert service.get_user_licenses(user_id) == expected
+
+
+def test_indexes_match_linear_scan_under_grants_and_revokes(service):
+    rng = random.Random(7)
+    users = [f"user-{i}" for i in range(4)]
+    products = make_products(service, 3)
+    past = datetime.utcnow() - timedelta(days=1)
+
+    for _ in range(120):
+        user_id, product_id = rng.choice(users), rng.choice(products)
+        action = rng.random()
+        if action < 0.5:
+            service.issue_license(user_id, product_id)
+        elif action < 0.7:
+            # Already expired, so the next grant issues a second license
+            service.issue_license(user_id, product_id, expires_at=past)
+        else:
+            service.revoke_user_license(user_id, product_id)
+
+        assert_license_indexes(service)
+
+        pair = [
+            license for license in service.licenses.values()
+            if license.user_id == user_id and license.product_id == product_id
+        ]
+        valid, _, license = service.validate_license(user_id, product_id)
+        assert valid == any(license.is_valid() for license in pair)
+        if valid:
+            assert license is next(license for license in pair if license.is_valid())
+
+    service._rebuild_indexes()
+    assert_license_indexes(service)
+
+
+def test_revoke_deactivates_every_license_for_the_pair(service):
+    (product_id,) = make_products(service, 1)
+    exhausted = service.issue_license("user-1", product_id, max_uses=1)
+    exhausted.record_usage()
+    current = service.issue_license("user-1", product_id)
+    other = service.issue_license("user-2", product_id)
+
+    assert current.id != exhausted.id
+    assert service.revoke_user_license("user-1", product_id)
+    assert not exhausted.is_active and not current.is_active
+    assert other.is_active
+    assert service.get_user_licenses("user-1") == []
+    assert not service.revoke_user_license("user-3", product_id)
+
+
+def test_revoke_drops_cached_validation(service):
+    (product_id,) = make_products(service, 1)
+    expired = service.issue_license(
+        "user-1", product_id, expires_at=datetime.utcnow() - timedelta(days=1)
+    )
+    license = service.issue_license("user-1", product_id)
+
+    assert service.validate_license("user-1", product_id) == (True, "License is valid", license)
+    assert ("user-1", product_id) in service._validation_cache
+
+    # Changes made behind the service's back are served from the cache...
+    license.is_active = False
+    assert service.validate_license("user-1", product_id)[0]
+    license.is_active = True
+
+    # ...but a revoke takes effect immediately, for every license of the pair
+    assert service.revoke_user_license("user-1", product_id)
+    valid, reason, found = service.validate_license("user-1", product_id)
+    assert not valid and found is None
+    assert reason == "License is inactive"
+    assert not expired.is_active
+
+    # A new grant replaces the cached rejection
+    renewed = service.issue_license("user-1", product_id)
+    assert service.validate_license("user-1", product_id) == (True, "License is valid", renewed)
+
+
+def test_cache_entries_expire_and_skip_use_limited_licenses(service, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(licensing.time, "monotonic", lambda: clock[0])
+    first, limited = make_products(service, 2)
+
+    license = service.issue_license("user-1", first)
+    assert service.validate_license("user-1", first)[0]
+    license.is_active = False
+    assert service.validate_license("user-1", first)[0]
+
+    clock[0] += service.validation_cache_ttl + 1
+    assert not service.validate_license("user-1", first)[0]
+
+    service.issue_license("user-1", limited, max_uses=3)
+    assert service.validate_license("user-1", limited)[0]
+    assert ("user-1", limited) not in service._validation_cache
+
+
+def linear_earnings(service, creator_id, start_date, end_date):
+    """Earnings totals by scanning every revenue share."""
+    shares = [
+        share for share in service.revenue_shares.values()
+        if share.creator_id == creator_id and start_date <= share.created_at <= end_date
+    ]
+    product_sales = {}
+    for share in shares:
+        product_id = service.transactions[share.transaction_id].product_id
+        product_sales[product_id] = product_sales.get(product_id, 0) + 1
+    return (
+        sum(share.gross_amount for share in shares),
+        sum(share.platform_fee for share in shares),
+        len(shares),
+        product_sales,
+    )
+
+
+def test_earnings_windows_match_linear_scan(service):
+    rng = random.Random(11)
+    creators = ["creator-1", "creator-2"]
+    products = {creator_id: make_products(service, 2, creator_id) for creator_id in creators}
+    base = datetime(2026, 1, 1)
+    dates = [base + timedelta(hours=rng.randrange(0, 24 * 60)) for _ in range(40)]
+
+    # Shares arrive out of date order and with duplicate timestamps
+    for i in range(80):
+        creator_id = rng.choice(creators)
+        transaction = service.create_transaction(
+            f"buyer-{i}", creator_id, rng.choice(products[creator_id]), amount=float(rng.randrange(1, 100))
+        )
+        share = licensing.RevenueShare(
+            id=f"rs-{i}",
+            transaction_id=transaction.id,
+            creator_id=creator_id,
+            gross_amount=transaction.amount,
+            platform_fee=transaction.platform_fee,
+            net_amount=transaction.net_amount,
+            created_at=rng.choice(dates),
+        )
+        service.revenue_shares[share.id] = share
+        service._index_revenue_share(share)
+
+    for creator_id in creators:
+        indexed, _ = service._shares_by_creator[creator_id]
+        assert indexed == sorted(indexed)
+
+    windows = [(min(dates), max(dates)), (max(dates), min(dates))]
+    for _ in range(60):
+        start, end = sorted(rng.sample(dates, 2))
+        windows.append((start, end))
+        windows.append((start + timedelta(minutes=1), end - timedelta(minutes=1)))
+
+    for creator_id in creators + ["creator-unknown"]:
+        for start, end in windows:
+            report = service.get_creator_earnings(creator_id, start, end)
+            gross, fees, count, product_sales = linear_earnings(service, creator_id, start, end)
+            assert report["totalEarnings"] == pytest.approx(gross)
+            assert report["totalFees"] == pytest.approx(fees)
+            assert report["netEarnings"] == pytest.approx(gross - fees)
+            assert report["transactionCount"] == count
+            assert report["productSales"] == product_sales
+
+
+def test_completed_transactions_are_indexed(service):
+    (product_id,) = make_products(service, 1)
+    transaction = service.create_transaction("buyer-1", "creator-1", product_id, amount=20.0)
+    service.complete_transaction(transaction.id)
+
+    report = service.get_creator_earnings("creator-1")
+    assert report["transactionCount"] == 1
+    assert report["totalEarnings"] == pytest.approx(20.0)
+    assert report["productSales"] == {product_id: 1}
+    assert service.validate_license("buyer-1", product_id)[0]
+
+    service.refund_transaction(transaction.id)
+    assert not service.validate_license("buyer-1", product_id)[0]
@@ -0,0 +1,102 @@
+"""
+Tests for the append-only object pack of the version control service.
+"""
+
+import os
+import random
+
+from tests.module_loader import load_module
+
+object_pack = load_module(
+    "visualverse_object_pack", "services/platform/services/version-control/object_pack.py"
+)
+
+
+def random_objects(seed, count):
+    rng = random.Random(seed)
+    kinds = (object_pack.OBJ_BLOB, object_pack.OBJ_TREE, object_pack.OBJ_COMMIT)
+    return {
+        (rng.choice(kinds), f"{i:040x}"): bytes(rng.randrange(256) for _ in range(rng.randrange(0, 400)))
+        for i in range(count)
+    }
+
+
+def assert_contents(pack, objects):
+    for (kind, key), data in objects.items():
+        assert pack.get(kind, key) == data
+    for kind in (object_pack.OBJ_BLOB, object_pack.OBJ_TREE, object_pack.OBJ_COMMIT):
+        expected = [key for (k, key) in objects if k == kind]
+        assert list(pack.keys(kind)) == expected
+        assert pack.count(kind) == len(expected)
+
+
+def test_objects_round_trip_across_reopen(tmp_path):
+    objects = random_objects(seed=1, count=200)
+    pack = object_pack.ObjectPack(str(tmp_path))
+    for (kind, key), data in objects.items():
+        assert pack.put(kind, key, data)
+    assert_contents(pack, objects)
+    pack.close()
+
+    reopened = object_pack.ObjectPack(str(tmp_path))
+    assert_contents(reopened, objects)
+    assert reopened.get(object_pack.OBJ_BLOB, "missing") is None
+    reopened.close()
+
+
+def test_duplicate_objects_are_stored_once(tmp_path):
+    pack = object_pack.ObjectPack(str(tmp_path))
+    assert pack.put(object_pack.OBJ_BLOB, "abc", b"content")
+    size = os.path.getsize(pack.pack_path)
+
+    assert not pack.put(object_pack.OBJ_BLOB, "abc", b"content")
+    assert os.path.getsize(pack.pack_path) == size
+    # Kinds have separate key spaces
+    assert pack.put(object_pack.OBJ_TREE, "abc", b"tree")
+    assert pack.get(object_pack.OBJ_BLOB, "abc") == b"content"
+    pack.close()
+
+
+def test_unindexed_pack_records_are_recovered(tmp_path):
+    objects = random_objects(seed=2, count=50)
+    pack = object_pack.ObjectPack(str(tmp_path))
+    items = list(objects.items())
+    for (kind, key), data in items[:30]:
+        pack.put(kind, key, data)
+    index_size = os.path.getsize(pack.index_path)
+    for (kind, key), data in items[30:]:
+        pack.put(kind, key, data)
+    pack.close()
+
+    # Crash after the pack write, before the index write
+    with open(pack.index_path, "r+b") as f:
+        f.truncate(index_size)
+
+    reopened = object_pack.ObjectPack(str(tmp_path))
+    assert_contents(reopened, objects)
+    reopened.close()
+
+    # The recovered records were indexed again
+    assert_contents(object_pack.ObjectPack(str(tmp_path)), objects)
+
+
+def test_torn_records_are_truncated(tmp_path):
+    objects = random_objects(seed=3, count=20)
+    pack = object_pack.ObjectPack(str(tmp_path))
+    for (kind, key), data in objects.items():
+        pack.put(kind, key, data)
+    pack.close()
+
+    pack_size = os.path.getsize(pack.pack_path)
+    with open(pack.pack_path, "ab") as f:
+        f.write(object_pack._PACK_RECORD.pack(object_pack.OBJ_BLOB, 3, 1000) + b"tor")
+    with open(pack.index_path, "ab") as f:
+        f.write(b"\x01\x05")
+
+    reopened = object_pack.ObjectPack(str(tmp_path))
+    assert_contents(reopened, objects)
+    assert os.path.getsize(pack.pack_path) == pack_size
+
+    assert reopened.put(object_pack.OBJ_BLOB, "after", b"new")
+    reopened.close()
+    assert object_pack.ObjectPack(str(tmp_path)).get(object_pack.OBJ_BLOB, "after") == b"new"
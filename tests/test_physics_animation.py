@@ -0,0 +1,166 @@
+"""
+Tests for vectorized frame buffers and the animation cache in
+PhysicsVerseAnimationService.
+"""
+
+import importlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tests.module_loader import load_namespace
+
+# The package __init__ pulls in every PhysicsVerse service; the animation
+# service only needs physics_core
+load_namespace(
+    "visualverse_physics_verse",
+    "open-source/engine/content-metadata/services/verticals/physics_verse"
+)
+animation = importlib.import_module("visualverse_physics_verse.physics_animation_service")
+
+WAVE_CONFIG = dict(duration=2.0, fps=15, particle_count=9, phase=0.4, amplitude=0.7)
+CIRCUIT_CONFIG = dict(duration=3.0, fps=10)
+
+CASES = {
+    "wave": lambda service: service.create_wave_animation(
+        1.0, 2.0, 1.5, animation.WaveAnimationConfig(**WAVE_CONFIG)
+    ),
+    "standing_wave": lambda service: service.create_standing_wave_animation(
+        1.2, 2.0, 0.5, [0.0, 1.0, 2.0], [0.5, 1.5], animation.WaveAnimationConfig(**WAVE_CONFIG)
+    ),
+    "rc_charging": lambda service: service.create_rc_charging_animation(
+        9.0, 100.0, 0.004, animation.CircuitAnimationConfig(**CIRCUIT_CONFIG)
+    ),
+    "rl_circuit": lambda service: service.create_rl_circuit_animation(
+        12.0, 4.0, 2.0, animation.CircuitAnimationConfig(**CIRCUIT_CONFIG)
+    ),
+}
+
+
+def approx_vectors(vectors):
+    return {
+        key: pytest.approx(vector, rel=1e-5, abs=1e-5)
+        for key, vector in vectors.items()
+    }
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_vectorized_frames_match_scalar_fallback(case, monkeypatch):
+    buffered = CASES[case](animation.PhysicsVerseAnimationService())
+    monkeypatch.setattr(animation, "NUMPY_AVAILABLE", False)
+    scalar = CASES[case](animation.PhysicsVerseAnimationService())
+
+    assert isinstance(buffered.frames, animation.FrameBuffer)
+    assert isinstance(scalar.frames, list)
+    assert buffered.total_frames == scalar.total_frames == len(buffered.frames) == len(scalar.frames)
+
+    service = animation.PhysicsVerseAnimationService()
+    expected = service.export_frames_to_dict(scalar)
+    exported = service.export_frames_to_dict(buffered)
+    materialized = [
+        {
+            "frame_number": frame.frame_number,
+            "timestamp": frame.timestamp,
+            "metadata": frame.metadata,
+            "positions": {k: v.to_dict() for k, v in frame.state.positions.items()},
+            "velocities": {k: v.to_dict() for k, v in frame.state.velocities.items()},
+            "trail": [],
+            **({"additional_properties": frame.state.additional_properties}
+               if frame.state.additional_properties else {})
+        }
+        for frame in buffered.frames
+    ]
+
+    for actual_frames in (exported, materialized):
+        assert len(actual_frames) == len(expected)
+        for actual, reference in zip(actual_frames, expected):
+            assert actual["frame_number"] == reference["frame_number"]
+            assert actual["timestamp"] == pytest.approx(reference["timestamp"])
+            assert actual["metadata"] == reference["metadata"]
+            assert actual["trail"] == reference["trail"]
+            assert actual["positions"] == approx_vectors(reference["positions"])
+            assert actual["velocities"] == approx_vectors(reference["velocities"])
+            assert actual.get("additional_properties") == pytest.approx(
+                reference.get("additional_properties")
+            )
+
+    # Negative indices and slices materialize the same frames
+    assert buffered.frames[-1].frame_number == len(buffered.frames) - 1
+    assert [frame.frame_number for frame in buffered.frames[1:4]] == [1, 2, 3]
+    with pytest.raises(IndexError):
+        buffered.frames[len(buffered.frames)]
+
+
+def make_animation(animation_id, frames):
+    return animation.PhysicsAnimation(
+        animation_id=animation_id,
+        animation_type=animation.AnimationType.CIRCUIT_TRANSIENT,
+        total_frames=len(frames),
+        frames=frames
+    )
+
+
+def buffer_of(num_frames):
+    return animation.FrameBuffer(np.zeros(num_frames), properties={"current": np.zeros(num_frames)})
+
+
+def test_cache_evicts_least_recently_used_by_count():
+    cache = animation.AnimationCache(maxsize=3, max_bytes=1 << 30)
+    for name in "abc":
+        cache.put(make_animation(name, buffer_of(10)))
+
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put(make_animation("d", buffer_of(10)))
+
+    assert cache.keys() == ["c", "a", "d"]
+    assert "b" not in cache
+    assert cache.info()['evictions'] == 1
+
+    # Replacing an entry does not evict anything
+    cache.put(make_animation("c", buffer_of(10)))
+    assert cache.keys() == ["a", "d", "c"]
+    assert cache.info()['evictions'] == 1
+
+
+def test_cache_evicts_by_bytes_but_keeps_the_newest_entry():
+    entry_bytes = buffer_of(100).nbytes
+    cache = animation.AnimationCache(maxsize=100, max_bytes=3 * entry_bytes)
+    for name in "abcd":
+        cache.put(make_animation(name, buffer_of(100)))
+
+    assert cache.keys() == ["b", "c", "d"]
+    assert cache.info()['bytes'] == 3 * entry_bytes
+
+    # A replacement's size replaces the old size in the running total
+    cache.put(make_animation("c", buffer_of(10)))
+    assert cache.info()['bytes'] == 2 * entry_bytes + buffer_of(10).nbytes
+
+    # An entry over the byte limit by itself is still kept
+    cache.put(make_animation("huge", buffer_of(1000)))
+    assert cache.keys() == ["huge"]
+    assert cache.info()['bytes'] == buffer_of(1000).nbytes
+
+    # Object frames are estimated per stored vector
+    scalar = make_animation("scalar", [
+        animation.AnimationFrame(frame_number=0, timestamp=0.0, state=animation.PhysicsState(
+            time=0.0, positions={"p": animation.Vector2D(0, 0)}
+        ))
+    ])
+    assert animation.AnimationCache.estimate_bytes(scalar) == 2 * animation.OBJECT_VECTOR_BYTES
+
+
+def test_configure_resizes_the_cache():
+    service = animation.PhysicsVerseAnimationService({"max_cached_animations": 4})
+    ids = [f"anim_{i}" for i in range(5)]
+    for animation_id in ids:
+        service._animations.put(make_animation(animation_id, buffer_of(50)))
+    assert service.list_animations() == ids[1:]
+
+    service.configure({"max_cached_animations": 2})
+    assert service.list_animations() == ids[3:]
+
+    service.configure({"max_animation_cache_bytes": buffer_of(50).nbytes})
+    assert service.list_animations() == ids[4:]
+    assert service._animations.info()['maxsize'] == 2
+    assert service.get_animation_info("anim_3") is None
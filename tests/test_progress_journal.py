@@ -0,0 +1,136 @@
+"""
+Tests for the sharded progress journal: replay, compaction and recovery.
+"""
+
+import os
+import random
+
+from tests.module_loader import load_module
+
+journal_module = load_module(
+    "visualverse_progress_journal", "services/lxp/services/progress/progress_journal.py"
+)
+
+
+def open_journal(directory, num_shards=4):
+    return journal_module.ProgressJournal(str(directory), num_shards=num_shards)
+
+
+def record(user_id, value):
+    return {"type": "progress", "data": {"userId": user_id, "value": value}}
+
+
+def replay(journal):
+    """Rebuild user -> values from snapshots plus journals, as the service does."""
+    state = {}
+    for snapshot, records in journal.load():
+        for user_id, values in (snapshot or {}).items():
+            state[user_id] = list(values)
+        for entry in records:
+            state.setdefault(entry["data"]["userId"], []).append(entry["data"]["value"])
+    return state
+
+
+def compact(journal, shard, state):
+    generation = journal.rotate(shard)
+    journal.write_snapshot(shard, generation, {
+        user_id: values for user_id, values in state.items()
+        if journal.shard_for(user_id) == shard
+    })
+
+
+def test_records_replay_per_shard_in_append_order(tmp_path):
+    journal = open_journal(tmp_path)
+    rng = random.Random(1)
+    expected = {}
+    for value in range(200):
+        user_id = f"user-{rng.randrange(10)}"
+        shard = journal.append(user_id, record(user_id, value))
+        assert shard == journal.shard_for(user_id)
+        expected.setdefault(user_id, []).append(value)
+    journal.close()
+
+    reopened = open_journal(tmp_path)
+    assert replay(reopened) == expected
+    assert sum(reopened.record_count(s) for s in range(reopened.num_shards)) == 200
+
+
+def test_replay_after_compaction_skips_covered_journals(tmp_path):
+    journal = open_journal(tmp_path)
+    expected = {}
+    for value in range(60):
+        user_id = f"user-{value % 7}"
+        journal.append(user_id, record(user_id, value))
+        expected.setdefault(user_id, []).append(value)
+
+    for shard in range(journal.num_shards):
+        compact(journal, shard, expected)
+        assert journal.record_count(shard) == 0
+        shard_dir = os.path.join(str(tmp_path), f"shard-{shard:03d}")
+        if os.path.isdir(shard_dir):
+            assert not [name for name in os.listdir(shard_dir) if name.endswith(".log")]
+
+    for value in range(60, 90):
+        user_id = f"user-{value % 7}"
+        journal.append(user_id, record(user_id, value))
+        expected.setdefault(user_id, []).append(value)
+    journal.close()
+
+    reopened = open_journal(tmp_path)
+    assert replay(reopened) == expected
+
+    # Appends after a reload go to a generation newer than anything on disk
+    reopened.append("user-0", record("user-0", 90))
+    expected["user-0"].append(90)
+    reopened.close()
+    assert replay(open_journal(tmp_path)) == expected
+
+
+def test_rotated_journal_survives_a_crash_before_the_snapshot(tmp_path):
+    journal = open_journal(tmp_path, num_shards=1)
+    for value in range(5):
+        journal.append("user-0", record("user-0", value))
+    journal.rotate(0)
+    journal.append("user-0", record("user-0", 5))
+    journal.close()
+
+    assert replay(open_journal(tmp_path, num_shards=1)) == {"user-0": list(range(6))}
+
+
+def test_stale_snapshot_does_not_replace_a_newer_one(tmp_path):
+    journal = open_journal(tmp_path, num_shards=1)
+    journal.append("user-0", record("user-0", 0))
+    old_generation = journal.rotate(0)
+    journal.append("user-0", record("user-0", 1))
+    new_generation = journal.rotate(0)
+
+    journal.write_snapshot(0, new_generation, {"user-0": [0, 1]})
+    journal.write_snapshot(0, old_generation, {"user-0": [0]})
+    journal.close()
+
+    assert replay(open_journal(tmp_path, num_shards=1)) == {"user-0": [0, 1]}
+
+
+def test_torn_trailing_record_is_skipped(tmp_path):
+    journal = open_journal(tmp_path, num_shards=1)
+    for value in range(3):
+        journal.append("user-0", record("user-0", value))
+    journal.close()
+
+    shard_dir = os.path.join(str(tmp_path), "shard-000")
+    (log_name,) = [name for name in os.listdir(shard_dir) if name.endswith(".log")]
+    with open(os.path.join(shard_dir, log_name), "a", encoding="utf-8") as f:
+        f.write('{"type":"progress","data":{"userId":"user-')
+
+    assert replay(open_journal(tmp_path, num_shards=1)) == {"user-0": [0, 1, 2]}
+
+
+def test_shard_count_is_fixed_by_the_manifest(tmp_path):
+    journal = open_journal(tmp_path, num_shards=4)
+    assert journal.is_empty
+    journal.append("user-0", record("user-0", 0))
+    journal.close()
+
+    reopened = open_journal(tmp_path, num_shards=8)
+    assert reopened.num_shards == 4
+    assert not reopened.is_empty
@@ -0,0 +1,270 @@
+"""
+Tests for journal persistence in ProgressTrackingService.
+"""
+
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+from tests.module_loader import load_module, load_namespace, stub_module
+
+load_namespace("visualverse_lxp_progress", "services/lxp/services/progress")
+# Analytics events are only sent when a service is attached
+stub_module(
+    "visualverse_lxp_progress.analytics_service",
+    LearningAnalyticsService=object, EventType=object
+)
+progress_module = load_module(
+    "visualverse_lxp_progress.progress_service",
+    "services/lxp/services/progress/progress_service.py"
+)
+
+
+def open_service(directory, **kwargs):
+    kwargs.setdefault("num_shards", 4)
+    kwargs.setdefault("background_compaction", False)
+    return progress_module.ProgressTrackingService(storage_dir=str(directory), **kwargs)
+
+
+def service_state(service):
+    """Everything the service persists, in serialized form."""
+    return {
+        "progress": {uid: p.to_dict() for uid, p in service.learner_progress.items()},
+        "sessions": {sid: s.to_dict() for sid, s in service.sessions.items()},
+        "timelines": {uid: list(t.session_ids) for uid, t in service.user_sessions.items()},
+        "concepts": {
+            uid: {cid: cp.to_dict() for cid, cp in concepts.items()}
+            for uid, concepts in service.concept_progress.items()
+        },
+        "milestones": {uid: [m.to_dict() for m in ms] for uid, ms in service.milestones.items()},
+        "achievements": {uid: [a.to_dict() for a in achs] for uid, achs in service.achievements.items()},
+    }
+
+
+def populate(service, seed, steps=150):
+    """Drive the service through its public API with a mix of changes."""
+    rng = random.Random(seed)
+    users = [f"user-{i}" for i in range(6)]
+    milestones = {}
+
+    for _ in range(steps):
+        user_id = rng.choice(users)
+        action = rng.random()
+        if action < 0.3:
+            service.record_session(
+                user_id, f"concept-{rng.randrange(5)}", time_spent=rng.randrange(30, 3600),
+                interactions=rng.randrange(10), completed=rng.random() < 0.7,
+                score=rng.random(), metadata={"source": "test"}
+            )
+        elif action < 0.5:
+            service.start_session(user_id, f"concept-{rng.randrange(5)}")
+        elif action < 0.65:
+            metadata = {"x": 1} if rng.random() < 0.5 else None
+            service.record_interaction(user_id, rng.choice(["click", "quiz"]), metadata)
+        elif action < 0.8:
+            if service.get_active_session(user_id):
+                service.complete_session(user_id, rng.choice([0.5, 0.9, 1.0]), mastery_level=rng.random())
+        elif action < 0.9:
+            milestone = service.create_milestone(user_id, "Goal", "Reach a goal", "sessions", rng.randrange(2, 6))
+            milestones.setdefault(user_id, []).append(milestone.id)
+        elif milestones.get(user_id):
+            service.update_milestone(user_id, rng.choice(milestones[user_id]), rng.randrange(1, 3))
+
+
+def test_restart_replays_the_journal(tmp_path):
+    service = open_service(tmp_path)
+    populate(service, seed=1)
+    expected = service_state(service)
+    service.close()
+
+    assert not os.path.exists(tmp_path / "learner_progress.json")
+    reopened = open_service(tmp_path)
+    assert service_state(reopened) == expected
+    reopened.close()
+
+
+def test_restart_after_compaction_keeps_state(tmp_path):
+    # A low threshold compacts shards repeatedly while the state is built up
+    service = open_service(tmp_path, compact_threshold=8)
+    populate(service, seed=2)
+    assert all(service.journal.record_count(s) < 8 for s in range(service.num_shards))
+    expected = service_state(service)
+    service.close()
+
+    reopened = open_service(tmp_path, compact_threshold=8)
+    assert service_state(reopened) == expected
+
+    # Compacting every shard of the reloaded state and appending more changes
+    for shard in range(reopened.num_shards):
+        reopened._compact_shard(shard)
+        assert reopened.journal.record_count(shard) == 0
+    populate(reopened, seed=3, steps=40)
+    expected = service_state(reopened)
+    reopened.close()
+
+    again = open_service(tmp_path, compact_threshold=8)
+    assert service_state(again) == expected
+    again.close()
+
+
+def test_background_compaction_keeps_state(tmp_path):
+    service = open_service(tmp_path, compact_threshold=5, background_compaction=True)
+    populate(service, seed=4)
+    service.flush()
+    expected = service_state(service)
+    service.close()
+
+    reopened = open_service(tmp_path)
+    assert service_state(reopened) == expected
+    reopened.close()
+
+
+def write_legacy_files(directory, service):
+    """Write a service's state in the previous whole-file JSON format."""
+    files = {
+        "learner_progress.json": {uid: p.to_dict() for uid, p in service.learner_progress.items()},
+        "sessions.json": {sid: s.to_dict() for sid, s in service.sessions.items()},
+        "concept_progress.json": {
+            uid: {cid: cp.to_dict() for cid, cp in concepts.items()}
+            for uid, concepts in service.concept_progress.items()
+        },
+        "milestones.json": {uid: [m.to_dict() for m in ms] for uid, ms in service.milestones.items()},
+        "achievements.json": {uid: [a.to_dict() for a in achs] for uid, achs in service.achievements.items()},
+    }
+    os.makedirs(directory, exist_ok=True)
+    for name, data in files.items():
+        with open(os.path.join(directory, name), "w") as f:
+            json.dump(data, f)
+
+
+def test_legacy_state_files_are_migrated(tmp_path):
+    source = open_service(tmp_path / "source")
+    populate(source, seed=5)
+    expected = service_state(source)
+    source.close()
+
+    legacy_dir = tmp_path / "legacy"
+    write_legacy_files(legacy_dir, source)
+
+    migrated = open_service(legacy_dir)
+    assert service_state(migrated) == expected
+    assert not migrated.journal.is_empty
+
+    # Later changes go to the journal, which now takes precedence over the legacy files
+    migrated.record_session("user-0", "concept-9", time_spent=60, interactions=1, completed=True, score=0.5)
+    expected = service_state(migrated)
+    migrated.close()
+
+    reopened = open_service(legacy_dir)
+    assert service_state(reopened) == expected
+    reopened.close()
+
+
+def add_session(service, session_id, user_id, start_time):
+    """Store and journal a finished session with a fixed start time."""
+    session = progress_module.SessionData(
+        id=session_id, user_id=user_id, content_id="concept-1",
+        start_time=start_time, end_time=start_time + timedelta(minutes=20), time_spent=1200
+    )
+    service._store_session(session)
+    service._journal_entity(user_id, "session", session)
+    return session
+
+
+def ids(sessions):
+    return [session.id for session in sessions]
+
+
+def test_session_range_queries_are_inclusive_at_both_ends(tmp_path):
+    service = open_service(tmp_path)
+    base = datetime(2026, 3, 1, 9, 0)
+    # Two sessions share a start time; they keep their insertion order
+    starts = [base, base + timedelta(hours=1), base + timedelta(hours=1), base + timedelta(hours=3)]
+    for i, start in enumerate(starts):
+        add_session(service, f"s{i}", "user-1", start)
+    add_session(service, "other", "user-2", base + timedelta(hours=1))
+
+    between = service.get_sessions_between
+    assert ids(between("user-1", base, base + timedelta(hours=3))) == ["s0", "s1", "s2", "s3"]
+    assert ids(between("user-1", base + timedelta(hours=1), base + timedelta(hours=1))) == ["s1", "s2"]
+    second = timedelta(seconds=1)
+    assert ids(between("user-1", base + second, base + timedelta(hours=3) - second)) == ["s1", "s2"]
+    assert ids(between("user-1", base + timedelta(hours=1, seconds=1), base + timedelta(hours=2))) == []
+    assert ids(between("user-1", base + timedelta(hours=3), base)) == []
+    assert ids(between("user-3", base, base + timedelta(days=1))) == []
+
+    assert ids(service.get_user_sessions("user-1", limit=3)) == ["s3", "s2", "s1"]
+    assert ids(service.get_user_sessions("user-1", limit=0)) == []
+    assert ids(service.get_user_sessions("user-1")) == ["s3", "s2", "s1", "s0"]
+
+    # Moving a session to a new start time re-sorts it
+    add_session(service, "s0", "user-1", base + timedelta(hours=2))
+    assert ids(between("user-1", base, base + timedelta(hours=3))) == ["s1", "s2", "s0", "s3"]
+    service.close()
+
+
+def test_timeline_matches_linear_scan(tmp_path):
+    rng = random.Random(9)
+    service = open_service(tmp_path)
+    base = datetime(2026, 1, 1)
+    offsets = [timedelta(minutes=15 * rng.randrange(200)) for _ in range(120)]
+    for i, offset in enumerate(offsets):
+        add_session(service, f"s{i}", f"user-{i % 3}", base + offset)
+
+    for _ in range(50):
+        start, end = sorted(base + rng.choice(offsets) for _ in range(2))
+        for user_id in ("user-0", "user-1", "user-2"):
+            expected = sorted(
+                (s for s in service.sessions.values()
+                 if s.user_id == user_id and start <= s.start_time <= end),
+                key=lambda s: s.start_time
+            )
+            assert ids(service.get_sessions_between(user_id, start, end)) == ids(expected)
+    service.close()
+
+
+def test_archived_sessions_are_read_back_from_the_archive(tmp_path):
+    service = open_service(tmp_path)
+    now = datetime.utcnow()
+    old = [add_session(service, f"old-{i}", "user-1", now - timedelta(days=90 + 10 * i)) for i in range(4)]
+    recent = add_session(service, "recent", "user-1", now - timedelta(days=2))
+    # An active session that started before the cutoff is kept in memory
+    active = service.start_session("user-2", "concept-2")
+    service._discard_session(active.id)
+    active.start_time = now - timedelta(days=200)
+    service._store_session(active)
+
+    cutoff = now - timedelta(days=30)
+    assert service.archive_sessions(cutoff) == len(old)
+    assert all(session.id not in service.sessions for session in old)
+    assert ids(service.get_user_sessions("user-1")) == ["recent"]
+    assert active.id in service.sessions
+
+    window = (now - timedelta(days=365), now)
+    expected = ids(sorted(old, key=lambda s: s.start_time)) + ["recent"]
+    assert ids(service.get_sessions_between("user-1", *window)) == expected
+    # Only the archive covers this range
+    archived_only = (now - timedelta(days=101), now - timedelta(days=99))
+    assert ids(service.get_sessions_between("user-1", *archived_only)) == ["old-1"]
+    assert service.archive_sessions(cutoff) == 0
+    service.close()
+
+    # Archived sessions stay out of memory after a restart
+    reopened = open_service(tmp_path)
+    assert set(reopened.sessions) == {recent.id, active.id}
+    assert ids(reopened.get_sessions_between("user-1", *window)) == expected
+    reopened.close()
+
+
+def test_retention_window_archives_on_startup(tmp_path):
+    service = open_service(tmp_path)
+    now = datetime.utcnow()
+    add_session(service, "stale", "user-1", now - timedelta(days=60))
+    add_session(service, "fresh", "user-1", now - timedelta(days=1))
+    service.close()
+
+    reopened = open_service(tmp_path, session_retention_days=30)
+    assert set(reopened.sessions) == {"fresh"}
+    assert ids(reopened.get_sessions_between("user-1", now - timedelta(days=90), now)) == ["stale", "fresh"]
+    reopened.close()
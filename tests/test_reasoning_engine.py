@@ -0,0 +1,185 @@
+"""
+Tests for incremental inference and LSH clustering in ReasoningEngine.
+"""
+
+import importlib
+import random
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from tests.module_loader import load_namespace
+
+CONTENT_METADATA = "open-source/engine/content-metadata"
+
+# The services and models package __init__ modules pull in the
+# database-backed services; the reasoning engine needs neither
+load_namespace("visualverse_content_metadata", CONTENT_METADATA)
+load_namespace("visualverse_content_metadata.services", f"{CONTENT_METADATA}/services")
+load_namespace("visualverse_content_metadata.models", f"{CONTENT_METADATA}/models")
+reasoning = importlib.import_module("visualverse_content_metadata.services.reasoning_engine")
+
+RELATIONSHIP_TYPES = ["prerequisite", "related_to", "component_of", "similar_to"]
+
+
+def inference_keys(engine):
+    return sorted(
+        (inf.source_concept_id, inf.target_concept_id, inf.relationship_type, inf.rule_id, inf.hop_count)
+        for inf in engine._inferred_relationships.values()
+    )
+
+
+def virtual_edges(graph):
+    return sorted(
+        (source, target, data['type'], data['rule_id'])
+        for source, target, data in graph.edges(data=True)
+        if data.get('is_inferred')
+    )
+
+
+def full_inference(concepts, explicit):
+    engine = reasoning.ReasoningEngine()
+    graph = engine.build_concept_graph(concepts, [
+        {'source': source, 'target': target, 'type': rel_type}
+        for (source, target), rel_type in explicit.items()
+    ])
+    engine.run_inference(graph)
+    return engine, graph
+
+
+def test_added_edge_retracts_superseded_symmetric_inference():
+    engine = reasoning.ReasoningEngine()
+    graph = engine.build_concept_graph(
+        {'a': {}, 'b': {}}, [{'source': 'a', 'target': 'b', 'type': 'related_to'}]
+    )
+    engine.run_inference(graph)
+    assert engine._find_existing_inference('b', 'a', 'related_to')
+
+    engine.update_inference(graph, [{'source': 'b', 'target': 'a', 'type': 'prerequisite'}], [])
+
+    assert engine._find_existing_inference('b', 'a', 'related_to') is None
+    assert engine._find_existing_inference('a', 'b', 'enables')
+    assert graph.get_edge_data('b', 'a')['type'] == 'prerequisite'
+
+
+def test_removed_edge_retracts_inverse_inference():
+    engine = reasoning.ReasoningEngine()
+    graph = engine.build_concept_graph(
+        {'a': {}, 'b': {}}, [{'source': 'a', 'target': 'b', 'type': 'prerequisite'}]
+    )
+    engine.run_inference(graph)
+    assert engine._find_existing_inference('b', 'a', 'enables')
+
+    _, stats = engine.update_inference(graph, [], [('a', 'b')])
+
+    assert stats['total_retracted'] == 1
+    assert engine._inferred_relationships == {}
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_incremental_inference_matches_full_run(seed):
+    rng = random.Random(seed)
+    concepts = {f"n{i}": {} for i in range(10)}
+    explicit = {}
+    for _ in range(14):
+        source, target = rng.sample(sorted(concepts), 2)
+        explicit[(source, target)] = rng.choice(RELATIONSHIP_TYPES)
+
+    engine, graph = full_inference(concepts, explicit)
+
+    for _ in range(10):
+        added, removed = [], []
+        for _ in range(rng.randint(0, 3)):
+            source, target = rng.sample(sorted(concepts), 2)
+            rel_type = rng.choice(RELATIONSHIP_TYPES)
+            explicit[(source, target)] = rel_type
+            added.append({'source': source, 'target': target, 'type': rel_type})
+        for _ in range(rng.randint(0, 2)):
+            pair = rng.choice(sorted(explicit))
+            if any((rel['source'], rel['target']) == pair for rel in added):
+                continue
+            del explicit[pair]
+            removed.append(pair)
+
+        engine.update_inference(graph, added, removed)
+        expected_engine, expected_graph = full_inference(concepts, explicit)
+
+        assert inference_keys(engine) == inference_keys(expected_engine)
+        assert virtual_edges(graph) == virtual_edges(expected_graph)
+
+
+def random_curriculum(seed, topic_count=12, per_topic=12):
+    """Concepts drawing tags and keywords from per-topic pools, plus random edges"""
+    rng = random.Random(seed)
+    concepts = {}
+    for topic in range(topic_count):
+        tags = [f"t{topic}_{k}" for k in range(5)]
+        keywords = [f"k{topic}_{k}" for k in range(6)]
+        for i in range(per_topic):
+            concepts[f"c{topic}_{i}"] = {
+                'tags': rng.sample(tags, rng.randint(2, 4)),
+                'keywords': rng.sample(keywords, rng.randint(2, 5)),
+                'learning_objectives': [f"o{rng.randrange(40)}"],
+            }
+    ids = sorted(concepts)
+    relationships = [
+        {'source': source, 'target': target, 'type': 'related_to'}
+        for source, target in (rng.sample(ids, 2) for _ in range(200))
+    ]
+    return concepts, relationships
+
+
+def cluster_members(clusters):
+    return sorted(sorted(cluster.concept_ids) for cluster in clusters)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_lsh_clusters_match_exhaustive(seed):
+    pytest.importorskip("numpy")
+    concepts, relationships = random_curriculum(seed)
+    engine = reasoning.ReasoningEngine()
+    graph = engine.build_concept_graph(concepts, relationships)
+
+    exhaustive = engine.discover_clusters(graph, min_similarity=0.5, min_cluster_size=2)
+    lsh = engine.discover_clusters(graph, min_similarity=0.5, min_cluster_size=2, method="lsh")
+
+    assert exhaustive
+    assert cluster_members(lsh) == cluster_members(exhaustive)
+
+
+def test_lsh_keeps_identical_concepts_in_oversized_buckets():
+    pytest.importorskip("numpy")
+    concepts, relationships = random_curriculum(0, topic_count=4)
+    # More identical concepts than fit in one bucket
+    for i in range(60):
+        concepts[f"dup{i}"] = {'tags': ["same"], 'keywords': ["same"], 'learning_objectives': ["same"]}
+    engine = reasoning.ReasoningEngine()
+    graph = engine.build_concept_graph(concepts, relationships)
+
+    exhaustive = engine.discover_clusters(graph, min_similarity=0.5, min_cluster_size=2)
+    lsh = engine.discover_clusters(
+        graph, min_similarity=0.5, min_cluster_size=2, method="lsh", max_bucket_size=20
+    )
+
+    assert any(cid.startswith("dup") for cluster in lsh for cid in cluster.concept_ids)
+    assert cluster_members(lsh) == cluster_members(exhaustive)
+
+
+def test_lsh_splits_buckets_of_a_tag_shared_by_all_concepts(caplog):
+    pytest.importorskip("numpy")
+    count = 400
+    concepts = {
+        f"c{i}": {'tags': ["shared", f"t{i}"], 'keywords': [f"k{i}", f"k{i + 1}"]}
+        for i in range(count)
+    }
+    engine = reasoning.ReasoningEngine()
+    graph = engine.build_concept_graph(concepts, [])
+
+    # One row per band, so about a third of the concepts share each tag band
+    with caplog.at_level("WARNING"):
+        engine.discover_clusters(graph, method="lsh", lsh_bands=128, max_bucket_size=50)
+
+    # The shared tag buckets are split rather than expanded or dropped unreported
+    assert engine._stats.similarities_calculated < count * (count - 1) // 4
+    assert "Split" in caplog.text and "bucket pairs" in caplog.text
@@ -0,0 +1,196 @@
+"""
+Tests for the content-addressed render cache.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tests.module_loader import load_module
+
+render_cache = load_module(
+    "visualverse_render_cache", "open-source/engine/animation-engine/core/render_cache.py"
+)
+
+
+def writer(content, result="ok", calls=None, delay=0.0):
+    """A render callback that writes ``content`` to the temp path."""
+    async def render(tmp_path):
+        if calls is not None:
+            calls.append(tmp_path)
+        await asyncio.sleep(delay)
+        if content is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+        return result
+    return render
+
+
+def test_keys_are_canonical_and_versioned(tmp_path):
+    cache = render_cache.RenderCache(str(tmp_path), versions={"renderer": "1"})
+    assert cache.make_key({"a": 1, "b": [1, 2]}) == cache.make_key({"b": [1, 2], "a": 1})
+    assert cache.make_key({"a": 1}) != cache.make_key({"a": 2})
+
+    upgraded = render_cache.RenderCache(str(tmp_path), versions={"renderer": "2"})
+    assert upgraded.make_key({"a": 1}) != cache.make_key({"a": 1})
+
+
+def test_concurrent_misses_share_one_render(tmp_path):
+    cache = render_cache.RenderCache(str(tmp_path))
+    calls = []
+
+    async def scenario():
+        render = writer(b"frames", calls=calls, delay=0.05)
+        return await asyncio.gather(*(cache.get_or_render("k" * 64, render) for _ in range(3)))
+
+    outcomes = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert [outcome.coalesced for outcome in outcomes] == [False, True, True]
+    assert len({outcome.path for outcome in outcomes}) == 1
+
+    hit = asyncio.run(cache.get_or_render("k" * 64, writer(b"other", calls=calls)))
+    assert hit.hit and len(calls) == 1
+    with open(hit.path, "rb") as f:
+        assert f.read() == b"frames"
+    assert os.listdir(cache.tmp_dir) == []
+
+
+def test_output_of_a_failed_render_is_not_published(tmp_path):
+    cache = render_cache.RenderCache(str(tmp_path))
+    key = "f" * 64
+
+    # A failed render that still left a partial file behind
+    outcome = asyncio.run(cache.get_or_render(
+        key, writer(b"partial", result=False), should_publish=bool
+    ))
+    assert outcome.path is None
+    assert outcome.result is False
+    assert cache.lookup(key) is None
+    assert os.listdir(cache.tmp_dir) == []
+
+    outcome = asyncio.run(cache.get_or_render(
+        key, writer(b"complete", result=True), should_publish=bool
+    ))
+    assert outcome.path == cache.lookup(key)
+
+
+def test_render_errors_reach_every_waiter(tmp_path):
+    cache = render_cache.RenderCache(str(tmp_path))
+
+    async def failing(tmp_path):
+        await asyncio.sleep(0.02)
+        with open(tmp_path, "wb") as f:
+            f.write(b"partial")
+        raise RuntimeError("render crashed")
+
+    async def scenario():
+        return await asyncio.gather(
+            cache.get_or_render("e" * 64, failing),
+            cache.get_or_render("e" * 64, failing),
+            return_exceptions=True
+        )
+
+    errors = asyncio.run(scenario())
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert cache.lookup("e" * 64) is None
+    assert cache.info()["errors"] == 1
+
+
+def test_lru_eviction_survives_reopen(tmp_path):
+    cache = render_cache.RenderCache(str(tmp_path), max_bytes=250)
+    for i, key in enumerate(["a" * 64, "b" * 64, "c" * 64]):
+        asyncio.run(cache.get_or_render(key, writer(bytes(100))))
+        # Distinct modification times keep the recency order on reload
+        os.utime(cache.lookup(key), (1000 + i, 1000 + i))
+
+    assert cache.lookup("a" * 64) is None
+    assert cache.info()["evictions"] == 1
+    os.utime(cache.lookup("b" * 64), (2000, 2000))
+
+    reopened = render_cache.RenderCache(str(tmp_path), max_bytes=150)
+    assert reopened.lookup("c" * 64) is None
+    assert reopened.lookup("b" * 64) is not None
+    assert reopened.info()["bytes"] == 100
+
+
+def test_load_reaps_only_abandoned_temp_dirs(tmp_path):
+    tmp_dir = tmp_path / "tmp"
+    tmp_dir.mkdir()
+
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+
+    live = tmp_dir / f"{os.getpid()}-live"
+    dead = tmp_dir / f"{exited.pid}-dead"
+    untagged = tmp_dir / "untagged"
+    ancient = tmp_dir / f"{os.getpid()}-ancient"
+    for directory in (live, dead, untagged, ancient):
+        directory.mkdir()
+        (directory / "output.mp4").write_bytes(b"partial")
+    old = time.time() - render_cache.TMP_MAX_AGE - 60
+    os.utime(ancient, (old, old))
+
+    cache = render_cache.RenderCache(str(tmp_path))
+    cache.lookup("0" * 64)
+
+    assert sorted(os.listdir(tmp_dir)) == sorted([live.name, untagged.name])
+
+    # New temp dirs are tagged with the owning process
+    path = cache.new_temp_path()
+    assert os.path.basename(os.path.dirname(path)).startswith(f"{os.getpid()}-")
+
+
+SCENE_MODULES = {
+    "fp_helpers.py": "def title():\n    return 'v1'\n",
+    "fp_base.py": "class BaseScene:\n    def intro(self):\n        return 'intro'\n",
+    "fp_scene.py": (
+        "from fp_base import BaseScene\n"
+        "from fp_helpers import title\n\n\n"
+        "class DemoScene(BaseScene):\n"
+        "    def construct(self):\n"
+        "        return title()\n"
+    ),
+}
+
+
+@pytest.fixture
+def scene_modules(tmp_path, monkeypatch):
+    for name, source in SCENE_MODULES.items():
+        (tmp_path / name).write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in SCENE_MODULES:
+        monkeypatch.delitem(sys.modules, name[:-3], raising=False)
+    import fp_scene
+    yield tmp_path, fp_scene
+    for name in SCENE_MODULES:
+        sys.modules.pop(name[:-3], None)
+
+
+@pytest.mark.parametrize("edited", ["fp_helpers.py", "fp_base.py"])
+def test_fingerprint_covers_base_classes_and_helpers(scene_modules, edited):
+    directory, fp_scene = scene_modules
+    before = render_cache.scene_fingerprint(fp_scene.DemoScene)
+    assert before is not None
+    assert render_cache.scene_fingerprint(fp_scene.DemoScene) == before
+
+    path = directory / edited
+    path.write_text(path.read_text() + "\nEXTRA = 1\n")
+    assert render_cache.scene_fingerprint(fp_scene.DemoScene) != before
+
+
+def test_scenes_without_source_are_not_fingerprinted(scene_modules):
+    _, fp_scene = scene_modules
+
+    def make_local():
+        class DemoScene(fp_scene.BaseScene):
+            pass
+        return DemoScene
+
+    dynamic = type("DemoScene", (fp_scene.BaseScene,), {"__module__": "fp_scene"})
+
+    assert render_cache.scene_fingerprint(make_local()) is None
+    assert render_cache.scene_fingerprint(dynamic) is None
@@ -0,0 +1,177 @@
+"""
+Tests for the process-based render farm.
+
+Workers are spawned, so they import the farm module and the tasks below by
+name: the farm's directory is put on ``sys.path`` (which spawned children
+inherit) instead of loading the module under an alias.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+
+from tests.module_loader import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT / "open-source/engine/animation-engine/core"))
+
+import render_farm  # noqa: E402
+
+
+def sleep_task(payload, reporter):
+    with reporter.stage("sleep", progress=0.5):
+        time.sleep(payload)
+    return {"pid": os.getpid(), "slept": payload}
+
+
+def failing_task(payload, reporter):
+    with reporter.stage("explode"):
+        raise ValueError("bad scene")
+
+
+def crashing_task(payload, reporter):
+    os._exit(3)
+
+
+@pytest.fixture
+def farm():
+    farm = render_farm.RenderFarm(max_workers=1, max_queue_size=2)
+    yield farm
+    farm.shutdown(wait=True, cancel_pending=True)
+
+
+def wait_for(predicate, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_workers_are_spawned_by_default(farm):
+    assert farm.mp_context.get_start_method() == "spawn"
+
+    job = farm.submit(sleep_task, 0.01)
+    result = job.future.result(timeout=60)
+    assert result["slept"] == 0.01
+    assert result["pid"] != os.getpid()
+    assert job.status == render_farm.RenderJobStatus.COMPLETED
+    assert job.progress == 1.0
+    assert {"queued", "sleep", "total"} <= set(job.stage_timings)
+
+
+def test_failures_and_crashes_fail_the_job_only(farm):
+    failed = farm.submit(failing_task, None)
+    with pytest.raises(render_farm.RenderFarmError, match="bad scene"):
+        failed.future.result(timeout=60)
+    assert failed.status == render_farm.RenderJobStatus.FAILED
+
+    crashed = farm.submit(crashing_task, None)
+    with pytest.raises(render_farm.RenderFarmError, match="exited with code 3"):
+        crashed.future.result(timeout=60)
+
+    # The dead worker is replaced for the next job
+    assert farm.submit(sleep_task, 0.01).future.result(timeout=60)["slept"] == 0.01
+    assert farm.get_status()["failed"] == 2
+
+
+def test_cancel_terminates_a_running_job(farm):
+    job = farm.submit(sleep_task, 30)
+    wait_for(lambda: job.stage == "sleep")
+
+    assert farm.cancel(job.render_id)
+    with pytest.raises(render_farm.RenderCancelled):
+        job.future.result(timeout=10)
+    assert job.status == render_farm.RenderJobStatus.CANCELLED
+    assert not farm.cancel(job.render_id)
+
+
+def test_future_cancelled_by_the_caller_is_never_run(farm):
+    running = farm.submit(sleep_task, 30)
+    wait_for(lambda: running.stage == "sleep")
+    pending = farm.submit(sleep_task, 0.01)
+
+    # A running future cannot be cancelled directly; a pending one can
+    assert not running.future.cancel()
+    assert pending.future.cancel()
+    assert pending.status == render_farm.RenderJobStatus.CANCELLED
+    assert pending.cancel_event.is_set()
+
+    farm.cancel(running.render_id)
+    after = farm.submit(sleep_task, 0.01)
+    assert after.future.result(timeout=60)["slept"] == 0.01
+
+    assert pending.started_at is None
+    assert pending.future.cancelled()
+    status = farm.get_status()
+    assert status["cancelled"] == 2
+    assert status["completed"] == 1
+    assert status["submitted"] == 3
+
+
+def test_full_queue_rejects_non_blocking_submits(farm):
+    running = farm.submit(sleep_task, 30)
+    wait_for(lambda: running.stage == "sleep")
+    queued = [farm.submit(sleep_task, 0.01) for _ in range(farm.max_queue_size)]
+
+    with pytest.raises(render_farm.RenderQueueFull):
+        farm.submit(sleep_task, 0.01, block=False)
+    with pytest.raises(render_farm.RenderQueueFull):
+        farm.submit(sleep_task, 0.01, timeout=0.05)
+
+    farm.cancel(running.render_id)
+    for job in queued:
+        job.future.result(timeout=60)
+    assert farm.get_status()["submitted"] == 1 + len(queued)
+
+
+class FailingFirstStart:
+    """Spawn context whose first worker process fails to start."""
+
+    def __init__(self):
+        self.context = multiprocessing.get_context("spawn")
+        self.failures = 1
+
+    def Pipe(self):
+        return self.context.Pipe()
+
+    def Process(self, **kwargs):
+        process = self.context.Process(**kwargs)
+        if self.failures:
+            self.failures -= 1
+
+            def start():
+                raise OSError("cannot start worker")
+            process.start = start
+        return process
+
+
+def test_worker_start_failure_fails_only_that_job():
+    farm = render_farm.RenderFarm(max_workers=1, mp_context=FailingFirstStart())
+    try:
+        failed = farm.submit(sleep_task, 0.01)
+        with pytest.raises(render_farm.RenderFarmError, match="cannot start worker"):
+            failed.future.result(timeout=60)
+
+        # The slot thread survived and starts a fresh worker
+        assert farm.submit(sleep_task, 0.01).future.result(timeout=60)["slept"] == 0.01
+    finally:
+        farm.shutdown()
+
+
+def test_shutdown_without_wait_does_not_block_on_a_full_queue():
+    farm = render_farm.RenderFarm(max_workers=1, max_queue_size=1)
+    running = farm.submit(sleep_task, 0.5)
+    wait_for(lambda: running.status == render_farm.RenderJobStatus.PROCESSING)
+    queued = farm.submit(sleep_task, 0.01)
+
+    started = time.monotonic()
+    farm.shutdown(wait=False)
+    assert time.monotonic() - started < 0.25
+
+    # Accepted jobs still run, then the slot exits without a sentinel
+    assert queued.future.result(timeout=60)["slept"] == 0.01
+    farm._slots[0].thread.join(timeout=30)
+    assert not farm._slots[0].thread.is_alive()
+    assert farm._slots[0].process is None or not farm._slots[0].process.is_alive()
@@ -0,0 +1,74 @@
+"""
+Tests for the month/shard partitioned session archive.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+from tests.module_loader import load_module
+
+archive_module = load_module(
+    "visualverse_session_archive", "services/lxp/services/progress/session_archive.py"
+)
+
+
+def session(session_id, user_id, start_time):
+    return {
+        "id": session_id,
+        "userId": user_id,
+        "contentId": "concept-1",
+        "startTime": start_time.isoformat(),
+        "endTime": None
+    }
+
+
+def test_archived_sessions_replay_after_reopen(tmp_path):
+    archive = archive_module.SessionArchive(str(tmp_path), num_shards=4)
+    start = datetime(2024, 1, 20)
+    sessions = [
+        session(f"s{i}", f"user-{i % 3}", start + timedelta(days=5 * i)) for i in range(12)
+    ]
+    cutoff = start + timedelta(days=60)
+    archive.append(sessions, cutoff)
+
+    # Partitioned by start month and user shard
+    months = sorted(name for name in os.listdir(str(tmp_path)) if name != "archive.json")
+    assert months == ["2024-01", "2024-02", "2024-03"]
+
+    reopened = archive_module.SessionArchive(str(tmp_path), num_shards=16)
+    assert reopened.num_shards == 4
+    assert reopened.archived_before == cutoff
+
+    found = reopened.read("user-1", start, start + timedelta(days=365))
+    expected = [
+        s for s in sessions
+        if s["userId"] == "user-1" and datetime.fromisoformat(s["startTime"]) <= cutoff
+    ]
+    assert found == expected
+
+
+def test_read_is_bounded_by_range_and_watermark(tmp_path):
+    archive = archive_module.SessionArchive(str(tmp_path))
+    start = datetime(2024, 3, 1)
+    archive.append(
+        [session(f"s{i}", "user-0", start + timedelta(days=i)) for i in range(10)],
+        start + timedelta(days=10)
+    )
+
+    found = archive.read("user-0", start + timedelta(days=2), start + timedelta(days=4))
+    assert [s["id"] for s in found] == ["s2", "s3", "s4"]
+    assert archive.read("user-0", start + timedelta(days=10), start + timedelta(days=40)) == []
+    assert archive.read("user-9", start, start + timedelta(days=10)) == []
+
+
+def test_duplicate_archival_returns_each_session_once(tmp_path):
+    archive = archive_module.SessionArchive(str(tmp_path))
+    start = datetime(2024, 5, 1)
+    sessions = [session(f"s{i}", "user-0", start + timedelta(hours=i)) for i in range(3)]
+
+    # A crash between archiving and journaling archives the same sessions again
+    archive.append(sessions, start + timedelta(days=1))
+    archive.append(sessions, start + timedelta(hours=12))
+
+    assert archive.archived_before == start + timedelta(days=1)
+    assert archive.read("user-0", start, start + timedelta(days=1)) == sessions
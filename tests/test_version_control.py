@@ -0,0 +1,176 @@
+"""
+Tests for VersionControlService on top of the object pack.
+"""
+
+import difflib
+import json
+
+import pytest
+
+from tests.module_loader import load_module, load_namespace, stub_module
+
+# Domain types are only re-exported by the service, not used by these paths
+stub_module(
+    "visualverse.platform.packages.shared_types",
+    Project=object, Commit=object, Branch=object
+)
+load_namespace("visualverse_vcs", "services/platform/services/version-control")
+vcs = load_module(
+    "visualverse_vcs.version_control",
+    "services/platform/services/version-control/version_control.py"
+)
+
+AUTHOR = {"author_id": "user-1", "author_name": "Ada", "author_email": "ada@example.com"}
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = vcs.VersionControlService(str(tmp_path))
+    service.init_repository("project-1", **AUTHOR)
+    yield service
+    service.close()
+
+
+def commit(service, message, content):
+    return service.commit("project-1", message=message, content=content, **AUTHOR)
+
+
+def blob_count(service):
+    return service.objects.count(vcs.OBJ_BLOB)
+
+
+def test_blobs_are_stored_once_across_commits(service):
+    first = commit(service, "Add files", {"a.py": "x = 1\n", "b.py": "y = 2\n", "copy.py": "x = 1\n"})
+    assert blob_count(service) == 2
+
+    # Only the changed file adds a blob; the unchanged one is reused
+    second = commit(service, "Edit b", {"a.py": "x = 1\n", "b.py": "y = 3\n", "copy.py": "x = 1\n"})
+    assert blob_count(service) == 3
+    assert (second.files_changed, second.additions, second.deletions) == (1, 1, 1)
+
+    # Returning to earlier contents stores nothing new
+    commit(service, "Undo b", {"a.py": "x = 1\n", "b.py": "y = 2\n", "copy.py": "x = 1\n"})
+    assert blob_count(service) == 3
+    assert service.get_tree_content(first.hash)["copy.py"] == "x = 1\n"
+
+
+def test_diff_reads_stored_contents(service):
+    base_content = {"a.py": "one\ntwo\nthree\n", "gone.py": "old\nlines\n", "same.py": "keep\n"}
+    compare_content = {"a.py": "one\n2\nthree\nfour\n", "new.py": "fresh\n", "same.py": "keep\n"}
+    base = commit(service, "Base", base_content)
+    compare = commit(service, "Compare", compare_content)
+
+    result = service.diff(base.hash, compare.hash)
+    files = {f["path"]: f for f in result.files}
+    assert sorted(files) == ["a.py", "gone.py", "new.py"]
+    assert [files[p]["status"] for p in sorted(files)] == ["modified", "deleted", "added"]
+
+    for path, file_diff in files.items():
+        expected = list(difflib.unified_diff(
+            base_content.get(path, "").splitlines(keepends=True),
+            compare_content.get(path, "").splitlines(keepends=True),
+            fromfile=f"a/{path}", tofile=f"b/{path}", lineterm=''
+        ))
+        assert file_diff["diff"] == expected
+
+    assert (files["a.py"]["additions"], files["a.py"]["deletions"]) == (2, 1)
+    assert (files["gone.py"]["additions"], files["gone.py"]["deletions"]) == (0, 2)
+    assert (files["new.py"]["additions"], files["new.py"]["deletions"]) == (1, 0)
+    assert (result.total_additions, result.total_deletions) == (3, 3)
+    assert (compare.files_changed, compare.additions, compare.deletions) == (3, 3, 3)
+
+
+def test_merge_combines_one_sided_changes(service):
+    root = commit(service, "Root", {"a.py": "a\n", "b.py": "b\n", "c.py": "c\n", "e.py": "e\n"})
+    service.create_branch("feature", root.hash)
+
+    service.switch_branch("feature")
+    commit(service, "Feature", {
+        "a.py": "a\n", "b.py": "b feature\n", "c.py": "c\n", "d.py": "d\n", "e.py": "e feature\n"
+    })
+    # Main deletes c.py, which feature left alone, and e.py, which feature changed
+    service.switch_branch("main")
+    commit(service, "Main", {"a.py": "a main\n", "b.py": "b\n"})
+
+    result = service.merge("main", "feature", **AUTHOR)
+    assert result.success, result.message
+    assert result.base_commit == root.hash
+    assert service.branches["main"].head_commit == result.commit_hash
+    assert service.get_tree_content(result.commit_hash) == {
+        "a.py": "a main\n",
+        "b.py": "b feature\n",
+        "d.py": "d\n",
+        "e.py": "e feature\n",
+    }
+
+
+def test_merge_reports_conflicting_changes(service):
+    root = commit(service, "Root", {"a.py": "a\n"})
+    service.create_branch("feature", root.hash)
+    service.switch_branch("feature")
+    commit(service, "Feature", {"a.py": "a feature\n"})
+    service.switch_branch("main")
+    head = commit(service, "Main", {"a.py": "a main\n"})
+
+    result = service.merge("main", "feature", **AUTHOR)
+    assert not result.success
+    assert [conflict["path"] for conflict in result.conflicts] == ["a.py"]
+    assert service.branches["main"].head_commit == head.hash
+
+
+def test_revert_restores_the_snapshot(service):
+    first = commit(service, "First", {"a.py": "v1\n", "b.py": "b\n"})
+    commit(service, "Second", {"a.py": "v2\n", "c.py": "c\n"})
+
+    reverted = service.revert(first.hash, **AUTHOR)
+    assert service.get_tree_content(reverted.hash) == {"a.py": "v1\n", "b.py": "b\n"}
+    assert reverted.tree_hash == first.tree_hash
+    assert service.get_file_content(reverted.hash, "c.py") is None
+    assert [c.hash for c in service.get_commit_history(limit=2)] == [reverted.hash, reverted.parent_hash]
+
+
+def test_contents_are_read_from_the_pack_after_restart(tmp_path):
+    service = vcs.VersionControlService(str(tmp_path))
+    service.init_repository("project-1", **AUTHOR)
+    first = commit(service, "First", {"a.py": "one\n", "dir/b.py": "two\n"})
+    second = commit(service, "Second", {"a.py": "one\nmore\n", "dir/b.py": "two\n"})
+    service.create_branch("feature", first.hash)
+    history = [c.to_dict() for c in service.get_commit_history()]
+    expected_diff = service.diff(first.hash, second.hash).to_dict()
+    service.close()
+
+    reopened = vcs.VersionControlService(str(tmp_path))
+    assert reopened.get_tree_content(first.hash) == {"a.py": "one\n", "dir/b.py": "two\n"}
+    assert reopened.get_file_content(second.hash, "a.py") == "one\nmore\n"
+    assert [c.to_dict() for c in reopened.get_commit_history()] == history
+    assert reopened.diff(first.hash, second.hash).to_dict() == expected_diff
+    assert reopened.branches["feature"].head_commit == first.hash
+
+    third = commit(reopened, "Third", {"a.py": "one\n", "dir/b.py": "two\n"})
+    assert third.parent_hash == second.hash
+    assert reopened.objects.count(vcs.OBJ_BLOB) == 3
+    reopened.close()
+
+
+def test_legacy_commits_file_is_migrated(tmp_path):
+    legacy = [
+        vcs.Commit(hash=f"{i:064x}", parent_hash=f"{i - 1:064x}" if i else None,
+                   tree_hash=f"tree-{i}", message=f"Commit {i}", **AUTHOR)
+        for i in range(3)
+    ]
+    head = legacy[-1].hash
+    (tmp_path / "commits.json").write_text(json.dumps({c.hash: c.to_dict() for c in legacy}))
+    (tmp_path / "refs.json").write_text(json.dumps({"HEAD": "refs/heads/main", "refs/heads/main": head}))
+
+    service = vcs.VersionControlService(str(tmp_path))
+    assert not (tmp_path / "commits.json").exists()
+    assert (tmp_path / "commits.json.migrated").exists()
+    assert [c.to_dict() for c in service.get_commit_history()] == [c.to_dict() for c in reversed(legacy)]
+    # Legacy commits carried no contents
+    assert service.get_tree_content(head) == {}
+    service.close()
+
+    reopened = vcs.VersionControlService(str(tmp_path))
+    assert sorted(reopened.commits) == sorted(c.hash for c in legacy)
+    assert reopened.get_commit(legacy[0].hash).to_dict() == legacy[0].to_dict()
+    reopened.close()